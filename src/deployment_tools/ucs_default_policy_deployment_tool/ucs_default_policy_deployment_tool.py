@@ -17,6 +17,14 @@ import intersight
 import re
 import time
 import base64
+import threading
+import concurrent.futures
+import urllib.parse
+import hashlib
+import os
+import random
+import email.utils
+import atexit
 import urllib3
 
 ########################
@@ -71,10 +79,30 @@ deployment_organization = "default"
 intersight_base_url = "https://www.intersight.com/api/v1"
 url_certificate_verification = True
 
+# Intersight API Request Rate Settings
+## NOTE - To stay under the request quota of the Intersight account, set the maximum average number of Intersight API requests per second, for example: intersight_api_request_rate_limit = 20
+## Leave the value as None to not limit the request rate. Throttled requests are always retried after the delay requested by Intersight.
+intersight_api_request_rate_limit = None
+
+# Intersight Object State File Setting
+## NOTE - Provide a file path to store a hash of each configured object, so that objects unchanged since the last run are skipped, for example: intersight_object_state_file = "intersight_object_state.json"
+## Leave the value empty to compare every pre-existing object with Intersight on each run.
+intersight_object_state_file = ""
+
 # Global Deployment Name Settings (Optional - These settings will attach a global prefix or suffix to the names of the created UCS Policies)
 deployment_name_prefix = "Default-"
 deployment_name_suffix = ""
 
+# Parallel Deployment Settings
+## NOTE - When deployment_parallel_mode is set to True, the enabled Policies are created at the same time, up to the number of Policies set in deployment_max_concurrent_policies.
+## The output for each Policy is shown together once all the Policies have been processed, followed by a summary of the results. Set to False to create the Policies one at a time.
+deployment_parallel_mode = True
+deployment_max_concurrent_policies = 8
+
+## NOTE - When deployment_adaptive_concurrency is set to True, the number of Policies created at the same time is adapted to the Intersight API, up to deployment_max_concurrent_policies.
+## The concurrency starts at half of the maximum, is raised while the Intersight API responds normally and is halved when requests are throttled, fail with server errors or slow down.
+deployment_adaptive_concurrency = True
+
 # UCS Default Policy Deployment List
 ## NOTE - The following variables enable creation and deployment of the corresponding named Policy. To disable a specific Policy, change the value to False.
 deploy_bios_policy = True
@@ -799,13 +827,255 @@ virtual_kvm_policy_enable_local_server_video = True
 # Suppress InsecureRequestWarning error messages
 urllib3.disable_warnings()
 
+# Establish the process-wide cache of Intersight API clients
+intersight_api_client_cache = {}
+intersight_api_client_cache_lock = threading.Lock()
+
+
+# Establish class to limit the request rate of an Intersight API client
+class IntersightRateLimiter:
+    """This class is used to limit the rate of Intersight API requests made
+    through an Intersight API client with a token bucket. Every function and
+    class sharing the API client draws from the same bucket, so the combined
+    request rate stays under the request quota of the Intersight account.
+    Requests can also be paused for every thread, for example after the
+    Intersight API has throttled a request.
+    """
+    def __init__(self,
+                 request_rate_limit=None,
+                 burst_size=None
+                 ):
+        self.request_rate_limit = request_rate_limit
+        self.burst_size = burst_size or max(1, request_rate_limit or 1)
+        self.available_tokens = self.burst_size
+        self.last_refill_time = time.monotonic()
+        self.paused_until = 0
+        self.lock = threading.Lock()
+
+    def __repr__(self):
+        return (
+            f"{self.__class__.__name__}"
+            f"({self.request_rate_limit}, "
+            f"{self.burst_size})"
+            )
+
+    def __str__(self):
+        return (f"{self.__class__.__name__} class object with a limit of "
+                f"{self.request_rate_limit} request(s) per second")
+
+    def acquire(self):
+        """This function waits until a request can be made, then consumes a
+        token from the bucket.
+        """
+        while True:
+            with self.lock:
+                current_time = time.monotonic()
+                wait_time = self.paused_until - current_time
+                if wait_time <= 0:
+                    if not self.request_rate_limit:
+                        return
+                    # Refill the bucket for the time elapsed since the last request
+                    self.available_tokens = min(self.burst_size,
+                                                self.available_tokens + (current_time - self.last_refill_time) * self.request_rate_limit
+                                                )
+                    self.last_refill_time = current_time
+                    if self.available_tokens >= 1:
+                        self.available_tokens -= 1
+                        return
+                    wait_time = (1 - self.available_tokens) / self.request_rate_limit
+            time.sleep(wait_time)
+
+    def pause(self,
+              pause_duration
+              ):
+        """This function pauses all requests for a duration.
+
+        Args:
+            pause_duration (float):
+                The duration of the pause in seconds.
+        """
+        with self.lock:
+            self.paused_until = max(self.paused_until, time.monotonic() + pause_duration)
+
+
+# Establish class for an Intersight SDK for Python API client with rate limiting and retries
+class RateLimitedApiClient(intersight.ApiClient):
+    """This class is used to provide an Intersight SDK for Python API client
+    that limits the rate of Intersight API requests and retries requests that
+    have been throttled or have failed temporarily. Throttled requests (429)
+    are retried for every method after the delay requested by the
+    Retry-After header. Requests that failed with a 500, 502, 503 or 504
+    status code are only retried for methods that are safe to repeat. Each
+    retry waits with jittered exponential backoff. The latency and status
+    code of each response are reported to the concurrency controller of the
+    API client, if attached.
+    """
+    idempotent_methods = ("GET", "HEAD", "OPTIONS", "PUT", "DELETE")
+    retryable_status_codes = (500, 502, 503, 504)
+    rate_limiter = None
+    api_retry_limit = 5
+    api_retry_backoff = 1
+    api_retry_max_delay = 60
+    concurrency_controller = None
+
+    def _retry_delay(self,
+                     error,
+                     retry_attempt
+                     ):
+        """This function determines the delay before a request is retried.
+
+        Args:
+            error (intersight.exceptions.ApiException):
+                The exception raised by the failed request.
+            retry_attempt (int):
+                The number of retries already performed for the request.
+
+        Returns:
+            A float of the delay in seconds.
+        """
+        retry_after = (error.headers or {}).get("Retry-After")
+        if retry_after:
+            # The Retry-After header is either a number of seconds or an HTTP date
+            try:
+                return max(float(retry_after), 0) + random.uniform(0, self.api_retry_backoff)
+            except ValueError:
+                try:
+                    return max(email.utils.mktime_tz(email.utils.parsedate_tz(retry_after)) - time.time(), 0) + random.uniform(0, self.api_retry_backoff)
+                except (TypeError, ValueError, OverflowError):
+                    pass
+        exponential_delay = min(self.api_retry_max_delay, self.api_retry_backoff * 2 ** retry_attempt)
+        return random.uniform(exponential_delay / 2, exponential_delay)
+
+    def call_api(self,
+                 resource_path,
+                 method,
+                 *args,
+                 **kwargs
+                 ):
+        """This function performs an Intersight API request, waiting for the
+        rate limiter and retrying throttled or temporarily failed requests.
+
+        Args:
+            resource_path (str):
+                The Intersight API resource path of the request.
+            method (str):
+                The HTTP method of the request.
+            *args:
+                The additional positional arguments of the request.
+            **kwargs:
+                The additional keyword arguments of the request.
+
+        Returns:
+            The response of the request.
+
+        Raises:
+            intersight.exceptions.ApiException:
+                The request failed and could not be retried.
+        """
+        if kwargs.get("async_req"):
+            return super().call_api(resource_path, method, *args, **kwargs)
+        retry_attempt = 0
+        while True:
+            if self.rate_limiter:
+                self.rate_limiter.acquire()
+            request_start_time = time.monotonic()
+            try:
+                api_response = super().call_api(resource_path, method, *args, **kwargs)
+                if self.concurrency_controller:
+                    self.concurrency_controller.record_response(time.monotonic() - request_start_time,
+                                                                request_method=method,
+                                                                request_path=resource_path
+                                                                )
+                return api_response
+            except intersight.exceptions.ApiException as error:
+                if self.concurrency_controller:
+                    self.concurrency_controller.record_response(time.monotonic() - request_start_time,
+                                                                error.status,
+                                                                request_method=method,
+                                                                request_path=resource_path
+                                                                )
+                if retry_attempt >= self.api_retry_limit or not (
+                    error.status == 429 or
+                    (error.status in self.retryable_status_codes and method.upper() in self.idempotent_methods)
+                    ):
+                    raise
+                retry_delay = self._retry_delay(error, retry_attempt)
+                if error.status == 429 and self.rate_limiter:
+                    # Pause every request sharing the API client while throttled
+                    self.rate_limiter.pause(retry_delay)
+                print(f"The Intersight API request for '{resource_path}' "
+                      f"returned the status code {error.status}. The request "
+                      f"will be retried in {retry_delay:.1f} seconds.")
+                time.sleep(retry_delay)
+                retry_attempt += 1
+
+
 # Function to get Intersight API client as specified in the Intersight Python SDK documentation for OpenAPI 3.x
 ## Modified to align with overall formatting, try/except blocks added for additional error handling, certificate verification option added
+## Modified to reuse one pooled API client per endpoint, API key and API client settings, connection pool sizing and connection retries added
 def get_api_client(api_key_id,
                    api_secret_file,
                    endpoint="https://intersight.com",
-                   url_certificate_verification=True
+                   url_certificate_verification=True,
+                   connection_pool_maxsize=32,
+                   connection_retry_limit=3,
+                   api_request_rate_limit=None,
+                   api_retry_limit=5
                    ):
+    """This is a function to get an Intersight API client. One API client is
+    established per endpoint, API key and set of API client settings, then
+    reused by every later call in the process with the same arguments, so
+    the API key is only loaded once and the pooled keep-alive connections of
+    the API client are shared. A call with different connection, rate limit
+    or retry settings establishes a separate API client with those settings.
+
+    Args:
+        api_key_id (str):
+            The ID of the Intersight API key.
+        api_secret_file (str):
+            The system file path of the Intersight API key.
+        endpoint (str):
+            Optional; The Intersight API base URL. The default value is
+            "https://intersight.com".
+        url_certificate_verification (bool):
+            Optional; The setting for verifying the SSL certificate of the
+            Intersight API base URL. The default value is True.
+        connection_pool_maxsize (int):
+            Optional; The maximum number of connections kept open to the
+            Intersight API by the API client. The value should be at least the
+            number of requests made at the same time. The default value is
+            32.
+        connection_retry_limit (int):
+            Optional; The number of times a request is retried after a
+            connection error. The default value is 3.
+        api_request_rate_limit (float):
+            Optional; The maximum average number of Intersight API requests
+            per second made through the API client, shared by every function
+            and class using the client. The default value is None, which does
+            not limit the request rate.
+        api_retry_limit (int):
+            Optional; The number of times a request is retried after a 429
+            status code, or after a 500, 502, 503 or 504 status code for
+            requests that are safe to repeat. The default value is 5.
+
+    Returns:
+        An ApiClient class instance which handles Intersight client-server
+        communication through the use of API keys.
+    """
+    # Reuse the API client already established for the endpoint, API key and API client settings
+    api_client_cache_key = (endpoint,
+                            api_key_id,
+                            api_secret_file,
+                            url_certificate_verification,
+                            connection_pool_maxsize,
+                            connection_retry_limit,
+                            api_request_rate_limit,
+                            api_retry_limit
+                            )
+    with intersight_api_client_cache_lock:
+        cached_api_client = intersight_api_client_cache.get(api_client_cache_key)
+    if cached_api_client is not None:
+        return cached_api_client
     try:
         with open(api_secret_file, 'r') as f:
             api_key = f.read()
@@ -841,6 +1111,13 @@ def get_api_client(api_key_id,
 
         if not url_certificate_verification:
             configuration.verify_ssl = False
+        # Size the connection pool for concurrent requests and retry failed connections
+        ## Failed status codes are retried by the API client with jittered backoff
+        configuration.connection_pool_maxsize = connection_pool_maxsize
+        configuration.retries = urllib3.util.Retry(total=connection_retry_limit,
+                                                   backoff_factor=0.5,
+                                                   raise_on_status=False
+                                                   )
     except Exception:
         print("\nA configuration error has occurred!\n")
         print("Unable to access the Intersight API Key.")
@@ -851,7 +1128,703 @@ def get_api_client(api_key_id,
         traceback.print_exc()
         sys.exit(0)
         
-    return intersight.ApiClient(configuration)
+    # Limit the request rate and retry throttled requests for every user of the API client
+    api_client = ThreadSafeApiClient(configuration)
+    api_client.rate_limiter = IntersightRateLimiter(api_request_rate_limit)
+    api_client.api_retry_limit = api_retry_limit
+    with intersight_api_client_cache_lock:
+        return intersight_api_client_cache.setdefault(api_client_cache_key,
+                                                      api_client
+                                                      )
+
+
+# Establish class for an Intersight SDK for Python API client that can be shared across threads
+class ThreadSafeApiClient(RateLimitedApiClient):
+    """This class is used to provide an Intersight SDK for Python API client
+    that can be shared by concurrently running threads. The last response of
+    an API call is stored per thread, so that each thread reads the response
+    of its own API call from the last_response attribute.
+    """
+    def _thread_local_responses(self):
+        """This function retrieves the per thread storage of the last
+        responses.
+
+        Returns:
+            A threading.local class instance.
+        """
+        return self.__dict__.setdefault("thread_local_responses", threading.local())
+
+    @property
+    def last_response(self):
+        return getattr(self._thread_local_responses(), "last_response", None)
+
+    @last_response.setter
+    def last_response(self, response):
+        self._thread_local_responses().last_response = response
+
+
+# Establish class to hold the Intersight account context of an Intersight API client
+class IntersightAccountContext:
+    """This class is used to hold the Intersight account information for a
+    specific Intersight API client, so that the account only needs to be
+    retrieved from Intersight once.
+    """
+    def __init__(self,
+                 api_client
+                 ):
+        self.api_client = api_client
+        self.iam_account = None
+        self.lock = threading.Lock()
+
+    def __repr__(self):
+        return (
+            f"{self.__class__.__name__}"
+            f"({self.api_client})"
+            )
+
+    def __str__(self):
+        if self.iam_account is None:
+            return f"{self.__class__.__name__} class object for an unresolved Intersight account"
+        return (f"{self.__class__.__name__} class object for the Intersight "
+                f"account named '{self.iam_account.get('Name')}'")
+
+    def set_account(self,
+                    iam_account
+                    ):
+        """This function stores the Intersight account information.
+
+        Args:
+            iam_account (dict):
+                The Intersight API object of the Intersight account.
+        """
+        with self.lock:
+            self.iam_account = iam_account
+
+    def get_account_name(self):
+        """This function returns the name of the Intersight account. If the
+        Intersight account information has not been stored yet, it is
+        retrieved from Intersight on first use.
+
+        Returns:
+            A string of the name for the Intersight account. If the Intersight
+            account information cannot be retrieved, the string "Unknown" is
+            returned, so that the calling error message can still be shown.
+        """
+        with self.lock:
+            if self.iam_account is None:
+                try:
+                    self.api_client.call_api(resource_path="/iam/Accounts?$select=Name",
+                                             method="GET",
+                                             auth_settings=['cookieAuth', 'http_signature', 'oAuth2', 'oAuth2']
+                                             )
+                    self.iam_account = json.loads(self.api_client.last_response.data)["Results"][0]
+                except Exception:
+                    return "Unknown"
+            return self.iam_account.get("Name")
+
+
+# Establish function to retrieve the Intersight account context of an Intersight API client
+intersight_account_context_creation_lock = threading.Lock()
+
+
+def get_intersight_account_context(api_client):
+    """This is a function to retrieve the Intersight account context for an
+    Intersight API client. The account context is created and attached to the
+    API client on first use, so that it is shared by every function and class
+    using the client.
+
+    Args:
+        api_client ("ApiClient"):
+            An ApiClient class instance which handles Intersight client-server
+            communication through the use of API keys.
+
+    Returns:
+        An IntersightAccountContext class instance.
+    """
+    with intersight_account_context_creation_lock:
+        intersight_account_context = getattr(api_client, "intersight_account_context", None)
+        if intersight_account_context is None:
+            intersight_account_context = IntersightAccountContext(api_client)
+            api_client.intersight_account_context = intersight_account_context
+    return intersight_account_context
+
+
+# Establish class to store the state of configured Intersight API objects across runs
+class IntersightObjectStateFile:
+    """This class is used to store a hash of the Intersight API body of each
+    configured Intersight object in a local JSON state file, along with the
+    MOID and modification time of the Intersight object. Intersight objects
+    with an unchanged Intersight API body and modification time can then be
+    skipped on later runs. The state file is saved after each batch of
+    stored object states and when flushed, rather than after every object.
+    """
+    def __init__(self,
+                 state_file_path,
+                 save_batch_size=50
+                 ):
+        self.state_file_path = state_file_path
+        self.save_batch_size = max(1, save_batch_size)
+        self.unsaved_object_state_count = 0
+        self.lock = threading.Lock()
+        self.object_states = {}
+        try:
+            with open(state_file_path, "r") as state_file:
+                self.object_states = json.load(state_file)
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError):
+            print(f"The state file '{state_file_path}' could not be read. "
+                  "A new state file will be created.")
+
+    def __repr__(self):
+        return (
+            f"{self.__class__.__name__}"
+            f"('{self.state_file_path}', "
+            f"{self.save_batch_size})"
+            )
+
+    def __str__(self):
+        return (f"{self.__class__.__name__} class object with "
+                f"{len(self.object_states)} stored object state(s)")
+
+    @staticmethod
+    def _state_key(intersight_api_path,
+                   organization_moid,
+                   object_name
+                   ):
+        """This function creates the state key for an Intersight object.
+
+        Args:
+            intersight_api_path (str):
+                The Intersight API path of the Intersight object.
+            organization_moid (str):
+                The MOID of the Intersight organization of the Intersight
+                object.
+            object_name (str):
+                The name of the Intersight object.
+
+        Returns:
+            A string containing the state key for the Intersight object.
+        """
+        base_intersight_api_path = intersight_api_path.split("?", 1)[0].strip("/")
+        return f"{base_intersight_api_path}|{organization_moid}|{object_name}"
+
+    @staticmethod
+    def api_body_hash(intersight_api_body):
+        """This function creates a canonical hash of an Intersight API body.
+
+        Args:
+            intersight_api_body (dict):
+                The Intersight API body of the Intersight object.
+
+        Returns:
+            A string of the SHA-256 hash of the Intersight API body.
+        """
+        canonical_intersight_api_body = json.dumps(intersight_api_body,
+                                                   sort_keys=True,
+                                                   separators=(",", ":"),
+                                                   default=str
+                                                   )
+        return hashlib.sha256(canonical_intersight_api_body.encode("utf-8")).hexdigest()
+
+    def is_unchanged(self,
+                     intersight_api_path,
+                     organization_moid,
+                     object_name,
+                     intersight_api_body,
+                     existing_intersight_object
+                     ):
+        """This function determines whether an Intersight object is unchanged
+        since it was last stored, both in the provided Intersight API body and
+        on Intersight.
+
+        Args:
+            intersight_api_path (str):
+                The Intersight API path of the Intersight object.
+            organization_moid (str):
+                The MOID of the Intersight organization of the Intersight
+                object.
+            object_name (str):
+                The name of the Intersight object.
+            intersight_api_body (dict):
+                The Intersight API body of the Intersight object.
+            existing_intersight_object (dict):
+                The pre-existing Intersight object.
+
+        Returns:
+            A boolean indicating whether the Intersight object is unchanged.
+        """
+        state_key = self._state_key(intersight_api_path,
+                                    organization_moid,
+                                    object_name
+                                    )
+        with self.lock:
+            object_state = self.object_states.get(state_key)
+        if not object_state or not existing_intersight_object.get("ModTime"):
+            return False
+        return (
+            object_state.get("Hash") == self.api_body_hash(intersight_api_body) and
+            object_state.get("Moid") == existing_intersight_object.get("Moid") and
+            object_state.get("ModTime") == existing_intersight_object.get("ModTime")
+            )
+
+    def set(self,
+            intersight_api_path,
+            organization_moid,
+            object_name,
+            intersight_api_body,
+            intersight_object
+            ):
+        """This function stores the state of a configured Intersight object.
+        The state file is saved once a full batch of object states has been
+        stored.
+
+        Args:
+            intersight_api_path (str):
+                The Intersight API path of the Intersight object.
+            organization_moid (str):
+                The MOID of the Intersight organization of the Intersight
+                object.
+            object_name (str):
+                The name of the Intersight object.
+            intersight_api_body (dict):
+                The Intersight API body of the Intersight object.
+            intersight_object (dict):
+                The Intersight object as returned by Intersight, including the
+                MOID and modification time.
+        """
+        if not intersight_object.get("Moid") or not intersight_object.get("ModTime"):
+            return
+        state_key = self._state_key(intersight_api_path,
+                                    organization_moid,
+                                    object_name
+                                    )
+        with self.lock:
+            self.object_states[state_key] = {
+                "Hash": self.api_body_hash(intersight_api_body),
+                "Moid": intersight_object["Moid"],
+                "ModTime": intersight_object["ModTime"]
+                }
+            self.unsaved_object_state_count += 1
+            if self.unsaved_object_state_count >= self.save_batch_size:
+                self._save()
+
+    def _save(self):
+        """This function saves the stored object states to the state file.
+        The lock of the state file must be held by the caller.
+        """
+        # Write the state file atomically, so an interrupted run leaves the previous state file intact
+        temporary_state_file_path = f"{self.state_file_path}.tmp"
+        try:
+            with open(temporary_state_file_path, "w") as state_file:
+                json.dump(self.object_states, state_file, indent=2, sort_keys=True)
+            os.replace(temporary_state_file_path, self.state_file_path)
+            self.unsaved_object_state_count = 0
+        except OSError:
+            print(f"The state file '{self.state_file_path}' could not be "
+                  "saved.")
+
+    def flush(self):
+        """This function saves any object states stored since the state file
+        was last saved.
+        """
+        with self.lock:
+            if self.unsaved_object_state_count:
+                self._save()
+
+
+# Establish function to attach a state file to an Intersight API client
+def set_intersight_object_state_file(api_client,
+                                     state_file_path
+                                     ):
+    """This is a function to attach a state file to an Intersight API client,
+    so that every Intersight object configured using the client is stored in
+    the state file and skipped on later runs if unchanged. The state file is
+    flushed when the process exits.
+
+    Args:
+        api_client ("ApiClient"):
+            An ApiClient class instance which handles Intersight client-server
+            communication through the use of API keys.
+        state_file_path (str):
+            The system file path of the state file.
+
+    Returns:
+        An IntersightObjectStateFile class instance.
+    """
+    intersight_object_state_file = IntersightObjectStateFile(state_file_path)
+    api_client.intersight_object_state_file = intersight_object_state_file
+    atexit.register(intersight_object_state_file.flush)
+    return intersight_object_state_file
+
+
+# Establish class to cache the live state of Intersight API objects for updates
+class IntersightObjectStateCache:
+    """This class is used to hold the live state of Intersight objects for a
+    specific Intersight API client. The Intersight objects under each
+    Intersight API path and organization are retrieved from Intersight once
+    with one filtered, paged query that selects only the compared attributes,
+    then indexed by name, so that pre-existing objects can be compared with
+    the provided configuration before any changes are made.
+    """
+    def __init__(self,
+                 api_client,
+                 page_size=1000
+                 ):
+        self.api_client = api_client
+        self.page_size = page_size
+        self.object_indexes = {}
+        self.object_index_attributes = {}
+        self.object_index_locks = {}
+        self.lock = threading.Lock()
+
+    def __repr__(self):
+        return (
+            f"{self.__class__.__name__}"
+            f"({self.api_client}, "
+            f"{self.page_size})"
+            )
+
+    def __str__(self):
+        return (f"{self.__class__.__name__} class object with "
+                f"{len(self.object_indexes)} indexed object type(s)")
+
+    def _get_object_index(self,
+                          intersight_api_path,
+                          organization_moid,
+                          select_attributes=None
+                          ):
+        """This function returns the index of the Intersight objects under an
+        Intersight API path and organization. The Intersight objects are
+        retrieved from Intersight on first use with one filtered query, and
+        retrieved again only if attributes that were not previously selected
+        are needed.
+
+        Args:
+            intersight_api_path (str):
+                The Intersight API path of the Intersight objects.
+            organization_moid (str):
+                The MOID of the Intersight organization of the Intersight
+                objects. If None, the Intersight objects are not filtered by
+                organization.
+            select_attributes (list):
+                Optional; A list of the attributes to be retrieved for each
+                Intersight object. The "Name", "Moid" and "ModTime" attributes
+                are always retrieved. The default value is None, which
+                retrieves all attributes.
+
+        Returns:
+            A dictionary with the names of the Intersight objects as keys and
+            the Intersight objects as values. If the Intersight objects could
+            not be retrieved, None is returned.
+        """
+        base_intersight_api_path = intersight_api_path.split("?", 1)[0].strip("/")
+        object_index_key = (base_intersight_api_path, organization_moid)
+        if select_attributes is None:
+            required_attributes = None
+        else:
+            required_attributes = {"Name", "Moid", "ModTime", *select_attributes}
+        with self.lock:
+            object_index_lock = self.object_index_locks.setdefault(object_index_key, threading.Lock())
+        with object_index_lock:
+            if object_index_key in self.object_indexes:
+                indexed_attributes = self.object_index_attributes[object_index_key]
+                if indexed_attributes is None or (required_attributes is not None and required_attributes <= indexed_attributes):
+                    return self.object_indexes[object_index_key]
+                # Retrieve the Intersight objects again with the previously selected attributes and the newly needed attributes
+                if required_attributes is not None:
+                    required_attributes |= indexed_attributes
+            filter_attributes = {"Organization": {"Moid": organization_moid}} if organization_moid else None
+            query_intersight_api_path = intersight_api_query_builder(base_intersight_api_path,
+                                                                     filter_attributes=filter_attributes,
+                                                                     select_attributes=sorted(required_attributes) if required_attributes else None
+                                                                     )
+            query_separator = "&" if "?" in query_intersight_api_path else "?"
+            object_index = {}
+            try:
+                skip_count = 0
+                while True:
+                    self.api_client.call_api(resource_path=f"/{query_intersight_api_path}{query_separator}$top={self.page_size}&$skip={skip_count}",
+                                             method="GET",
+                                             auth_settings=['cookieAuth', 'http_signature', 'oAuth2', 'oAuth2']
+                                             )
+                    retrieved_intersight_objects = json.loads(self.api_client.last_response.data).get("Results") or []
+                    for intersight_object in retrieved_intersight_objects:
+                        if intersight_object.get("Name"):
+                            object_index.setdefault(intersight_object["Name"], intersight_object)
+                    if len(retrieved_intersight_objects) < self.page_size:
+                        break
+                    skip_count += self.page_size
+            except Exception:
+                # Retrieve the Intersight objects again on the next use, as the error may be transient
+                print("The pre-existing objects under the Intersight API "
+                      f"resource path '{base_intersight_api_path}' could not "
+                      "be retrieved for comparison.")
+                return None
+            self.object_indexes[object_index_key] = object_index
+            self.object_index_attributes[object_index_key] = required_attributes
+            return object_index
+
+    def get(self,
+            intersight_api_path,
+            organization_moid,
+            object_name,
+            select_attributes=None
+            ):
+        """This function retrieves the live state of an Intersight object.
+
+        Args:
+            intersight_api_path (str):
+                The Intersight API path of the Intersight object.
+            organization_moid (str):
+                The MOID of the Intersight organization of the Intersight
+                object. If None, the Intersight object is not filtered by
+                organization.
+            object_name (str):
+                The name of the Intersight object.
+            select_attributes (list):
+                Optional; A list of the attributes of the Intersight object
+                to be compared. The default value is None, which retrieves all
+                attributes.
+
+        Returns:
+            A dictionary of the Intersight object. If the Intersight object
+            does not exist or the Intersight objects could not be retrieved,
+            None is returned.
+        """
+        object_index = self._get_object_index(intersight_api_path,
+                                              organization_moid,
+                                              select_attributes
+                                              )
+        if object_index is None:
+            return None
+        return object_index.get(object_name)
+
+    def set(self,
+            intersight_api_path,
+            organization_moid,
+            object_name,
+            intersight_object
+            ):
+        """This function stores the live state of an Intersight object after
+        it has been updated.
+
+        Args:
+            intersight_api_path (str):
+                The Intersight API path of the Intersight object.
+            organization_moid (str):
+                The MOID of the Intersight organization of the Intersight
+                object.
+            object_name (str):
+                The name of the Intersight object.
+            intersight_object (dict):
+                The Intersight object.
+        """
+        base_intersight_api_path = intersight_api_path.split("?", 1)[0].strip("/")
+        with self.lock:
+            object_index = self.object_indexes.get((base_intersight_api_path, organization_moid))
+            if object_index is not None:
+                object_index[object_name] = intersight_object
+
+
+# Establish function to retrieve the object state cache of an Intersight API client
+intersight_object_state_cache_creation_lock = threading.Lock()
+
+
+def get_intersight_object_state_cache(api_client):
+    """This is a function to retrieve the object state cache for an
+    Intersight API client. The object state cache is created and attached to
+    the API client on first use, so that it is shared by every function and
+    class using the client.
+
+    Args:
+        api_client ("ApiClient"):
+            An ApiClient class instance which handles Intersight client-server
+            communication through the use of API keys.
+
+    Returns:
+        An IntersightObjectStateCache class instance.
+    """
+    with intersight_object_state_cache_creation_lock:
+        intersight_object_state_cache = getattr(api_client, "intersight_object_state_cache", None)
+        if intersight_object_state_cache is None:
+            intersight_object_state_cache = IntersightObjectStateCache(api_client)
+            api_client.intersight_object_state_cache = intersight_object_state_cache
+    return intersight_object_state_cache
+
+
+# Establish function to compare a provided attribute value with the live state of an Intersight object
+def intersight_attribute_matcher(provided_attribute_value,
+                                 existing_attribute_value
+                                 ):
+    """This is a function to determine whether a provided attribute value
+    already matches the attribute value of a pre-existing Intersight object.
+    Dictionaries are matched on the provided keys only, since Intersight
+    returns additional read-only attributes such as "ClassId" and "link" on
+    each object reference.
+
+    Args:
+        provided_attribute_value (any):
+            The provided attribute value.
+        existing_attribute_value (any):
+            The attribute value of the pre-existing Intersight object.
+
+    Returns:
+        A boolean indicating whether the provided attribute value matches.
+    """
+    if isinstance(provided_attribute_value, dict):
+        if not isinstance(existing_attribute_value, dict):
+            return False
+        return all(
+            intersight_attribute_matcher(provided_sub_value, existing_attribute_value.get(provided_sub_key))
+            for provided_sub_key, provided_sub_value in provided_attribute_value.items()
+            )
+    if isinstance(provided_attribute_value, list):
+        if not isinstance(existing_attribute_value, list) or len(provided_attribute_value) != len(existing_attribute_value):
+            return False
+        return all(
+            intersight_attribute_matcher(provided_item, existing_item)
+            for provided_item, existing_item in zip(provided_attribute_value, existing_attribute_value)
+            )
+    return provided_attribute_value == existing_attribute_value
+
+
+# Establish function to update a pre-existing Intersight object with only the changed attributes
+def intersight_object_updater(api_client,
+                              intersight_api_path,
+                              intersight_api_body,
+                              object_type="object",
+                              update_api_body_maker=None,
+                              existing_object_attributes=None
+                              ):
+    """This is a function to update a pre-existing Intersight object. The
+    provided Intersight API body is compared with the live state of the
+    Intersight object and a PATCH is performed with only the changed
+    attributes. No changes are made if the Intersight object already matches.
+
+    Args:
+        api_client ("ApiClient"):
+            An ApiClient class instance which handles Intersight client-server
+            communication through the use of API keys.
+        intersight_api_path (str):
+            The Intersight API path of the Intersight object.
+        intersight_api_body (dict):
+            The Intersight API body of the Intersight object.
+        object_type (str):
+            Optional; The type of Intersight object. The default value is
+            "object".
+        update_api_body_maker (function):
+            Optional; A function that receives the pre-existing Intersight
+            object and returns the Intersight API body to be compared, or
+            None if the pre-existing Intersight object must be updated
+            through a POST instead. The default value is None, which compares
+            the provided Intersight API body.
+        existing_object_attributes (list):
+            Optional; A list of additional attributes of the pre-existing
+            Intersight object that are needed by the update_api_body_maker
+            function. Only the attributes of the provided Intersight API body
+            and these attributes are retrieved. The default value is None.
+
+    If a state file is attached to the API client, Intersight objects with an
+    unchanged Intersight API body and modification time since the last run
+    are skipped without comparison.
+
+    Returns:
+        A string with a statement indicating whether the update was
+        successful or failed, using the same statements as the POST method.
+        If the Intersight object already matches and no update was made,
+        "The object is unchanged." is returned. If the Intersight object does
+        not already exist or must be updated through a POST, None is
+        returned. None is also returned if the Intersight API body has no
+        name or organization.
+    """
+    existing_intersight_object_name = intersight_api_body.get("Name")
+    organization_moid = (intersight_api_body.get("Organization") or {}).get("Moid")
+    if not existing_intersight_object_name or not organization_moid:
+        return None
+    intersight_object_state_cache = get_intersight_object_state_cache(api_client)
+    existing_intersight_object = intersight_object_state_cache.get(intersight_api_path,
+                                                                   organization_moid,
+                                                                   existing_intersight_object_name,
+                                                                   select_attributes=[*intersight_api_body, *(existing_object_attributes or [])]
+                                                                   )
+    if existing_intersight_object is None:
+        return None
+    intersight_object_state_file = getattr(api_client, "intersight_object_state_file", None)
+    if intersight_object_state_file and intersight_object_state_file.is_unchanged(intersight_api_path,
+                                                                                  organization_moid,
+                                                                                  existing_intersight_object_name,
+                                                                                  intersight_api_body,
+                                                                                  existing_intersight_object
+                                                                                  ):
+        print(f"The {object_type} named {existing_intersight_object_name} is "
+              "unchanged since the last run. No update is needed.")
+        return "The object is unchanged."
+    if update_api_body_maker:
+        update_api_body = update_api_body_maker(existing_intersight_object)
+        if update_api_body is None:
+            return None
+    else:
+        update_api_body = intersight_api_body
+    # Determine the attributes that differ from the pre-existing object
+    changed_attributes = {
+        attribute_name: attribute_value
+        for attribute_name, attribute_value in update_api_body.items()
+        if not intersight_attribute_matcher(attribute_value, existing_intersight_object.get(attribute_name))
+        }
+    print(f"The targeted {object_type} already exists.")
+    if not changed_attributes:
+        print(f"The pre-existing {existing_intersight_object_name} already "
+              "matches the provided configuration. No update is needed.")
+        if intersight_object_state_file:
+            intersight_object_state_file.set(intersight_api_path,
+                                             organization_moid,
+                                             existing_intersight_object_name,
+                                             intersight_api_body,
+                                             existing_intersight_object
+                                             )
+        return "The object is unchanged."
+    print("An attempt will be made to update the changed attributes of the "
+          f"pre-existing {existing_intersight_object_name}: "
+          f"{', '.join(changed_attributes)}...")
+    full_intersight_api_path_with_moid = f"/{intersight_api_path.split('?', 1)[0].strip('/')}/{existing_intersight_object['Moid']}"
+    try:
+        api_client.call_api(resource_path=full_intersight_api_path_with_moid,
+                            method="PATCH",
+                            body=changed_attributes,
+                            auth_settings=['cookieAuth', 'http_signature', 'oAuth2', 'oAuth2']
+                            )
+        # Use the modification time returned by Intersight for the updated object
+        updated_intersight_object = {**existing_intersight_object, **changed_attributes, "ModTime": None}
+        try:
+            updated_intersight_object["ModTime"] = json.loads(api_client.last_response.data).get("ModTime")
+        except Exception:
+            pass
+        intersight_object_state_cache.set(intersight_api_path,
+                                          organization_moid,
+                                          existing_intersight_object_name,
+                                          updated_intersight_object
+                                          )
+        if intersight_object_state_file:
+            intersight_object_state_file.set(intersight_api_path,
+                                             organization_moid,
+                                             existing_intersight_object_name,
+                                             intersight_api_body,
+                                             updated_intersight_object
+                                             )
+        print(f"The update of the {object_type} has completed.")
+        print(f"The pre-existing {existing_intersight_object_name} has been "
+              "updated.")
+        return "The POST method was successful."
+    except Exception:
+        print("\nA configuration error has occurred!\n")
+        print(f"Unable to update the {object_type} under the Intersight API "
+              f"resource path '{full_intersight_api_path_with_moid}'.\n")
+        print(f"The pre-existing {existing_intersight_object_name} could not "
+              "be updated.")
+        print("Exception Message: ")
+        traceback.print_exc()
+        return "The POST method failed."
 
 
 # Establish function to test for the availability of the Intersight API and Intersight account
@@ -919,6 +1892,8 @@ def test_intersight_api_service(intersight_api_key_id,
             sys.exit(0)
         else:
             intersight_account_name = iam_account["Results"][0]["Name"]
+            # Store the Intersight account context for reuse by later lookups
+            get_intersight_account_context(api_client).set_account(iam_account["Results"][0])
             print("The Intersight API and Account Availability Test has "
                   "passed.\n")
             print(f"The Intersight account named '{intersight_account_name}' "
@@ -935,6 +1910,260 @@ def test_intersight_api_service(intersight_api_key_id,
         sys.exit(0)
 
 
+# Establish function to add server-side query options to an Intersight API path
+def intersight_api_query_builder(intersight_api_path,
+                                 filter_attributes=None,
+                                 select_attributes=None
+                                 ):
+    """This is a function to add the $filter and $select query options to an
+    Intersight API path, so that matching of Intersight objects and trimming
+    of returned attributes is performed by Intersight rather than locally.
+    Any query options already present on the Intersight API path are kept and
+    an existing $filter is combined with the new filter expressions.
+
+    Args:
+        intersight_api_path (str):
+            The Intersight API path of the Intersight objects. The path can
+            include existing query options, for example
+            "compute/Blades?$top=1000".
+        filter_attributes (dict):
+            Optional; A dictionary containing the attribute keys and values
+            that the Intersight objects must match. String, number and boolean
+            values are matched with the "eq" operator. Dictionary values
+            containing a "Moid" key, such as object references, are matched on
+            the referenced MOID. Values of any other type are skipped and must
+            be matched locally. The default value is None.
+        select_attributes (list):
+            Optional; A list containing the attribute keys to be returned for
+            each Intersight object. The default value is None, which returns
+            all attributes.
+
+    Returns:
+        A string of the Intersight API path with the query options applied.
+    """
+    def filter_value_formatter(attribute_value):
+        """This is a function to format an attribute value for use in an
+        Intersight API $filter expression.
+
+        Args:
+            attribute_value (str, int, float, bool):
+                The attribute value to be formatted.
+
+        Returns:
+            A string of the formatted attribute value.
+        """
+        if isinstance(attribute_value, bool):
+            return str(attribute_value).lower()
+        if isinstance(attribute_value, (int, float)):
+            return str(attribute_value)
+        escaped_attribute_value = attribute_value.replace("'", "''")
+        return f"'{escaped_attribute_value}'"
+
+    # Separate the base Intersight API path from any existing query options
+    if "?" in intersight_api_path:
+        base_intersight_api_path, existing_query = intersight_api_path.split("?", 1)
+        query_options = existing_query.split("&")
+    else:
+        base_intersight_api_path = intersight_api_path
+        query_options = []
+    # Create the list of filter expressions
+    filter_expressions = []
+    if filter_attributes:
+        for attribute_name, attribute_value in filter_attributes.items():
+            if isinstance(attribute_value, (str, int, float, bool)):
+                filter_expressions.append(f"{attribute_name} eq {filter_value_formatter(attribute_value)}")
+            elif isinstance(attribute_value, dict) and attribute_value.get("Moid"):
+                filter_expressions.append(f"{attribute_name}.Moid eq {filter_value_formatter(attribute_value['Moid'])}")
+    # Combine the filter expressions with any existing $filter query option
+    if filter_expressions:
+        for query_option in query_options:
+            if query_option.startswith("$filter="):
+                query_options.remove(query_option)
+                existing_filter_expression = urllib.parse.unquote(query_option[len("$filter="):])
+                filter_expressions.insert(0, f"({existing_filter_expression})")
+                break
+        combined_filter_expression = " and ".join(filter_expressions)
+        query_options.append(f"$filter={urllib.parse.quote(combined_filter_expression, safe='')}")
+    # Replace any existing $select query option
+    if select_attributes:
+        query_options = [query_option for query_option in query_options if not query_option.startswith("$select=")]
+        unique_select_attributes = list(dict.fromkeys(select_attributes))
+        query_options.append(f"$select={','.join(unique_select_attributes)}")
+    if query_options:
+        return f"{base_intersight_api_path}?{'&'.join(query_options)}"
+    return base_intersight_api_path
+
+
+# Establish class to cache the MOIDs of Intersight API objects retrieved by name
+class IntersightMoidCache:
+    """This class is used to cache the MOIDs of Intersight objects that have
+    been retrieved by name for a specific Intersight API client.
+    """
+    def __init__(self,
+                 time_to_live=900
+                 ):
+        self.time_to_live = time_to_live
+        self.cached_moids = {}
+        self.lock = threading.Lock()
+
+    def __repr__(self):
+        return (
+            f"{self.__class__.__name__}"
+            f"({self.time_to_live})"
+            )
+
+    def __str__(self):
+        return (f"{self.__class__.__name__} class object with "
+                f"{len(self.cached_moids)} cached MOIDs")
+
+    @staticmethod
+    def _cache_key(intersight_api_path,
+                   organization,
+                   object_name
+                   ):
+        """This function creates the cache key for an Intersight object. Any
+        query parameters are removed from the Intersight API path, so that
+        lookups of the same object under varying queries share one entry.
+
+        Args:
+            intersight_api_path (str):
+                The Intersight API path of the Intersight object.
+            organization (str):
+                The Intersight organization of the Intersight object.
+            object_name (str):
+                The name of the Intersight object.
+
+        Returns:
+            A tuple containing the cache key for the Intersight object.
+        """
+        base_intersight_api_path = intersight_api_path.split("?", 1)[0].strip("/")
+        return (base_intersight_api_path, organization, object_name)
+
+    def get(self,
+            intersight_api_path,
+            organization,
+            object_name
+            ):
+        """This function retrieves a cached MOID for an Intersight object.
+
+        Args:
+            intersight_api_path (str):
+                The Intersight API path of the Intersight object.
+            organization (str):
+                The Intersight organization of the Intersight object.
+            object_name (str):
+                The name of the Intersight object.
+
+        Returns:
+            A string of the cached MOID for the provided Intersight object. If
+            the MOID has not been cached or has expired, None will be returned.
+        """
+        cache_key = self._cache_key(intersight_api_path,
+                                    organization,
+                                    object_name
+                                    )
+        with self.lock:
+            cached_entry = self.cached_moids.get(cache_key)
+            if cached_entry is None:
+                return None
+            cached_moid, expiration_time = cached_entry
+            if time.monotonic() >= expiration_time:
+                self.cached_moids.pop(cache_key, None)
+                return None
+            return cached_moid
+
+    def set(self,
+            intersight_api_path,
+            organization,
+            object_name,
+            object_moid
+            ):
+        """This function caches the MOID for an Intersight object.
+
+        Args:
+            intersight_api_path (str):
+                The Intersight API path of the Intersight object.
+            organization (str):
+                The Intersight organization of the Intersight object.
+            object_name (str):
+                The name of the Intersight object.
+            object_moid (str):
+                The MOID of the Intersight object.
+        """
+        cache_key = self._cache_key(intersight_api_path,
+                                    organization,
+                                    object_name
+                                    )
+        with self.lock:
+            self.cached_moids[cache_key] = (object_moid,
+                                            time.monotonic() + self.time_to_live
+                                            )
+
+    def invalidate(self,
+                   intersight_api_path,
+                   organization=None,
+                   object_name=None
+                   ):
+        """This function removes cached MOIDs for Intersight objects under an
+        Intersight API path. This should be performed whenever an Intersight
+        object under the path is created, updated or deleted.
+
+        Args:
+            intersight_api_path (str):
+                The Intersight API path of the Intersight objects.
+            organization (str):
+                Optional; The Intersight organization of the Intersight
+                objects. The default value is None, which matches every
+                organization.
+            object_name (str):
+                Optional; The name of the Intersight object. The default value
+                is None, which matches every object name.
+        """
+        base_intersight_api_path = self._cache_key(intersight_api_path,
+                                                   organization,
+                                                   object_name
+                                                   )[0]
+        with self.lock:
+            for cache_key in list(self.cached_moids):
+                if (
+                    cache_key[0] == base_intersight_api_path and
+                    organization in (None, cache_key[1]) and
+                    object_name in (None, cache_key[2])
+                    ):
+                    self.cached_moids.pop(cache_key)
+
+    def clear(self):
+        """This function removes all cached MOIDs.
+        """
+        with self.lock:
+            self.cached_moids.clear()
+
+
+# Establish function to retrieve the MOID cache of an Intersight API client
+intersight_moid_cache_creation_lock = threading.Lock()
+
+
+def get_intersight_moid_cache(api_client):
+    """This is a function to retrieve the MOID cache for an Intersight API
+    client. The MOID cache is created and attached to the API client on first
+    use, so that it is shared by every function and class using the client.
+
+    Args:
+        api_client ("ApiClient"):
+            An ApiClient class instance which handles Intersight client-server
+            communication through the use of API keys.
+
+    Returns:
+        An IntersightMoidCache class instance.
+    """
+    with intersight_moid_cache_creation_lock:
+        intersight_moid_cache = getattr(api_client, "intersight_moid_cache", None)
+        if intersight_moid_cache is None:
+            intersight_moid_cache = IntersightMoidCache()
+            api_client.intersight_moid_cache = intersight_moid_cache
+    return intersight_moid_cache
+
+
 # Establish function to retrieve the MOID of a specific Intersight API object by name
 def intersight_object_moid_retriever(intersight_api_key_id,
                                      intersight_api_key,
@@ -991,32 +2220,21 @@ def intersight_object_moid_retriever(intersight_api_key_id,
                                     )
     else:
         api_client = preconfigured_api_client
-    try:
-        # Retrieve the Intersight Account name
-        api_client.call_api(resource_path="/iam/Accounts",
-                            method="GET",
-                            auth_settings=['cookieAuth', 'http_signature', 'oAuth2', 'oAuth2']
-                            )
-        response = api_client.last_response.data
-        iam_account = json.loads(response)
-        if api_client.last_response.status != 200:
-            print("The provided Intersight account information could not be "
-                  "accessed.")
-            print("Exiting due to the Intersight account being unavailable.\n")
-            print("Please verify that the correct API Key ID and API Key have "
-                  "been entered, then re-attempt execution.\n")
-            sys.exit(0)
-        else:
-            intersight_account_name = iam_account["Results"][0]["Name"]
-    except Exception:
-        print("\nA configuration error has occurred!\n")
-        print("Unable to access the Intersight API.")
-        print("Exiting due to the Intersight API being unavailable.\n")
-        print("Please verify that the correct API Key ID and API Key have "
-              "been entered, then re-attempt execution.\n")
-        sys.exit(0)
+    # Check the MOID cache of the API client for the provided object
+    intersight_moid_cache = get_intersight_moid_cache(api_client)
+    cached_intersight_object_moid = intersight_moid_cache.get(intersight_api_path,
+                                                              organization,
+                                                              object_name
+                                                              )
+    if cached_intersight_object_moid:
+        return cached_intersight_object_moid
+    # Retrieve the Intersight account context of the API client
+    intersight_account_context = get_intersight_account_context(api_client)
     # Retrieving the provided object from Intersight...
-    full_intersight_api_path = f"/{intersight_api_path}"
+    filtered_intersight_api_path = intersight_api_query_builder(intersight_api_path,
+                                                                filter_attributes={"Name": object_name}
+                                                                )
+    full_intersight_api_path = f"/{filtered_intersight_api_path}"
     try:
         api_client.call_api(resource_path=full_intersight_api_path,
                             method="GET",
@@ -1038,49 +2256,208 @@ def intersight_object_moid_retriever(intersight_api_key_id,
         sys.exit(0)
 
     if intersight_objects.get("Results"):
+        # Resolve the MOID of the provided organization once, on first use
+        provided_organization_moid = None
         for intersight_object in intersight_objects.get("Results"):
             if intersight_object.get("Organization"):
-                provided_organization_moid = intersight_object_moid_retriever(intersight_api_key_id=None,
-                                                                              intersight_api_key=None,
-                                                                              object_name=organization,
-                                                                              intersight_api_path="organization/Organizations?$top=1000",
-                                                                              object_type="Organization",
-                                                                              preconfigured_api_client=api_client
-                                                                              )
+                if provided_organization_moid is None:
+                    provided_organization_moid = intersight_object_moid_retriever(intersight_api_key_id=None,
+                                                                                  intersight_api_key=None,
+                                                                                  object_name=organization,
+                                                                                  intersight_api_path="organization/Organizations?$top=1000",
+                                                                                  object_type="Organization",
+                                                                                  preconfigured_api_client=api_client
+                                                                                  )
                 if intersight_object.get("Organization", {}).get("Moid") == provided_organization_moid:
                     if intersight_object.get("Name") == object_name:
                         intersight_object_moid = intersight_object.get("Moid")
                         # The provided object and MOID has been identified and retrieved.
+                        intersight_moid_cache.set(intersight_api_path,
+                                                  organization,
+                                                  object_name,
+                                                  intersight_object_moid
+                                                  )
                         return intersight_object_moid
             else:
                 if intersight_object.get("Name") == object_name:
                     intersight_object_moid = intersight_object.get("Moid")
                     # The provided object and MOID has been identified and retrieved.
+                    intersight_moid_cache.set(intersight_api_path,
+                                              organization,
+                                              object_name,
+                                              intersight_object_moid
+                                              )
                     return intersight_object_moid
         else:
             print("\nA configuration error has occurred!\n")
-            print(f"The provided {object_type} named '{object_name}' was not "
-                  "found.")
-            print("Please check the Intersight Account named "
-                  f"{intersight_account_name}.")
-            print("Verify through the API or GUI that the needed "
-                  f"{object_type} is present.")
-            print(f"If the needed {object_type} is missing, please create it.")
-            print("Once the issue has been resolved, re-attempt execution.\n")
+            print(f"The provided {object_type} named '{object_name}' was not "
+                  "found.")
+            print("Please check the Intersight Account named "
+                  f"{intersight_account_context.get_account_name()}.")
+            print("Verify through the API or GUI that the needed "
+                  f"{object_type} is present.")
+            print(f"If the needed {object_type} is missing, please create it.")
+            print("Once the issue has been resolved, re-attempt execution.\n")
+            sys.exit(0)
+    else:
+        print("\nA configuration error has occurred!\n")
+        print(f"The provided {object_type} named '{object_name}' was not "
+              "found.")
+        print(f"No requested {object_type} instance is currently available in "
+              f"the Intersight account named {intersight_account_context.get_account_name()}.")
+        print("Please check the Intersight Account named "
+              f"{intersight_account_context.get_account_name()}.")
+        print(f"Verify through the API or GUI that the needed {object_type} "
+              "is present.")
+        print(f"If the needed {object_type} is missing, please create it.")
+        print("Once the issue has been resolved, re-attempt execution.\n")
+        sys.exit(0)
+
+
+# Establish function to retrieve all instances of a particular Intersight API object type one page at a time
+def get_intersight_object_pages(intersight_api_key_id,
+                                intersight_api_key,
+                                intersight_api_path,
+                                object_type="object",
+                                intersight_base_url="https://www.intersight.com/api/v1",
+                                preconfigured_api_client=None,
+                                filter_attributes=None,
+                                select_attributes=None,
+                                page_size=1000,
+                                count_preflight=False
+                                ):
+    """This is a generator function to perform paginated HTTP GETs on all
+    objects under an available Intersight API type. The objects are retrieved
+    using the $top and $skip query options and provided one page at a time,
+    so that large object types can be processed without holding every
+    object in memory.
+
+    Args:
+        intersight_api_key_id (str):
+            The ID of the Intersight API key.
+        intersight_api_key (str):
+            The system file path of the Intersight API key.
+        intersight_api_path (str):
+            The path to the targeted Intersight API object type. For example,
+            to specify the Intersight API type for adapter configuration
+            policies, enter "adapter/ConfigPolicies". Any $top or $skip query
+            options on the path are replaced by the pagination settings.
+        object_type (str):
+            Optional; The type of Intersight object. The default value is
+            "object".
+        intersight_base_url (str):
+            Optional; The base URL for Intersight API paths. The default value
+            is "https://www.intersight.com/api/v1". This value typically only
+            needs to be changed if using the Intersight Virtual Appliance.
+        preconfigured_api_client ("ApiClient"):
+            Optional; An ApiClient class instance which handles
+            Intersight client-server communication through the use of API keys.
+            The default value is None. If a preconfigured_api_client argument
+            is provided, empty strings ("") or None can be provided for the
+            intersight_api_key_id, intersight_api_key, and intersight_base_url
+            arguments.
+        filter_attributes (dict):
+            Optional; A dictionary containing the attribute keys and values
+            that the returned objects must match. The default value is None.
+        select_attributes (list):
+            Optional; A list containing the attribute keys to be returned for
+            each object. The default value is None.
+        page_size (int):
+            Optional; The number of objects to be retrieved per page. The
+            maximum accepted by Intersight is 1000. The default value is 1000.
+        count_preflight (bool):
+            Optional; The option to retrieve the total number of matching
+            objects with the $count query option before the pages are
+            retrieved, so that the exact number of pages is requested. The
+            default value is False.
+
+    Yields:
+        A list containing the objects of the specified API type for each
+        retrieved page.
+
+    Raises:
+        Exception:
+            An exception occurred due to an issue accessing the Intersight API
+            path. The status code or error message will be specified.
+    """
+    def paginated_api_path_maker(additional_query_options):
+        """This is a function to add query options to the filtered Intersight
+        API path, after removing any existing pagination query options.
+
+        Args:
+            additional_query_options (list):
+                A list of the query options to be added.
+
+        Returns:
+            A string of the Intersight API path with the query options added.
+        """
+        if "?" in filtered_intersight_api_path:
+            base_intersight_api_path, existing_query = filtered_intersight_api_path.split("?", 1)
+            query_options = [query_option for query_option in existing_query.split("&")
+                             if not query_option.startswith(("$top=", "$skip=", "$count="))]
+        else:
+            base_intersight_api_path = filtered_intersight_api_path
+            query_options = []
+        query_options.extend(additional_query_options)
+        return f"/{base_intersight_api_path}?{'&'.join(query_options)}"
+
+    def intersight_api_get(full_intersight_api_path):
+        """This is a function to perform an HTTP GET on an Intersight API path.
+
+        Args:
+            full_intersight_api_path (str):
+                The full Intersight API path to be retrieved.
+
+        Returns:
+            A dictionary containing the retrieved Intersight API response.
+        """
+        try:
+            api_client.call_api(resource_path=full_intersight_api_path,
+                                method="GET",
+                                auth_settings=['cookieAuth', 'http_signature', 'oAuth2', 'oAuth2']
+                                )
+            response = api_client.last_response.data
+            # The Intersight API resource path has been accessed successfully.
+            return json.loads(response)
+        except Exception:
+            print("\nA configuration error has occurred!\n")
+            print(f"There was an issue retrieving the requested {object_type} "
+                  "instances from Intersight.")
+            print("Unable to access the provided Intersight API resource path "
+                  f"'{intersight_api_path}'.")
+            print("Please review and resolve any error messages, then re-attempt "
+                  "execution.\n")
+            print("Exception Message: ")
+            traceback.print_exc()
             sys.exit(0)
+
+    # Define Intersight SDK ApiClient variable
+    if preconfigured_api_client is None:
+        api_client = get_api_client(api_key_id=intersight_api_key_id,
+                                    api_secret_file=intersight_api_key,
+                                    endpoint=intersight_base_url
+                                    )
     else:
-        print("\nA configuration error has occurred!\n")
-        print(f"The provided {object_type} named '{object_name}' was not "
-              "found.")
-        print(f"No requested {object_type} instance is currently available in "
-              f"the Intersight account named {intersight_account_name}.")
-        print("Please check the Intersight Account named "
-              f"{intersight_account_name}.")
-        print(f"Verify through the API or GUI that the needed {object_type} "
-              "is present.")
-        print(f"If the needed {object_type} is missing, please create it.")
-        print("Once the issue has been resolved, re-attempt execution.\n")
-        sys.exit(0)
+        api_client = preconfigured_api_client
+    filtered_intersight_api_path = intersight_api_query_builder(intersight_api_path,
+                                                                filter_attributes=filter_attributes,
+                                                                select_attributes=select_attributes
+                                                                )
+    # Retrieve the total number of matching objects, if requested
+    total_object_count = None
+    if count_preflight:
+        intersight_object_count = intersight_api_get(paginated_api_path_maker(["$count=true"]))
+        total_object_count = intersight_object_count.get("Count", 0)
+    # Retrieve the matching objects one page at a time
+    skip_count = 0
+    while total_object_count is None or skip_count < total_object_count:
+        intersight_objects_page = intersight_api_get(paginated_api_path_maker([f"$top={page_size}", f"$skip={skip_count}"]))
+        intersight_objects_page_results = intersight_objects_page.get("Results") or []
+        if intersight_objects_page_results:
+            yield intersight_objects_page_results
+        if len(intersight_objects_page_results) < page_size:
+            break
+        skip_count += page_size
 
 
 # Establish function to retrieve all instances of a particular Intersight API object type
@@ -1089,10 +2466,14 @@ def get_intersight_objects(intersight_api_key_id,
                            intersight_api_path,
                            object_type="object",
                            intersight_base_url="https://www.intersight.com/api/v1",
-                           preconfigured_api_client=None
+                           preconfigured_api_client=None,
+                           filter_attributes=None,
+                           select_attributes=None
                            ):
     """This is a function to perform an HTTP GET on all objects under an
-    available Intersight API type.
+    available Intersight API type. Every page of objects is retrieved, so the
+    results are not limited by the page size of a single request. To process
+    large object types one page at a time, use get_intersight_object_pages.
 
     Args:
         intersight_api_key_id (str):
@@ -1119,6 +2500,15 @@ def get_intersight_objects(intersight_api_key_id,
             is provided, empty strings ("") or None can be provided for the
             intersight_api_key_id, intersight_api_key, and intersight_base_url
             arguments.
+        filter_attributes (dict):
+            Optional; A dictionary containing the attribute keys and values
+            that the returned objects must match. The matching is performed
+            by Intersight through the $filter query option. The default value
+            is None.
+        select_attributes (list):
+            Optional; A list containing the attribute keys to be returned for
+            each object through the $select query option. The default value is
+            None, which returns all attributes.
 
     Returns:
         A dictionary containing all objects of the specified API type. If the
@@ -1129,36 +2519,23 @@ def get_intersight_objects(intersight_api_key_id,
             An exception occurred due to an issue accessing the Intersight API
             path. The status code or error message will be specified.
     """
-    # Define Intersight SDK ApiClient variable
-    if preconfigured_api_client is None:
-        api_client = get_api_client(api_key_id=intersight_api_key_id,
-                                    api_secret_file=intersight_api_key,
-                                    endpoint=intersight_base_url
-                                    )
-    else:
-        api_client = preconfigured_api_client
-    # Retrieving the provided object from Intersight...
-    full_intersight_api_path = f"/{intersight_api_path}"
-    try:
-        api_client.call_api(resource_path=full_intersight_api_path,
-                            method="GET",
-                            auth_settings=['cookieAuth', 'http_signature', 'oAuth2', 'oAuth2']
-                            )
-        response = api_client.last_response.data
-        intersight_objects = json.loads(response)
-        # The Intersight API resource path has been accessed successfully.
-        return intersight_objects
-    except Exception:
-        print("\nA configuration error has occurred!\n")
-        print(f"There was an issue retrieving the requested {object_type} "
-              "instances from Intersight.")
-        print("Unable to access the provided Intersight API resource path "
-              f"'{intersight_api_path}'.")
-        print("Please review and resolve any error messages, then re-attempt "
-              "execution.\n")
-        print("Exception Message: ")
-        traceback.print_exc()
-        sys.exit(0)
+    # Retrieve every page of matching objects from Intersight
+    intersight_objects_results = []
+    for intersight_objects_page_results in get_intersight_object_pages(intersight_api_key_id,
+                                                                       intersight_api_key,
+                                                                       intersight_api_path,
+                                                                       object_type=object_type,
+                                                                       intersight_base_url=intersight_base_url,
+                                                                       preconfigured_api_client=preconfigured_api_client,
+                                                                       filter_attributes=filter_attributes,
+                                                                       select_attributes=select_attributes
+                                                                       ):
+        intersight_objects_results.extend(intersight_objects_page_results)
+    intersight_objects = {
+        "ObjectType": "mo.List",
+        "Results": intersight_objects_results
+        }
+    return intersight_objects
 
 
 # Establish function to retrieve a particular instance of a particular Intersight API object type
@@ -1299,32 +2676,13 @@ def advanced_intersight_object_moid_retriever(intersight_api_key_id,
                                     )
     else:
         api_client = preconfigured_api_client
-    try:
-        # Retrieve the Intersight Account name
-        api_client.call_api(resource_path="/iam/Accounts",
-                            method="GET",
-                            auth_settings=['cookieAuth', 'http_signature', 'oAuth2', 'oAuth2']
-                            )
-        response = api_client.last_response.data
-        iam_account = json.loads(response)
-        if api_client.last_response.status != 200:
-            print("The provided Intersight account information could not be "
-                  "accessed.")
-            print("Exiting due to the Intersight account being unavailable.\n")
-            print("Please verify that the correct API Key ID and API Key have "
-                  "been entered, then re-attempt execution.\n")
-            sys.exit(0)
-        else:
-            intersight_account_name = iam_account["Results"][0]["Name"]
-    except Exception:
-        print("\nA configuration error has occurred!\n")
-        print("Unable to access the Intersight API.")
-        print("Exiting due to the Intersight API being unavailable.\n")
-        print("Please verify that the correct API Key ID and API Key have "
-              "been entered, then re-attempt execution.\n")
-        sys.exit(0)
+    # Retrieve the Intersight account context of the API client
+    intersight_account_context = get_intersight_account_context(api_client)
     # Retrieving the provided object from Intersight...
-    full_intersight_api_path = f"/{intersight_api_path}"
+    filtered_intersight_api_path = intersight_api_query_builder(intersight_api_path,
+                                                                filter_attributes=object_attributes
+                                                                )
+    full_intersight_api_path = f"/{filtered_intersight_api_path}"
     try:
         api_client.call_api(resource_path=full_intersight_api_path,
                             method="GET",
@@ -1346,15 +2704,18 @@ def advanced_intersight_object_moid_retriever(intersight_api_key_id,
         sys.exit(0)
 
     if intersight_objects.get("Results"):
+        # Resolve the MOID of the provided organization once, on first use
+        provided_organization_moid = None
         for intersight_object in intersight_objects.get("Results"):
             if intersight_object.get("Organization"):
-                provided_organization_moid = intersight_object_moid_retriever(intersight_api_key_id=None,
-                                                                              intersight_api_key=None,
-                                                                              object_name=organization,
-                                                                              intersight_api_path="organization/Organizations?$top=1000",
-                                                                              object_type="Organization",
-                                                                              preconfigured_api_client=api_client
-                                                                              )
+                if provided_organization_moid is None:
+                    provided_organization_moid = intersight_object_moid_retriever(intersight_api_key_id=None,
+                                                                                  intersight_api_key=None,
+                                                                                  object_name=organization,
+                                                                                  intersight_api_path="organization/Organizations?$top=1000",
+                                                                                  object_type="Organization",
+                                                                                  preconfigured_api_client=api_client
+                                                                                  )
                 if intersight_object.get("Organization", {}).get("Moid") == provided_organization_moid:
                     for object_attribute in object_attributes:
                         try:
@@ -1383,7 +2744,7 @@ def advanced_intersight_object_moid_retriever(intersight_api_key_id,
             print("\nA configuration error has occurred!\n")
             print(f"The provided {object_type} was not found.")
             print("Please check the Intersight Account named "
-                  f"{intersight_account_name}.")
+                  f"{intersight_account_context.get_account_name()}.")
             print("Verify through the API or GUI that the needed "
                   f"{object_type} is present.")
             print(f"If the needed {object_type} is missing, please create it.")
@@ -1393,9 +2754,9 @@ def advanced_intersight_object_moid_retriever(intersight_api_key_id,
         print("\nA configuration error has occurred!\n")
         print(f"The provided {object_type} was not found.")
         print(f"No requested {object_type} instance is currently available in "
-              f"the Intersight account named {intersight_account_name}.")
+              f"the Intersight account named {intersight_account_context.get_account_name()}.")
         print("Please check the Intersight Account named "
-              f"{intersight_account_name}.")
+              f"{intersight_account_context.get_account_name()}.")
         print(f"Verify through the API or GUI that the needed {object_type} "
               "is present.")
         print(f"If the needed {object_type} is missing, please create it.")
@@ -1464,32 +2825,17 @@ def intersight_object_backup(intersight_api_key_id,
                                     )
     else:
         api_client = preconfigured_api_client
-    try:
-        # Retrieve the Intersight Account name
-        api_client.call_api(resource_path="/iam/Accounts",
-                            method="GET",
-                            auth_settings=['cookieAuth', 'http_signature', 'oAuth2', 'oAuth2']
-                            )
-        response = api_client.last_response.data
-        iam_account = json.loads(response)
-        if api_client.last_response.status != 200:
-            print("The provided Intersight account information could not be "
-                  "accessed.")
-            print("Exiting due to the Intersight account being unavailable.\n")
-            print("Please verify that the correct API Key ID and API Key have "
-                  "been entered, then re-attempt execution.\n")
-            sys.exit(0)
-        else:
-            intersight_account_name = iam_account["Results"][0]["Name"]
-    except Exception:
-        print("\nA configuration error has occurred!\n")
-        print("Unable to access the Intersight API.")
-        print("Exiting due to the Intersight API being unavailable.\n")
-        print("Please verify that the correct API Key ID and API Key have "
-              "been entered, then re-attempt execution.\n")
-        sys.exit(0)
+    # Retrieve the Intersight account context of the API client
+    intersight_account_context = get_intersight_account_context(api_client)
     # Retrieving the provided object from Intersight...
-    full_intersight_api_path = f"/{intersight_api_path}"
+    selected_attributes = [*object_attributes, *backup_attribute_list, "Moid"]
+    if organization:
+        selected_attributes.append("Organization")
+    filtered_intersight_api_path = intersight_api_query_builder(intersight_api_path,
+                                                                filter_attributes=object_attributes,
+                                                                select_attributes=selected_attributes
+                                                                )
+    full_intersight_api_path = f"/{filtered_intersight_api_path}"
     try:
         api_client.call_api(resource_path=full_intersight_api_path,
                             method="GET",
@@ -1512,15 +2858,18 @@ def intersight_object_backup(intersight_api_key_id,
     
     if intersight_objects.get("Results"):
         if organization:
+            # Resolve the MOID of the provided organization once, on first use
+            provided_organization_moid = None
             for intersight_object in intersight_objects.get("Results"):
                 if intersight_object.get("Organization"):
-                    provided_organization_moid = intersight_object_moid_retriever(intersight_api_key_id=None,
-                                                                                  intersight_api_key=None,
-                                                                                  object_name=organization,
-                                                                                  intersight_api_path="organization/Organizations?$top=1000",
-                                                                                  object_type="Organization",
-                                                                                  preconfigured_api_client=api_client
-                                                                                  )
+                    if provided_organization_moid is None:
+                        provided_organization_moid = intersight_object_moid_retriever(intersight_api_key_id=None,
+                                                                                      intersight_api_key=None,
+                                                                                      object_name=organization,
+                                                                                      intersight_api_path="organization/Organizations?$top=1000",
+                                                                                      object_type="Organization",
+                                                                                      preconfigured_api_client=api_client
+                                                                                      )
                     if intersight_object.get("Organization", {}).get("Moid") == provided_organization_moid:
                         for object_attribute in object_attributes:
                             try:
@@ -1557,7 +2906,7 @@ def intersight_object_backup(intersight_api_key_id,
                 print("\nA configuration error has occurred!\n")
                 print(f"The provided {object_type} was not found.")
                 print("Please check the Intersight Account named "
-                      f"{intersight_account_name}.")
+                      f"{intersight_account_context.get_account_name()}.")
                 print("Verify through the API or GUI that the needed "
                       f"{object_type} is present.")
                 print(f"If the needed {object_type} is missing, please create it.")
@@ -1584,7 +2933,7 @@ def intersight_object_backup(intersight_api_key_id,
                 print("\nA configuration error has occurred!\n")
                 print(f"The provided {object_type} was not found.")
                 print("Please check the Intersight Account named "
-                      f"{intersight_account_name}.")
+                      f"{intersight_account_context.get_account_name()}.")
                 print("Verify through the API or GUI that the needed "
                       f"{object_type} is present.")
                 print(f"If the needed {object_type} is missing, please create it.")
@@ -1594,9 +2943,9 @@ def intersight_object_backup(intersight_api_key_id,
         print("\nA configuration error has occurred!\n")
         print(f"The provided {object_type} was not found.")
         print(f"No requested {object_type} instance is currently available in "
-              f"the Intersight account named {intersight_account_name}.")
+              f"the Intersight account named {intersight_account_context.get_account_name()}.")
         print("Please check the Intersight Account named "
-              f"{intersight_account_name}.")
+              f"{intersight_account_context.get_account_name()}.")
         print(f"Verify through the API or GUI that the needed {object_type} "
               "is present.")
         print(f"If the needed {object_type} is missing, please create it.")
@@ -1676,12 +3025,24 @@ class UcsPolicy:
                 The status code or error message will be specified.
         """
         full_intersight_api_path = f"/{self.intersight_api_path}"
+        # Compare the provided configuration with any pre-existing object and update only the changed attributes
+        intersight_object_update_status = intersight_object_updater(api_client=self.api_client,
+                                                                    intersight_api_path=self.intersight_api_path,
+                                                                    intersight_api_body=self.intersight_api_body,
+                                                                    object_type=self.object_type
+                                                                    )
+        if intersight_object_update_status is not None:
+            return intersight_object_update_status
         try:
             self.api_client.call_api(resource_path=full_intersight_api_path,
                                      method="POST",
                                      body=self.intersight_api_body,
                                      auth_settings=['cookieAuth', 'http_signature', 'oAuth2', 'oAuth2']
                                      )
+            # Invalidate any cached MOID for the newly configured object
+            get_intersight_moid_cache(self.api_client).invalidate(self.intersight_api_path,
+                                                                   object_name=self.intersight_api_body.get("Name")
+                                                                   )
             print(f"The configuration of the base {self.object_type} "
                   "has completed.")
             return "The POST method was successful."
@@ -1984,7 +3345,11 @@ class UcsPolicy:
 
     def object_maker(self):
         """This function makes the targeted policy object.
-        """           
+
+        Returns:
+            A string with a statement indicating whether the POST method
+            was successful or failed.
+        """
         print(f"\nConfiguring the {self.object_type} named "
               f"{self.policy_name}...")
         # Update the API body with general attributes
@@ -1994,7 +3359,7 @@ class UcsPolicy:
         # Update the API body with individual mapped object attributes
         self._update_api_body_mapped_object_attributes()
         # POST the API body to Intersight
-        self._post_intersight_object()
+        return self._post_intersight_object()
 
 
 class DirectlyAttachedUcsDomainPolicy(UcsPolicy):
@@ -2128,7 +3493,11 @@ class DirectlyAttachedUcsDomainPolicy(UcsPolicy):
 
     def object_maker(self):
         """This function makes the targeted policy object.
-        """           
+
+        Returns:
+            A string with a statement indicating whether the POST method
+            was successful or failed.
+        """
         print(f"\nConfiguring the {self.object_type} named "
               f"{self.policy_name}...")
         # Update the API body with general attributes
@@ -2140,7 +3509,7 @@ class DirectlyAttachedUcsDomainPolicy(UcsPolicy):
         # Update the API body with a UCS Domain Profile attached, if specified
         self._attach_ucs_domain_profile()
         # POST the API body to Intersight
-        self._post_intersight_object()
+        return self._post_intersight_object()
 
 
 class DirectlyAttachedUcsServerPolicy(UcsPolicy):
@@ -2216,7 +3585,11 @@ class DirectlyAttachedUcsServerPolicy(UcsPolicy):
 
     def object_maker(self):
         """This function makes the targeted policy object.
-        """           
+
+        Returns:
+            A string with a statement indicating whether the POST method
+            was successful or failed.
+        """
         print(f"\nConfiguring the {self.object_type} named "
               f"{self.policy_name}...")
         # Update the API body with general attributes
@@ -2228,7 +3601,7 @@ class DirectlyAttachedUcsServerPolicy(UcsPolicy):
         # Update the API body with a UCS Server Profile attached, if specified
         self._attach_ucs_server_profile()
         # POST the API body to Intersight
-        self._post_intersight_object()
+        return self._post_intersight_object()
 
 
 class DirectlyAttachedUcsChassisPolicy(UcsPolicy):
@@ -2304,7 +3677,11 @@ class DirectlyAttachedUcsChassisPolicy(UcsPolicy):
 
     def object_maker(self):
         """This function makes the targeted policy object.
-        """           
+
+        Returns:
+            A string with a statement indicating whether the POST method
+            was successful or failed.
+        """
         print(f"\nConfiguring the {self.object_type} named "
               f"{self.policy_name}...")
         # Update the API body with general attributes
@@ -2316,7 +3693,7 @@ class DirectlyAttachedUcsChassisPolicy(UcsPolicy):
         # Update the API body with a UCS Chassis Profile attached, if specified
         self._attach_ucs_chassis_profile()
         # POST the API body to Intersight
-        self._post_intersight_object()
+        return self._post_intersight_object()
 
 
 class DirectlyAttachedUcsServerAndChassisPolicy(UcsPolicy):
@@ -2415,7 +3792,11 @@ class DirectlyAttachedUcsServerAndChassisPolicy(UcsPolicy):
 
     def object_maker(self):
         """This function makes the targeted policy object.
-        """           
+
+        Returns:
+            A string with a statement indicating whether the POST method
+            was successful or failed.
+        """
         print(f"\nConfiguring the {self.object_type} named "
               f"{self.policy_name}...")
         # Update the API body with general attributes
@@ -2427,7 +3808,7 @@ class DirectlyAttachedUcsServerAndChassisPolicy(UcsPolicy):
         # Update the API body with a UCS Server and/or UCS Chassis Profile attached, if specified
         self._attach_ucs_server_and_chassis_profiles()
         # POST the API body to Intersight
-        self._post_intersight_object()
+        return self._post_intersight_object()
 
 
 class DirectlyAttachedUcsServerChassisAndDomainPolicy(UcsPolicy):
@@ -2607,7 +3988,11 @@ class DirectlyAttachedUcsServerChassisAndDomainPolicy(UcsPolicy):
 
     def object_maker(self):
         """This function makes the targeted policy object.
-        """           
+
+        Returns:
+            A string with a statement indicating whether the POST method
+            was successful or failed.
+        """
         print(f"\nConfiguring the {self.object_type} named "
               f"{self.policy_name}...")
         # Update the API body with general attributes
@@ -2619,7 +4004,7 @@ class DirectlyAttachedUcsServerChassisAndDomainPolicy(UcsPolicy):
         # Update the API body with a UCS Server, UCS Chassis and/or UCS Domain Profile attached, if specified
         self._attach_ucs_server_chassis_and_domain_profiles()
         # POST the API body to Intersight
-        self._post_intersight_object()
+        return self._post_intersight_object()
 
 
 # Establish classes and functions to make BIOS Policy
@@ -2673,7 +4058,11 @@ class BiosPolicy(DirectlyAttachedUcsServerPolicy):
 
     def object_maker(self):
         """This function makes the targeted policy object.
-        """           
+
+        Returns:
+            A string with a statement indicating whether the POST method
+            was successful or failed.
+        """
         print(f"\nConfiguring the {self.object_type} named "
               f"{self.policy_name}...")
         # Update the API body with general attributes
@@ -2699,7 +4088,7 @@ class BiosPolicy(DirectlyAttachedUcsServerPolicy):
         # Update the API body with a UCS Server Profile attached, if specified
         self._attach_ucs_server_profile()
         # POST the API body to Intersight
-        self._post_intersight_object()
+        return self._post_intersight_object()
 
 
 def bios_policy_maker(intersight_api_key_id,
@@ -2755,6 +4144,10 @@ def bios_policy_maker(intersight_api_key_id,
         ucs_server_profile_name (str):
             Optional; The UCS Server Profile the policy should be attached to.
             The default value is an empty string ("").
+
+    Returns:
+        A string with a statement indicating whether the POST method
+        was successful or failed.
     """
     def builder(target_object):
         """This is a function used to build the objects that are components of
@@ -2764,13 +4157,17 @@ def bios_policy_maker(intersight_api_key_id,
             target_object (class):
                 The class representing the object to be built on Intersight.
 
+        Returns:
+            A string with a statement indicating whether the POST method
+            was successful or failed.
+
         Raises:
             Exception:
                 An exception occurred due to an issue accessing the Intersight
                 API path. The status code or error message will be specified.
         """
         try:
-            target_object.object_maker()
+            return target_object.object_maker()
         except Exception:
             print("\nA configuration error has occurred!\n")
             print("The builder function failed to configure the "
@@ -2779,9 +4176,10 @@ def bios_policy_maker(intersight_api_key_id,
                   f"{target_object.object_type} settings.\n")
             print("Exception Message: ")
             traceback.print_exc()
+            return "The POST method failed."
 
     # Define and create BIOS Policy object in Intersight
-    builder(BiosPolicy(intersight_api_key_id=intersight_api_key_id,
+    return builder(BiosPolicy(intersight_api_key_id=intersight_api_key_id,
                        intersight_api_key=intersight_api_key,
                        policy_name=policy_name,
                        policy_description=policy_description,
@@ -3257,7 +4655,11 @@ class BootOrderPolicy(DirectlyAttachedUcsServerPolicy):
 
     def object_maker(self):
         """This function makes the targeted policy object.
-        """           
+
+        Returns:
+            A string with a statement indicating whether the POST method
+            was successful or failed.
+        """
         print(f"\nConfiguring the {self.object_type} named "
               f"{self.policy_name}...")
         # Update the API body with general attributes
@@ -3271,7 +4673,7 @@ class BootOrderPolicy(DirectlyAttachedUcsServerPolicy):
         # Update the API body with a UCS Server Profile attached, if specified
         self._attach_ucs_server_profile()
         # POST the API body to Intersight
-        self._post_intersight_object()
+        return self._post_intersight_object()
 
 
 def boot_order_policy_maker(intersight_api_key_id,
@@ -3341,6 +4743,10 @@ def boot_order_policy_maker(intersight_api_key_id,
         ucs_server_profile_name (str):
             Optional; The UCS Server Profile the policy should be attached to.
             The default value is an empty string ("").
+
+    Returns:
+        A string with a statement indicating whether the POST method
+        was successful or failed.
     """
     def builder(target_object):
         """This is a function used to build the objects that are components of
@@ -3350,13 +4756,17 @@ def boot_order_policy_maker(intersight_api_key_id,
             target_object (class):
                 The class representing the object to be built on Intersight.
 
+        Returns:
+            A string with a statement indicating whether the POST method
+            was successful or failed.
+
         Raises:
             Exception:
                 An exception occurred due to an issue accessing the Intersight
                 API path. The status code or error message will be specified.
         """
         try:
-            target_object.object_maker()
+            return target_object.object_maker()
         except Exception:
             print("\nA configuration error has occurred!\n")
             print("The builder function failed to configure the "
@@ -3365,9 +4775,10 @@ def boot_order_policy_maker(intersight_api_key_id,
                   f"{target_object.object_type} settings.\n")
             print("Exception Message: ")
             traceback.print_exc()
+            return "The POST method failed."
 
     # Define and create Boot Order Policy object in Intersight
-    builder(BootOrderPolicy(intersight_api_key_id=intersight_api_key_id,
+    return builder(BootOrderPolicy(intersight_api_key_id=intersight_api_key_id,
                             intersight_api_key=intersight_api_key,
                             policy_name=policy_name,
                             policy_description=policy_description,
@@ -3483,7 +4894,11 @@ class CertMgmtPolicy(DirectlyAttachedUcsServerPolicy):
     
     def object_maker(self):
         """This function makes the targeted policy object.
-        """           
+
+        Returns:
+            A string with a statement indicating whether the POST method
+            was successful or failed.
+        """
         print(f"\nConfiguring the {self.object_type} named "
               f"{self.policy_name}...")
         # Update the API body with general attributes
@@ -3513,7 +4928,7 @@ class CertMgmtPolicy(DirectlyAttachedUcsServerPolicy):
             ]
         
         # POST the API body to Intersight
-        self._post_intersight_object()
+        return self._post_intersight_object()
 
 
 def cert_mgmt_policy_maker(intersight_api_key_id,
@@ -3572,6 +4987,10 @@ def cert_mgmt_policy_maker(intersight_api_key_id,
         ucs_server_profile_name (str):
             Optional; The UCS Server Profile the policy should be attached to.
             The default value is an empty string ("").
+
+    Returns:
+        A string with a statement indicating whether the POST method
+        was successful or failed.
     """
     def builder(target_object):
         """This is a function used to build the objects that are components of
@@ -3581,13 +5000,17 @@ def cert_mgmt_policy_maker(intersight_api_key_id,
             target_object (class):
                 The class representing the object to be built on Intersight.
 
+        Returns:
+            A string with a statement indicating whether the POST method
+            was successful or failed.
+
         Raises:
             Exception:
                 An exception occurred due to an issue accessing the Intersight
                 API path. The status code or error message will be specified.
         """
         try:
-            target_object.object_maker()
+            return target_object.object_maker()
         except Exception:
             print("\nA configuration error has occurred!\n")
             print("The builder function failed to configure the "
@@ -3596,9 +5019,10 @@ def cert_mgmt_policy_maker(intersight_api_key_id,
                   f"{target_object.object_type} settings.\n")
             print("Exception Message: ")
             traceback.print_exc()
+            return "The POST method failed."
 
     # Define and create Certificate Management Policy object in Intersight
-    builder(
+    return builder(
         CertMgmtPolicy(
             intersight_api_key_id=intersight_api_key_id,
             intersight_api_key=intersight_api_key,
@@ -3772,7 +5196,11 @@ class EthernetAdapterPolicy(UcsPolicy):
 
     def object_maker(self):
         """This function makes the targeted policy object.
-        """           
+
+        Returns:
+            A string with a statement indicating whether the POST method
+            was successful or failed.
+        """
         print(f"\nConfiguring the {self.object_type} named "
               f"{self.policy_name}...")
         # Update the API body with general attributes
@@ -3932,7 +5360,7 @@ class EthernetAdapterPolicy(UcsPolicy):
             # Update the API body with the user provided Ethernet Adapter Configuration settings
             self.intersight_api_body.update(ethernet_adapter_user_configuration_settings)
         # POST the API body to Intersight
-        self._post_intersight_object()
+        return self._post_intersight_object()
 
 
 def ethernet_adapter_policy_maker(
@@ -4130,6 +5558,10 @@ def ethernet_adapter_policy_maker(
             is provided, empty strings ("") or None can be provided for the
             intersight_api_key_id, intersight_api_key, and intersight_base_url
             arguments.
+
+    Returns:
+        A string with a statement indicating whether the POST method
+        was successful or failed.
     """
     def builder(target_object):
         """This is a function used to build the objects that are components of
@@ -4139,13 +5571,17 @@ def ethernet_adapter_policy_maker(
             target_object (class):
                 The class representing the object to be built on Intersight.
 
+        Returns:
+            A string with a statement indicating whether the POST method
+            was successful or failed.
+
         Raises:
             Exception:
                 An exception occurred due to an issue accessing the Intersight
                 API path. The status code or error message will be specified.
         """
         try:
-            target_object.object_maker()
+            return target_object.object_maker()
         except Exception:
             print("\nA configuration error has occurred!\n")
             print("The builder function failed to configure the "
@@ -4154,9 +5590,10 @@ def ethernet_adapter_policy_maker(
                   f"{target_object.object_type} settings.\n")
             print("Exception Message: ")
             traceback.print_exc()
+            return "The POST method failed."
 
     # Define and create Ethernet Adapter Policy object in Intersight
-    builder(
+    return builder(
         EthernetAdapterPolicy(
             intersight_api_key_id=intersight_api_key_id,
             intersight_api_key=intersight_api_key,
@@ -4385,6 +5822,10 @@ def ethernet_network_control_policy_maker(intersight_api_key_id,
             is provided, empty strings ("") or None can be provided for the
             intersight_api_key_id, intersight_api_key, and intersight_base_url
             arguments.
+
+    Returns:
+        A string with a statement indicating whether the POST method
+        was successful or failed.
     """
     def builder(target_object):
         """This is a function used to build the objects that are components of
@@ -4394,13 +5835,17 @@ def ethernet_network_control_policy_maker(intersight_api_key_id,
             target_object (class):
                 The class representing the object to be built on Intersight.
 
+        Returns:
+            A string with a statement indicating whether the POST method
+            was successful or failed.
+
         Raises:
             Exception:
                 An exception occurred due to an issue accessing the Intersight
                 API path. The status code or error message will be specified.
         """
         try:
-            target_object.object_maker()
+            return target_object.object_maker()
         except Exception:
             print("\nA configuration error has occurred!\n")
             print("The builder function failed to configure the "
@@ -4409,9 +5854,10 @@ def ethernet_network_control_policy_maker(intersight_api_key_id,
                   f"{target_object.object_type} settings.\n")
             print("Exception Message: ")
             traceback.print_exc()
+            return "The POST method failed."
 
     # Define and create Ethernet Network Control Policy object in Intersight
-    builder(EthernetNetworkControlPolicy(intersight_api_key_id=intersight_api_key_id,
+    return builder(EthernetNetworkControlPolicy(intersight_api_key_id=intersight_api_key_id,
                                          intersight_api_key=intersight_api_key,
                                          policy_name=policy_name,
                                          policy_description=policy_description,
@@ -4534,6 +5980,10 @@ def ethernet_network_group_policy_maker(intersight_api_key_id,
             is provided, empty strings ("") or None can be provided for the
             intersight_api_key_id, intersight_api_key, and intersight_base_url
             arguments.
+
+    Returns:
+        A string with a statement indicating whether the POST method
+        was successful or failed.
     """
 
     def builder(target_object):
@@ -4544,13 +5994,17 @@ def ethernet_network_group_policy_maker(intersight_api_key_id,
             target_object (class):
                 The class representing the object to be built on Intersight.
 
+        Returns:
+            A string with a statement indicating whether the POST method
+            was successful or failed.
+
         Raises:
             Exception:
                 An exception occurred due to an issue accessing the Intersight
                 API path. The status code or error message will be specified.
         """
         try:
-            target_object.object_maker()
+            return target_object.object_maker()
         except Exception:
             print("\nA configuration error has occurred!\n")
             print("The builder function failed to configure the "
@@ -4559,9 +6013,10 @@ def ethernet_network_group_policy_maker(intersight_api_key_id,
                   f"{target_object.object_type} settings.\n")
             print("Exception Message: ")
             traceback.print_exc()
+            return "The POST method failed."
 
     # Define and create Ethernet Network Group Policy object in Intersight
-    builder(EthernetNetworkGroupPolicy(intersight_api_key_id=intersight_api_key_id,
+    return builder(EthernetNetworkGroupPolicy(intersight_api_key_id=intersight_api_key_id,
                                        intersight_api_key=intersight_api_key,
                                        policy_name=policy_name,
                                        policy_description=policy_description,
@@ -4695,6 +6150,10 @@ def ethernet_qos_policy_maker(intersight_api_key_id,
             is provided, empty strings ("") or None can be provided for the
             intersight_api_key_id, intersight_api_key, and intersight_base_url
             arguments.
+
+    Returns:
+        A string with a statement indicating whether the POST method
+        was successful or failed.
     """
     def builder(target_object):
         """This is a function used to build the objects that are components of
@@ -4704,13 +6163,17 @@ def ethernet_qos_policy_maker(intersight_api_key_id,
             target_object (class):
                 The class representing the object to be built on Intersight.
 
+        Returns:
+            A string with a statement indicating whether the POST method
+            was successful or failed.
+
         Raises:
             Exception:
                 An exception occurred due to an issue accessing the Intersight
                 API path. The status code or error message will be specified.
         """
         try:
-            target_object.object_maker()
+            return target_object.object_maker()
         except Exception:
             print("\nA configuration error has occurred!\n")
             print("The builder function failed to configure the "
@@ -4719,9 +6182,10 @@ def ethernet_qos_policy_maker(intersight_api_key_id,
                   f"{target_object.object_type} settings.\n")
             print("Exception Message: ")
             traceback.print_exc()
+            return "The POST method failed."
 
     # Define and create Ethernet QoS Policy object in Intersight
-    builder(EthernetQosPolicy(intersight_api_key_id=intersight_api_key_id,
+    return builder(EthernetQosPolicy(intersight_api_key_id=intersight_api_key_id,
                               intersight_api_key=intersight_api_key,
                               policy_name=policy_name,
                               policy_description=policy_description,
@@ -4841,7 +6305,11 @@ class FibreChannelAdapterPolicy(UcsPolicy):
 
     def object_maker(self):
         """This function makes the targeted policy object.
-        """           
+
+        Returns:
+            A string with a statement indicating whether the POST method
+            was successful or failed.
+        """
         print(f"\nConfiguring the {self.object_type} named "
               f"{self.policy_name}...")
         # Update the API body with general attributes
@@ -4933,7 +6401,7 @@ class FibreChannelAdapterPolicy(UcsPolicy):
             # Update the API body with the user provided Fibre Channel Adapter Configuration settings
             self.intersight_api_body.update(fibre_channel_adapter_user_configuration_settings)
         # POST the API body to Intersight
-        self._post_intersight_object()
+        return self._post_intersight_object()
 
 
 def fibre_channel_adapter_policy_maker(
@@ -5076,6 +6544,10 @@ def fibre_channel_adapter_policy_maker(
             is provided, empty strings ("") or None can be provided for the
             intersight_api_key_id, intersight_api_key, and intersight_base_url
             arguments.
+
+    Returns:
+        A string with a statement indicating whether the POST method
+        was successful or failed.
     """
     def builder(target_object):
         """This is a function used to build the objects that are components of
@@ -5085,13 +6557,17 @@ def fibre_channel_adapter_policy_maker(
             target_object (class):
                 The class representing the object to be built on Intersight.
 
+        Returns:
+            A string with a statement indicating whether the POST method
+            was successful or failed.
+
         Raises:
             Exception:
                 An exception occurred due to an issue accessing the Intersight
                 API path. The status code or error message will be specified.
         """
         try:
-            target_object.object_maker()
+            return target_object.object_maker()
         except Exception:
             print("\nA configuration error has occurred!\n")
             print("The builder function failed to configure the "
@@ -5100,9 +6576,10 @@ def fibre_channel_adapter_policy_maker(
                   f"{target_object.object_type} settings.\n")
             print("Exception Message: ")
             traceback.print_exc()
+            return "The POST method failed."
 
     # Define and create Fibre Channel Adapter Policy object in Intersight
-    builder(
+    return builder(
         FibreChannelAdapterPolicy(
             intersight_api_key_id=intersight_api_key_id,
             intersight_api_key=intersight_api_key,
@@ -5236,6 +6713,10 @@ def fibre_channel_network_policy_maker(intersight_api_key_id,
             is provided, empty strings ("") or None can be provided for the
             intersight_api_key_id, intersight_api_key, and intersight_base_url
             arguments.
+
+    Returns:
+        A string with a statement indicating whether the POST method
+        was successful or failed.
     """
     def builder(target_object):
         """This is a function used to build the objects that are components of
@@ -5245,13 +6726,17 @@ def fibre_channel_network_policy_maker(intersight_api_key_id,
             target_object (class):
                 The class representing the object to be built on Intersight.
 
+        Returns:
+            A string with a statement indicating whether the POST method
+            was successful or failed.
+
         Raises:
             Exception:
                 An exception occurred due to an issue accessing the Intersight
                 API path. The status code or error message will be specified.
         """
         try:
-            target_object.object_maker()
+            return target_object.object_maker()
         except Exception:
             print("\nA configuration error has occurred!\n")
             print("The builder function failed to configure the "
@@ -5260,9 +6745,10 @@ def fibre_channel_network_policy_maker(intersight_api_key_id,
                   f"{target_object.object_type} settings.\n")
             print("Exception Message: ")
             traceback.print_exc()
+            return "The POST method failed."
 
     # Define and create Fibre Channel Network Policy object in Intersight
-    builder(FibreChannelNetworkPolicy(intersight_api_key_id=intersight_api_key_id,
+    return builder(FibreChannelNetworkPolicy(intersight_api_key_id=intersight_api_key_id,
                                       intersight_api_key=intersight_api_key,
                                       policy_name=policy_name,
                                       policy_description=policy_description,
@@ -5392,6 +6878,10 @@ def fibre_channel_qos_policy_maker(intersight_api_key_id,
             is provided, empty strings ("") or None can be provided for the
             intersight_api_key_id, intersight_api_key, and intersight_base_url
             arguments.
+
+    Returns:
+        A string with a statement indicating whether the POST method
+        was successful or failed.
     """
     def builder(target_object):
         """This is a function used to build the objects that are components of
@@ -5401,13 +6891,17 @@ def fibre_channel_qos_policy_maker(intersight_api_key_id,
             target_object (class):
                 The class representing the object to be built on Intersight.
 
+        Returns:
+            A string with a statement indicating whether the POST method
+            was successful or failed.
+
         Raises:
             Exception:
                 An exception occurred due to an issue accessing the Intersight
                 API path. The status code or error message will be specified.
         """
         try:
-            target_object.object_maker()
+            return target_object.object_maker()
         except Exception:
             print("\nA configuration error has occurred!\n")
             print("The builder function failed to configure the "
@@ -5416,9 +6910,10 @@ def fibre_channel_qos_policy_maker(intersight_api_key_id,
                   f"{target_object.object_type} settings.\n")
             print("Exception Message: ")
             traceback.print_exc()
+            return "The POST method failed."
 
     # Define and create Fibre Channel QoS Policy object in Intersight
-    builder(FibreChannelQosPolicy(intersight_api_key_id=intersight_api_key_id,
+    return builder(FibreChannelQosPolicy(intersight_api_key_id=intersight_api_key_id,
                                   intersight_api_key=intersight_api_key,
                                   policy_name=policy_name,
                                   policy_description=policy_description,
@@ -5556,6 +7051,10 @@ def flow_control_policy_maker(intersight_api_key_id,
             is provided, empty strings ("") or None can be provided for the
             intersight_api_key_id, intersight_api_key, and intersight_base_url
             arguments.
+
+    Returns:
+        A string with a statement indicating whether the POST method
+        was successful or failed.
     """
     def builder(target_object):
         """This is a function used to build the objects that are components of
@@ -5565,13 +7064,17 @@ def flow_control_policy_maker(intersight_api_key_id,
             target_object (class):
                 The class representing the object to be built on Intersight.
 
+        Returns:
+            A string with a statement indicating whether the POST method
+            was successful or failed.
+
         Raises:
             Exception:
                 An exception occurred due to an issue accessing the Intersight
                 API path. The status code or error message will be specified.
         """
         try:
-            target_object.object_maker()
+            return target_object.object_maker()
         except Exception:
             print("\nA configuration error has occurred!\n")
             print("The builder function failed to configure the "
@@ -5580,9 +7083,10 @@ def flow_control_policy_maker(intersight_api_key_id,
                   f"{target_object.object_type} settings.\n")
             print("Exception Message: ")
             traceback.print_exc()
+            return "The POST method failed."
 
     # Define and create Flow Control Policy object in Intersight
-    builder(FlowControlPolicy(intersight_api_key_id=intersight_api_key_id,
+    return builder(FlowControlPolicy(intersight_api_key_id=intersight_api_key_id,
                               intersight_api_key=intersight_api_key,
                               policy_name=policy_name,
                               policy_description=policy_description,
@@ -5713,6 +7217,10 @@ def ipmi_over_lan_policy_maker(
         ucs_server_profile_name (str):
             Optional; The UCS Server Profile the policy should be attached to.
             The default value is an empty string ("").
+
+    Returns:
+        A string with a statement indicating whether the POST method
+        was successful or failed.
     """
     def builder(target_object):
         """This is a function used to build the objects that are components of
@@ -5722,13 +7230,17 @@ def ipmi_over_lan_policy_maker(
             target_object (class):
                 The class representing the object to be built on Intersight.
 
+        Returns:
+            A string with a statement indicating whether the POST method
+            was successful or failed.
+
         Raises:
             Exception:
                 An exception occurred due to an issue accessing the Intersight
                 API path. The status code or error message will be specified.
         """
         try:
-            target_object.object_maker()
+            return target_object.object_maker()
         except Exception:
             print("\nA configuration error has occurred!\n")
             print("The builder function failed to configure the "
@@ -5737,9 +7249,10 @@ def ipmi_over_lan_policy_maker(
                   f"{target_object.object_type} settings.\n")
             print("Exception Message: ")
             traceback.print_exc()
+            return "The POST method failed."
 
     # Define and create IPMI Over LAN Policy object in Intersight
-    builder(
+    return builder(
         IpmiOverLanPolicy(
             intersight_api_key_id=intersight_api_key_id,
             intersight_api_key=intersight_api_key,
@@ -5866,6 +7379,10 @@ def iscsi_adapter_policy_maker(intersight_api_key_id,
             is provided, empty strings ("") or None can be provided for the
             intersight_api_key_id, intersight_api_key, and intersight_base_url
             arguments.
+
+    Returns:
+        A string with a statement indicating whether the POST method
+        was successful or failed.
     """
     def builder(target_object):
         """This is a function used to build the objects that are components of
@@ -5875,13 +7392,17 @@ def iscsi_adapter_policy_maker(intersight_api_key_id,
             target_object (class):
                 The class representing the object to be built on Intersight.
 
+        Returns:
+            A string with a statement indicating whether the POST method
+            was successful or failed.
+
         Raises:
             Exception:
                 An exception occurred due to an issue accessing the Intersight
                 API path. The status code or error message will be specified.
         """
         try:
-            target_object.object_maker()
+            return target_object.object_maker()
         except Exception:
             print("\nA configuration error has occurred!\n")
             print("The builder function failed to configure the "
@@ -5890,9 +7411,10 @@ def iscsi_adapter_policy_maker(intersight_api_key_id,
                   f"{target_object.object_type} settings.\n")
             print("Exception Message: ")
             traceback.print_exc()
+            return "The POST method failed."
 
     # Define and create iSCSI Adapter Policy object in Intersight
-    builder(
+    return builder(
         IscsiAdapterPolicy(
             intersight_api_key_id=intersight_api_key_id,
             intersight_api_key=intersight_api_key,
@@ -6023,6 +7545,10 @@ def link_aggregation_policy_maker(intersight_api_key_id,
             is provided, empty strings ("") or None can be provided for the
             intersight_api_key_id, intersight_api_key, and intersight_base_url
             arguments.
+
+    Returns:
+        A string with a statement indicating whether the POST method
+        was successful or failed.
     """
     def builder(target_object):
         """This is a function used to build the objects that are components of
@@ -6032,13 +7558,17 @@ def link_aggregation_policy_maker(intersight_api_key_id,
             target_object (class):
                 The class representing the object to be built on Intersight.
 
+        Returns:
+            A string with a statement indicating whether the POST method
+            was successful or failed.
+
         Raises:
             Exception:
                 An exception occurred due to an issue accessing the Intersight
                 API path. The status code or error message will be specified.
         """
         try:
-            target_object.object_maker()
+            return target_object.object_maker()
         except Exception:
             print("\nA configuration error has occurred!\n")
             print("The builder function failed to configure the "
@@ -6047,9 +7577,10 @@ def link_aggregation_policy_maker(intersight_api_key_id,
                   f"{target_object.object_type} settings.\n")
             print("Exception Message: ")
             traceback.print_exc()
+            return "The POST method failed."
 
     # Define and create Link Aggregation Policy object in Intersight
-    builder(LinkAggregationPolicy(intersight_api_key_id=intersight_api_key_id,
+    return builder(LinkAggregationPolicy(intersight_api_key_id=intersight_api_key_id,
                                   intersight_api_key=intersight_api_key,
                                   policy_name=policy_name,
                                   policy_description=policy_description,
@@ -6110,7 +7641,11 @@ class LinkControlPolicy(UcsPolicy):
 
     def object_maker(self):
         """This function makes the targeted policy object.
-        """           
+
+        Returns:
+            A string with a statement indicating whether the POST method
+            was successful or failed.
+        """
         print(f"\nConfiguring the {self.object_type} named "
               f"{self.policy_name}...")
         # Reformat the provided Link Control Mode value to lowercase format for back-end Intersight API compatibility
@@ -6142,7 +7677,7 @@ class LinkControlPolicy(UcsPolicy):
         # Update the API body with individual mapped object attributes
         self._update_api_body_mapped_object_attributes()
         # POST the API body to Intersight
-        self._post_intersight_object()
+        return self._post_intersight_object()
 
 
 def link_control_policy_maker(intersight_api_key_id,
@@ -6194,6 +7729,10 @@ def link_control_policy_maker(intersight_api_key_id,
             is provided, empty strings ("") or None can be provided for the
             intersight_api_key_id, intersight_api_key, and intersight_base_url
             arguments.
+
+    Returns:
+        A string with a statement indicating whether the POST method
+        was successful or failed.
     """
     def builder(target_object):
         """This is a function used to build the objects that are components of
@@ -6203,13 +7742,17 @@ def link_control_policy_maker(intersight_api_key_id,
             target_object (class):
                 The class representing the object to be built on Intersight.
 
+        Returns:
+            A string with a statement indicating whether the POST method
+            was successful or failed.
+
         Raises:
             Exception:
                 An exception occurred due to an issue accessing the Intersight
                 API path. The status code or error message will be specified.
         """
         try:
-            target_object.object_maker()
+            return target_object.object_maker()
         except Exception:
             print("\nA configuration error has occurred!\n")
             print("The builder function failed to configure the "
@@ -6218,9 +7761,10 @@ def link_control_policy_maker(intersight_api_key_id,
                   f"{target_object.object_type} settings.\n")
             print("Exception Message: ")
             traceback.print_exc()
+            return "The POST method failed."
 
     # Define and create Link Control Policy object in Intersight
-    builder(LinkControlPolicy(intersight_api_key_id=intersight_api_key_id,
+    return builder(LinkControlPolicy(intersight_api_key_id=intersight_api_key_id,
                               intersight_api_key=intersight_api_key,
                               policy_name=policy_name,
                               policy_description=policy_description,
@@ -6565,7 +8109,12 @@ class LocalUser:
 
     def object_maker(self):
         """This function makes the targeted policy object.
+
+        Returns:
+            A string with a statement indicating whether the POST method
+            was successful or failed.
         """
+        local_user_post_status = "The POST method was successful."
         # Check for Local User object attributes that may need configuration
         if self.local_users_list:
             # Retrieve the Intersight Organization MOID
@@ -6595,10 +8144,12 @@ class LocalUser:
                 staged_local_user_dictionary.pop("Password", None)
                 # Create new Local User object in Intersight
                 current_local_user_name = staged_local_user_dictionary.get("Name")
-                self._post_intersight_local_user(
+                if self._post_intersight_local_user(
                     local_user_name=current_local_user_name,
                     body=staged_local_user_dictionary
-                    )
+                    ) != "The POST method was successful.":
+                    local_user_post_status = "The POST method failed."
+        return local_user_post_status
 
 
 class LocalUserRole(LocalUser):
@@ -6788,7 +8339,12 @@ class LocalUserRole(LocalUser):
 
     def object_maker(self):
         """This function makes the targeted policy object.
-        """        
+
+        Returns:
+            A string with a statement indicating whether the POST method
+            was successful or failed.
+        """
+        local_user_role_post_status = "The POST method was successful."
         # Check for Local User object attributes that may need configuration
         if self.local_users_list:
             # Verify a Local User Policy name has been provided
@@ -6852,10 +8408,12 @@ class LocalUserRole(LocalUser):
                 staged_local_user_dictionary.pop("Username", None)
                 staged_local_user_dictionary.pop("Name", None)
                 # Create new Local User Role object in Intersight
-                self._post_intersight_local_user_role(
+                if self._post_intersight_local_user_role(
                     local_user_name=current_local_user_name,
                     body=staged_local_user_dictionary
-                    )
+                    ) != "The POST method was successful.":
+                    local_user_role_post_status = "The POST method failed."
+        return local_user_role_post_status
 
 
 def local_user_policy_maker(intersight_api_key_id,
@@ -6954,6 +8512,10 @@ def local_user_policy_maker(intersight_api_key_id,
         ucs_server_profile_name (str):
             Optional; The UCS Server Profile the policy should be attached to.
             The default value is an empty string ("").
+
+    Returns:
+        A string with a statement indicating whether the POST method
+        was successful or failed.
     """
     def builder(target_object):
         """This is a function used to build the objects that are components of
@@ -6963,13 +8525,17 @@ def local_user_policy_maker(intersight_api_key_id,
             target_object (class):
                 The class representing the object to be built on Intersight.
 
+        Returns:
+            A string with a statement indicating whether the POST method
+            was successful or failed.
+
         Raises:
             Exception:
                 An exception occurred due to an issue accessing the Intersight
                 API path. The status code or error message will be specified.
         """
         try:
-            target_object.object_maker()
+            return target_object.object_maker()
         except Exception:
             print("\nA configuration error has occurred!\n")
             print("The builder function failed to configure the "
@@ -6978,9 +8544,10 @@ def local_user_policy_maker(intersight_api_key_id,
                   f"{target_object.object_type} settings.\n")
             print("Exception Message: ")
             traceback.print_exc()
+            return "The POST method failed."
 
     # Define and create Local User Policy object in Intersight
-    builder(
+    local_user_policy_post_status = builder(
         LocalUserPolicy(
             intersight_api_key_id=intersight_api_key_id,
             intersight_api_key=intersight_api_key,
@@ -7001,7 +8568,7 @@ def local_user_policy_maker(intersight_api_key_id,
             ))
 
     # Define and create Local User object in Intersight
-    builder(
+    local_user_post_status = builder(
         LocalUser(
             intersight_api_key_id=intersight_api_key_id,
             intersight_api_key=intersight_api_key,
@@ -7012,7 +8579,7 @@ def local_user_policy_maker(intersight_api_key_id,
             ))
 
     # Define and create Local User Role object in Intersight
-    builder(
+    local_user_role_post_status = builder(
         LocalUserRole(
             intersight_api_key_id=intersight_api_key_id,
             intersight_api_key=intersight_api_key,
@@ -7022,6 +8589,12 @@ def local_user_policy_maker(intersight_api_key_id,
             local_users_list=local_users_list,
             policy_name=policy_name
             ))
+    if "The POST method failed." in (local_user_policy_post_status,
+                                     local_user_post_status,
+                                     local_user_role_post_status
+                                     ):
+        return "The POST method failed."
+    return "The POST method was successful."
 
 
 # Establish classes and functions to make Multicast Policy
@@ -7141,6 +8714,10 @@ def multicast_policy_maker(intersight_api_key_id,
             is provided, empty strings ("") or None can be provided for the
             intersight_api_key_id, intersight_api_key, and intersight_base_url
             arguments.
+
+    Returns:
+        A string with a statement indicating whether the POST method
+        was successful or failed.
     """
     def builder(target_object):
         """This is a function used to build the objects that are components of
@@ -7150,13 +8727,17 @@ def multicast_policy_maker(intersight_api_key_id,
             target_object (class):
                 The class representing the object to be built on Intersight.
 
+        Returns:
+            A string with a statement indicating whether the POST method
+            was successful or failed.
+
         Raises:
             Exception:
                 An exception occurred due to an issue accessing the Intersight
                 API path. The status code or error message will be specified.
         """
         try:
-            target_object.object_maker()
+            return target_object.object_maker()
         except Exception:
             print("\nA configuration error has occurred!\n")
             print("The builder function failed to configure the "
@@ -7165,9 +8746,10 @@ def multicast_policy_maker(intersight_api_key_id,
                   f"{target_object.object_type} settings.\n")
             print("Exception Message: ")
             traceback.print_exc()
+            return "The POST method failed."
 
     # Define and create Multicast Policy object in Intersight
-    builder(MulticastPolicy(intersight_api_key_id=intersight_api_key_id,
+    return builder(MulticastPolicy(intersight_api_key_id=intersight_api_key_id,
                             intersight_api_key=intersight_api_key,
                             policy_name=policy_name,
                             policy_description=policy_description,
@@ -7347,6 +8929,10 @@ def network_connectivity_policy_maker(intersight_api_key_id,
         ucs_domain_profile_name (str):
             Optional; The UCS Domain Profile the policy should be attached to.
             The default value is an empty string ("").
+
+    Returns:
+        A string with a statement indicating whether the POST method
+        was successful or failed.
     """
     def builder(target_object):
         """This is a function used to build the objects that are components of
@@ -7356,13 +8942,17 @@ def network_connectivity_policy_maker(intersight_api_key_id,
             target_object (class):
                 The class representing the object to be built on Intersight.
 
+        Returns:
+            A string with a statement indicating whether the POST method
+            was successful or failed.
+
         Raises:
             Exception:
                 An exception occurred due to an issue accessing the Intersight
                 API path. The status code or error message will be specified.
         """
         try:
-            target_object.object_maker()
+            return target_object.object_maker()
         except Exception:
             print("\nA configuration error has occurred!\n")
             print("The builder function failed to configure the "
@@ -7371,9 +8961,10 @@ def network_connectivity_policy_maker(intersight_api_key_id,
                   f"{target_object.object_type} settings.\n")
             print("Exception Message: ")
             traceback.print_exc()
+            return "The POST method failed."
 
     # Define and create Network Connectivity Policy object in Intersight
-    builder(NetworkConnectivityPolicy(intersight_api_key_id=intersight_api_key_id,
+    return builder(NetworkConnectivityPolicy(intersight_api_key_id=intersight_api_key_id,
                                       intersight_api_key=intersight_api_key,
                                       policy_name=policy_name,
                                       policy_description=policy_description,
@@ -7515,6 +9106,10 @@ def ntp_policy_maker(intersight_api_key_id,
         ucs_domain_profile_name (str):
             Optional; The UCS Domain Profile the policy should be attached to.
             The default value is an empty string ("").
+
+    Returns:
+        A string with a statement indicating whether the POST method
+        was successful or failed.
     """
     def builder(target_object):
         """This is a function used to build the objects that are components of
@@ -7524,13 +9119,17 @@ def ntp_policy_maker(intersight_api_key_id,
             target_object (class):
                 The class representing the object to be built on Intersight.
 
+        Returns:
+            A string with a statement indicating whether the POST method
+            was successful or failed.
+
         Raises:
             Exception:
                 An exception occurred due to an issue accessing the Intersight
                 API path. The status code or error message will be specified.
         """
         try:
-            target_object.object_maker()
+            return target_object.object_maker()
         except Exception:
             print("\nA configuration error has occurred!\n")
             print("The builder function failed to configure the "
@@ -7539,9 +9138,10 @@ def ntp_policy_maker(intersight_api_key_id,
                   f"{target_object.object_type} settings.\n")
             print("Exception Message: ")
             traceback.print_exc()
+            return "The POST method failed."
 
     # Define and create NTP Policy object in Intersight
-    builder(NtpPolicy(intersight_api_key_id=intersight_api_key_id,
+    return builder(NtpPolicy(intersight_api_key_id=intersight_api_key_id,
                       intersight_api_key=intersight_api_key,
                       policy_name=policy_name,
                       policy_description=policy_description,
@@ -7813,6 +9413,10 @@ def power_policy_maker(
         ucs_chassis_profile_name (str):
             Optional; The UCS Chassis Profile the policy should be attached to.
             The default value is an empty string ("").
+
+    Returns:
+        A string with a statement indicating whether the POST method
+        was successful or failed.
     """
     def builder(target_object):
         """This is a function used to build the objects that are components of
@@ -7822,13 +9426,17 @@ def power_policy_maker(
             target_object (class):
                 The class representing the object to be built on Intersight.
 
+        Returns:
+            A string with a statement indicating whether the POST method
+            was successful or failed.
+
         Raises:
             Exception:
                 An exception occurred due to an issue accessing the Intersight
                 API path. The status code or error message will be specified.
         """
         try:
-            target_object.object_maker()
+            return target_object.object_maker()
         except Exception:
             print("\nA configuration error has occurred!\n")
             print("The builder function failed to configure the "
@@ -7837,9 +9445,10 @@ def power_policy_maker(
                   f"{target_object.object_type} settings.\n")
             print("Exception Message: ")
             traceback.print_exc()
+            return "The POST method failed."
 
     # Define and create Power Policy object in Intersight
-    builder(
+    return builder(
         PowerPolicy(
             intersight_api_key_id=intersight_api_key_id,
             intersight_api_key=intersight_api_key,
@@ -7986,6 +9595,10 @@ def serial_over_lan_policy_maker(
         ucs_server_profile_name (str):
             Optional; The UCS Server Profile the policy should be attached to.
             The default value is an empty string ("").
+
+    Returns:
+        A string with a statement indicating whether the POST method
+        was successful or failed.
     """
     def builder(target_object):
         """This is a function used to build the objects that are components of
@@ -7995,13 +9608,17 @@ def serial_over_lan_policy_maker(
             target_object (class):
                 The class representing the object to be built on Intersight.
 
+        Returns:
+            A string with a statement indicating whether the POST method
+            was successful or failed.
+
         Raises:
             Exception:
                 An exception occurred due to an issue accessing the Intersight
                 API path. The status code or error message will be specified.
         """
         try:
-            target_object.object_maker()
+            return target_object.object_maker()
         except Exception:
             print("\nA configuration error has occurred!\n")
             print("The builder function failed to configure the "
@@ -8010,9 +9627,10 @@ def serial_over_lan_policy_maker(
                   f"{target_object.object_type} settings.\n")
             print("Exception Message: ")
             traceback.print_exc()
+            return "The POST method failed."
 
     # Define and create Serial Over LAN Policy object in Intersight
-    builder(
+    return builder(
         SerialOverLanPolicy(
             intersight_api_key_id=intersight_api_key_id,
             intersight_api_key=intersight_api_key,
@@ -8452,6 +10070,10 @@ def snmp_policy_maker(intersight_api_key_id,
         ucs_domain_profile_name (str):
             Optional; The UCS Domain Profile the policy should be attached to.
             The default value is an empty string ("").
+
+    Returns:
+        A string with a statement indicating whether the POST method
+        was successful or failed.
     """
     def builder(target_object):
         """This is a function used to build the objects that are components of
@@ -8461,13 +10083,17 @@ def snmp_policy_maker(intersight_api_key_id,
             target_object (class):
                 The class representing the object to be built on Intersight.
 
+        Returns:
+            A string with a statement indicating whether the POST method
+            was successful or failed.
+
         Raises:
             Exception:
                 An exception occurred due to an issue accessing the Intersight
                 API path. The status code or error message will be specified.
         """
         try:
-            target_object.object_maker()
+            return target_object.object_maker()
         except Exception:
             print("\nA configuration error has occurred!\n")
             print("The builder function failed to configure the "
@@ -8476,9 +10102,10 @@ def snmp_policy_maker(intersight_api_key_id,
                   f"{target_object.object_type} settings.\n")
             print("Exception Message: ")
             traceback.print_exc()
+            return "The POST method failed."
 
     # Define and create SNMP Policy object in Intersight
-    builder(
+    return builder(
         SnmpPolicy(
             intersight_api_key_id=intersight_api_key_id,
             intersight_api_key=intersight_api_key,
@@ -8576,7 +10203,11 @@ class SwitchControlPolicy(DirectlyAttachedUcsDomainPolicy):
 
     def object_maker(self):
         """This function makes the targeted policy object.
-        """           
+
+        Returns:
+            A string with a statement indicating whether the POST method
+            was successful or failed.
+        """
         print(f"\nConfiguring the {self.object_type} named "
               f"{self.policy_name}...")
         # Reformat the provided Link Control Recovery Action value to lowercase format for back-end Intersight API compatibility
@@ -8609,7 +10240,7 @@ class SwitchControlPolicy(DirectlyAttachedUcsDomainPolicy):
         # Update the API body with a UCS Domain Profile attached, if specified
         self._attach_ucs_domain_profile()
         # POST the API body to Intersight
-        self._post_intersight_object()
+        return self._post_intersight_object()
 
 
 def switch_control_policy_maker(intersight_api_key_id,
@@ -8685,6 +10316,10 @@ def switch_control_policy_maker(intersight_api_key_id,
         ucs_domain_profile_name (str):
             Optional; The UCS Domain Profile the policy should be attached to.
             The default value is an empty string ("").
+
+    Returns:
+        A string with a statement indicating whether the POST method
+        was successful or failed.
     """
     def builder(target_object):
         """This is a function used to build the objects that are components of
@@ -8694,13 +10329,17 @@ def switch_control_policy_maker(intersight_api_key_id,
             target_object (class):
                 The class representing the object to be built on Intersight.
 
+        Returns:
+            A string with a statement indicating whether the POST method
+            was successful or failed.
+
         Raises:
             Exception:
                 An exception occurred due to an issue accessing the Intersight
                 API path. The status code or error message will be specified.
         """
         try:
-            target_object.object_maker()
+            return target_object.object_maker()
         except Exception:
             print("\nA configuration error has occurred!\n")
             print("The builder function failed to configure the "
@@ -8709,9 +10348,10 @@ def switch_control_policy_maker(intersight_api_key_id,
                   f"{target_object.object_type} settings.\n")
             print("Exception Message: ")
             traceback.print_exc()
+            return "The POST method failed."
 
     # Define and create Switch Control Policy object in Intersight
-    builder(SwitchControlPolicy(intersight_api_key_id=intersight_api_key_id,
+    return builder(SwitchControlPolicy(intersight_api_key_id=intersight_api_key_id,
                                 intersight_api_key=intersight_api_key,
                                 policy_name=policy_name,
                                 policy_description=policy_description,
@@ -8988,6 +10628,10 @@ def syslog_policy_maker(intersight_api_key_id,
         ucs_domain_profile_name (str):
             Optional; The UCS Domain Profile the policy should be attached to.
             The default value is an empty string ("").
+
+    Returns:
+        A string with a statement indicating whether the POST method
+        was successful or failed.
     """
     def builder(target_object):
         """This is a function used to build the objects that are components of
@@ -8997,13 +10641,17 @@ def syslog_policy_maker(intersight_api_key_id,
             target_object (class):
                 The class representing the object to be built on Intersight.
 
+        Returns:
+            A string with a statement indicating whether the POST method
+            was successful or failed.
+
         Raises:
             Exception:
                 An exception occurred due to an issue accessing the Intersight
                 API path. The status code or error message will be specified.
         """
         try:
-            target_object.object_maker()
+            return target_object.object_maker()
         except Exception:
             print("\nA configuration error has occurred!\n")
             print("The builder function failed to configure the "
@@ -9012,9 +10660,10 @@ def syslog_policy_maker(intersight_api_key_id,
                   f"{target_object.object_type} settings.\n")
             print("Exception Message: ")
             traceback.print_exc()
+            return "The POST method failed."
 
     # Define and create Syslog Policy object in Intersight
-    builder(SyslogPolicy(intersight_api_key_id=intersight_api_key_id,
+    return builder(SyslogPolicy(intersight_api_key_id=intersight_api_key_id,
                          intersight_api_key=intersight_api_key,
                          policy_name=policy_name,
                          policy_description=policy_description,
@@ -9080,7 +10729,11 @@ class SystemQosPolicy(DirectlyAttachedUcsDomainPolicy):
 
     def object_maker(self):
         """This function makes the targeted policy object.
-        """           
+
+        Returns:
+            A string with a statement indicating whether the POST method
+            was successful or failed.
+        """
         print(f"\nConfiguring the {self.object_type} named "
               f"{self.policy_name}...")
         # Update the API body with general attributes
@@ -9090,13 +10743,15 @@ class SystemQosPolicy(DirectlyAttachedUcsDomainPolicy):
         # Update the API body with a UCS Domain Profile attached, if specified
         self._attach_ucs_domain_profile()
         # POST the API body to Intersight
-        self._post_intersight_object()
+        system_qos_policy_post_status = self._post_intersight_object()
+        if system_qos_policy_post_status not in ("The POST method was successful.", "The object is unchanged."):
+            return system_qos_policy_post_status
         # Update the API body with the QoS Class Settings (NOTE - As of 7/27/21, QoS Class Settings cannot be set until after a base System QoS Policy is created)
         if self.qos_class_settings_list:
             print("Updating the QoS classes of the System QoS Policy...")
             self.intersight_api_body["Classes"] = self.qos_class_settings_list
         # POST the API body to Intersight
-        self._post_intersight_object()
+        return self._post_intersight_object()
 
 
 def system_qos_policy_maker(intersight_api_key_id,
@@ -9188,6 +10843,10 @@ def system_qos_policy_maker(intersight_api_key_id,
         ucs_domain_profile_name (str):
             Optional; The UCS Domain Profile the policy should be attached to.
             The default value is an empty string ("").
+
+    Returns:
+        A string with a statement indicating whether the POST method
+        was successful or failed.
     """
     def builder(target_object):
         """This is a function used to build the objects that are components of
@@ -9197,13 +10856,17 @@ def system_qos_policy_maker(intersight_api_key_id,
             target_object (class):
                 The class representing the object to be built on Intersight.
 
+        Returns:
+            A string with a statement indicating whether the POST method
+            was successful or failed.
+
         Raises:
             Exception:
                 An exception occurred due to an issue accessing the Intersight
                 API path. The status code or error message will be specified.
         """
         try:
-            target_object.object_maker()
+            return target_object.object_maker()
         except Exception:
             print("\nA configuration error has occurred!\n")
             print("The builder function failed to configure the "
@@ -9212,9 +10875,10 @@ def system_qos_policy_maker(intersight_api_key_id,
                   f"{target_object.object_type} settings.\n")
             print("Exception Message: ")
             traceback.print_exc()
+            return "The POST method failed."
 
     # Define and create System QoS Policy object in Intersight
-    builder(SystemQosPolicy(intersight_api_key_id=intersight_api_key_id,
+    return builder(SystemQosPolicy(intersight_api_key_id=intersight_api_key_id,
                             intersight_api_key=intersight_api_key,
                             policy_name=policy_name,
                             policy_description=policy_description,
@@ -9349,6 +11013,10 @@ def thermal_policy_maker(
         ucs_chassis_profile_name (str):
             Optional; The UCS Chassis Profile the policy should be attached to.
             The default value is an empty string ("").
+
+    Returns:
+        A string with a statement indicating whether the POST method
+        was successful or failed.
     """
     def builder(target_object):
         """This is a function used to build the objects that are components of
@@ -9358,13 +11026,17 @@ def thermal_policy_maker(
             target_object (class):
                 The class representing the object to be built on Intersight.
 
+        Returns:
+            A string with a statement indicating whether the POST method
+            was successful or failed.
+
         Raises:
             Exception:
                 An exception occurred due to an issue accessing the Intersight
                 API path. The status code or error message will be specified.
         """
         try:
-            target_object.object_maker()
+            return target_object.object_maker()
         except Exception:
             print("\nA configuration error has occurred!\n")
             print("The builder function failed to configure the "
@@ -9373,9 +11045,10 @@ def thermal_policy_maker(
                   f"{target_object.object_type} settings.\n")
             print("Exception Message: ")
             traceback.print_exc()
+            return "The POST method failed."
 
     # Define and create Thermal Policy object in Intersight
-    builder(
+    return builder(
         ThermalPolicy(
             intersight_api_key_id=intersight_api_key_id,
             intersight_api_key=intersight_api_key,
@@ -9520,6 +11193,10 @@ def virtual_kvm_policy_maker(intersight_api_key_id,
         ucs_server_profile_name (str):
             Optional; The UCS Server Profile the policy should be attached to.
             The default value is an empty string ("").
+
+    Returns:
+        A string with a statement indicating whether the POST method
+        was successful or failed.
     """
     def builder(target_object):
         """This is a function used to build the objects that are components of
@@ -9529,13 +11206,17 @@ def virtual_kvm_policy_maker(intersight_api_key_id,
             target_object (class):
                 The class representing the object to be built on Intersight.
 
+        Returns:
+            A string with a statement indicating whether the POST method
+            was successful or failed.
+
         Raises:
             Exception:
                 An exception occurred due to an issue accessing the Intersight
                 API path. The status code or error message will be specified.
         """
         try:
-            target_object.object_maker()
+            return target_object.object_maker()
         except Exception:
             print("\nA configuration error has occurred!\n")
             print("The builder function failed to configure the "
@@ -9544,9 +11225,10 @@ def virtual_kvm_policy_maker(intersight_api_key_id,
                   f"{target_object.object_type} settings.\n")
             print("Exception Message: ")
             traceback.print_exc()
+            return "The POST method failed."
 
     # Define and create Virtual KVM Policy object in Intersight
-    builder(VirtualKvmPolicy(intersight_api_key_id=intersight_api_key_id,
+    return builder(VirtualKvmPolicy(intersight_api_key_id=intersight_api_key_id,
                              intersight_api_key=intersight_api_key,
                              policy_name=policy_name,
                              policy_description=policy_description,
@@ -9563,6 +11245,509 @@ def virtual_kvm_policy_maker(intersight_api_key_id,
                              ))
 
 
+# Establish class to adapt the concurrency of parallel Intersight operations
+class IntersightConcurrencyController:
+    """This class is used to adapt the number of parallel operations, such as
+    deployment tasks, that run at the same time against the Intersight API.
+    The concurrency limit is raised by one after each window of operations
+    that completed successfully, with one operation per allowed slot, and
+    halved after a throttled (429) response, a server error (5xx) or a
+    latency spike (additive increase, multiplicative decrease). The
+    responses are reported by the API client the controller is attached to
+    and the latency of each response is compared with the baseline of the
+    same request method and Intersight API path. The completed operations
+    are reported by the function running them.
+    """
+    def __init__(self,
+                 initial_limit=4,
+                 min_limit=1,
+                 max_limit=16,
+                 latency_spike_factor=3,
+                 latency_smoothing=0.2
+                 ):
+        self.max_limit = max(1, max_limit)
+        self.min_limit = max(1, min(min_limit, self.max_limit))
+        self.limit = max(self.min_limit, min(initial_limit, self.max_limit))
+        self.latency_spike_factor = latency_spike_factor
+        self.latency_smoothing = latency_smoothing
+        self.in_flight = 0
+        self.healthy_completions = 0
+        self.last_decrease_time = 0
+        self.average_latency = None
+        self.baseline_latencies = {}
+        self.metrics = {
+            "Requests": 0,
+            "Completed Operations": 0,
+            "Throttled Responses": 0,
+            "Server Error Responses": 0,
+            "Latency Spikes": 0,
+            "Limit Increases": 0,
+            "Limit Decreases": 0,
+            "Peak Limit": self.limit
+            }
+        self.condition = threading.Condition()
+
+    def __repr__(self):
+        return (
+            f"{self.__class__.__name__}"
+            f"({self.limit}, "
+            f"{self.min_limit}, "
+            f"{self.max_limit}, "
+            f"{self.latency_spike_factor}, "
+            f"{self.latency_smoothing})"
+            )
+
+    def __str__(self):
+        return (f"{self.__class__.__name__} class object with a concurrency "
+                f"limit of {self.limit}")
+
+    def __enter__(self):
+        self.acquire()
+        return self
+
+    def __exit__(self, exception_type, exception_value, exception_traceback):
+        self.release()
+
+    def acquire(self):
+        """This function waits until the number of running operations is
+        under the concurrency limit, then starts an operation.
+        """
+        with self.condition:
+            while self.in_flight >= self.limit:
+                self.condition.wait()
+            self.in_flight += 1
+
+    def release(self):
+        """This function finishes an operation started with acquire.
+        """
+        with self.condition:
+            self.in_flight -= 1
+            self.condition.notify_all()
+
+    def _decrease_limit(self,
+                        decrease_reason
+                        ):
+        """This function halves the concurrency limit. The concurrency limit
+        is decreased at most once per average response time, so that several
+        failed responses to requests made at the same time count as one
+        signal.
+
+        Args:
+            decrease_reason (str):
+                The reason for the decrease, to be reported.
+        """
+        current_time = time.monotonic()
+        if current_time - self.last_decrease_time < max(1, self.average_latency or 0):
+            return
+        self.last_decrease_time = current_time
+        self.healthy_completions = 0
+        decreased_limit = max(self.min_limit, self.limit // 2)
+        if decreased_limit < self.limit:
+            self.limit = decreased_limit
+            self.metrics["Limit Decreases"] += 1
+            print(f"The concurrency limit has been reduced to {self.limit} "
+                  f"due to {decrease_reason}.")
+
+    @staticmethod
+    def _latency_baseline_key(request_method,
+                              request_path
+                              ):
+        """This function creates the key of the latency baseline for a
+        request. The query options and MOIDs are removed from the Intersight
+        API path, so that requests for different objects of the same type
+        share a baseline.
+
+        Args:
+            request_method (str):
+                The HTTP method of the request.
+            request_path (str):
+                The Intersight API resource path of the request.
+
+        Returns:
+            A string of the latency baseline key.
+        """
+        request_path = re.sub(r"/[0-9a-f]{24}(?=/|$)", "/{Moid}", (request_path or "").split("?")[0])
+        return f"{(request_method or '').upper()} {request_path}"
+
+    def record_response(self,
+                        response_latency,
+                        status_code=None,
+                        request_method=None,
+                        request_path=None
+                        ):
+        """This function adapts the concurrency limit to the latency and
+        status code of an Intersight API response. Successful responses do
+        not raise the concurrency limit on their own, as one operation can
+        make many requests.
+
+        Args:
+            response_latency (float):
+                The latency of the response in seconds.
+            status_code (int):
+                Optional; The status code of a failed response. The default
+                value is None, for a successful response.
+            request_method (str):
+                Optional; The HTTP method of the request. The default value
+                is None.
+            request_path (str):
+                Optional; The Intersight API resource path of the request.
+                The default value is None.
+        """
+        with self.condition:
+            self.metrics["Requests"] += 1
+            if self.average_latency is None:
+                self.average_latency = response_latency
+            else:
+                self.average_latency += self.latency_smoothing * (response_latency - self.average_latency)
+            if status_code == 429:
+                self.metrics["Throttled Responses"] += 1
+                self._decrease_limit("throttling by the Intersight API")
+                return
+            if status_code is not None and status_code >= 500:
+                self.metrics["Server Error Responses"] += 1
+                self._decrease_limit("Intersight API server errors")
+                return
+            if status_code is not None:
+                return
+            # Compare the latency with the slowly adapting baseline of healthy responses to the same kind of request
+            latency_baseline_key = self._latency_baseline_key(request_method, request_path)
+            baseline_latency = self.baseline_latencies.get(latency_baseline_key)
+            if baseline_latency is None:
+                self.baseline_latencies[latency_baseline_key] = response_latency
+            elif response_latency > self.latency_spike_factor * baseline_latency:
+                self.metrics["Latency Spikes"] += 1
+                self._decrease_limit("increased Intersight API latency")
+            else:
+                self.baseline_latencies[latency_baseline_key] = baseline_latency + self.latency_smoothing / 4 * (response_latency - baseline_latency)
+
+    def record_completion(self,
+                          operation_succeeded=True
+                          ):
+        """This function adapts the concurrency limit to a completed
+        operation. The concurrency limit is raised by one after a full
+        window of successful operations, with one operation per allowed
+        slot, since the last change of the limit.
+
+        Args:
+            operation_succeeded (bool):
+                Optional; Whether the operation completed successfully. The
+                default value is True.
+        """
+        with self.condition:
+            self.metrics["Completed Operations"] += 1
+            if not operation_succeeded:
+                self.healthy_completions = 0
+                return
+            self.healthy_completions += 1
+            if self.healthy_completions >= self.limit and self.limit < self.max_limit:
+                self.healthy_completions = 0
+                self.limit += 1
+                self.metrics["Limit Increases"] += 1
+                self.metrics["Peak Limit"] = max(self.metrics["Peak Limit"], self.limit)
+                self.condition.notify_all()
+
+    def get_metrics(self):
+        """This function retrieves the current concurrency limit and the
+        observed Intersight API response metrics.
+
+        Returns:
+            A dictionary of the metrics.
+        """
+        with self.condition:
+            return {
+                "Concurrency Limit": self.limit,
+                "Operations In Progress": self.in_flight,
+                "Average Latency": round(self.average_latency or 0, 3),
+                "Latency Baselines": len(self.baseline_latencies),
+                **self.metrics
+                }
+
+
+# Establish function to attach a concurrency controller to an Intersight API client
+def set_intersight_concurrency_controller(api_client,
+                                          max_limit,
+                                          initial_limit=None
+                                          ):
+    """This is a function to attach an adaptive concurrency controller to an
+    Intersight API client, so that the responses of every request made
+    through the client adapt the concurrency limit.
+
+    Args:
+        api_client ("ApiClient"):
+            An ApiClient class instance which handles Intersight client-server
+            communication through the use of API keys.
+        max_limit (int):
+            The maximum number of parallel operations.
+        initial_limit (int):
+            Optional; The initial number of parallel operations. The default
+            value is None, which starts at half of the maximum.
+
+    Returns:
+        An IntersightConcurrencyController class instance.
+    """
+    intersight_concurrency_controller = IntersightConcurrencyController(
+        initial_limit=initial_limit or max(1, max_limit // 2),
+        max_limit=max_limit
+        )
+    api_client.concurrency_controller = intersight_concurrency_controller
+    return intersight_concurrency_controller
+
+
+# Establish function to run deployment tasks concurrently in dependency order
+def deployment_task_runner(deployment_tasks,
+                           max_concurrent_tasks=8,
+                           concurrency_controller=None
+                           ):
+    """This is a function to run a set of deployment tasks, such as the
+    creation of Pools, Policies and Profiles, on a pool of worker threads.
+    Each deployment task is started as soon as every deployment task it
+    depends on has completed, so that unrelated Pools and Policies are
+    created at the same time.
+
+    Args:
+        deployment_tasks (list):
+            A list of dictionaries containing the deployment tasks. Each
+            dictionary contains the keys "Task Name" (str), "Task Function"
+            (function) and "Dependencies" (list). The "Dependencies" key
+            contains the task names of the deployment tasks that must complete
+            first. Task names that are not present in the list are considered
+            to be complete, e.g. for a Pool or Policy that was not enabled for
+            creation. An optional "Task Arguments" (dict) key contains the
+            keyword arguments for the task function. Deployment tasks that are
+            ready at the same time are started in list order.
+        max_concurrent_tasks (int):
+            Optional; The maximum number of deployment tasks that can run at
+            the same time. Setting the value to 1 runs the deployment tasks
+            one at a time. The default value is 8.
+        concurrency_controller ("IntersightConcurrencyController"):
+            Optional; An IntersightConcurrencyController class instance. If
+            provided, the number of deployment tasks started at the same time
+            follows the adaptive concurrency limit, up to the value of
+            max_concurrent_tasks. The default value is None.
+
+    Returns:
+        A dictionary containing the lists of task names for the "Completed
+        Tasks", "Failed Tasks" and "Skipped Tasks" keys. Deployment tasks
+        are skipped if a deployment task they depend on has failed. The
+        "Exit Requested" key is set to True if a deployment task requested
+        an exit of the deployment tool, in which case no further deployment
+        tasks are started.
+    """
+    # Establish the pending deployment tasks and their remaining dependencies
+    pending_deployment_tasks = {deployment_task["Task Name"]: deployment_task for deployment_task in deployment_tasks}
+    remaining_task_dependencies = {
+        deployment_task["Task Name"]: {task_dependency for task_dependency in deployment_task.get("Dependencies", [])
+                                       if task_dependency in pending_deployment_tasks}
+        for deployment_task in deployment_tasks
+        }
+    deployment_task_results = {
+        "Completed Tasks": [],
+        "Failed Tasks": [],
+        "Skipped Tasks": [],
+        "Exit Requested": False
+        }
+    running_deployment_tasks = {}
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max(1, max_concurrent_tasks)) as executor:
+        while pending_deployment_tasks or running_deployment_tasks:
+            # Start every deployment task with completed dependencies, up to the concurrency limit
+            if not deployment_task_results["Exit Requested"]:
+                concurrent_task_limit = min(max_concurrent_tasks, concurrency_controller.limit) if concurrency_controller else max_concurrent_tasks
+                for task_name in list(pending_deployment_tasks):
+                    if len(running_deployment_tasks) >= concurrent_task_limit:
+                        break
+                    if not remaining_task_dependencies[task_name]:
+                        deployment_task = pending_deployment_tasks.pop(task_name)
+                        running_deployment_task = executor.submit(deployment_task["Task Function"],
+                                                                  **deployment_task.get("Task Arguments", {})
+                                                                  )
+                        running_deployment_tasks[running_deployment_task] = task_name
+            if not running_deployment_tasks:
+                break
+            # Wait for a running deployment task to finish
+            finished_deployment_tasks, _ = concurrent.futures.wait(running_deployment_tasks,
+                                                                   return_when=concurrent.futures.FIRST_COMPLETED
+                                                                   )
+            for finished_deployment_task in finished_deployment_tasks:
+                task_name = running_deployment_tasks.pop(finished_deployment_task)
+                task_exception = finished_deployment_task.exception()
+                if concurrency_controller:
+                    concurrency_controller.record_completion(task_exception is None)
+                if task_exception is None:
+                    deployment_task_results["Completed Tasks"].append(task_name)
+                    for task_dependencies in remaining_task_dependencies.values():
+                        task_dependencies.discard(task_name)
+                else:
+                    deployment_task_results["Failed Tasks"].append(task_name)
+                    if isinstance(task_exception, SystemExit):
+                        deployment_task_results["Exit Requested"] = True
+                    else:
+                        print("\nA configuration error has occurred!\n")
+                        print(f"The deployment task for the {task_name} did "
+                              "not complete.")
+                        print("Exception Message: ")
+                        traceback.print_exception(type(task_exception),
+                                                  task_exception,
+                                                  task_exception.__traceback__
+                                                  )
+    deployment_task_results["Skipped Tasks"].extend(pending_deployment_tasks)
+    return deployment_task_results
+
+
+# Establish class to collect the printed output of each thread separately
+class ThreadOutputCollector:
+    """This class is used to collect the output printed by a thread into a
+    separate list, so that the output of concurrently running tasks can be
+    shown together once the tasks have completed. The output of threads that
+    are not collecting output is written to the original output stream.
+    """
+    def __init__(self,
+                 output_stream,
+                 thread_local_storage
+                 ):
+        self.output_stream = output_stream
+        self.thread_local_storage = thread_local_storage
+
+    def __repr__(self):
+        return (
+            f"{self.__class__.__name__}"
+            f"({self.output_stream!r}, "
+            f"{self.thread_local_storage!r})"
+            )
+
+    def __str__(self):
+        return f"{self.__class__.__name__} class object for {self.output_stream}"
+
+    def write(self,
+              text
+              ):
+        """This function writes text to the output list of the current
+        thread or, if the current thread is not collecting output, to the
+        original output stream.
+
+        Args:
+            text (str):
+                The text to be written.
+
+        Returns:
+            The number of characters written.
+        """
+        collected_output = getattr(self.thread_local_storage, "collected_output", None)
+        if collected_output is None:
+            return self.output_stream.write(text)
+        collected_output.append(text)
+        return len(text)
+
+    def flush(self):
+        """This function flushes the original output stream.
+        """
+        self.output_stream.flush()
+
+
+# Establish function to create Policies concurrently and report the results
+def parallel_policy_deployment_runner(policy_deployment_tasks,
+                                      max_concurrent_policies=8,
+                                      concurrency_controller=None
+                                      ):
+    """This is a function to create a set of independent Policies at the same
+    time on a bounded pool of worker threads. The output printed during the
+    creation of each Policy is collected separately and shown together once
+    every Policy has been processed, followed by a summary of the results.
+
+    Args:
+        policy_deployment_tasks (list):
+            A list of dictionaries containing the Policy deployment tasks.
+            Each dictionary contains the keys "Task Name" (str) and "Task
+            Function" (function). The Task Function returns the POST method
+            status of the Policy maker it runs.
+        max_concurrent_policies (int):
+            Optional; The maximum number of Policies that can be created at
+            the same time. The default value is 8.
+        concurrency_controller ("IntersightConcurrencyController"):
+            Optional; An IntersightConcurrencyController class instance. If
+            provided, the number of Policies created at the same time
+            follows the adaptive concurrency limit, up to the value of
+            max_concurrent_policies. The default value is None.
+
+    Returns:
+        A dictionary containing the lists of task names for the "Completed
+        Tasks", "Failed Tasks" and "Skipped Tasks" keys. A Policy deployment
+        task has failed if it raised an exception, requested an exit or
+        returned a status other than "The POST method was successful." or
+        "The object is unchanged.".
+    """
+    def output_collecting_task(task_name,
+                               task_function
+                               ):
+        """This is a function to run a Policy deployment task while
+        collecting the output printed by the task and keeping the status
+        returned by the task.
+
+        Args:
+            task_name (str):
+                The name of the Policy deployment task.
+            task_function (function):
+                The function of the Policy deployment task.
+        """
+        thread_local_storage.collected_output = []
+        try:
+            policy_deployment_statuses[task_name] = task_function()
+        finally:
+            policy_deployment_outputs[task_name] = "".join(thread_local_storage.collected_output)
+            thread_local_storage.collected_output = None
+
+    # Collect the printed output of each Policy deployment task
+    policy_deployment_outputs = {}
+    policy_deployment_statuses = {}
+    thread_local_storage = threading.local()
+    original_stdout = sys.stdout
+    original_stderr = sys.stderr
+    sys.stdout = ThreadOutputCollector(original_stdout, thread_local_storage)
+    sys.stderr = ThreadOutputCollector(original_stderr, thread_local_storage)
+    try:
+        deployment_task_results = deployment_task_runner(
+            deployment_tasks=[
+                {"Task Name": policy_deployment_task["Task Name"],
+                 "Task Function": output_collecting_task,
+                 "Task Arguments": {"task_name": policy_deployment_task["Task Name"],
+                                    "task_function": policy_deployment_task["Task Function"]},
+                 "Dependencies": []}
+                for policy_deployment_task in policy_deployment_tasks
+                ],
+            max_concurrent_tasks=max_concurrent_policies,
+            concurrency_controller=concurrency_controller
+            )
+    finally:
+        sys.stdout = original_stdout
+        sys.stderr = original_stderr
+
+    # Report the completed Policy deployment tasks without a successful or unchanged status as failures
+    for task_name in list(deployment_task_results["Completed Tasks"]):
+        if policy_deployment_statuses.get(task_name) not in ("The POST method was successful.", "The object is unchanged."):
+            deployment_task_results["Completed Tasks"].remove(task_name)
+            deployment_task_results["Failed Tasks"].append(task_name)
+
+    # Show the collected output of each Policy deployment task
+    for policy_deployment_task in policy_deployment_tasks:
+        task_output = policy_deployment_outputs.get(policy_deployment_task["Task Name"])
+        if task_output:
+            print(task_output, end="")
+
+    # Show the summary of the Policy deployment tasks
+    print("\nPolicy Deployment Summary:")
+    for policy_deployment_task in policy_deployment_tasks:
+        task_name = policy_deployment_task["Task Name"]
+        if task_name in deployment_task_results["Completed Tasks"]:
+            task_status = "Completed"
+        elif task_name in deployment_task_results["Failed Tasks"]:
+            task_status = "Failed"
+        else:
+            task_status = "Not started"
+        print(f"{task_name:<45}{task_status}")
+    print(f"\n{len(deployment_task_results['Completed Tasks'])} of "
+          f"{len(policy_deployment_tasks)} Policies completed successfully.")
+    return deployment_task_results
+
+
 def main():
 
     # Establish UCS Default Policy Deployment Tool specific variables
@@ -9572,12 +11757,27 @@ def main():
     main_intersight_api_client = get_api_client(api_key_id=key_id,
                                                 api_secret_file=key,
                                                 endpoint=intersight_base_url,
-                                                url_certificate_verification=url_certificate_verification
+                                                url_certificate_verification=url_certificate_verification,
+                                                api_request_rate_limit=intersight_api_request_rate_limit
                                                 )
+
+    # Attach the object state file to the API client, if provided
+    if intersight_object_state_file:
+        set_intersight_object_state_file(main_intersight_api_client,
+                                         intersight_object_state_file
+                                         )
     
     # Starting the UCS Default Policy Deployment Tool for Cisco Intersight
     print(f"\nStarting the {deployment_tool_type} for Cisco Intersight.\n")
 
+    # Attach the adaptive concurrency controller to the API client, if enabled
+    deployment_concurrency_controller = None
+    if deployment_parallel_mode and deployment_adaptive_concurrency:
+        deployment_concurrency_controller = set_intersight_concurrency_controller(
+            main_intersight_api_client,
+            max_limit=deployment_max_concurrent_policies
+            )
+
     # Run the Intersight API and Account Availability Test
     print("Running the Intersight API and Account Availability Test.")
     test_intersight_api_service(
@@ -9587,10 +11787,10 @@ def main():
         )
 
     # Create the BIOS Policy in Intersight
-    if deploy_bios_policy:
+    def bios_policy_creation_task():
         # Update Policy name with UCS Default Policy Deployment Tool provided prefix and/or suffix
         deployment_tool_bios_policy_name = f"{deployment_name_prefix}{bios_policy_name}{deployment_name_suffix}"
-        bios_policy_maker(
+        return bios_policy_maker(
             intersight_api_key_id=None,
             intersight_api_key=None,
             policy_name=deployment_tool_bios_policy_name,
@@ -9602,10 +11802,10 @@ def main():
             )
 
     # Create the Boot Order Policy in Intersight
-    if deploy_boot_order_policy:
+    def boot_order_policy_creation_task():
         # Update Policy name with UCS Default Policy Deployment Tool provided prefix and/or suffix
         deployment_tool_boot_order_policy_name = f"{deployment_name_prefix}{boot_order_policy_name}{deployment_name_suffix}"
-        boot_order_policy_maker(
+        return boot_order_policy_maker(
             intersight_api_key_id=None,
             intersight_api_key=None,
             policy_name=deployment_tool_boot_order_policy_name,
@@ -9619,10 +11819,10 @@ def main():
             )
 
     # Create the Certificate Management Policy in Intersight
-    if deploy_cert_mgmt_policy:
+    def cert_mgmt_policy_creation_task():
         # Update Policy name with UCS Default Policy Deployment Tool provided prefix and/or suffix
         deployment_tool_cert_mgmt_policy_name = f"{deployment_name_prefix}{cert_mgmt_policy_name}{deployment_name_suffix}"
-        cert_mgmt_policy_maker(
+        return cert_mgmt_policy_maker(
             intersight_api_key_id=None,
             intersight_api_key=None,
             policy_name=deployment_tool_cert_mgmt_policy_name,
@@ -9636,10 +11836,10 @@ def main():
             )
 
     # Create the Ethernet Adapter Policy in Intersight
-    if deploy_ethernet_adapter_policy:
+    def ethernet_adapter_policy_creation_task():
         # Update Policy name with UCS Default Policy Deployment Tool provided prefix and/or suffix
         deployment_tool_ethernet_adapter_policy_name = f"{deployment_name_prefix}{ethernet_adapter_policy_name}{deployment_name_suffix}"
-        ethernet_adapter_policy_maker(
+        return ethernet_adapter_policy_maker(
             intersight_api_key_id=None,
             intersight_api_key=None,
             policy_name=deployment_tool_ethernet_adapter_policy_name,
@@ -9688,10 +11888,10 @@ def main():
             )
 
     # Create the Ethernet Network Control Policy in Intersight
-    if deploy_ethernet_network_control_policy:
+    def ethernet_network_control_policy_creation_task():
         # Update Policy name with UCS Default Policy Deployment Tool provided prefix and/or suffix
         deployment_tool_ethernet_network_control_policy_name = f"{deployment_name_prefix}{ethernet_network_control_policy_name}{deployment_name_suffix}"
-        ethernet_network_control_policy_maker(
+        return ethernet_network_control_policy_maker(
             intersight_api_key_id=None,
             intersight_api_key=None,
             policy_name=deployment_tool_ethernet_network_control_policy_name,
@@ -9708,10 +11908,10 @@ def main():
             )
 
     # Create the Ethernet Network Group Policy in Intersight
-    if deploy_ethernet_network_group_policy:
+    def ethernet_network_group_policy_creation_task():
         # Update Policy name with UCS Default Policy Deployment Tool provided prefix and/or suffix
         deployment_tool_ethernet_network_group_policy_name = f"{deployment_name_prefix}{ethernet_network_group_policy_name}{deployment_name_suffix}"
-        ethernet_network_group_policy_maker(
+        return ethernet_network_group_policy_maker(
             intersight_api_key_id=None,
             intersight_api_key=None,
             policy_name=deployment_tool_ethernet_network_group_policy_name,
@@ -9724,10 +11924,10 @@ def main():
             )
 
     # Create the Ethernet QoS Policy in Intersight
-    if deploy_ethernet_qos_policy:
+    def ethernet_qos_policy_creation_task():
         # Update Policy name with UCS Default Policy Deployment Tool provided prefix and/or suffix
         deployment_tool_ethernet_qos_policy_name = f"{deployment_name_prefix}{ethernet_qos_policy_name}{deployment_name_suffix}"
-        ethernet_qos_policy_maker(
+        return ethernet_qos_policy_maker(
             intersight_api_key_id=None,
             intersight_api_key=None,
             policy_name=deployment_tool_ethernet_qos_policy_name,
@@ -9744,10 +11944,10 @@ def main():
             )
 
     # Create the Fibre Channel Adapter Policy in Intersight
-    if deploy_fibre_channel_adapter_policy:
+    def fibre_channel_adapter_policy_creation_task():
         # Update Policy name with UCS Default Policy Deployment Tool provided prefix and/or suffix
         deployment_tool_fibre_channel_adapter_policy_name = f"{deployment_name_prefix}{fibre_channel_adapter_policy_name}{deployment_name_suffix}"
-        fibre_channel_adapter_policy_maker(
+        return fibre_channel_adapter_policy_maker(
             intersight_api_key_id=None,
             intersight_api_key=None,
             policy_name=deployment_tool_fibre_channel_adapter_policy_name,
@@ -9778,10 +11978,10 @@ def main():
             )
 
     # Create the Fibre Channel Network Policy in Intersight
-    if deploy_fibre_channel_network_policy:
+    def fibre_channel_network_policy_creation_task():
         # Update Policy name with UCS Default Policy Deployment Tool provided prefix and/or suffix
         deployment_tool_fibre_channel_network_policy_name = f"{deployment_name_prefix}{fibre_channel_network_policy_name}{deployment_name_suffix}"
-        fibre_channel_network_policy_maker(
+        return fibre_channel_network_policy_maker(
             intersight_api_key_id=None,
             intersight_api_key=None,
             policy_name=deployment_tool_fibre_channel_network_policy_name,
@@ -9794,10 +11994,10 @@ def main():
             )
 
     # Create the Fibre Channel QoS Policy in Intersight
-    if deploy_fibre_channel_qos_policy:
+    def fibre_channel_qos_policy_creation_task():
         # Update Policy name with UCS Default Policy Deployment Tool provided prefix and/or suffix
         deployment_tool_fibre_channel_qos_policy_name = f"{deployment_name_prefix}{fibre_channel_qos_policy_name}{deployment_name_suffix}"
-        fibre_channel_qos_policy_maker(
+        return fibre_channel_qos_policy_maker(
             intersight_api_key_id=None,
             intersight_api_key=None,
             policy_name=deployment_tool_fibre_channel_qos_policy_name,
@@ -9812,10 +12012,10 @@ def main():
             )
 
     # Create the Flow Control Policy in Intersight
-    if deploy_flow_control_policy:
+    def flow_control_policy_creation_task():
         # Update Policy name with UCS Default Policy Deployment Tool provided prefix and/or suffix
         deployment_tool_flow_control_policy_name = f"{deployment_name_prefix}{flow_control_policy_name}{deployment_name_suffix}"
-        flow_control_policy_maker(
+        return flow_control_policy_maker(
             intersight_api_key_id=None,
             intersight_api_key=None,
             policy_name=deployment_tool_flow_control_policy_name,
@@ -9829,10 +12029,10 @@ def main():
             )
 
     # Create the IPMI Over LAN Policy in Intersight
-    if deploy_ipmi_over_lan_policy:
+    def ipmi_over_lan_policy_creation_task():
         # Update Policy name with UCS Default Policy Deployment Tool provided prefix and/or suffix
         deployment_tool_ipmi_over_lan_policy_name = f"{deployment_name_prefix}{ipmi_over_lan_policy_name}{deployment_name_suffix}"
-        ipmi_over_lan_policy_maker(
+        return ipmi_over_lan_policy_maker(
             intersight_api_key_id=None,
             intersight_api_key=None,
             policy_name=deployment_tool_ipmi_over_lan_policy_name,
@@ -9846,10 +12046,10 @@ def main():
             )
 
     # Create the iSCSI Adapter Policy in Intersight
-    if deploy_iscsi_adapter_policy:
+    def iscsi_adapter_policy_creation_task():
         # Update Policy name with UCS Default Policy Deployment Tool provided prefix and/or suffix
         deployment_tool_iscsi_adapter_policy_name = f"{deployment_name_prefix}{iscsi_adapter_policy_name}{deployment_name_suffix}"
-        iscsi_adapter_policy_maker(
+        return iscsi_adapter_policy_maker(
             intersight_api_key_id=None,
             intersight_api_key=None,
             policy_name=deployment_tool_iscsi_adapter_policy_name,
@@ -9863,10 +12063,10 @@ def main():
             )
 
     # Create the Link Aggregation Policy in Intersight
-    if deploy_link_aggregation_policy:
+    def link_aggregation_policy_creation_task():
         # Update Policy name with UCS Default Policy Deployment Tool provided prefix and/or suffix
         deployment_tool_link_aggregation_policy_name = f"{deployment_name_prefix}{link_aggregation_policy_name}{deployment_name_suffix}"
-        link_aggregation_policy_maker(
+        return link_aggregation_policy_maker(
             intersight_api_key_id=None,
             intersight_api_key=None,
             policy_name=deployment_tool_link_aggregation_policy_name,
@@ -9879,10 +12079,10 @@ def main():
             )
 
     # Create the Link Control Policy in Intersight
-    if deploy_link_control_policy:
+    def link_control_policy_creation_task():
         # Update Policy name with UCS Default Policy Deployment Tool provided prefix and/or suffix
         deployment_tool_link_control_policy_name = f"{deployment_name_prefix}{link_control_policy_name}{deployment_name_suffix}"
-        link_control_policy_maker(
+        return link_control_policy_maker(
             intersight_api_key_id=None,
             intersight_api_key=None,
             policy_name=deployment_tool_link_control_policy_name,
@@ -9895,10 +12095,10 @@ def main():
             )
 
     # Create the Local User Policy in Intersight
-    if deploy_local_user_policy:
+    def local_user_policy_creation_task():
         # Update Policy name with UCS Default Policy Deployment Tool provided prefix and/or suffix
         deployment_tool_local_user_policy_name = f"{deployment_name_prefix}{local_user_policy_name}{deployment_name_suffix}"
-        local_user_policy_maker(
+        return local_user_policy_maker(
             intersight_api_key_id=None,
             intersight_api_key=None,
             policy_name=deployment_tool_local_user_policy_name,
@@ -9917,10 +12117,10 @@ def main():
             )
 
     # Create the Multicast Policy in Intersight
-    if deploy_multicast_policy:
+    def multicast_policy_creation_task():
         # Update Policy name with UCS Default Policy Deployment Tool provided prefix and/or suffix
         deployment_tool_multicast_policy_name = f"{deployment_name_prefix}{multicast_policy_name}{deployment_name_suffix}"
-        multicast_policy_maker(
+        return multicast_policy_maker(
             intersight_api_key_id=None,
             intersight_api_key=None,
             policy_name=deployment_tool_multicast_policy_name,
@@ -9935,10 +12135,10 @@ def main():
             )
 
     # Create the Network Connectivity Policy in Intersight
-    if deploy_network_connectivity_policy:
+    def network_connectivity_policy_creation_task():
         # Update Policy name with UCS Default Policy Deployment Tool provided prefix and/or suffix
         deployment_tool_network_connectivity_policy_name = f"{deployment_name_prefix}{network_connectivity_policy_name}{deployment_name_suffix}"
-        network_connectivity_policy_maker(
+        return network_connectivity_policy_maker(
             intersight_api_key_id=None,
             intersight_api_key=None,
             policy_name=deployment_tool_network_connectivity_policy_name,
@@ -9958,10 +12158,10 @@ def main():
             )
 
     # Create the NTP Policy in Intersight
-    if deploy_ntp_policy:
+    def ntp_policy_creation_task():
         # Update Policy name with UCS Default Policy Deployment Tool provided prefix and/or suffix
         deployment_tool_ntp_policy_name = f"{deployment_name_prefix}{ntp_policy_name}{deployment_name_suffix}"
-        ntp_policy_maker(
+        return ntp_policy_maker(
             intersight_api_key_id=None,
             intersight_api_key=None,
             policy_name=deployment_tool_ntp_policy_name,
@@ -9975,10 +12175,10 @@ def main():
             )
 
     # Create the Power Policy in Intersight
-    if deploy_power_policy:
+    def power_policy_creation_task():
         # Update Policy name with UCS Default Policy Deployment Tool provided prefix and/or suffix
         deployment_tool_power_policy_name = f"{deployment_name_prefix}{power_policy_name}{deployment_name_suffix}"
-        power_policy_maker(
+        return power_policy_maker(
             intersight_api_key_id=None,
             intersight_api_key=None,
             policy_name=deployment_tool_power_policy_name,
@@ -9997,10 +12197,10 @@ def main():
             )
 
     # Create the Serial Over LAN Policy in Intersight
-    if deploy_serial_over_lan_policy:
+    def serial_over_lan_policy_creation_task():
         # Update Policy name with UCS Default Policy Deployment Tool provided prefix and/or suffix
         deployment_tool_serial_over_lan_policy_name = f"{deployment_name_prefix}{serial_over_lan_policy_name}{deployment_name_suffix}"
-        serial_over_lan_policy_maker(
+        return serial_over_lan_policy_maker(
             intersight_api_key_id=None,
             intersight_api_key=None,
             policy_name=deployment_tool_serial_over_lan_policy_name,
@@ -10015,10 +12215,10 @@ def main():
             )
 
     # Create the SNMP Policy in Intersight
-    if deploy_snmp_policy:
+    def snmp_policy_creation_task():
         # Update Policy name with UCS Default Policy Deployment Tool provided prefix and/or suffix
         deployment_tool_snmp_policy_name = f"{deployment_name_prefix}{snmp_policy_name}{deployment_name_suffix}"
-        snmp_policy_maker(
+        return snmp_policy_maker(
             intersight_api_key_id=None,
             intersight_api_key=None,
             policy_name=deployment_tool_snmp_policy_name,
@@ -10041,10 +12241,10 @@ def main():
             )
 
     # Create the Switch Control Policy in Intersight
-    if deploy_switch_control_policy:
+    def switch_control_policy_creation_task():
         # Update Policy name with UCS Default Policy Deployment Tool provided prefix and/or suffix
         deployment_tool_switch_control_policy_name = f"{deployment_name_prefix}{switch_control_policy_name}{deployment_name_suffix}"
-        switch_control_policy_maker(
+        return switch_control_policy_maker(
             intersight_api_key_id=None,
             intersight_api_key=None,
             policy_name=deployment_tool_switch_control_policy_name,
@@ -10060,10 +12260,10 @@ def main():
             )
 
     # Create the Syslog Policy in Intersight
-    if deploy_syslog_policy:
+    def syslog_policy_creation_task():
         # Update Policy name with UCS Default Policy Deployment Tool provided prefix and/or suffix
         deployment_tool_syslog_policy_name = f"{deployment_name_prefix}{syslog_policy_name}{deployment_name_suffix}"
-        syslog_policy_maker(
+        return syslog_policy_maker(
             intersight_api_key_id=None,
             intersight_api_key=None,
             policy_name=deployment_tool_syslog_policy_name,
@@ -10076,10 +12276,10 @@ def main():
             )
 
     # Create the System QoS Policy in Intersight
-    if deploy_system_qos_policy:
+    def system_qos_policy_creation_task():
         # Update Policy name with UCS Default Policy Deployment Tool provided prefix and/or suffix
         deployment_tool_system_qos_policy_name = f"{deployment_name_prefix}{system_qos_policy_name}{deployment_name_suffix}"
-        system_qos_policy_maker(
+        return system_qos_policy_maker(
             intersight_api_key_id=None,
             intersight_api_key=None,
             policy_name=deployment_tool_system_qos_policy_name,
@@ -10091,10 +12291,10 @@ def main():
             )
 
     # Create the Thermal Policy in Intersight
-    if deploy_thermal_policy:
+    def thermal_policy_creation_task():
         # Update Policy name with UCS Default Policy Deployment Tool provided prefix and/or suffix
         deployment_tool_thermal_policy_name = f"{deployment_name_prefix}{thermal_policy_name}{deployment_name_suffix}"
-        thermal_policy_maker(
+        return thermal_policy_maker(
             intersight_api_key_id=None,
             intersight_api_key=None,
             policy_name=deployment_tool_thermal_policy_name,
@@ -10106,10 +12306,10 @@ def main():
             )
 
     # Create the Virtual KVM Policy in Intersight
-    if deploy_virtual_kvm_policy:
+    def virtual_kvm_policy_creation_task():
         # Update Policy name with UCS Default Policy Deployment Tool provided prefix and/or suffix
         deployment_tool_virtual_kvm_policy_name = f"{deployment_name_prefix}{virtual_kvm_policy_name}{deployment_name_suffix}"
-        virtual_kvm_policy_maker(
+        return virtual_kvm_policy_maker(
             intersight_api_key_id=None,
             intersight_api_key=None,
             policy_name=deployment_tool_virtual_kvm_policy_name,
@@ -10124,6 +12324,58 @@ def main():
             preconfigured_api_client=main_intersight_api_client
             )
 
+    # Establish the UCS Default Policy Deployment Tool Policy deployment tasks
+    policy_deployment_tasks = [
+        {"Task Name": "BIOS Policy", "Task Function": bios_policy_creation_task, "Enabled": deploy_bios_policy},
+        {"Task Name": "Boot Order Policy", "Task Function": boot_order_policy_creation_task, "Enabled": deploy_boot_order_policy},
+        {"Task Name": "Certificate Management Policy", "Task Function": cert_mgmt_policy_creation_task, "Enabled": deploy_cert_mgmt_policy},
+        {"Task Name": "Ethernet Adapter Policy", "Task Function": ethernet_adapter_policy_creation_task, "Enabled": deploy_ethernet_adapter_policy},
+        {"Task Name": "Ethernet Network Control Policy", "Task Function": ethernet_network_control_policy_creation_task, "Enabled": deploy_ethernet_network_control_policy},
+        {"Task Name": "Ethernet Network Group Policy", "Task Function": ethernet_network_group_policy_creation_task, "Enabled": deploy_ethernet_network_group_policy},
+        {"Task Name": "Ethernet QoS Policy", "Task Function": ethernet_qos_policy_creation_task, "Enabled": deploy_ethernet_qos_policy},
+        {"Task Name": "Fibre Channel Adapter Policy", "Task Function": fibre_channel_adapter_policy_creation_task, "Enabled": deploy_fibre_channel_adapter_policy},
+        {"Task Name": "Fibre Channel Network Policy", "Task Function": fibre_channel_network_policy_creation_task, "Enabled": deploy_fibre_channel_network_policy},
+        {"Task Name": "Fibre Channel QoS Policy", "Task Function": fibre_channel_qos_policy_creation_task, "Enabled": deploy_fibre_channel_qos_policy},
+        {"Task Name": "Flow Control Policy", "Task Function": flow_control_policy_creation_task, "Enabled": deploy_flow_control_policy},
+        {"Task Name": "IPMI Over LAN Policy", "Task Function": ipmi_over_lan_policy_creation_task, "Enabled": deploy_ipmi_over_lan_policy},
+        {"Task Name": "iSCSI Adapter Policy", "Task Function": iscsi_adapter_policy_creation_task, "Enabled": deploy_iscsi_adapter_policy},
+        {"Task Name": "Link Aggregation Policy", "Task Function": link_aggregation_policy_creation_task, "Enabled": deploy_link_aggregation_policy},
+        {"Task Name": "Link Control Policy", "Task Function": link_control_policy_creation_task, "Enabled": deploy_link_control_policy},
+        {"Task Name": "Local User Policy", "Task Function": local_user_policy_creation_task, "Enabled": deploy_local_user_policy},
+        {"Task Name": "Multicast Policy", "Task Function": multicast_policy_creation_task, "Enabled": deploy_multicast_policy},
+        {"Task Name": "Network Connectivity Policy", "Task Function": network_connectivity_policy_creation_task, "Enabled": deploy_network_connectivity_policy},
+        {"Task Name": "NTP Policy", "Task Function": ntp_policy_creation_task, "Enabled": deploy_ntp_policy},
+        {"Task Name": "Power Policy", "Task Function": power_policy_creation_task, "Enabled": deploy_power_policy},
+        {"Task Name": "Serial Over LAN Policy", "Task Function": serial_over_lan_policy_creation_task, "Enabled": deploy_serial_over_lan_policy},
+        {"Task Name": "SNMP Policy", "Task Function": snmp_policy_creation_task, "Enabled": deploy_snmp_policy},
+        {"Task Name": "Switch Control Policy", "Task Function": switch_control_policy_creation_task, "Enabled": deploy_switch_control_policy},
+        {"Task Name": "Syslog Policy", "Task Function": syslog_policy_creation_task, "Enabled": deploy_syslog_policy},
+        {"Task Name": "System QoS Policy", "Task Function": system_qos_policy_creation_task, "Enabled": deploy_system_qos_policy},
+        {"Task Name": "Thermal Policy", "Task Function": thermal_policy_creation_task, "Enabled": deploy_thermal_policy},
+        {"Task Name": "Virtual KVM Policy", "Task Function": virtual_kvm_policy_creation_task, "Enabled": deploy_virtual_kvm_policy},
+        ]
+    enabled_policy_deployment_tasks = [policy_deployment_task for policy_deployment_task in policy_deployment_tasks if policy_deployment_task["Enabled"]]
+
+    # Create the enabled Policies in Intersight
+    if deployment_parallel_mode:
+        print(f"\nCreating {len(enabled_policy_deployment_tasks)} Policies with up to "
+              f"{deployment_max_concurrent_policies} Policies at a time, please wait...")
+        parallel_policy_deployment_runner(
+            policy_deployment_tasks=enabled_policy_deployment_tasks,
+            max_concurrent_policies=deployment_max_concurrent_policies,
+            concurrency_controller=deployment_concurrency_controller
+            )
+    else:
+        for policy_deployment_task in enabled_policy_deployment_tasks:
+            policy_deployment_task["Task Function"]()
+
+    # Show the adaptive concurrency metrics
+    if deployment_concurrency_controller:
+        print("\nAdaptive Concurrency Metrics:")
+        for metric_name, metric_value in deployment_concurrency_controller.get_metrics().items():
+            print(f"{metric_name:<45}"
+                  f"{metric_value}")
+
     # UCS Default Policy Deployment Tool completion
     print(f"\nThe {deployment_tool_type} has completed.\n")
 
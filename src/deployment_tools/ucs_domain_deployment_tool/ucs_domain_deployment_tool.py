@@ -16,6 +16,14 @@ import copy
 import intersight
 import re
 import time
+import threading
+import urllib.parse
+import hashlib
+import os
+import argparse
+import random
+import email.utils
+import atexit
 import urllib3
 
 ########################
@@ -67,6 +75,21 @@ values and replace them with your own, where applicable.
 intersight_base_url = "https://www.intersight.com/api/v1"
 url_certificate_verification = True
 
+# Intersight API Request Rate Settings
+## NOTE - To stay under the request quota of the Intersight account, set the maximum average number of Intersight API requests per second, for example: intersight_api_request_rate_limit = 20
+## Leave the value as None to not limit the request rate. Throttled requests are always retried after the delay requested by Intersight.
+intersight_api_request_rate_limit = None
+
+# Intersight Object State File Setting
+## NOTE - Provide a file path to store a hash of each configured object, so that objects unchanged since the last run are skipped, for example: intersight_object_state_file = "intersight_object_state.json"
+## Leave the value empty to compare every pre-existing object with Intersight on each run.
+intersight_object_state_file = ""
+
+# Deployment Journal Settings
+## NOTE - Each completed deployment step is recorded in the deployment journal file. If a deployment stops before completion, run the UCS Domain Deployment Tool again with the --resume option to skip the completed steps, for example: python ucs_domain_deployment_tool.py --resume
+## The default value of None does not record a deployment journal. To record one, set the value to a file path, for example: deployment_journal_file = "ucs_domain_deployment_tool_journal.jsonl"
+deployment_journal_file = None
+
 # Global Deployment Name Settings (Optional - These settings will attach a global prefix or suffix to the names of the created UCS Domain Profile and Policies)
 deployment_name_prefix = ""
 deployment_name_suffix = f"_{int(time.time())}"     # If no suffix is desired, change the value to an empty string, for example: deployment_name_suffix = ""
@@ -585,13 +608,239 @@ custom_default_link_aggregation_policy_name = ""
 # Suppress InsecureRequestWarning error messages
 urllib3.disable_warnings()
 
+# Establish the process-wide cache of Intersight API clients
+intersight_api_client_cache = {}
+intersight_api_client_cache_lock = threading.Lock()
+
+
+# Establish class to limit the request rate of an Intersight API client
+class IntersightRateLimiter:
+    """This class is used to limit the rate of Intersight API requests made
+    through an Intersight API client with a token bucket. Every function and
+    class sharing the API client draws from the same bucket, so the combined
+    request rate stays under the request quota of the Intersight account.
+    Requests can also be paused for every thread, for example after the
+    Intersight API has throttled a request.
+    """
+    def __init__(self,
+                 request_rate_limit=None,
+                 burst_size=None
+                 ):
+        self.request_rate_limit = request_rate_limit
+        self.burst_size = burst_size or max(1, request_rate_limit or 1)
+        self.available_tokens = self.burst_size
+        self.last_refill_time = time.monotonic()
+        self.paused_until = 0
+        self.lock = threading.Lock()
+
+    def __repr__(self):
+        return (
+            f"{self.__class__.__name__}"
+            f"({self.request_rate_limit}, "
+            f"{self.burst_size})"
+            )
+
+    def __str__(self):
+        return (f"{self.__class__.__name__} class object with a limit of "
+                f"{self.request_rate_limit} request(s) per second")
+
+    def acquire(self):
+        """This function waits until a request can be made, then consumes a
+        token from the bucket.
+        """
+        while True:
+            with self.lock:
+                current_time = time.monotonic()
+                wait_time = self.paused_until - current_time
+                if wait_time <= 0:
+                    if not self.request_rate_limit:
+                        return
+                    # Refill the bucket for the time elapsed since the last request
+                    self.available_tokens = min(self.burst_size,
+                                                self.available_tokens + (current_time - self.last_refill_time) * self.request_rate_limit
+                                                )
+                    self.last_refill_time = current_time
+                    if self.available_tokens >= 1:
+                        self.available_tokens -= 1
+                        return
+                    wait_time = (1 - self.available_tokens) / self.request_rate_limit
+            time.sleep(wait_time)
+
+    def pause(self,
+              pause_duration
+              ):
+        """This function pauses all requests for a duration.
+
+        Args:
+            pause_duration (float):
+                The duration of the pause in seconds.
+        """
+        with self.lock:
+            self.paused_until = max(self.paused_until, time.monotonic() + pause_duration)
+
+
+# Establish class for an Intersight SDK for Python API client with rate limiting and retries
+class RateLimitedApiClient(intersight.ApiClient):
+    """This class is used to provide an Intersight SDK for Python API client
+    that limits the rate of Intersight API requests and retries requests that
+    have been throttled or have failed temporarily. Throttled requests (429)
+    are retried for every method after the delay requested by the
+    Retry-After header. Requests that failed with a 500, 502, 503 or 504
+    status code are only retried for methods that are safe to repeat. Each
+    retry waits with jittered exponential backoff.
+    """
+    idempotent_methods = ("GET", "HEAD", "OPTIONS", "PUT", "DELETE")
+    retryable_status_codes = (500, 502, 503, 504)
+    rate_limiter = None
+    api_retry_limit = 5
+    api_retry_backoff = 1
+    api_retry_max_delay = 60
+
+    def _retry_delay(self,
+                     error,
+                     retry_attempt
+                     ):
+        """This function determines the delay before a request is retried.
+
+        Args:
+            error (intersight.exceptions.ApiException):
+                The exception raised by the failed request.
+            retry_attempt (int):
+                The number of retries already performed for the request.
+
+        Returns:
+            A float of the delay in seconds.
+        """
+        retry_after = (error.headers or {}).get("Retry-After")
+        if retry_after:
+            # The Retry-After header is either a number of seconds or an HTTP date
+            try:
+                return max(float(retry_after), 0) + random.uniform(0, self.api_retry_backoff)
+            except ValueError:
+                try:
+                    return max(email.utils.mktime_tz(email.utils.parsedate_tz(retry_after)) - time.time(), 0) + random.uniform(0, self.api_retry_backoff)
+                except (TypeError, ValueError, OverflowError):
+                    pass
+        exponential_delay = min(self.api_retry_max_delay, self.api_retry_backoff * 2 ** retry_attempt)
+        return random.uniform(exponential_delay / 2, exponential_delay)
+
+    def call_api(self,
+                 resource_path,
+                 method,
+                 *args,
+                 **kwargs
+                 ):
+        """This function performs an Intersight API request, waiting for the
+        rate limiter and retrying throttled or temporarily failed requests.
+
+        Args:
+            resource_path (str):
+                The Intersight API resource path of the request.
+            method (str):
+                The HTTP method of the request.
+            *args:
+                The additional positional arguments of the request.
+            **kwargs:
+                The additional keyword arguments of the request.
+
+        Returns:
+            The response of the request.
+
+        Raises:
+            intersight.exceptions.ApiException:
+                The request failed and could not be retried.
+        """
+        if kwargs.get("async_req"):
+            return super().call_api(resource_path, method, *args, **kwargs)
+        retry_attempt = 0
+        while True:
+            if self.rate_limiter:
+                self.rate_limiter.acquire()
+            try:
+                return super().call_api(resource_path, method, *args, **kwargs)
+            except intersight.exceptions.ApiException as error:
+                if retry_attempt >= self.api_retry_limit or not (
+                    error.status == 429 or
+                    (error.status in self.retryable_status_codes and method.upper() in self.idempotent_methods)
+                    ):
+                    raise
+                retry_delay = self._retry_delay(error, retry_attempt)
+                if error.status == 429 and self.rate_limiter:
+                    # Pause every request sharing the API client while throttled
+                    self.rate_limiter.pause(retry_delay)
+                print(f"The Intersight API request for '{resource_path}' "
+                      f"returned the status code {error.status}. The request "
+                      f"will be retried in {retry_delay:.1f} seconds.")
+                time.sleep(retry_delay)
+                retry_attempt += 1
+
+
 # Function to get Intersight API client as specified in the Intersight Python SDK documentation for OpenAPI 3.x
 ## Modified to align with overall formatting, try/except blocks added for additional error handling, certificate verification option added
+## Modified to reuse one pooled API client per endpoint, API key and API client settings, connection pool sizing and connection retries added
 def get_api_client(api_key_id,
                    api_secret_file,
                    endpoint="https://intersight.com",
-                   url_certificate_verification=True
+                   url_certificate_verification=True,
+                   connection_pool_maxsize=32,
+                   connection_retry_limit=3,
+                   api_request_rate_limit=None,
+                   api_retry_limit=5
                    ):
+    """This is a function to get an Intersight API client. One API client is
+    established per endpoint, API key and set of API client settings, then
+    reused by every later call in the process with the same arguments, so
+    the API key is only loaded once and the pooled keep-alive connections of
+    the API client are shared. A call with different connection, rate limit
+    or retry settings establishes a separate API client with those settings.
+
+    Args:
+        api_key_id (str):
+            The ID of the Intersight API key.
+        api_secret_file (str):
+            The system file path of the Intersight API key.
+        endpoint (str):
+            Optional; The Intersight API base URL. The default value is
+            "https://intersight.com".
+        url_certificate_verification (bool):
+            Optional; The setting for verifying the SSL certificate of the
+            Intersight API base URL. The default value is True.
+        connection_pool_maxsize (int):
+            Optional; The maximum number of connections kept open to the
+            Intersight API by the API client. The value should be at least the
+            number of requests made at the same time. The default value is
+            32.
+        connection_retry_limit (int):
+            Optional; The number of times a request is retried after a
+            connection error. The default value is 3.
+        api_request_rate_limit (float):
+            Optional; The maximum average number of Intersight API requests
+            per second made through the API client, shared by every function
+            and class using the client. The default value is None, which does
+            not limit the request rate.
+        api_retry_limit (int):
+            Optional; The number of times a request is retried after a 429
+            status code, or after a 500, 502, 503 or 504 status code for
+            requests that are safe to repeat. The default value is 5.
+
+    Returns:
+        An ApiClient class instance which handles Intersight client-server
+        communication through the use of API keys.
+    """
+    # Reuse the API client already established for the endpoint, API key and API client settings
+    api_client_cache_key = (endpoint,
+                            api_key_id,
+                            api_secret_file,
+                            url_certificate_verification,
+                            connection_pool_maxsize,
+                            connection_retry_limit,
+                            api_request_rate_limit,
+                            api_retry_limit
+                            )
+    with intersight_api_client_cache_lock:
+        cached_api_client = intersight_api_client_cache.get(api_client_cache_key)
+    if cached_api_client is not None:
+        return cached_api_client
     try:
         with open(api_secret_file, 'r') as f:
             api_key = f.read()
@@ -627,6 +876,13 @@ def get_api_client(api_key_id,
 
         if not url_certificate_verification:
             configuration.verify_ssl = False
+        # Size the connection pool for concurrent requests and retry failed connections
+        ## Failed status codes are retried by the API client with jittered backoff
+        configuration.connection_pool_maxsize = connection_pool_maxsize
+        configuration.retries = urllib3.util.Retry(total=connection_retry_limit,
+                                                   backoff_factor=0.5,
+                                                   raise_on_status=False
+                                                   )
     except Exception:
         print("\nA configuration error has occurred!\n")
         print("Unable to access the Intersight API Key.")
@@ -637,7 +893,937 @@ def get_api_client(api_key_id,
         traceback.print_exc()
         sys.exit(0)
         
-    return intersight.ApiClient(configuration)
+    # Limit the request rate and retry throttled requests for every user of the API client
+    api_client = RateLimitedApiClient(configuration)
+    api_client.rate_limiter = IntersightRateLimiter(api_request_rate_limit)
+    api_client.api_retry_limit = api_retry_limit
+    with intersight_api_client_cache_lock:
+        return intersight_api_client_cache.setdefault(api_client_cache_key,
+                                                      api_client
+                                                      )
+
+
+# Establish class to hold the Intersight account context of an Intersight API client
+class IntersightAccountContext:
+    """This class is used to hold the Intersight account information for a
+    specific Intersight API client, so that the account only needs to be
+    retrieved from Intersight once.
+    """
+    def __init__(self,
+                 api_client
+                 ):
+        self.api_client = api_client
+        self.iam_account = None
+        self.lock = threading.Lock()
+
+    def __repr__(self):
+        return (
+            f"{self.__class__.__name__}"
+            f"({self.api_client})"
+            )
+
+    def __str__(self):
+        if self.iam_account is None:
+            return f"{self.__class__.__name__} class object for an unresolved Intersight account"
+        return (f"{self.__class__.__name__} class object for the Intersight "
+                f"account named '{self.iam_account.get('Name')}'")
+
+    def set_account(self,
+                    iam_account
+                    ):
+        """This function stores the Intersight account information.
+
+        Args:
+            iam_account (dict):
+                The Intersight API object of the Intersight account.
+        """
+        with self.lock:
+            self.iam_account = iam_account
+
+    def get_account_name(self):
+        """This function returns the name of the Intersight account. If the
+        Intersight account information has not been stored yet, it is
+        retrieved from Intersight on first use.
+
+        Returns:
+            A string of the name for the Intersight account. If the Intersight
+            account information cannot be retrieved, the string "Unknown" is
+            returned, so that the calling error message can still be shown.
+        """
+        with self.lock:
+            if self.iam_account is None:
+                try:
+                    self.api_client.call_api(resource_path="/iam/Accounts?$select=Name",
+                                             method="GET",
+                                             auth_settings=['cookieAuth', 'http_signature', 'oAuth2', 'oAuth2']
+                                             )
+                    self.iam_account = json.loads(self.api_client.last_response.data)["Results"][0]
+                except Exception:
+                    return "Unknown"
+            return self.iam_account.get("Name")
+
+
+# Establish function to retrieve the Intersight account context of an Intersight API client
+intersight_account_context_creation_lock = threading.Lock()
+
+
+def get_intersight_account_context(api_client):
+    """This is a function to retrieve the Intersight account context for an
+    Intersight API client. The account context is created and attached to the
+    API client on first use, so that it is shared by every function and class
+    using the client.
+
+    Args:
+        api_client ("ApiClient"):
+            An ApiClient class instance which handles Intersight client-server
+            communication through the use of API keys.
+
+    Returns:
+        An IntersightAccountContext class instance.
+    """
+    with intersight_account_context_creation_lock:
+        intersight_account_context = getattr(api_client, "intersight_account_context", None)
+        if intersight_account_context is None:
+            intersight_account_context = IntersightAccountContext(api_client)
+            api_client.intersight_account_context = intersight_account_context
+    return intersight_account_context
+
+
+# Establish class to store the state of configured Intersight API objects across runs
+class IntersightObjectStateFile:
+    """This class is used to store a hash of the Intersight API body of each
+    configured Intersight object in a local JSON state file, along with the
+    MOID and modification time of the Intersight object. Intersight objects
+    with an unchanged Intersight API body and modification time can then be
+    skipped on later runs. The state file is saved after each batch of
+    stored object states and when flushed, rather than after every object.
+    """
+    def __init__(self,
+                 state_file_path,
+                 save_batch_size=50
+                 ):
+        self.state_file_path = state_file_path
+        self.save_batch_size = max(1, save_batch_size)
+        self.unsaved_object_state_count = 0
+        self.lock = threading.Lock()
+        self.object_states = {}
+        try:
+            with open(state_file_path, "r") as state_file:
+                self.object_states = json.load(state_file)
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError):
+            print(f"The state file '{state_file_path}' could not be read. "
+                  "A new state file will be created.")
+
+    def __repr__(self):
+        return (
+            f"{self.__class__.__name__}"
+            f"('{self.state_file_path}', "
+            f"{self.save_batch_size})"
+            )
+
+    def __str__(self):
+        return (f"{self.__class__.__name__} class object with "
+                f"{len(self.object_states)} stored object state(s)")
+
+    @staticmethod
+    def _state_key(intersight_api_path,
+                   organization_moid,
+                   object_name
+                   ):
+        """This function creates the state key for an Intersight object.
+
+        Args:
+            intersight_api_path (str):
+                The Intersight API path of the Intersight object.
+            organization_moid (str):
+                The MOID of the Intersight organization of the Intersight
+                object.
+            object_name (str):
+                The name of the Intersight object.
+
+        Returns:
+            A string containing the state key for the Intersight object.
+        """
+        base_intersight_api_path = intersight_api_path.split("?", 1)[0].strip("/")
+        return f"{base_intersight_api_path}|{organization_moid}|{object_name}"
+
+    @staticmethod
+    def api_body_hash(intersight_api_body):
+        """This function creates a canonical hash of an Intersight API body.
+
+        Args:
+            intersight_api_body (dict):
+                The Intersight API body of the Intersight object.
+
+        Returns:
+            A string of the SHA-256 hash of the Intersight API body.
+        """
+        canonical_intersight_api_body = json.dumps(intersight_api_body,
+                                                   sort_keys=True,
+                                                   separators=(",", ":"),
+                                                   default=str
+                                                   )
+        return hashlib.sha256(canonical_intersight_api_body.encode("utf-8")).hexdigest()
+
+    def is_unchanged(self,
+                     intersight_api_path,
+                     organization_moid,
+                     object_name,
+                     intersight_api_body,
+                     existing_intersight_object
+                     ):
+        """This function determines whether an Intersight object is unchanged
+        since it was last stored, both in the provided Intersight API body and
+        on Intersight.
+
+        Args:
+            intersight_api_path (str):
+                The Intersight API path of the Intersight object.
+            organization_moid (str):
+                The MOID of the Intersight organization of the Intersight
+                object.
+            object_name (str):
+                The name of the Intersight object.
+            intersight_api_body (dict):
+                The Intersight API body of the Intersight object.
+            existing_intersight_object (dict):
+                The pre-existing Intersight object.
+
+        Returns:
+            A boolean indicating whether the Intersight object is unchanged.
+        """
+        state_key = self._state_key(intersight_api_path,
+                                    organization_moid,
+                                    object_name
+                                    )
+        with self.lock:
+            object_state = self.object_states.get(state_key)
+        if not object_state or not existing_intersight_object.get("ModTime"):
+            return False
+        return (
+            object_state.get("Hash") == self.api_body_hash(intersight_api_body) and
+            object_state.get("Moid") == existing_intersight_object.get("Moid") and
+            object_state.get("ModTime") == existing_intersight_object.get("ModTime")
+            )
+
+    def set(self,
+            intersight_api_path,
+            organization_moid,
+            object_name,
+            intersight_api_body,
+            intersight_object
+            ):
+        """This function stores the state of a configured Intersight object.
+        The state file is saved once a full batch of object states has been
+        stored.
+
+        Args:
+            intersight_api_path (str):
+                The Intersight API path of the Intersight object.
+            organization_moid (str):
+                The MOID of the Intersight organization of the Intersight
+                object.
+            object_name (str):
+                The name of the Intersight object.
+            intersight_api_body (dict):
+                The Intersight API body of the Intersight object.
+            intersight_object (dict):
+                The Intersight object as returned by Intersight, including the
+                MOID and modification time.
+        """
+        if not intersight_object.get("Moid") or not intersight_object.get("ModTime"):
+            return
+        state_key = self._state_key(intersight_api_path,
+                                    organization_moid,
+                                    object_name
+                                    )
+        with self.lock:
+            self.object_states[state_key] = {
+                "Hash": self.api_body_hash(intersight_api_body),
+                "Moid": intersight_object["Moid"],
+                "ModTime": intersight_object["ModTime"]
+                }
+            self.unsaved_object_state_count += 1
+            if self.unsaved_object_state_count >= self.save_batch_size:
+                self._save()
+
+    def _save(self):
+        """This function saves the stored object states to the state file.
+        The lock of the state file must be held by the caller.
+        """
+        # Write the state file atomically, so an interrupted run leaves the previous state file intact
+        temporary_state_file_path = f"{self.state_file_path}.tmp"
+        try:
+            with open(temporary_state_file_path, "w") as state_file:
+                json.dump(self.object_states, state_file, indent=2, sort_keys=True)
+            os.replace(temporary_state_file_path, self.state_file_path)
+            self.unsaved_object_state_count = 0
+        except OSError:
+            print(f"The state file '{self.state_file_path}' could not be "
+                  "saved.")
+
+    def flush(self):
+        """This function saves any object states stored since the state file
+        was last saved.
+        """
+        with self.lock:
+            if self.unsaved_object_state_count:
+                self._save()
+
+
+# Establish function to attach a state file to an Intersight API client
+def set_intersight_object_state_file(api_client,
+                                     state_file_path
+                                     ):
+    """This is a function to attach a state file to an Intersight API client,
+    so that every Intersight object configured using the client is stored in
+    the state file and skipped on later runs if unchanged. The state file is
+    flushed when the process exits.
+
+    Args:
+        api_client ("ApiClient"):
+            An ApiClient class instance which handles Intersight client-server
+            communication through the use of API keys.
+        state_file_path (str):
+            The system file path of the state file.
+
+    Returns:
+        An IntersightObjectStateFile class instance.
+    """
+    intersight_object_state_file = IntersightObjectStateFile(state_file_path)
+    api_client.intersight_object_state_file = intersight_object_state_file
+    atexit.register(intersight_object_state_file.flush)
+    return intersight_object_state_file
+
+
+# Establish class to journal the completed steps of a deployment
+class IntersightDeploymentJournal:
+    """This class is used to record the completed steps of a deployment in an
+    append-only journal file, with one JSON entry per line. When a deployment
+    is resumed, the journaled steps are skipped and the journaled MOIDs are
+    used to pre-seed the MOID cache of the API client.
+    """
+    def __init__(self,
+                 journal_file_path,
+                 resume=False
+                 ):
+        self.journal_file_path = journal_file_path
+        self.resume = resume
+        self.completed_steps = {}
+        self.lock = threading.Lock()
+        if resume:
+            try:
+                with open(journal_file_path, "r") as journal_file:
+                    for journal_line in journal_file:
+                        try:
+                            journal_entry = json.loads(journal_line)
+                        except ValueError:
+                            # A partially written final entry is ignored
+                            continue
+                        if journal_entry.get("Step"):
+                            self.completed_steps[journal_entry["Step"]] = journal_entry
+            except FileNotFoundError:
+                print(f"The deployment journal '{journal_file_path}' was not "
+                      "found. All deployment steps will be performed.")
+        else:
+            # Start a new journal for a new deployment
+            try:
+                open(journal_file_path, "w").close()
+            except OSError:
+                print(f"The deployment journal '{journal_file_path}' could "
+                      "not be created.")
+
+    def __repr__(self):
+        return (
+            f"{self.__class__.__name__}"
+            f"('{self.journal_file_path}', "
+            f"{self.resume})"
+            )
+
+    def __str__(self):
+        return (f"{self.__class__.__name__} class object with "
+                f"{len(self.completed_steps)} completed step(s)")
+
+    def is_completed(self,
+                     step_name
+                     ):
+        """This function determines whether a deployment step was completed in
+        the previous run of the deployment.
+
+        Args:
+            step_name (str):
+                The name of the deployment step.
+
+        Returns:
+            A boolean indicating whether the deployment step was completed.
+        """
+        with self.lock:
+            return self.resume and step_name in self.completed_steps
+
+    def record(self,
+               step_name,
+               object_type,
+               object_name,
+               object_moid=None,
+               intersight_api_path=None,
+               organization=None
+               ):
+        """This function appends a completed deployment step to the journal
+        file. Each entry is flushed to disk before the deployment continues.
+
+        Args:
+            step_name (str):
+                The name of the deployment step.
+            object_type (str):
+                The type of Intersight object of the deployment step.
+            object_name (str):
+                The name of the Intersight object of the deployment step.
+            object_moid (str):
+                Optional; The MOID of the Intersight object. The default value
+                is None.
+            intersight_api_path (str):
+                Optional; The Intersight API path of the Intersight object.
+                The default value is None.
+            organization (str):
+                Optional; The Intersight organization of the Intersight object.
+                The default value is None.
+        """
+        journal_entry = {
+            "Step": step_name,
+            "ObjectType": object_type,
+            "Name": object_name,
+            "Moid": object_moid,
+            "Path": intersight_api_path.split("?", 1)[0].strip("/") if intersight_api_path else None,
+            "Organization": organization
+            }
+        with self.lock:
+            self.completed_steps[step_name] = journal_entry
+            try:
+                with open(self.journal_file_path, "a") as journal_file:
+                    journal_file.write(json.dumps(journal_entry) + "\n")
+                    journal_file.flush()
+                    os.fsync(journal_file.fileno())
+            except OSError:
+                print(f"The deployment journal '{self.journal_file_path}' "
+                      "could not be updated.")
+
+    def seed_moid_cache(self,
+                        intersight_moid_cache
+                        ):
+        """This function adds the MOIDs of the journaled Intersight objects to
+        a MOID cache.
+
+        Args:
+            intersight_moid_cache ("IntersightMoidCache"):
+                An IntersightMoidCache class instance.
+
+        Returns:
+            An integer of the number of MOIDs added to the MOID cache.
+        """
+        seeded_moid_count = 0
+        with self.lock:
+            journal_entries = list(self.completed_steps.values())
+        for journal_entry in journal_entries:
+            if all(journal_entry.get(journal_key) for journal_key in ("Path", "Organization", "Name", "Moid")):
+                intersight_moid_cache.set(journal_entry["Path"],
+                                          journal_entry["Organization"],
+                                          journal_entry["Name"],
+                                          journal_entry["Moid"]
+                                          )
+                seeded_moid_count += 1
+        return seeded_moid_count
+
+
+# Establish function to attach a deployment journal to an Intersight API client
+def set_intersight_deployment_journal(api_client,
+                                      journal_file_path,
+                                      resume=False
+                                      ):
+    """This is a function to attach a deployment journal to an Intersight API
+    client, so that every Intersight object configured using the client is
+    journaled. If the deployment is resumed, the MOID cache of the API client
+    is pre-seeded from the journal.
+
+    Args:
+        api_client ("ApiClient"):
+            An ApiClient class instance which handles Intersight client-server
+            communication through the use of API keys.
+        journal_file_path (str):
+            The system file path of the deployment journal.
+        resume (bool):
+            Optional; The setting to skip the deployment steps completed in
+            the previous run of the deployment. The default value is False.
+
+    Returns:
+        An IntersightDeploymentJournal class instance.
+    """
+    intersight_deployment_journal = IntersightDeploymentJournal(journal_file_path,
+                                                                resume=resume
+                                                                )
+    api_client.intersight_deployment_journal = intersight_deployment_journal
+    if resume:
+        seeded_moid_count = intersight_deployment_journal.seed_moid_cache(get_intersight_moid_cache(api_client))
+        print("Resuming the deployment from the deployment journal "
+              f"'{journal_file_path}'.")
+        print(f"{len(intersight_deployment_journal.completed_steps)} completed "
+              f"step(s) will be skipped and {seeded_moid_count} MOID(s) have "
+              "been restored.")
+    return intersight_deployment_journal
+
+
+# Establish function to check the deployment journal for a configured Intersight object
+def intersight_deployment_journal_checker(api_client,
+                                          object_type,
+                                          object_name,
+                                          organization
+                                          ):
+    """This is a function to determine whether an Intersight object was
+    configured in the previous run of a resumed deployment.
+
+    Args:
+        api_client ("ApiClient"):
+            An ApiClient class instance which handles Intersight client-server
+            communication through the use of API keys.
+        object_type (str):
+            The type of Intersight object.
+        object_name (str):
+            The name of the Intersight object.
+        organization (str):
+            The Intersight organization of the Intersight object.
+
+    Returns:
+        A boolean indicating whether the Intersight object was configured in
+        the previous run and can be skipped.
+    """
+    intersight_deployment_journal = getattr(api_client, "intersight_deployment_journal", None)
+    if intersight_deployment_journal and intersight_deployment_journal.is_completed(f"Configure {object_type} {object_name} in {organization}"):
+        print(f"The {object_type} named {object_name} was configured in the "
+              "previous run. The configuration will be skipped.")
+        return True
+    return False
+
+
+# Establish function to record a configured Intersight object in the deployment journal
+def intersight_deployment_journal_recorder(api_client,
+                                           intersight_api_path,
+                                           intersight_api_body,
+                                           object_type,
+                                           organization
+                                           ):
+    """This is a function to record a configured Intersight object in the
+    deployment journal of an Intersight API client, if provided. The MOID of
+    the Intersight object is taken from the object state cache, or otherwise
+    from the last response of the API client.
+
+    Args:
+        api_client ("ApiClient"):
+            An ApiClient class instance which handles Intersight client-server
+            communication through the use of API keys.
+        intersight_api_path (str):
+            The Intersight API path of the Intersight object.
+        intersight_api_body (dict):
+            The Intersight API body of the Intersight object.
+        object_type (str):
+            The type of Intersight object.
+        organization (str):
+            The Intersight organization of the Intersight object.
+    """
+    intersight_deployment_journal = getattr(api_client, "intersight_deployment_journal", None)
+    if not intersight_deployment_journal:
+        return
+    object_name = intersight_api_body.get("Name")
+    organization_moid = (intersight_api_body.get("Organization") or {}).get("Moid")
+    existing_intersight_object = None
+    if object_name and organization_moid:
+        existing_intersight_object = get_intersight_object_state_cache(api_client).get(intersight_api_path,
+                                                                                       organization_moid,
+                                                                                       object_name
+                                                                                       )
+    if existing_intersight_object:
+        object_moid = existing_intersight_object.get("Moid")
+    else:
+        try:
+            object_moid = json.loads(api_client.last_response.data).get("Moid")
+        except Exception:
+            object_moid = None
+    intersight_deployment_journal.record(f"Configure {object_type} {object_name} in {organization}",
+                                         object_type,
+                                         object_name,
+                                         object_moid=object_moid,
+                                         intersight_api_path=intersight_api_path,
+                                         organization=organization
+                                         )
+
+
+# Establish class to cache the live state of Intersight API objects for updates
+class IntersightObjectStateCache:
+    """This class is used to hold the live state of Intersight objects for a
+    specific Intersight API client. The Intersight objects under each
+    Intersight API path and organization are retrieved from Intersight once
+    with one filtered, paged query that selects only the compared attributes,
+    then indexed by name, so that pre-existing objects can be compared with
+    the provided configuration before any changes are made.
+    """
+    def __init__(self,
+                 api_client,
+                 page_size=1000
+                 ):
+        self.api_client = api_client
+        self.page_size = page_size
+        self.object_indexes = {}
+        self.object_index_attributes = {}
+        self.object_index_locks = {}
+        self.lock = threading.Lock()
+
+    def __repr__(self):
+        return (
+            f"{self.__class__.__name__}"
+            f"({self.api_client}, "
+            f"{self.page_size})"
+            )
+
+    def __str__(self):
+        return (f"{self.__class__.__name__} class object with "
+                f"{len(self.object_indexes)} indexed object type(s)")
+
+    def _get_object_index(self,
+                          intersight_api_path,
+                          organization_moid,
+                          select_attributes=None
+                          ):
+        """This function returns the index of the Intersight objects under an
+        Intersight API path and organization. The Intersight objects are
+        retrieved from Intersight on first use with one filtered query, and
+        retrieved again only if attributes that were not previously selected
+        are needed.
+
+        Args:
+            intersight_api_path (str):
+                The Intersight API path of the Intersight objects.
+            organization_moid (str):
+                The MOID of the Intersight organization of the Intersight
+                objects. If None, the Intersight objects are not filtered by
+                organization.
+            select_attributes (list):
+                Optional; A list of the attributes to be retrieved for each
+                Intersight object. The "Name", "Moid" and "ModTime" attributes
+                are always retrieved. The default value is None, which
+                retrieves all attributes.
+
+        Returns:
+            A dictionary with the names of the Intersight objects as keys and
+            the Intersight objects as values. If the Intersight objects could
+            not be retrieved, None is returned.
+        """
+        base_intersight_api_path = intersight_api_path.split("?", 1)[0].strip("/")
+        object_index_key = (base_intersight_api_path, organization_moid)
+        if select_attributes is None:
+            required_attributes = None
+        else:
+            required_attributes = {"Name", "Moid", "ModTime", *select_attributes}
+        with self.lock:
+            object_index_lock = self.object_index_locks.setdefault(object_index_key, threading.Lock())
+        with object_index_lock:
+            if object_index_key in self.object_indexes:
+                indexed_attributes = self.object_index_attributes[object_index_key]
+                if indexed_attributes is None or (required_attributes is not None and required_attributes <= indexed_attributes):
+                    return self.object_indexes[object_index_key]
+                # Retrieve the Intersight objects again with the previously selected attributes and the newly needed attributes
+                if required_attributes is not None:
+                    required_attributes |= indexed_attributes
+            filter_attributes = {"Organization": {"Moid": organization_moid}} if organization_moid else None
+            query_intersight_api_path = intersight_api_query_builder(base_intersight_api_path,
+                                                                     filter_attributes=filter_attributes,
+                                                                     select_attributes=sorted(required_attributes) if required_attributes else None
+                                                                     )
+            query_separator = "&" if "?" in query_intersight_api_path else "?"
+            object_index = {}
+            try:
+                skip_count = 0
+                while True:
+                    self.api_client.call_api(resource_path=f"/{query_intersight_api_path}{query_separator}$top={self.page_size}&$skip={skip_count}",
+                                             method="GET",
+                                             auth_settings=['cookieAuth', 'http_signature', 'oAuth2', 'oAuth2']
+                                             )
+                    retrieved_intersight_objects = json.loads(self.api_client.last_response.data).get("Results") or []
+                    for intersight_object in retrieved_intersight_objects:
+                        if intersight_object.get("Name"):
+                            object_index.setdefault(intersight_object["Name"], intersight_object)
+                    if len(retrieved_intersight_objects) < self.page_size:
+                        break
+                    skip_count += self.page_size
+            except Exception:
+                # Retrieve the Intersight objects again on the next use, as the error may be transient
+                print("The pre-existing objects under the Intersight API "
+                      f"resource path '{base_intersight_api_path}' could not "
+                      "be retrieved for comparison.")
+                return None
+            self.object_indexes[object_index_key] = object_index
+            self.object_index_attributes[object_index_key] = required_attributes
+            return object_index
+
+    def get(self,
+            intersight_api_path,
+            organization_moid,
+            object_name,
+            select_attributes=None
+            ):
+        """This function retrieves the live state of an Intersight object.
+
+        Args:
+            intersight_api_path (str):
+                The Intersight API path of the Intersight object.
+            organization_moid (str):
+                The MOID of the Intersight organization of the Intersight
+                object. If None, the Intersight object is not filtered by
+                organization.
+            object_name (str):
+                The name of the Intersight object.
+            select_attributes (list):
+                Optional; A list of the attributes of the Intersight object
+                to be compared. The default value is None, which retrieves all
+                attributes.
+
+        Returns:
+            A dictionary of the Intersight object. If the Intersight object
+            does not exist or the Intersight objects could not be retrieved,
+            None is returned.
+        """
+        object_index = self._get_object_index(intersight_api_path,
+                                              organization_moid,
+                                              select_attributes
+                                              )
+        if object_index is None:
+            return None
+        return object_index.get(object_name)
+
+    def set(self,
+            intersight_api_path,
+            organization_moid,
+            object_name,
+            intersight_object
+            ):
+        """This function stores the live state of an Intersight object after
+        it has been updated.
+
+        Args:
+            intersight_api_path (str):
+                The Intersight API path of the Intersight object.
+            organization_moid (str):
+                The MOID of the Intersight organization of the Intersight
+                object.
+            object_name (str):
+                The name of the Intersight object.
+            intersight_object (dict):
+                The Intersight object.
+        """
+        base_intersight_api_path = intersight_api_path.split("?", 1)[0].strip("/")
+        with self.lock:
+            object_index = self.object_indexes.get((base_intersight_api_path, organization_moid))
+            if object_index is not None:
+                object_index[object_name] = intersight_object
+
+
+# Establish function to retrieve the object state cache of an Intersight API client
+intersight_object_state_cache_creation_lock = threading.Lock()
+
+
+def get_intersight_object_state_cache(api_client):
+    """This is a function to retrieve the object state cache for an
+    Intersight API client. The object state cache is created and attached to
+    the API client on first use, so that it is shared by every function and
+    class using the client.
+
+    Args:
+        api_client ("ApiClient"):
+            An ApiClient class instance which handles Intersight client-server
+            communication through the use of API keys.
+
+    Returns:
+        An IntersightObjectStateCache class instance.
+    """
+    with intersight_object_state_cache_creation_lock:
+        intersight_object_state_cache = getattr(api_client, "intersight_object_state_cache", None)
+        if intersight_object_state_cache is None:
+            intersight_object_state_cache = IntersightObjectStateCache(api_client)
+            api_client.intersight_object_state_cache = intersight_object_state_cache
+    return intersight_object_state_cache
+
+
+# Establish function to compare a provided attribute value with the live state of an Intersight object
+def intersight_attribute_matcher(provided_attribute_value,
+                                 existing_attribute_value
+                                 ):
+    """This is a function to determine whether a provided attribute value
+    already matches the attribute value of a pre-existing Intersight object.
+    Dictionaries are matched on the provided keys only, since Intersight
+    returns additional read-only attributes such as "ClassId" and "link" on
+    each object reference.
+
+    Args:
+        provided_attribute_value (any):
+            The provided attribute value.
+        existing_attribute_value (any):
+            The attribute value of the pre-existing Intersight object.
+
+    Returns:
+        A boolean indicating whether the provided attribute value matches.
+    """
+    if isinstance(provided_attribute_value, dict):
+        if not isinstance(existing_attribute_value, dict):
+            return False
+        return all(
+            intersight_attribute_matcher(provided_sub_value, existing_attribute_value.get(provided_sub_key))
+            for provided_sub_key, provided_sub_value in provided_attribute_value.items()
+            )
+    if isinstance(provided_attribute_value, list):
+        if not isinstance(existing_attribute_value, list) or len(provided_attribute_value) != len(existing_attribute_value):
+            return False
+        return all(
+            intersight_attribute_matcher(provided_item, existing_item)
+            for provided_item, existing_item in zip(provided_attribute_value, existing_attribute_value)
+            )
+    return provided_attribute_value == existing_attribute_value
+
+
+# Establish function to update a pre-existing Intersight object with only the changed attributes
+def intersight_object_updater(api_client,
+                              intersight_api_path,
+                              intersight_api_body,
+                              object_type="object",
+                              update_api_body_maker=None,
+                              existing_object_attributes=None
+                              ):
+    """This is a function to update a pre-existing Intersight object. The
+    provided Intersight API body is compared with the live state of the
+    Intersight object and a PATCH is performed with only the changed
+    attributes. No changes are made if the Intersight object already matches.
+
+    Args:
+        api_client ("ApiClient"):
+            An ApiClient class instance which handles Intersight client-server
+            communication through the use of API keys.
+        intersight_api_path (str):
+            The Intersight API path of the Intersight object.
+        intersight_api_body (dict):
+            The Intersight API body of the Intersight object.
+        object_type (str):
+            Optional; The type of Intersight object. The default value is
+            "object".
+        update_api_body_maker (function):
+            Optional; A function that receives the pre-existing Intersight
+            object and returns the Intersight API body to be compared, or
+            None if the pre-existing Intersight object must be updated
+            through a POST instead. The default value is None, which compares
+            the provided Intersight API body.
+        existing_object_attributes (list):
+            Optional; A list of additional attributes of the pre-existing
+            Intersight object that are needed by the update_api_body_maker
+            function. Only the attributes of the provided Intersight API body
+            and these attributes are retrieved. The default value is None.
+
+    If a state file is attached to the API client, Intersight objects with an
+    unchanged Intersight API body and modification time since the last run
+    are skipped without comparison.
+
+    Returns:
+        A string with a statement indicating whether the update was
+        successful or failed, using the same statements as the POST method.
+        If the Intersight object already matches and no update was made,
+        "The object is unchanged." is returned. If the Intersight object does
+        not already exist or must be updated through a POST, None is
+        returned. None is also returned if the Intersight API body has no
+        name or organization.
+    """
+    existing_intersight_object_name = intersight_api_body.get("Name")
+    organization_moid = (intersight_api_body.get("Organization") or {}).get("Moid")
+    if not existing_intersight_object_name or not organization_moid:
+        return None
+    intersight_object_state_cache = get_intersight_object_state_cache(api_client)
+    existing_intersight_object = intersight_object_state_cache.get(intersight_api_path,
+                                                                   organization_moid,
+                                                                   existing_intersight_object_name,
+                                                                   select_attributes=[*intersight_api_body, *(existing_object_attributes or [])]
+                                                                   )
+    if existing_intersight_object is None:
+        return None
+    intersight_object_state_file = getattr(api_client, "intersight_object_state_file", None)
+    if intersight_object_state_file and intersight_object_state_file.is_unchanged(intersight_api_path,
+                                                                                  organization_moid,
+                                                                                  existing_intersight_object_name,
+                                                                                  intersight_api_body,
+                                                                                  existing_intersight_object
+                                                                                  ):
+        print(f"The {object_type} named {existing_intersight_object_name} is "
+              "unchanged since the last run. No update is needed.")
+        return "The object is unchanged."
+    if update_api_body_maker:
+        update_api_body = update_api_body_maker(existing_intersight_object)
+        if update_api_body is None:
+            return None
+    else:
+        update_api_body = intersight_api_body
+    # Determine the attributes that differ from the pre-existing object
+    changed_attributes = {
+        attribute_name: attribute_value
+        for attribute_name, attribute_value in update_api_body.items()
+        if not intersight_attribute_matcher(attribute_value, existing_intersight_object.get(attribute_name))
+        }
+    print(f"The targeted {object_type} already exists.")
+    if not changed_attributes:
+        print(f"The pre-existing {existing_intersight_object_name} already "
+              "matches the provided configuration. No update is needed.")
+        if intersight_object_state_file:
+            intersight_object_state_file.set(intersight_api_path,
+                                             organization_moid,
+                                             existing_intersight_object_name,
+                                             intersight_api_body,
+                                             existing_intersight_object
+                                             )
+        return "The object is unchanged."
+    print("An attempt will be made to update the changed attributes of the "
+          f"pre-existing {existing_intersight_object_name}: "
+          f"{', '.join(changed_attributes)}...")
+    full_intersight_api_path_with_moid = f"/{intersight_api_path.split('?', 1)[0].strip('/')}/{existing_intersight_object['Moid']}"
+    try:
+        api_client.call_api(resource_path=full_intersight_api_path_with_moid,
+                            method="PATCH",
+                            body=changed_attributes,
+                            auth_settings=['cookieAuth', 'http_signature', 'oAuth2', 'oAuth2']
+                            )
+        # Use the modification time returned by Intersight for the updated object
+        updated_intersight_object = {**existing_intersight_object, **changed_attributes, "ModTime": None}
+        try:
+            updated_intersight_object["ModTime"] = json.loads(api_client.last_response.data).get("ModTime")
+        except Exception:
+            pass
+        intersight_object_state_cache.set(intersight_api_path,
+                                          organization_moid,
+                                          existing_intersight_object_name,
+                                          updated_intersight_object
+                                          )
+        if intersight_object_state_file:
+            intersight_object_state_file.set(intersight_api_path,
+                                             organization_moid,
+                                             existing_intersight_object_name,
+                                             intersight_api_body,
+                                             updated_intersight_object
+                                             )
+        print(f"The update of the {object_type} has completed.")
+        print(f"The pre-existing {existing_intersight_object_name} has been "
+              "updated.")
+        return "The POST method was successful."
+    except Exception:
+        print("\nA configuration error has occurred!\n")
+        print(f"Unable to update the {object_type} under the Intersight API "
+              f"resource path '{full_intersight_api_path_with_moid}'.\n")
+        print(f"The pre-existing {existing_intersight_object_name} could not "
+              "be updated.")
+        print("Exception Message: ")
+        traceback.print_exc()
+        return "The POST method failed."
 
 
 # Establish function to test for the availability of the Intersight API and Intersight account
@@ -704,6 +1890,8 @@ def test_intersight_api_service(intersight_api_key_id,
             sys.exit(0)
         else:
             intersight_account_name = iam_account["Results"][0]["Name"]
+            # Store the Intersight account context for reuse by later lookups
+            get_intersight_account_context(api_client).set_account(iam_account["Results"][0])
             print("The Intersight API and Account Availability Test has "
                   "passed.\n")
             print(f"The Intersight account named '{intersight_account_name}' "
@@ -720,6 +1908,260 @@ def test_intersight_api_service(intersight_api_key_id,
         sys.exit(0)
 
 
+# Establish function to add server-side query options to an Intersight API path
+def intersight_api_query_builder(intersight_api_path,
+                                 filter_attributes=None,
+                                 select_attributes=None
+                                 ):
+    """This is a function to add the $filter and $select query options to an
+    Intersight API path, so that matching of Intersight objects and trimming
+    of returned attributes is performed by Intersight rather than locally.
+    Any query options already present on the Intersight API path are kept and
+    an existing $filter is combined with the new filter expressions.
+
+    Args:
+        intersight_api_path (str):
+            The Intersight API path of the Intersight objects. The path can
+            include existing query options, for example
+            "compute/Blades?$top=1000".
+        filter_attributes (dict):
+            Optional; A dictionary containing the attribute keys and values
+            that the Intersight objects must match. String, number and boolean
+            values are matched with the "eq" operator. Dictionary values
+            containing a "Moid" key, such as object references, are matched on
+            the referenced MOID. Values of any other type are skipped and must
+            be matched locally. The default value is None.
+        select_attributes (list):
+            Optional; A list containing the attribute keys to be returned for
+            each Intersight object. The default value is None, which returns
+            all attributes.
+
+    Returns:
+        A string of the Intersight API path with the query options applied.
+    """
+    def filter_value_formatter(attribute_value):
+        """This is a function to format an attribute value for use in an
+        Intersight API $filter expression.
+
+        Args:
+            attribute_value (str, int, float, bool):
+                The attribute value to be formatted.
+
+        Returns:
+            A string of the formatted attribute value.
+        """
+        if isinstance(attribute_value, bool):
+            return str(attribute_value).lower()
+        if isinstance(attribute_value, (int, float)):
+            return str(attribute_value)
+        escaped_attribute_value = attribute_value.replace("'", "''")
+        return f"'{escaped_attribute_value}'"
+
+    # Separate the base Intersight API path from any existing query options
+    if "?" in intersight_api_path:
+        base_intersight_api_path, existing_query = intersight_api_path.split("?", 1)
+        query_options = existing_query.split("&")
+    else:
+        base_intersight_api_path = intersight_api_path
+        query_options = []
+    # Create the list of filter expressions
+    filter_expressions = []
+    if filter_attributes:
+        for attribute_name, attribute_value in filter_attributes.items():
+            if isinstance(attribute_value, (str, int, float, bool)):
+                filter_expressions.append(f"{attribute_name} eq {filter_value_formatter(attribute_value)}")
+            elif isinstance(attribute_value, dict) and attribute_value.get("Moid"):
+                filter_expressions.append(f"{attribute_name}.Moid eq {filter_value_formatter(attribute_value['Moid'])}")
+    # Combine the filter expressions with any existing $filter query option
+    if filter_expressions:
+        for query_option in query_options:
+            if query_option.startswith("$filter="):
+                query_options.remove(query_option)
+                existing_filter_expression = urllib.parse.unquote(query_option[len("$filter="):])
+                filter_expressions.insert(0, f"({existing_filter_expression})")
+                break
+        combined_filter_expression = " and ".join(filter_expressions)
+        query_options.append(f"$filter={urllib.parse.quote(combined_filter_expression, safe='')}")
+    # Replace any existing $select query option
+    if select_attributes:
+        query_options = [query_option for query_option in query_options if not query_option.startswith("$select=")]
+        unique_select_attributes = list(dict.fromkeys(select_attributes))
+        query_options.append(f"$select={','.join(unique_select_attributes)}")
+    if query_options:
+        return f"{base_intersight_api_path}?{'&'.join(query_options)}"
+    return base_intersight_api_path
+
+
+# Establish class to cache the MOIDs of Intersight API objects retrieved by name
+class IntersightMoidCache:
+    """This class is used to cache the MOIDs of Intersight objects that have
+    been retrieved by name for a specific Intersight API client.
+    """
+    def __init__(self,
+                 time_to_live=900
+                 ):
+        self.time_to_live = time_to_live
+        self.cached_moids = {}
+        self.lock = threading.Lock()
+
+    def __repr__(self):
+        return (
+            f"{self.__class__.__name__}"
+            f"({self.time_to_live})"
+            )
+
+    def __str__(self):
+        return (f"{self.__class__.__name__} class object with "
+                f"{len(self.cached_moids)} cached MOIDs")
+
+    @staticmethod
+    def _cache_key(intersight_api_path,
+                   organization,
+                   object_name
+                   ):
+        """This function creates the cache key for an Intersight object. Any
+        query parameters are removed from the Intersight API path, so that
+        lookups of the same object under varying queries share one entry.
+
+        Args:
+            intersight_api_path (str):
+                The Intersight API path of the Intersight object.
+            organization (str):
+                The Intersight organization of the Intersight object.
+            object_name (str):
+                The name of the Intersight object.
+
+        Returns:
+            A tuple containing the cache key for the Intersight object.
+        """
+        base_intersight_api_path = intersight_api_path.split("?", 1)[0].strip("/")
+        return (base_intersight_api_path, organization, object_name)
+
+    def get(self,
+            intersight_api_path,
+            organization,
+            object_name
+            ):
+        """This function retrieves a cached MOID for an Intersight object.
+
+        Args:
+            intersight_api_path (str):
+                The Intersight API path of the Intersight object.
+            organization (str):
+                The Intersight organization of the Intersight object.
+            object_name (str):
+                The name of the Intersight object.
+
+        Returns:
+            A string of the cached MOID for the provided Intersight object. If
+            the MOID has not been cached or has expired, None will be returned.
+        """
+        cache_key = self._cache_key(intersight_api_path,
+                                    organization,
+                                    object_name
+                                    )
+        with self.lock:
+            cached_entry = self.cached_moids.get(cache_key)
+            if cached_entry is None:
+                return None
+            cached_moid, expiration_time = cached_entry
+            if time.monotonic() >= expiration_time:
+                self.cached_moids.pop(cache_key, None)
+                return None
+            return cached_moid
+
+    def set(self,
+            intersight_api_path,
+            organization,
+            object_name,
+            object_moid
+            ):
+        """This function caches the MOID for an Intersight object.
+
+        Args:
+            intersight_api_path (str):
+                The Intersight API path of the Intersight object.
+            organization (str):
+                The Intersight organization of the Intersight object.
+            object_name (str):
+                The name of the Intersight object.
+            object_moid (str):
+                The MOID of the Intersight object.
+        """
+        cache_key = self._cache_key(intersight_api_path,
+                                    organization,
+                                    object_name
+                                    )
+        with self.lock:
+            self.cached_moids[cache_key] = (object_moid,
+                                            time.monotonic() + self.time_to_live
+                                            )
+
+    def invalidate(self,
+                   intersight_api_path,
+                   organization=None,
+                   object_name=None
+                   ):
+        """This function removes cached MOIDs for Intersight objects under an
+        Intersight API path. This should be performed whenever an Intersight
+        object under the path is created, updated or deleted.
+
+        Args:
+            intersight_api_path (str):
+                The Intersight API path of the Intersight objects.
+            organization (str):
+                Optional; The Intersight organization of the Intersight
+                objects. The default value is None, which matches every
+                organization.
+            object_name (str):
+                Optional; The name of the Intersight object. The default value
+                is None, which matches every object name.
+        """
+        base_intersight_api_path = self._cache_key(intersight_api_path,
+                                                   organization,
+                                                   object_name
+                                                   )[0]
+        with self.lock:
+            for cache_key in list(self.cached_moids):
+                if (
+                    cache_key[0] == base_intersight_api_path and
+                    organization in (None, cache_key[1]) and
+                    object_name in (None, cache_key[2])
+                    ):
+                    self.cached_moids.pop(cache_key)
+
+    def clear(self):
+        """This function removes all cached MOIDs.
+        """
+        with self.lock:
+            self.cached_moids.clear()
+
+
+# Establish function to retrieve the MOID cache of an Intersight API client
+intersight_moid_cache_creation_lock = threading.Lock()
+
+
+def get_intersight_moid_cache(api_client):
+    """This is a function to retrieve the MOID cache for an Intersight API
+    client. The MOID cache is created and attached to the API client on first
+    use, so that it is shared by every function and class using the client.
+
+    Args:
+        api_client ("ApiClient"):
+            An ApiClient class instance which handles Intersight client-server
+            communication through the use of API keys.
+
+    Returns:
+        An IntersightMoidCache class instance.
+    """
+    with intersight_moid_cache_creation_lock:
+        intersight_moid_cache = getattr(api_client, "intersight_moid_cache", None)
+        if intersight_moid_cache is None:
+            intersight_moid_cache = IntersightMoidCache()
+            api_client.intersight_moid_cache = intersight_moid_cache
+    return intersight_moid_cache
+
+
 # Establish function to retrieve the MOID of a specific Intersight API object by name
 def intersight_object_moid_retriever(intersight_api_key_id,
                                      intersight_api_key,
@@ -776,32 +2218,21 @@ def intersight_object_moid_retriever(intersight_api_key_id,
                                     )
     else:
         api_client = preconfigured_api_client
-    try:
-        # Retrieve the Intersight Account name
-        api_client.call_api(resource_path="/iam/Accounts",
-                            method="GET",
-                            auth_settings=['cookieAuth', 'http_signature', 'oAuth2', 'oAuth2']
-                            )
-        response = api_client.last_response.data
-        iam_account = json.loads(response)
-        if api_client.last_response.status != 200:
-            print("The provided Intersight account information could not be "
-                  "accessed.")
-            print("Exiting due to the Intersight account being unavailable.\n")
-            print("Please verify that the correct API Key ID and API Key have "
-                  "been entered, then re-attempt execution.\n")
-            sys.exit(0)
-        else:
-            intersight_account_name = iam_account["Results"][0]["Name"]
-    except Exception:
-        print("\nA configuration error has occurred!\n")
-        print("Unable to access the Intersight API.")
-        print("Exiting due to the Intersight API being unavailable.\n")
-        print("Please verify that the correct API Key ID and API Key have "
-              "been entered, then re-attempt execution.\n")
-        sys.exit(0)
+    # Check the MOID cache of the API client for the provided object
+    intersight_moid_cache = get_intersight_moid_cache(api_client)
+    cached_intersight_object_moid = intersight_moid_cache.get(intersight_api_path,
+                                                              organization,
+                                                              object_name
+                                                              )
+    if cached_intersight_object_moid:
+        return cached_intersight_object_moid
+    # Retrieve the Intersight account context of the API client
+    intersight_account_context = get_intersight_account_context(api_client)
     # Retrieving the provided object from Intersight...
-    full_intersight_api_path = f"/{intersight_api_path}"
+    filtered_intersight_api_path = intersight_api_query_builder(intersight_api_path,
+                                                                filter_attributes={"Name": object_name}
+                                                                )
+    full_intersight_api_path = f"/{filtered_intersight_api_path}"
     try:
         api_client.call_api(resource_path=full_intersight_api_path,
                             method="GET",
@@ -823,31 +2254,44 @@ def intersight_object_moid_retriever(intersight_api_key_id,
         sys.exit(0)
 
     if intersight_objects.get("Results"):
+        # Resolve the MOID of the provided organization once, on first use
+        provided_organization_moid = None
         for intersight_object in intersight_objects.get("Results"):
             if intersight_object.get("Organization"):
-                provided_organization_moid = intersight_object_moid_retriever(intersight_api_key_id=None,
-                                                                              intersight_api_key=None,
-                                                                              object_name=organization,
-                                                                              intersight_api_path="organization/Organizations?$top=1000",
-                                                                              object_type="Organization",
-                                                                              preconfigured_api_client=api_client
-                                                                              )
+                if provided_organization_moid is None:
+                    provided_organization_moid = intersight_object_moid_retriever(intersight_api_key_id=None,
+                                                                                  intersight_api_key=None,
+                                                                                  object_name=organization,
+                                                                                  intersight_api_path="organization/Organizations?$top=1000",
+                                                                                  object_type="Organization",
+                                                                                  preconfigured_api_client=api_client
+                                                                                  )
                 if intersight_object.get("Organization", {}).get("Moid") == provided_organization_moid:
                     if intersight_object.get("Name") == object_name:
                         intersight_object_moid = intersight_object.get("Moid")
                         # The provided object and MOID has been identified and retrieved.
+                        intersight_moid_cache.set(intersight_api_path,
+                                                  organization,
+                                                  object_name,
+                                                  intersight_object_moid
+                                                  )
                         return intersight_object_moid
             else:
                 if intersight_object.get("Name") == object_name:
                     intersight_object_moid = intersight_object.get("Moid")
                     # The provided object and MOID has been identified and retrieved.
+                    intersight_moid_cache.set(intersight_api_path,
+                                              organization,
+                                              object_name,
+                                              intersight_object_moid
+                                              )
                     return intersight_object_moid
         else:
             print("\nA configuration error has occurred!\n")
             print(f"The provided {object_type} named '{object_name}' was not "
                   "found.")
             print("Please check the Intersight Account named "
-                  f"{intersight_account_name}.")
+                  f"{intersight_account_context.get_account_name()}.")
             print("Verify through the API or GUI that the needed "
                   f"{object_type} is present.")
             print(f"If the needed {object_type} is missing, please create it.")
@@ -858,9 +2302,9 @@ def intersight_object_moid_retriever(intersight_api_key_id,
         print(f"The provided {object_type} named '{object_name}' was not "
               "found.")
         print(f"No requested {object_type} instance is currently available in "
-              f"the Intersight account named {intersight_account_name}.")
+              f"the Intersight account named {intersight_account_context.get_account_name()}.")
         print("Please check the Intersight Account named "
-              f"{intersight_account_name}.")
+              f"{intersight_account_context.get_account_name()}.")
         print(f"Verify through the API or GUI that the needed {object_type} "
               "is present.")
         print(f"If the needed {object_type} is missing, please create it.")
@@ -868,16 +2312,23 @@ def intersight_object_moid_retriever(intersight_api_key_id,
         sys.exit(0)
 
 
-# Establish function to retrieve all instances of a particular Intersight API object type
-def get_intersight_objects(intersight_api_key_id,
-                           intersight_api_key,
-                           intersight_api_path,
-                           object_type="object",
-                           intersight_base_url="https://www.intersight.com/api/v1",
-                           preconfigured_api_client=None
-                           ):
-    """This is a function to perform an HTTP GET on all objects under an
-    available Intersight API type.
+# Establish function to retrieve all instances of a particular Intersight API object type one page at a time
+def get_intersight_object_pages(intersight_api_key_id,
+                                intersight_api_key,
+                                intersight_api_path,
+                                object_type="object",
+                                intersight_base_url="https://www.intersight.com/api/v1",
+                                preconfigured_api_client=None,
+                                filter_attributes=None,
+                                select_attributes=None,
+                                page_size=1000,
+                                count_preflight=False
+                                ):
+    """This is a generator function to perform paginated HTTP GETs on all
+    objects under an available Intersight API type. The objects are retrieved
+    using the $top and $skip query options and provided one page at a time,
+    so that large object types can be processed without holding every
+    object in memory.
 
     Args:
         intersight_api_key_id (str):
@@ -887,9 +2338,8 @@ def get_intersight_objects(intersight_api_key_id,
         intersight_api_path (str):
             The path to the targeted Intersight API object type. For example,
             to specify the Intersight API type for adapter configuration
-            policies, enter "adapter/ConfigPolicies". More API types can be
-            found in the Intersight API reference library at
-            https://intersight.com/apidocs/introduction/overview/.
+            policies, enter "adapter/ConfigPolicies". Any $top or $skip query
+            options on the path are replaced by the pagination settings.
         object_type (str):
             Optional; The type of Intersight object. The default value is
             "object".
@@ -904,16 +2354,81 @@ def get_intersight_objects(intersight_api_key_id,
             is provided, empty strings ("") or None can be provided for the
             intersight_api_key_id, intersight_api_key, and intersight_base_url
             arguments.
+        filter_attributes (dict):
+            Optional; A dictionary containing the attribute keys and values
+            that the returned objects must match. The default value is None.
+        select_attributes (list):
+            Optional; A list containing the attribute keys to be returned for
+            each object. The default value is None.
+        page_size (int):
+            Optional; The number of objects to be retrieved per page. The
+            maximum accepted by Intersight is 1000. The default value is 1000.
+        count_preflight (bool):
+            Optional; The option to retrieve the total number of matching
+            objects with the $count query option before the pages are
+            retrieved, so that the exact number of pages is requested. The
+            default value is False.
+
+    Yields:
+        A list containing the objects of the specified API type for each
+        retrieved page.
 
-    Returns:
-        A dictionary containing all objects of the specified API type. If the
-        API type is inaccessible, an implicit value of None will be returned.
-        
     Raises:
         Exception:
             An exception occurred due to an issue accessing the Intersight API
             path. The status code or error message will be specified.
     """
+    def paginated_api_path_maker(additional_query_options):
+        """This is a function to add query options to the filtered Intersight
+        API path, after removing any existing pagination query options.
+
+        Args:
+            additional_query_options (list):
+                A list of the query options to be added.
+
+        Returns:
+            A string of the Intersight API path with the query options added.
+        """
+        if "?" in filtered_intersight_api_path:
+            base_intersight_api_path, existing_query = filtered_intersight_api_path.split("?", 1)
+            query_options = [query_option for query_option in existing_query.split("&")
+                             if not query_option.startswith(("$top=", "$skip=", "$count="))]
+        else:
+            base_intersight_api_path = filtered_intersight_api_path
+            query_options = []
+        query_options.extend(additional_query_options)
+        return f"/{base_intersight_api_path}?{'&'.join(query_options)}"
+
+    def intersight_api_get(full_intersight_api_path):
+        """This is a function to perform an HTTP GET on an Intersight API path.
+
+        Args:
+            full_intersight_api_path (str):
+                The full Intersight API path to be retrieved.
+
+        Returns:
+            A dictionary containing the retrieved Intersight API response.
+        """
+        try:
+            api_client.call_api(resource_path=full_intersight_api_path,
+                                method="GET",
+                                auth_settings=['cookieAuth', 'http_signature', 'oAuth2', 'oAuth2']
+                                )
+            response = api_client.last_response.data
+            # The Intersight API resource path has been accessed successfully.
+            return json.loads(response)
+        except Exception:
+            print("\nA configuration error has occurred!\n")
+            print(f"There was an issue retrieving the requested {object_type} "
+                  "instances from Intersight.")
+            print("Unable to access the provided Intersight API resource path "
+                  f"'{intersight_api_path}'.")
+            print("Please review and resolve any error messages, then re-attempt "
+                  "execution.\n")
+            print("Exception Message: ")
+            traceback.print_exc()
+            sys.exit(0)
+
     # Define Intersight SDK ApiClient variable
     if preconfigured_api_client is None:
         api_client = get_api_client(api_key_id=intersight_api_key_id,
@@ -922,28 +2437,103 @@ def get_intersight_objects(intersight_api_key_id,
                                     )
     else:
         api_client = preconfigured_api_client
-    # Retrieving the provided object from Intersight...
-    full_intersight_api_path = f"/{intersight_api_path}"
-    try:
-        api_client.call_api(resource_path=full_intersight_api_path,
-                            method="GET",
-                            auth_settings=['cookieAuth', 'http_signature', 'oAuth2', 'oAuth2']
-                            )
-        response = api_client.last_response.data
-        intersight_objects = json.loads(response)
-        # The Intersight API resource path has been accessed successfully.
-        return intersight_objects
-    except Exception:
-        print("\nA configuration error has occurred!\n")
-        print(f"There was an issue retrieving the requested {object_type} "
-              "instances from Intersight.")
-        print("Unable to access the provided Intersight API resource path "
-              f"'{intersight_api_path}'.")
-        print("Please review and resolve any error messages, then re-attempt "
-              "execution.\n")
-        print("Exception Message: ")
-        traceback.print_exc()
-        sys.exit(0)
+    filtered_intersight_api_path = intersight_api_query_builder(intersight_api_path,
+                                                                filter_attributes=filter_attributes,
+                                                                select_attributes=select_attributes
+                                                                )
+    # Retrieve the total number of matching objects, if requested
+    total_object_count = None
+    if count_preflight:
+        intersight_object_count = intersight_api_get(paginated_api_path_maker(["$count=true"]))
+        total_object_count = intersight_object_count.get("Count", 0)
+    # Retrieve the matching objects one page at a time
+    skip_count = 0
+    while total_object_count is None or skip_count < total_object_count:
+        intersight_objects_page = intersight_api_get(paginated_api_path_maker([f"$top={page_size}", f"$skip={skip_count}"]))
+        intersight_objects_page_results = intersight_objects_page.get("Results") or []
+        if intersight_objects_page_results:
+            yield intersight_objects_page_results
+        if len(intersight_objects_page_results) < page_size:
+            break
+        skip_count += page_size
+
+
+# Establish function to retrieve all instances of a particular Intersight API object type
+def get_intersight_objects(intersight_api_key_id,
+                           intersight_api_key,
+                           intersight_api_path,
+                           object_type="object",
+                           intersight_base_url="https://www.intersight.com/api/v1",
+                           preconfigured_api_client=None,
+                           filter_attributes=None,
+                           select_attributes=None
+                           ):
+    """This is a function to perform an HTTP GET on all objects under an
+    available Intersight API type. Every page of objects is retrieved, so the
+    results are not limited by the page size of a single request. To process
+    large object types one page at a time, use get_intersight_object_pages.
+
+    Args:
+        intersight_api_key_id (str):
+            The ID of the Intersight API key.
+        intersight_api_key (str):
+            The system file path of the Intersight API key.
+        intersight_api_path (str):
+            The path to the targeted Intersight API object type. For example,
+            to specify the Intersight API type for adapter configuration
+            policies, enter "adapter/ConfigPolicies". More API types can be
+            found in the Intersight API reference library at
+            https://intersight.com/apidocs/introduction/overview/.
+        object_type (str):
+            Optional; The type of Intersight object. The default value is
+            "object".
+        intersight_base_url (str):
+            Optional; The base URL for Intersight API paths. The default value
+            is "https://www.intersight.com/api/v1". This value typically only
+            needs to be changed if using the Intersight Virtual Appliance.
+        preconfigured_api_client ("ApiClient"):
+            Optional; An ApiClient class instance which handles
+            Intersight client-server communication through the use of API keys.
+            The default value is None. If a preconfigured_api_client argument
+            is provided, empty strings ("") or None can be provided for the
+            intersight_api_key_id, intersight_api_key, and intersight_base_url
+            arguments.
+        filter_attributes (dict):
+            Optional; A dictionary containing the attribute keys and values
+            that the returned objects must match. The matching is performed
+            by Intersight through the $filter query option. The default value
+            is None.
+        select_attributes (list):
+            Optional; A list containing the attribute keys to be returned for
+            each object through the $select query option. The default value is
+            None, which returns all attributes.
+
+    Returns:
+        A dictionary containing all objects of the specified API type. If the
+        API type is inaccessible, an implicit value of None will be returned.
+        
+    Raises:
+        Exception:
+            An exception occurred due to an issue accessing the Intersight API
+            path. The status code or error message will be specified.
+    """
+    # Retrieve every page of matching objects from Intersight
+    intersight_objects_results = []
+    for intersight_objects_page_results in get_intersight_object_pages(intersight_api_key_id,
+                                                                       intersight_api_key,
+                                                                       intersight_api_path,
+                                                                       object_type=object_type,
+                                                                       intersight_base_url=intersight_base_url,
+                                                                       preconfigured_api_client=preconfigured_api_client,
+                                                                       filter_attributes=filter_attributes,
+                                                                       select_attributes=select_attributes
+                                                                       ):
+        intersight_objects_results.extend(intersight_objects_page_results)
+    intersight_objects = {
+        "ObjectType": "mo.List",
+        "Results": intersight_objects_results
+        }
+    return intersight_objects
 
 
 # Establish function to retrieve a particular instance of a particular Intersight API object type
@@ -1263,6 +2853,9 @@ class IdConfigurator:
     """
     object_type = "ID Configurator"
     attributes_that_require_special_handling = None
+    bulk_request_chunk_size = 100
+    bulk_request_maximum_chunk_size = 100
+    bulk_request_retry_limit = 2
     object_variable_value_maps = None
     
     def __init__(self,
@@ -1509,6 +3102,147 @@ class IdConfigurator:
                         backend_object_variable_value
                         )
 
+    def _bulk_post_intersight_objects(self,
+                                      staged_intersight_objects,
+                                      configured_intersight_objects=None,
+                                      bulk_object_type=None
+                                      ):
+        """This function configures multiple objects on Intersight by packing
+        the object POSTs into chunks of sub-requests that are sent through the
+        Intersight bulk/Requests API. The result of each sub-request is
+        mapped back to its object and only the objects that failed with a
+        retryable status are resubmitted.
+
+        Args:
+            staged_intersight_objects (list):
+                A list of tuples for the objects to be configured. Each tuple
+                contains the display name of the object, such as a VLAN name
+                or a Port ID, and the Intersight API body of the object. A
+                tuple can also contain the class instance that staged the
+                object as a third item, so that the objects of several
+                classes, such as the Port roles of a Port Policy, can share
+                the same bulk requests. The Intersight API path and object
+                type of that class instance are then used for the object.
+            configured_intersight_objects (list):
+                Optional; A list to be extended with the configured objects.
+                Each configured object is the Intersight API body of the
+                object updated with the attributes returned by Intersight,
+                such as the MOID. The default value is None.
+            bulk_object_type (str):
+                Optional; The type of the objects to be used in messages about
+                multiple objects. The default value is None, which uses the
+                object type of the class.
+
+        Returns:
+            A list of the tuples for the objects that could not be
+            configured.
+        """
+        def retryable_status_check(sub_request_status):
+            """This is a function to check whether a failed sub-request can be
+            retried. Sub-requests without a result, throttled sub-requests and
+            sub-requests that failed with a server error are retried.
+
+            Args:
+                sub_request_status (int):
+                    The HTTP status code of the sub-request.
+
+            Returns:
+                A boolean indicating whether the sub-request can be retried.
+            """
+            return sub_request_status in (0, 429) or sub_request_status >= 500
+
+        def object_configurator_retriever(intersight_object):
+            """This is a function to retrieve the class instance that staged
+            an object.
+
+            Args:
+                intersight_object (tuple):
+                    The tuple for the staged object.
+
+            Returns:
+                The class instance that staged the object. If no class
+                instance was provided with the object, this class instance is
+                returned.
+            """
+            return intersight_object[2] if len(intersight_object) > 2 else self
+
+        bulk_object_type = bulk_object_type or self.object_type
+        bulk_request_chunk_size = min(self.bulk_request_chunk_size,
+                                      self.bulk_request_maximum_chunk_size
+                                      )
+        pending_intersight_objects = list(staged_intersight_objects)
+        for bulk_request_attempt in range(self.bulk_request_retry_limit + 1):
+            if bulk_request_attempt:
+                print(f"\nRetrying the configuration of "
+                      f"{len(pending_intersight_objects)} {bulk_object_type}s "
+                      "that failed to be configured...")
+                time.sleep(bulk_request_attempt)
+            retryable_intersight_objects = []
+            failed_intersight_objects = []
+            for chunk_start in range(0, len(pending_intersight_objects), bulk_request_chunk_size):
+                intersight_object_chunk = pending_intersight_objects[chunk_start:chunk_start + bulk_request_chunk_size]
+                bulk_request_body = {
+                    "Verb": "POST",
+                    "Uri": f"/v1/{self.intersight_api_path}",
+                    "Requests": [
+                        {"ObjectType": "bulk.RestSubRequest",
+                         "Uri": f"/v1/{object_configurator_retriever(intersight_object).intersight_api_path}",
+                         "Body": intersight_object[1]}
+                        for intersight_object in intersight_object_chunk
+                        ]
+                    }
+                try:
+                    self.api_client.call_api(resource_path="/bulk/Requests",
+                                             method="POST",
+                                             body=bulk_request_body,
+                                             auth_settings=['cookieAuth', 'http_signature', 'oAuth2', 'oAuth2']
+                                             )
+                    bulk_request_results = json.loads(self.api_client.last_response.data).get("Results") or []
+                except Exception:
+                    print("\nA configuration error has occurred!\n")
+                    print(f"Unable to configure {len(intersight_object_chunk)} "
+                          f"{bulk_object_type}s under the Intersight API "
+                          "resource path '/bulk/Requests'.\n")
+                    print("Exception Message: ")
+                    traceback.print_exc()
+                    retryable_intersight_objects.extend(intersight_object_chunk)
+                    continue
+                # Map the result of each sub-request back to its object
+                for sub_request_index, intersight_object in enumerate(intersight_object_chunk):
+                    if sub_request_index < len(bulk_request_results):
+                        sub_request_result = bulk_request_results[sub_request_index]
+                    else:
+                        sub_request_result = {}
+                    sub_request_status = sub_request_result.get("Status") or 0
+                    object_configurator = object_configurator_retriever(intersight_object)
+                    if 200 <= sub_request_status < 300:
+                        print(f"The configuration of {object_configurator.object_type} "
+                              f"{intersight_object[0]} has completed.")
+                        if configured_intersight_objects is not None:
+                            configured_intersight_objects.append(
+                                {**intersight_object[1], **(sub_request_result.get("Body") or {})}
+                                )
+                    elif retryable_status_check(sub_request_status):
+                        retryable_intersight_objects.append(intersight_object)
+                    else:
+                        sub_request_result_body = sub_request_result.get("Body") or {}
+                        print("\nA configuration error has occurred!\n")
+                        print(f"Unable to configure {object_configurator.object_type} "
+                              f"{intersight_object[0]} under the Intersight "
+                              f"API resource path '/{object_configurator.intersight_api_path}'.")
+                        print(f"Status Code: {sub_request_status}")
+                        print(f"Error Message: {sub_request_result_body.get('message', sub_request_result_body)}\n")
+                        failed_intersight_objects.append(intersight_object)
+            pending_intersight_objects = retryable_intersight_objects
+            if not pending_intersight_objects:
+                break
+        for intersight_object in pending_intersight_objects:
+            print("\nA configuration error has occurred!\n")
+            print(f"Unable to configure {object_configurator_retriever(intersight_object).object_type} "
+                  f"{intersight_object[0]} after "
+                  f"{self.bulk_request_retry_limit + 1} attempts.\n")
+        return failed_intersight_objects + pending_intersight_objects
+
 
 # Establish base classes for configuring Intersight UCS Policies
 class UcsPolicy:
@@ -1582,14 +3316,46 @@ class UcsPolicy:
                 The status code or error message will be specified.
         """
         full_intersight_api_path = f"/{self.intersight_api_path}"
+        # Skip the object if it was configured in the previous run of a resumed deployment
+        if intersight_deployment_journal_checker(api_client=self.api_client,
+                                                 object_type=self.object_type,
+                                                 object_name=self.intersight_api_body.get("Name"),
+                                                 organization=self.organization
+                                                 ):
+            return "The POST method was successful."
+        # Compare the provided configuration with any pre-existing object and update only the changed attributes
+        intersight_object_update_status = intersight_object_updater(api_client=self.api_client,
+                                                                    intersight_api_path=self.intersight_api_path,
+                                                                    intersight_api_body=self.intersight_api_body,
+                                                                    object_type=self.object_type
+                                                                    )
+        if intersight_object_update_status is not None:
+            if intersight_object_update_status in ("The POST method was successful.", "The object is unchanged."):
+                intersight_deployment_journal_recorder(api_client=self.api_client,
+                                                       intersight_api_path=self.intersight_api_path,
+                                                       intersight_api_body=self.intersight_api_body,
+                                                       object_type=self.object_type,
+                                                       organization=self.organization
+                                                       )
+            return intersight_object_update_status
         try:
             self.api_client.call_api(resource_path=full_intersight_api_path,
                                      method="POST",
                                      body=self.intersight_api_body,
                                      auth_settings=['cookieAuth', 'http_signature', 'oAuth2', 'oAuth2']
                                      )
+            # Invalidate any cached MOID for the newly configured object
+            get_intersight_moid_cache(self.api_client).invalidate(self.intersight_api_path,
+                                                                   object_name=self.intersight_api_body.get("Name")
+                                                                   )
             print(f"The configuration of the base {self.object_type} "
                   "has completed.")
+            intersight_deployment_journal_recorder(api_client=self.api_client,
+                                                   intersight_api_path=self.intersight_api_path,
+                                                   intersight_api_body=self.intersight_api_body,
+                                                   object_type=self.object_type,
+                                                   organization=self.organization
+                                                   )
             return "The POST method was successful."
         except intersight.exceptions.ApiException as error:
             if error.status == 409:
@@ -1618,6 +3384,12 @@ class UcsPolicy:
                           "completed.")
                     print(f"The pre-existing {existing_intersight_object_name} "
                           "has been updated.")
+                    intersight_deployment_journal_recorder(api_client=self.api_client,
+                                                           intersight_api_path=self.intersight_api_path,
+                                                           intersight_api_body=self.intersight_api_body,
+                                                           object_type=self.object_type,
+                                                           organization=self.organization
+                                                           )
                     return "The POST method was successful."
                 except Exception:
                     print("\nA configuration error has occurred!\n")
@@ -2119,14 +3891,46 @@ class UcsDomainProfile:
                 The status code or error message will be specified.
         """
         full_intersight_api_path = f"/{self.intersight_api_path}"
+        # Skip the object if it was configured in the previous run of a resumed deployment
+        if intersight_deployment_journal_checker(api_client=self.api_client,
+                                                 object_type=self.object_type,
+                                                 object_name=self.intersight_api_body.get("Name"),
+                                                 organization=self.ucs_domain_profile_organization
+                                                 ):
+            return "The POST method was successful."
+        # Compare the provided configuration with any pre-existing object and update only the changed attributes
+        intersight_object_update_status = intersight_object_updater(api_client=self.api_client,
+                                                                    intersight_api_path=self.intersight_api_path,
+                                                                    intersight_api_body=self.intersight_api_body,
+                                                                    object_type=self.object_type
+                                                                    )
+        if intersight_object_update_status is not None:
+            if intersight_object_update_status in ("The POST method was successful.", "The object is unchanged."):
+                intersight_deployment_journal_recorder(api_client=self.api_client,
+                                                       intersight_api_path=self.intersight_api_path,
+                                                       intersight_api_body=self.intersight_api_body,
+                                                       object_type=self.object_type,
+                                                       organization=self.ucs_domain_profile_organization
+                                                       )
+            return intersight_object_update_status
         try:
             self.api_client.call_api(resource_path=full_intersight_api_path,
                                      method="POST",
                                      body=self.intersight_api_body,
                                      auth_settings=['cookieAuth', 'http_signature', 'oAuth2', 'oAuth2']
                                      )
+            # Invalidate any cached MOID for the newly configured object
+            get_intersight_moid_cache(self.api_client).invalidate(self.intersight_api_path,
+                                                                   object_name=self.intersight_api_body.get("Name")
+                                                                   )
             print(f"The configuration of the base {self.object_type} "
                   "has completed.")
+            intersight_deployment_journal_recorder(api_client=self.api_client,
+                                                   intersight_api_path=self.intersight_api_path,
+                                                   intersight_api_body=self.intersight_api_body,
+                                                   object_type=self.object_type,
+                                                   organization=self.ucs_domain_profile_organization
+                                                   )
             return "The POST method was successful."
         except intersight.exceptions.ApiException as error:
             if error.status == 409:
@@ -2154,6 +3958,12 @@ class UcsDomainProfile:
                           "completed.")
                     print(f"The pre-existing {existing_intersight_object_name} "
                           "has been updated.")
+                    intersight_deployment_journal_recorder(api_client=self.api_client,
+                                                           intersight_api_path=self.intersight_api_path,
+                                                           intersight_api_body=self.intersight_api_body,
+                                                           object_type=self.object_type,
+                                                           organization=self.ucs_domain_profile_organization
+                                                           )
                     return "The POST method was successful."
                 except Exception:
                     print("\nA configuration error has occurred!\n")
@@ -2536,6 +4346,10 @@ def assign_and_deploy_ucs_domain_profile(intersight_api_key_id,
             is provided, empty strings ("") or None can be provided for the
             intersight_api_key_id, intersight_api_key, and intersight_base_url
             arguments.
+
+    Returns:
+        A string with a statement indicating whether the POST methods for
+        the assignment and deployment were successful or failed.
     """
     def post_intersight_switch_profile_update(switch_profile_moid,
                                               switch_profile_api_body,
@@ -2592,30 +4406,8 @@ def assign_and_deploy_ucs_domain_profile(intersight_api_key_id,
                                     )
     else:
         api_client = preconfigured_api_client
-    try:
-        # Retrieve the Intersight Account name
-        api_client.call_api(resource_path="/iam/Accounts",
-                            method="GET",
-                            auth_settings=['cookieAuth', 'http_signature', 'oAuth2', 'oAuth2']
-                            )
-        response = api_client.last_response.data
-        iam_account = json.loads(response)
-        if api_client.last_response.status != 200:
-            print("The provided Intersight account information could not be "
-                  "accessed.")
-            print("Exiting due to the Intersight account being unavailable.\n")
-            print("Please verify that the correct API Key ID and API Key have "
-                  "been entered, then re-attempt execution.\n")
-            sys.exit(0)
-        else:
-            intersight_account_name = iam_account["Results"][0]["Name"]
-    except Exception:
-        print("\nA configuration error has occurred!\n")
-        print("Unable to access the Intersight API.")
-        print("Exiting due to the Intersight API being unavailable.\n")
-        print("Please verify that the correct API Key ID and API Key have "
-              "been entered, then re-attempt execution.\n")
-        sys.exit(0)
+    # Retrieve the Intersight account context of the API client
+    intersight_account_context = get_intersight_account_context(api_client)
     # Get UCS Domain Profile MOID
     ucs_domain_profile_moid = intersight_object_moid_retriever(intersight_api_key_id=None,
                                                                intersight_api_key=None,
@@ -2703,7 +4495,7 @@ def assign_and_deploy_ucs_domain_profile(intersight_api_key_id,
                 print("The Intersight Target with the provided identifier of "
                       f"'{target_assignment_identifier}' was not found.")
                 print("Please check the Intersight Account named "
-                      f"{intersight_account_name}.")
+                      f"{intersight_account_context.get_account_name()}.")
                 print("Verify through the API or GUI that the needed "
                       "Intersight Target is present.")
                 print("If the needed Intersight Target is missing, please "
@@ -2718,9 +4510,9 @@ def assign_and_deploy_ucs_domain_profile(intersight_api_key_id,
             print(f"The Intersight Target with the provided identifier of "
                   f"'{target_assignment_identifier}' was not found.")
             print("No Intersight targets are currently available in the "
-                  f"Intersight account named {intersight_account_name}.")
+                  f"Intersight account named {intersight_account_context.get_account_name()}.")
             print("Please check the Intersight Account named "
-                  f"{intersight_account_name}.")
+                  f"{intersight_account_context.get_account_name()}.")
             print("Verify through the API or GUI that the needed Intersight "
                   "Target is present.")
             print("If the needed Intersight Target is missing, please register "
@@ -2756,7 +4548,7 @@ def assign_and_deploy_ucs_domain_profile(intersight_api_key_id,
                       "(no more and no less) must be registered under the "
                       "provided Intersight Target.")
                 print("Please check the Intersight Account named "
-                      f"{intersight_account_name}.")
+                      f"{intersight_account_context.get_account_name()}.")
                 print("Verify through the API or GUI that the needed "
                       "Intersight Target is present, properly registered and "
                       "in a healthy state.")
@@ -2779,9 +4571,9 @@ def assign_and_deploy_ucs_domain_profile(intersight_api_key_id,
                   "with the provided identifier of "
                   f"'{target_assignment_identifier}' were not found.")
             print("No Fabric Interconnects are currently registered under the "
-                  f"Intersight account named {intersight_account_name}.")
+                  f"Intersight account named {intersight_account_context.get_account_name()}.")
             print("Please check the Intersight Account named "
-                  f"{intersight_account_name}.")
+                  f"{intersight_account_context.get_account_name()}.")
             print("Verify through the API or GUI that the needed Intersight "
                   "Target is present, properly registered and in a healthy "
                   "state.")
@@ -2796,7 +4588,7 @@ def assign_and_deploy_ucs_domain_profile(intersight_api_key_id,
         fabric_interconnect_a_switch_profile_assignment_api_body = {
             "AssignedSwitch": {"Moid": fabric_interconnect_a_network_element_moid}
             }
-        post_intersight_switch_profile_update(
+        fabric_interconnect_a_switch_profile_assignment_request = post_intersight_switch_profile_update(
             switch_profile_moid=fabric_interconnect_a_switch_profile_moid,
             switch_profile_api_body=fabric_interconnect_a_switch_profile_assignment_api_body,
             switch_profile_fabric_id="A"
@@ -2808,11 +4600,17 @@ def assign_and_deploy_ucs_domain_profile(intersight_api_key_id,
         fabric_interconnect_b_switch_profile_assignment_api_body = {
             "AssignedSwitch": {"Moid": fabric_interconnect_b_network_element_moid}
             }
-        post_intersight_switch_profile_update(
+        fabric_interconnect_b_switch_profile_assignment_request = post_intersight_switch_profile_update(
             switch_profile_moid=fabric_interconnect_b_switch_profile_moid,
             switch_profile_api_body=fabric_interconnect_b_switch_profile_assignment_api_body,
             switch_profile_fabric_id="B"
             )
+        if "The POST method failed." in (fabric_interconnect_a_switch_profile_assignment_request,
+                                         fabric_interconnect_b_switch_profile_assignment_request
+                                         ):
+            print(f"The UCS Domain Profile named {ucs_domain_profile_name} "
+                  "could not be assigned and will not be deployed.")
+            return "The POST method failed."
     # Deploy UCS Domain Profile
     if deploy_ucs_domain_profile:
         print("\nDeploying the UCS Domain Profile named "
@@ -2823,7 +4621,7 @@ def assign_and_deploy_ucs_domain_profile(intersight_api_key_id,
         fabric_interconnect_a_switch_profile_deployment_api_body = {
             "Action": "Deploy"
             }
-        post_intersight_switch_profile_update(
+        fabric_interconnect_a_switch_profile_deployment_request = post_intersight_switch_profile_update(
             switch_profile_moid=fabric_interconnect_a_switch_profile_moid,
             switch_profile_api_body=fabric_interconnect_a_switch_profile_deployment_api_body,
             switch_profile_fabric_id="A"
@@ -2834,11 +4632,16 @@ def assign_and_deploy_ucs_domain_profile(intersight_api_key_id,
         fabric_interconnect_b_switch_profile_deployment_api_body = {
             "Action": "Deploy"
             }
-        post_intersight_switch_profile_update(
+        fabric_interconnect_b_switch_profile_deployment_request = post_intersight_switch_profile_update(
             switch_profile_moid=fabric_interconnect_b_switch_profile_moid,
             switch_profile_api_body=fabric_interconnect_b_switch_profile_deployment_api_body,
             switch_profile_fabric_id="B"
             )
+        if "The POST method failed." in (fabric_interconnect_a_switch_profile_deployment_request,
+                                         fabric_interconnect_b_switch_profile_deployment_request
+                                         ):
+            return "The POST method failed."
+    return "The POST method was successful."
 
 
 # Establish classes and functions to make Multicast Policy
@@ -3081,7 +4884,9 @@ class Vlan(IdConfigurator):
                  intersight_base_url="https://www.intersight.com/api/v1",
                  preconfigured_api_client=None,
                  default_multicast_policy_name="",
-                 native_vlan_id=None
+                 native_vlan_id=None,
+                 bulk_request_chunk_size=100,
+                 bulk_request_retry_limit=2
                  ):
         super().__init__(intersight_api_key_id,
                          intersight_api_key,
@@ -3093,6 +4898,8 @@ class Vlan(IdConfigurator):
                          )
         self.default_multicast_policy_name = default_multicast_policy_name
         self.native_vlan_id = native_vlan_id
+        self.bulk_request_chunk_size = bulk_request_chunk_size
+        self.bulk_request_retry_limit = bulk_request_retry_limit
 
     def __repr__(self):
         return (
@@ -3105,7 +4912,9 @@ class Vlan(IdConfigurator):
             f"'{self.intersight_base_url}', "
             f"{self.api_client}, "
             f"'{self.default_multicast_policy_name}', "
-            f"{self.native_vlan_id})"
+            f"{self.native_vlan_id}, "
+            f"{self.bulk_request_chunk_size}, "
+            f"{self.bulk_request_retry_limit})"
             )
 
     def object_maker(self):
@@ -3153,6 +4962,9 @@ class Vlan(IdConfigurator):
                 else:
                     print(f"The configuration of {self.object_type} "
                           f"{vlan_name} has completed.")
+                    configured_vlans.append(
+                        {**body, **json.loads(self.api_client.last_response.data)}
+                        )
                 return "The POST method was successful."
             except Exception:
                 print("\nA configuration error has occurred!\n")
@@ -3181,6 +4993,8 @@ class Vlan(IdConfigurator):
                                                            intersight_base_url=self.intersight_base_url,
                                                            preconfigured_api_client=self.api_client
                                                            )
+            staged_vlan_intersight_objects = []
+            configured_vlans = []
             for id_dictionary in self.id_list:
                 vlans_enumerated_id_range = self.enumerated_id_range_retriever(id_dictionary,
                                                                                vlans_id_key
@@ -3196,28 +5010,49 @@ class Vlan(IdConfigurator):
                     current_vlan_id_full_name = f"{current_vlan_id_name_prefix}_{current_vlan_id}"
                     staged_intersight_api_body["Name"] = current_vlan_id_full_name
                     staged_intersight_api_body["IsNative"] = False
-                    post_intersight_vlan(
-                        current_vlan_id_full_name,
-                        staged_intersight_api_body
-                        )
+                    if self.bulk_request_chunk_size:
+                        staged_vlan_intersight_objects.append((current_vlan_id_full_name,
+                                                               copy.deepcopy(staged_intersight_api_body)
+                                                               ))
+                    else:
+                        post_intersight_vlan(
+                            current_vlan_id_full_name,
+                            staged_intersight_api_body
+                            )
+
+            # Configure the staged VLANs through the Intersight bulk/Requests API
+            if staged_vlan_intersight_objects:
+                self._bulk_post_intersight_objects(staged_vlan_intersight_objects,
+                                                   configured_intersight_objects=configured_vlans
+                                                   )
+
+            # Index the VLANs configured in this run by VLAN ID with the MOIDs returned by Intersight
+            configured_vlan_moid_index = {
+                configured_vlan.get("VlanId"): configured_vlan
+                for configured_vlan in configured_vlans
+                if configured_vlan.get("Moid")
+                }
 
             # Begin the process to set the native VLAN for the VLAN Policy
             if self.native_vlan_id:
                 print("\nAttempting to set the native VLAN to VLAN "
                       f"{self.native_vlan_id}...")
-                all_intersight_vlans_pre_check_cycle = get_intersight_objects(intersight_api_key_id=None,
-                                                                              intersight_api_key=None,
-                                                                              intersight_api_path=f"{self.intersight_api_path}?$top=1000",
-                                                                              object_type=self.object_type,
-                                                                              intersight_base_url=self.intersight_base_url,
-                                                                              preconfigured_api_client=self.api_client
-                                                                              )
-                if all_intersight_vlans_pre_check_cycle.get("Results"):
-                    # Verify that a VLAN object matching the native VLAN ID exists
-                    for vlan_check in all_intersight_vlans_pre_check_cycle.get("Results"):
-                        if (vlan_check.get("VlanId") == self.native_vlan_id and
-                            vlan_check.get("EthNetworkPolicy", {}).get("Moid") == policy_moid):
-                            break
+                native_vlan_select_attributes = ["Moid", "Name", "VlanId", "IsNative"]
+                # Verify that a VLAN object matching the native VLAN ID exists
+                native_vlan = configured_vlan_moid_index.get(self.native_vlan_id)
+                if native_vlan is None:
+                    native_vlan_search_results = get_intersight_objects(intersight_api_key_id=None,
+                                                                        intersight_api_key=None,
+                                                                        intersight_api_path=self.intersight_api_path,
+                                                                        object_type=self.object_type,
+                                                                        intersight_base_url=self.intersight_base_url,
+                                                                        preconfigured_api_client=self.api_client,
+                                                                        filter_attributes={"EthNetworkPolicy": {"Moid": policy_moid},
+                                                                                           "VlanId": self.native_vlan_id},
+                                                                        select_attributes=native_vlan_select_attributes
+                                                                        )
+                    if native_vlan_search_results.get("Results"):
+                        native_vlan = native_vlan_search_results.get("Results")[0]
                     else:
                         print("\nA configuration error has occurred!\n")
                         print("The native VLAN cannot be set to "
@@ -3228,82 +5063,49 @@ class Vlan(IdConfigurator):
                               f"VLAN list for {self.policy_name}, then "
                               "re-attempt execution.\n")
                         sys.exit(0)
-                    # Verify the native VLAN is not already set on a pre-existing VLAN object that does not match
-                    for native_vlan_id_check in all_intersight_vlans_pre_check_cycle.get("Results"):
-                        if (native_vlan_id_check.get("VlanId") != self.native_vlan_id and
-                            native_vlan_id_check.get("EthNetworkPolicy", {}).get("Moid") == policy_moid and
-                            native_vlan_id_check.get("IsNative") == True):
-                            native_vlan_id_check_vlan_id = native_vlan_id_check.get("VlanId")
-                            native_vlan_id_check_full_name = native_vlan_id_check.get("Name")
-                            native_vlan_id_check_moid = native_vlan_id_check.get("Moid")
-                            print("The native VLAN is currently set to VLAN "
-                                  f"{native_vlan_id_check_vlan_id}.")
-                            print(f"The native VLAN setting will now be "
-                                  "removed from VLAN "
-                                  f"{native_vlan_id_check_full_name}, in order "
-                                  "to change the native VLAN to VLAN "
-                                  f"{self.native_vlan_id}...")
-                            # Remove the native VLAN setting from the mis-matched pre-existing VLAN object if needed
-                            native_vlan_id_check_api_body_update = {"IsNative": False}
-                            post_intersight_vlan(
-                                native_vlan_id_check_full_name,
-                                native_vlan_id_check_api_body_update,
-                                moid=native_vlan_id_check_moid
-                                )
-                            break
-                else:
-                    print("\nA configuration error has occurred!\n")
-                    print("The native VLAN cannot be set to "
-                          f"VLAN {self.native_vlan_id}.")
-                    print("No VLANs were found in the VLAN Policy "
-                          f"{self.policy_name}.")
-                    print(f"Please add VLAN {self.native_vlan_id} to the "
-                          f"VLAN list for {self.policy_name}, then re-attempt "
-                          "execution.\n")
-                    sys.exit(0)
+                # Verify the native VLAN is not already set on a pre-existing VLAN object that does not match
+                current_native_vlan_search_results = get_intersight_objects(intersight_api_key_id=None,
+                                                                            intersight_api_key=None,
+                                                                            intersight_api_path=self.intersight_api_path,
+                                                                            object_type=self.object_type,
+                                                                            intersight_base_url=self.intersight_base_url,
+                                                                            preconfigured_api_client=self.api_client,
+                                                                            filter_attributes={"EthNetworkPolicy": {"Moid": policy_moid},
+                                                                                               "IsNative": True},
+                                                                            select_attributes=native_vlan_select_attributes
+                                                                            )
+                native_vlan_is_set = False
+                for current_native_vlan in current_native_vlan_search_results.get("Results", []):
+                    if current_native_vlan.get("VlanId") == self.native_vlan_id:
+                        native_vlan_is_set = True
+                        continue
+                    current_native_vlan_full_name = current_native_vlan.get("Name")
+                    print("The native VLAN is currently set to VLAN "
+                          f"{current_native_vlan.get('VlanId')}.")
+                    print(f"The native VLAN setting will now be "
+                          "removed from VLAN "
+                          f"{current_native_vlan_full_name}, in order "
+                          "to change the native VLAN to VLAN "
+                          f"{self.native_vlan_id}...")
+                    # Remove the native VLAN setting from the mis-matched pre-existing VLAN object if needed
+                    post_intersight_vlan(
+                        current_native_vlan_full_name,
+                        {"IsNative": False},
+                        moid=current_native_vlan.get("Moid")
+                        )
                 # Set the native VLAN on the matching VLAN object
-                all_intersight_vlans_update_cycle = get_intersight_objects(intersight_api_key_id=None,
-                                                                           intersight_api_key=None,
-                                                                           intersight_api_path=f"{self.intersight_api_path}?$top=1000",
-                                                                           object_type=self.object_type,
-                                                                           intersight_base_url=self.intersight_base_url,
-                                                                           preconfigured_api_client=self.api_client
-                                                                           )
-                if all_intersight_vlans_update_cycle.get("Results"):
-                    for native_vlan_id_update in all_intersight_vlans_update_cycle.get("Results"):
-                        if (native_vlan_id_update.get("VlanId") == self.native_vlan_id and
-                            native_vlan_id_update.get("EthNetworkPolicy", {}).get("Moid") == policy_moid and
-                            native_vlan_id_update.get("IsNative") == True):
-                            native_vlan_id_update_full_name = native_vlan_id_update.get("Name")
-                            print(f"VLAN {self.native_vlan_id} is already set "
-                                  "as the native VLAN.")
-                            break
-                        elif (native_vlan_id_update.get("VlanId") == self.native_vlan_id and
-                              native_vlan_id_update.get("EthNetworkPolicy", {}).get("Moid") == policy_moid and
-                              native_vlan_id_update.get("IsNative") == False):
-                            native_vlan_id_update_vlan_id = native_vlan_id_update.get("VlanId")
-                            native_vlan_id_update_full_name = native_vlan_id_update.get("Name")
-                            native_vlan_id_update_moid = native_vlan_id_update.get("Moid")
-                            print("The native VLAN will now be set to VLAN "
-                                  f"{self.native_vlan_id}...")
-                            # Add the native VLAN ID setting to the matching VLAN object
-                            native_vlan_id_update_api_body_update = {"IsNative": True}
-                            post_intersight_vlan(
-                                native_vlan_id_update_full_name,
-                                native_vlan_id_update_api_body_update,
-                                moid=native_vlan_id_update_moid
-                                )
-                            break
+                if native_vlan_is_set:
+                    print(f"VLAN {self.native_vlan_id} is already set "
+                          "as the native VLAN.")
                 else:
-                    print("\nA configuration error has occurred!\n")
-                    print("The native VLAN cannot be set to "
-                          f"VLAN {self.native_vlan_id}.")
-                    print("No VLANs were found in the VLAN Policy "
-                          f"{self.policy_name}.")
-                    print(f"Please add VLAN {self.native_vlan_id} to the "
-                          f"VLAN list for {self.policy_name}, then re-attempt "
-                          "execution.\n")
-                    sys.exit(0)
+                    print("The native VLAN will now be set to VLAN "
+                          f"{self.native_vlan_id}...")
+                    # Add the native VLAN ID setting to the matching VLAN object
+                    post_intersight_vlan(
+                        native_vlan.get("Name"),
+                        {"IsNative": True},
+                        moid=native_vlan.get("Moid")
+                        )
                               
 
 def vlan_policy_maker(intersight_api_key_id,
@@ -3318,7 +5120,8 @@ def vlan_policy_maker(intersight_api_key_id,
                       tags=None,
                       preconfigured_api_client=None,
                       ucs_domain_profile_name="",
-                      fabric_interconnect="AB"
+                      fabric_interconnect="AB",
+                      bulk_request_chunk_size=100
                       ):
     """This is a function used to make a VLAN Policy on Cisco Intersight.
 
@@ -3389,6 +5192,11 @@ def vlan_policy_maker(intersight_api_key_id,
             Accepted values are "AB" for both Fabric Interconnects A and B,
             "A" for only Fabric Interconnect A, and "B" for only
             Fabric Interconnect B.
+        bulk_request_chunk_size (int):
+            Optional; The number of VLANs to be configured with each request
+            to the Intersight bulk/Requests API. The maximum accepted by
+            Intersight is 100. The default value is 100. Setting the value to
+            0 configures the VLANs with one request per VLAN.
     """
     def builder(target_object):
         """This is a function used to build the objects that are components of
@@ -3436,7 +5244,8 @@ def vlan_policy_maker(intersight_api_key_id,
                  intersight_base_url=intersight_base_url,
                  preconfigured_api_client=preconfigured_api_client,
                  default_multicast_policy_name=default_multicast_policy_name,
-                 native_vlan_id=native_vlan_id
+                 native_vlan_id=native_vlan_id,
+                 bulk_request_chunk_size=bulk_request_chunk_size
                  ))
 
 
@@ -3608,6 +5417,7 @@ class Vsan(IdConfigurator):
         if self.id_list:
             vsans_id_key = f"{self.id_type}s"
             fcoe_vlans_id_key = "FcoeVlans"
+            staged_vsan_intersight_objects = []
             for id_dictionary in self.id_list:
                 # Enumerate provided VSAN range
                 vsans_enumerated_id_range = self.enumerated_id_range_retriever(id_dictionary,
@@ -3643,10 +5453,19 @@ class Vsan(IdConfigurator):
                     current_vsan_id_full_name = f"{current_vsan_id_name_prefix}_{current_vsan_id}"
                     staged_intersight_api_body["Name"] = current_vsan_id_full_name
                     staged_intersight_api_body["FcoeVlan"] = current_fcoe_vlan_id
-                    post_intersight_vsan(
-                        current_vsan_id_full_name,
-                        staged_intersight_api_body
-                        )
+                    if self.bulk_request_chunk_size:
+                        staged_vsan_intersight_objects.append((current_vsan_id_full_name,
+                                                               copy.deepcopy(staged_intersight_api_body)
+                                                               ))
+                    else:
+                        post_intersight_vsan(
+                            current_vsan_id_full_name,
+                            staged_intersight_api_body
+                            )
+
+            # Configure the staged VSANs through the Intersight bulk/Requests API
+            if staged_vsan_intersight_objects:
+                self._bulk_post_intersight_objects(staged_vsan_intersight_objects)
                               
 
 def vsan_policy_maker(intersight_api_key_id,
@@ -4924,6 +6743,57 @@ class Port(IdConfigurator):
             f"{self.default_aggregate_port_id})"
             )
 
+    def port_stager(self):
+        """This function stages the Intersight API bodies of the Ports in the
+        provided id list configuration for the targeted policy.
+
+        Returns:
+            A list of tuples for the staged Ports. Each tuple contains the
+            full Port ID, the Intersight API body of the Port and this class
+            instance, as accepted by the _bulk_post_intersight_objects
+            function.
+        """
+        staged_port_intersight_objects = []
+        if self.id_list:
+            ports_id_key = f"{self.id_type}s"
+            # Retrieving the Port Policy MOID
+            policy_moid = intersight_object_moid_retriever(intersight_api_key_id=None,
+                                                           intersight_api_key=None,
+                                                           object_name=self.policy_name,
+                                                           intersight_api_path=f"{self.policy_intersight_api_path}?$top=1000",
+                                                           object_type=self.policy_type,
+                                                           organization=self.organization,
+                                                           preconfigured_api_client=self.api_client
+                                                           )
+            for id_dictionary in self.id_list:
+                ports_enumerated_id_range = self.enumerated_id_range_retriever(id_dictionary,
+                                                                               ports_id_key
+                                                                               )
+                staged_intersight_api_body = copy.deepcopy(id_dictionary)
+                staged_intersight_api_body.pop(ports_id_key)
+                staged_intersight_api_body["PortPolicy"] = {"Moid": policy_moid}
+                # Retrieve MOIDs for ID attributes that require MOIDs
+                self.attribute_handler(staged_intersight_api_body)
+                current_slot_id = id_dictionary.get("SlotId",
+                                                    self.default_slot_id
+                                                    )
+                staged_intersight_api_body["SlotId"] = current_slot_id
+                current_aggregate_port_id = id_dictionary.get("AggregatePortId",
+                                                              self.default_aggregate_port_id
+                                                              )
+                staged_intersight_api_body["AggregatePortId"] = current_aggregate_port_id
+                for current_port_id in ports_enumerated_id_range:
+                    staged_intersight_api_body[f"{self.id_type}Id"] = current_port_id
+                    if current_aggregate_port_id > 0:
+                        full_current_port_id = f"{current_slot_id}/{current_aggregate_port_id}/{current_port_id}"
+                    else:
+                        full_current_port_id = f"{current_slot_id}/{current_port_id}"
+                    staged_port_intersight_objects.append((full_current_port_id,
+                                                           copy.deepcopy(staged_intersight_api_body),
+                                                           self
+                                                           ))
+        return staged_port_intersight_objects
+
     def object_maker(self):
         """This function applies the provided id list configuration to the
         targeted policy.
@@ -4965,41 +6835,14 @@ class Port(IdConfigurator):
                 traceback.print_exc()
                 return "The POST method failed."
             
-        if self.id_list:
-            ports_id_key = f"{self.id_type}s"
-            # Retrieving the Port Policy MOID
-            policy_moid = intersight_object_moid_retriever(intersight_api_key_id=None,
-                                                           intersight_api_key=None,
-                                                           object_name=self.policy_name,
-                                                           intersight_api_path=f"{self.policy_intersight_api_path}?$top=1000",
-                                                           object_type=self.policy_type,
-                                                           organization=self.organization,
-                                                           preconfigured_api_client=self.api_client
-                                                           )
-            for id_dictionary in self.id_list:
-                ports_enumerated_id_range = self.enumerated_id_range_retriever(id_dictionary,
-                                                                               ports_id_key
-                                                                               )
-                staged_intersight_api_body = copy.deepcopy(id_dictionary)
-                staged_intersight_api_body.pop(ports_id_key)
-                staged_intersight_api_body["PortPolicy"] = {"Moid": policy_moid}
-                # Retrieve MOIDs for ID attributes that require MOIDs
-                self.attribute_handler(staged_intersight_api_body)
-                current_slot_id = id_dictionary.get("SlotId",
-                                                    self.default_slot_id
-                                                    )
-                staged_intersight_api_body["SlotId"] = current_slot_id
-                current_aggregate_port_id = id_dictionary.get("AggregatePortId",
-                                                              self.default_aggregate_port_id
-                                                              )
-                staged_intersight_api_body["AggregatePortId"] = current_aggregate_port_id
-                for current_port_id in ports_enumerated_id_range:
-                    staged_intersight_api_body[f"{self.id_type}Id"] = current_port_id
-                    if current_aggregate_port_id > 0:
-                        full_current_port_id = f"{current_slot_id}/{current_aggregate_port_id}/{current_port_id}"
-                    else:
-                        full_current_port_id = f"{current_slot_id}/{current_port_id}"
-                    post_intersight_port(staged_intersight_api_body)
+        staged_port_intersight_objects = self.port_stager()
+        if self.bulk_request_chunk_size:
+            # Configure the staged Ports through the Intersight bulk/Requests API
+            if staged_port_intersight_objects:
+                self._bulk_post_intersight_objects(staged_port_intersight_objects)
+        else:
+            for full_current_port_id, staged_intersight_api_body, _ in staged_port_intersight_objects:
+                post_intersight_port(staged_intersight_api_body)
 
 
 class ServerPort(Port):
@@ -5952,6 +7795,51 @@ def port_policy_maker(intersight_api_key_id,
             print("Exception Message: ")
             traceback.print_exc()
 
+    def port_builder(target_objects):
+        """This is a function used to build the Port objects of a Port Policy
+        on Cisco Intersight. The Ports of every provided Port class are staged
+        first, then configured together through shared Intersight
+        bulk/Requests API calls.
+
+        Args:
+            target_objects (list):
+                A list of the classes representing the Port objects to be
+                built on Intersight.
+
+        Raises:
+            Exception:
+                An exception occurred due to an issue accessing the Intersight
+                API path. The status code or error message will be specified.
+        """
+        staged_port_intersight_objects = []
+        for target_object in target_objects:
+            if not target_object.bulk_request_chunk_size:
+                builder(target_object)
+                continue
+            try:
+                staged_port_intersight_objects.extend(target_object.port_stager())
+            except Exception:
+                print("\nA configuration error has occurred!\n")
+                print("The builder function failed to configure the "
+                      f"{target_object.object_type} settings.")
+                print("Please check the provided arguments for the "
+                      f"{target_object.object_type} settings.\n")
+                print("Exception Message: ")
+                traceback.print_exc()
+        if staged_port_intersight_objects:
+            try:
+                staged_port_intersight_objects[0][2]._bulk_post_intersight_objects(staged_port_intersight_objects,
+                                                                                   bulk_object_type="Port"
+                                                                                   )
+            except Exception:
+                print("\nA configuration error has occurred!\n")
+                print("The builder function failed to configure the Port "
+                      "settings.")
+                print("Please check the provided arguments for the Port "
+                      "settings.\n")
+                print("Exception Message: ")
+                traceback.print_exc()
+
     # Define and create Port Policy object in Intersight
     builder(PortPolicy(intersight_api_key_id=intersight_api_key_id,
                        intersight_api_key=intersight_api_key,
@@ -6038,70 +7926,75 @@ def port_policy_maker(intersight_api_key_id,
                       port_mode_type="Breakout FibreChannel 32G"
                       ))
     
-    # Define and create Server Port objects in Intersight
-    builder(ServerPort(intersight_api_key_id=intersight_api_key_id,
-                       intersight_api_key=intersight_api_key,
-                       policy_name=policy_name,
-                       id_list=server_port_list,
-                       organization=organization,
-                       intersight_base_url=intersight_base_url,
-                       preconfigured_api_client=preconfigured_api_client,
-                       default_slot_id=default_slot_id_of_server_ports,
-                       default_aggregate_port_id=default_aggregate_port_id_of_server_ports
-                       ))
+    # Define the Port objects to be created in Intersight with shared bulk requests
+    port_objects = []
+    # Define Server Port objects
+    port_objects.append(ServerPort(intersight_api_key_id=intersight_api_key_id,
+                                   intersight_api_key=intersight_api_key,
+                                   policy_name=policy_name,
+                                   id_list=server_port_list,
+                                   organization=organization,
+                                   intersight_base_url=intersight_base_url,
+                                   preconfigured_api_client=preconfigured_api_client,
+                                   default_slot_id=default_slot_id_of_server_ports,
+                                   default_aggregate_port_id=default_aggregate_port_id_of_server_ports
+                                   ))
         
-    # Define and create Ethernet Uplink Port objects in Intersight
-    builder(EthernetUplinkPort(intersight_api_key_id=intersight_api_key_id,
-                               intersight_api_key=intersight_api_key,
-                               policy_name=policy_name,
-                               id_list=ethernet_uplink_port_list,
-                               organization=organization,
-                               intersight_base_url=intersight_base_url,
-                               preconfigured_api_client=preconfigured_api_client,
-                               default_slot_id=default_slot_id_of_ethernet_uplink_ports,
-                               default_aggregate_port_id=default_aggregate_port_id_of_ethernet_uplink_ports,
-                               default_flow_control_policy_name=default_flow_control_policy_name,
-                               default_link_control_policy_name=default_link_control_policy_name
-                               ))
-
-    # Define and create FCoE Uplink Port objects in Intersight
-    builder(FcoeUplinkPort(intersight_api_key_id=intersight_api_key_id,
-                           intersight_api_key=intersight_api_key,
-                           policy_name=policy_name,
-                           id_list=fcoe_uplink_port_list,
-                           organization=organization,
-                           intersight_base_url=intersight_base_url,
-                           preconfigured_api_client=preconfigured_api_client,
-                           default_slot_id=default_slot_id_of_fcoe_uplink_ports,
-                           default_aggregate_port_id=default_aggregate_port_id_of_fcoe_uplink_ports,
-                           default_link_control_policy_name=default_link_control_policy_name
-                           ))
-
-    # Define and create FC Uplink Port objects in Intersight
-    builder(FcUplinkPort(intersight_api_key_id=intersight_api_key_id,
-                         intersight_api_key=intersight_api_key,
-                         policy_name=policy_name,
-                         id_list=fc_uplink_port_list,
-                         organization=organization,
-                         intersight_base_url=intersight_base_url,
-                         preconfigured_api_client=preconfigured_api_client,
-                         default_slot_id=default_slot_id_of_fc_uplink_ports,
-                         default_aggregate_port_id=default_aggregate_port_id_of_fc_uplink_ports
-                         ))
+    # Define Ethernet Uplink Port objects
+    port_objects.append(EthernetUplinkPort(intersight_api_key_id=intersight_api_key_id,
+                                           intersight_api_key=intersight_api_key,
+                                           policy_name=policy_name,
+                                           id_list=ethernet_uplink_port_list,
+                                           organization=organization,
+                                           intersight_base_url=intersight_base_url,
+                                           preconfigured_api_client=preconfigured_api_client,
+                                           default_slot_id=default_slot_id_of_ethernet_uplink_ports,
+                                           default_aggregate_port_id=default_aggregate_port_id_of_ethernet_uplink_ports,
+                                           default_flow_control_policy_name=default_flow_control_policy_name,
+                                           default_link_control_policy_name=default_link_control_policy_name
+                                           ))
+
+    # Define FCoE Uplink Port objects
+    port_objects.append(FcoeUplinkPort(intersight_api_key_id=intersight_api_key_id,
+                                       intersight_api_key=intersight_api_key,
+                                       policy_name=policy_name,
+                                       id_list=fcoe_uplink_port_list,
+                                       organization=organization,
+                                       intersight_base_url=intersight_base_url,
+                                       preconfigured_api_client=preconfigured_api_client,
+                                       default_slot_id=default_slot_id_of_fcoe_uplink_ports,
+                                       default_aggregate_port_id=default_aggregate_port_id_of_fcoe_uplink_ports,
+                                       default_link_control_policy_name=default_link_control_policy_name
+                                       ))
 
-    # Define and create Appliance Port objects in Intersight
-    builder(AppliancePort(intersight_api_key_id=intersight_api_key_id,
-                          intersight_api_key=intersight_api_key,
-                          policy_name=policy_name,
-                          id_list=appliance_port_list,
-                          organization=organization,
-                          intersight_base_url=intersight_base_url,
-                          preconfigured_api_client=preconfigured_api_client,
-                          default_slot_id=default_slot_id_of_appliance_ports,
-                          default_aggregate_port_id=default_aggregate_port_id_of_appliance_ports,
-                          default_ethernet_network_group_policy_name=default_ethernet_network_group_policy_name,
-                          default_ethernet_network_control_policy_name=default_ethernet_network_control_policy_name
-                          ))
+    # Define FC Uplink Port objects
+    port_objects.append(FcUplinkPort(intersight_api_key_id=intersight_api_key_id,
+                                     intersight_api_key=intersight_api_key,
+                                     policy_name=policy_name,
+                                     id_list=fc_uplink_port_list,
+                                     organization=organization,
+                                     intersight_base_url=intersight_base_url,
+                                     preconfigured_api_client=preconfigured_api_client,
+                                     default_slot_id=default_slot_id_of_fc_uplink_ports,
+                                     default_aggregate_port_id=default_aggregate_port_id_of_fc_uplink_ports
+                                     ))
+
+    # Define Appliance Port objects
+    port_objects.append(AppliancePort(intersight_api_key_id=intersight_api_key_id,
+                                      intersight_api_key=intersight_api_key,
+                                      policy_name=policy_name,
+                                      id_list=appliance_port_list,
+                                      organization=organization,
+                                      intersight_base_url=intersight_base_url,
+                                      preconfigured_api_client=preconfigured_api_client,
+                                      default_slot_id=default_slot_id_of_appliance_ports,
+                                      default_aggregate_port_id=default_aggregate_port_id_of_appliance_ports,
+                                      default_ethernet_network_group_policy_name=default_ethernet_network_group_policy_name,
+                                      default_ethernet_network_control_policy_name=default_ethernet_network_control_policy_name
+                                      ))
+
+    # Create the defined Port objects in Intersight
+    port_builder(port_objects)
 
     # Define and create Ethernet Uplink Port Channel objects in Intersight
     builder(EthernetUplinkPortChannel(intersight_api_key_id=intersight_api_key_id,
@@ -7719,16 +9612,42 @@ def main():
     deployment_tool_type = "Intersight UCS Domain Deployment Tool"
     deployment_tool_ucs_domain_profile_name = f"{deployment_name_prefix}{ucs_domain_profile_name}{deployment_name_suffix}"
 
+    # Parse the command line options
+    argument_parser = argparse.ArgumentParser(description=f"The {deployment_tool_type} for Cisco Intersight.")
+    argument_parser.add_argument("--resume",
+                                 action="store_true",
+                                 help="Skip the deployment steps completed in the previous run, as recorded in the deployment journal."
+                                 )
+    deployment_tool_arguments = argument_parser.parse_args()
+
     # Establish Intersight SDK for Python API client instance
     main_intersight_api_client = get_api_client(api_key_id=key_id,
                                                 api_secret_file=key,
                                                 endpoint=intersight_base_url,
-                                                url_certificate_verification=url_certificate_verification
+                                                url_certificate_verification=url_certificate_verification,
+                                                api_request_rate_limit=intersight_api_request_rate_limit
                                                 )
+
+    # Attach the object state file to the API client, if provided
+    if intersight_object_state_file:
+        set_intersight_object_state_file(main_intersight_api_client,
+                                         intersight_object_state_file
+                                         )
     
     # Starting the UCS Domain Deployment Tool for Cisco Intersight
     print(f"\nStarting the {deployment_tool_type} for Cisco Intersight.\n")
 
+    # Attach the deployment journal to the API client, if provided
+    deployment_journal = None
+    if deployment_journal_file:
+        deployment_journal = set_intersight_deployment_journal(main_intersight_api_client,
+                                                               deployment_journal_file,
+                                                               resume=deployment_tool_arguments.resume
+                                                               )
+    elif deployment_tool_arguments.resume:
+        print("No deployment journal file has been provided. All deployment "
+              "steps will be performed.")
+
     # Run the Intersight API and Account Availability Test
     print("Running the Intersight API and Account Availability Test.")
     test_intersight_api_service(
@@ -8258,16 +10177,29 @@ def main():
 
     # Assign and Deploy the UCS Domain Profile to an Intersight Target
     if assign_ucs_domain_profile or deploy_ucs_domain_profile:
-        assign_and_deploy_ucs_domain_profile(
-            intersight_api_key_id=None,
-            intersight_api_key=None,
-            ucs_domain_profile_name=deployment_tool_ucs_domain_profile_name,
-            target_assignment_identifier=target_assignment_identifier,
-            assign_ucs_domain_profile=assign_ucs_domain_profile,
-            deploy_ucs_domain_profile=deploy_ucs_domain_profile,
-            ucs_domain_profile_organization=ucs_domain_profile_organization,
-            preconfigured_api_client=main_intersight_api_client
-            )
+        # Skip the UCS Domain Profile if it was assigned and deployed in the previous run of a resumed deployment
+        ucs_domain_profile_deployment_step_name = f"Assign and Deploy UCS Domain Profile {deployment_tool_ucs_domain_profile_name}"
+        if deployment_journal and deployment_journal.is_completed(ucs_domain_profile_deployment_step_name):
+            print("\nThe UCS Domain Profile named "
+                  f"{deployment_tool_ucs_domain_profile_name} was assigned and "
+                  "deployed in the previous run. The assignment and deployment "
+                  "will be skipped.")
+        else:
+            ucs_domain_profile_deployment = assign_and_deploy_ucs_domain_profile(
+                intersight_api_key_id=None,
+                intersight_api_key=None,
+                ucs_domain_profile_name=deployment_tool_ucs_domain_profile_name,
+                target_assignment_identifier=target_assignment_identifier,
+                assign_ucs_domain_profile=assign_ucs_domain_profile,
+                deploy_ucs_domain_profile=deploy_ucs_domain_profile,
+                ucs_domain_profile_organization=ucs_domain_profile_organization,
+                preconfigured_api_client=main_intersight_api_client
+                )
+            if deployment_journal and ucs_domain_profile_deployment == "The POST method was successful.":
+                deployment_journal.record(ucs_domain_profile_deployment_step_name,
+                                          "UCS Domain Profile",
+                                          deployment_tool_ucs_domain_profile_name
+                                          )
 
     # UCS Domain Deployment Tool completion
     print(f"\nThe {deployment_tool_type} has completed.\n")
@@ -60,10 +60,27 @@ ucs_fi_device_console_ip_list = ["192.168.0.11",]
 ucs_fi_device_console_username = "admin"
 ucs_fi_device_console_password = "C1sco12345"
 
+# Claim Concurrency Settings
+## NOTE - The UCS IMM FI clusters are claimed at the same time, up to the number of claims set in ucs_fi_max_concurrent_claims.
+## The output for each UCS IMM FI cluster is shown together once its claim has finished, followed by a summary of the results. Set to 1 to claim the UCS IMM FI clusters one at a time.
+ucs_fi_max_concurrent_claims = 8
+ucs_fi_device_console_request_timeout = 30       # The time in seconds to wait for each response from a UCS IMM FI cluster
+
+# Claim Readiness Settings
+## NOTE - If a Claim Code is not available, the Device Connector is refreshed and polled for a Claim Code for up to ucs_fi_device_connector_readiness_timeout seconds.
+## After each claim, the Intersight device registration is polled for up to ucs_fi_claim_confirmation_timeout seconds to confirm the device is connected. Set to 0 to skip the claim confirmation.
+ucs_fi_device_connector_readiness_timeout = 60
+ucs_fi_claim_confirmation_timeout = 300
+
 # Intersight Base URL Setting (Change only if using the Intersight Virtual Appliance)
 intersight_base_url = "https://www.intersight.com/api/v1"
 url_certificate_verification = True
 
+# Intersight API Request Rate Settings
+## NOTE - To stay under the request quota of the Intersight account, set the maximum average number of Intersight API requests per second, for example: intersight_api_request_rate_limit = 20
+## Leave the value as None to not limit the request rate. Throttled requests are always retried after the delay requested by Intersight.
+intersight_api_request_rate_limit = None
+
 ####### Finish Configuration Settings - The required value entries are complete. #######
 
 
@@ -78,19 +95,250 @@ import copy
 import intersight
 import re
 import requests
+import threading
+import concurrent.futures
+import urllib.parse
+import random
+import email.utils
 import urllib3
 import time
 
 # Suppress InsecureRequestWarning error messages
 urllib3.disable_warnings()
 
+# Establish the process-wide cache of Intersight API clients
+intersight_api_client_cache = {}
+intersight_api_client_cache_lock = threading.Lock()
+
+
+# Establish class to limit the request rate of an Intersight API client
+class IntersightRateLimiter:
+    """This class is used to limit the rate of Intersight API requests made
+    through an Intersight API client with a token bucket. Every function and
+    class sharing the API client draws from the same bucket, so the combined
+    request rate stays under the request quota of the Intersight account.
+    Requests can also be paused for every thread, for example after the
+    Intersight API has throttled a request.
+    """
+    def __init__(self,
+                 request_rate_limit=None,
+                 burst_size=None
+                 ):
+        self.request_rate_limit = request_rate_limit
+        self.burst_size = burst_size or max(1, request_rate_limit or 1)
+        self.available_tokens = self.burst_size
+        self.last_refill_time = time.monotonic()
+        self.paused_until = 0
+        self.lock = threading.Lock()
+
+    def __repr__(self):
+        return (
+            f"{self.__class__.__name__}"
+            f"({self.request_rate_limit}, "
+            f"{self.burst_size})"
+            )
+
+    def __str__(self):
+        return (f"{self.__class__.__name__} class object with a limit of "
+                f"{self.request_rate_limit} request(s) per second")
+
+    def acquire(self):
+        """This function waits until a request can be made, then consumes a
+        token from the bucket.
+        """
+        while True:
+            with self.lock:
+                current_time = time.monotonic()
+                wait_time = self.paused_until - current_time
+                if wait_time <= 0:
+                    if not self.request_rate_limit:
+                        return
+                    # Refill the bucket for the time elapsed since the last request
+                    self.available_tokens = min(self.burst_size,
+                                                self.available_tokens + (current_time - self.last_refill_time) * self.request_rate_limit
+                                                )
+                    self.last_refill_time = current_time
+                    if self.available_tokens >= 1:
+                        self.available_tokens -= 1
+                        return
+                    wait_time = (1 - self.available_tokens) / self.request_rate_limit
+            time.sleep(wait_time)
+
+    def pause(self,
+              pause_duration
+              ):
+        """This function pauses all requests for a duration.
+
+        Args:
+            pause_duration (float):
+                The duration of the pause in seconds.
+        """
+        with self.lock:
+            self.paused_until = max(self.paused_until, time.monotonic() + pause_duration)
+
+
+# Establish class for an Intersight SDK for Python API client with rate limiting and retries
+class RateLimitedApiClient(intersight.ApiClient):
+    """This class is used to provide an Intersight SDK for Python API client
+    that limits the rate of Intersight API requests and retries requests that
+    have been throttled or have failed temporarily. Throttled requests (429)
+    are retried for every method after the delay requested by the
+    Retry-After header. Requests that failed with a 500, 502, 503 or 504
+    status code are only retried for methods that are safe to repeat. Each
+    retry waits with jittered exponential backoff.
+    """
+    idempotent_methods = ("GET", "HEAD", "OPTIONS", "PUT", "DELETE")
+    retryable_status_codes = (500, 502, 503, 504)
+    rate_limiter = None
+    api_retry_limit = 5
+    api_retry_backoff = 1
+    api_retry_max_delay = 60
+
+    def _retry_delay(self,
+                     error,
+                     retry_attempt
+                     ):
+        """This function determines the delay before a request is retried.
+
+        Args:
+            error (intersight.exceptions.ApiException):
+                The exception raised by the failed request.
+            retry_attempt (int):
+                The number of retries already performed for the request.
+
+        Returns:
+            A float of the delay in seconds.
+        """
+        retry_after = (error.headers or {}).get("Retry-After")
+        if retry_after:
+            # The Retry-After header is either a number of seconds or an HTTP date
+            try:
+                return max(float(retry_after), 0) + random.uniform(0, self.api_retry_backoff)
+            except ValueError:
+                try:
+                    return max(email.utils.mktime_tz(email.utils.parsedate_tz(retry_after)) - time.time(), 0) + random.uniform(0, self.api_retry_backoff)
+                except (TypeError, ValueError, OverflowError):
+                    pass
+        exponential_delay = min(self.api_retry_max_delay, self.api_retry_backoff * 2 ** retry_attempt)
+        return random.uniform(exponential_delay / 2, exponential_delay)
+
+    def call_api(self,
+                 resource_path,
+                 method,
+                 *args,
+                 **kwargs
+                 ):
+        """This function performs an Intersight API request, waiting for the
+        rate limiter and retrying throttled or temporarily failed requests.
+
+        Args:
+            resource_path (str):
+                The Intersight API resource path of the request.
+            method (str):
+                The HTTP method of the request.
+            *args:
+                The additional positional arguments of the request.
+            **kwargs:
+                The additional keyword arguments of the request.
+
+        Returns:
+            The response of the request.
+
+        Raises:
+            intersight.exceptions.ApiException:
+                The request failed and could not be retried.
+        """
+        if kwargs.get("async_req"):
+            return super().call_api(resource_path, method, *args, **kwargs)
+        retry_attempt = 0
+        while True:
+            if self.rate_limiter:
+                self.rate_limiter.acquire()
+            try:
+                return super().call_api(resource_path, method, *args, **kwargs)
+            except intersight.exceptions.ApiException as error:
+                if retry_attempt >= self.api_retry_limit or not (
+                    error.status == 429 or
+                    (error.status in self.retryable_status_codes and method.upper() in self.idempotent_methods)
+                    ):
+                    raise
+                retry_delay = self._retry_delay(error, retry_attempt)
+                if error.status == 429 and self.rate_limiter:
+                    # Pause every request sharing the API client while throttled
+                    self.rate_limiter.pause(retry_delay)
+                print(f"The Intersight API request for '{resource_path}' "
+                      f"returned the status code {error.status}. The request "
+                      f"will be retried in {retry_delay:.1f} seconds.")
+                time.sleep(retry_delay)
+                retry_attempt += 1
+
+
 # Function to get Intersight API client as specified in the Intersight Python SDK documentation for OpenAPI 3.x
 ## Modified to align with overall formatting, try/except blocks added for additional error handling, certificate verification option added
+## Modified to reuse one pooled API client per endpoint, API key and API client settings, connection pool sizing and connection retries added
 def get_api_client(api_key_id,
                    api_secret_file,
                    endpoint="https://intersight.com",
-                   url_certificate_verification=True
+                   url_certificate_verification=True,
+                   connection_pool_maxsize=32,
+                   connection_retry_limit=3,
+                   api_request_rate_limit=None,
+                   api_retry_limit=5
                    ):
+    """This is a function to get an Intersight API client. One API client is
+    established per endpoint, API key and set of API client settings, then
+    reused by every later call in the process with the same arguments, so
+    the API key is only loaded once and the pooled keep-alive connections of
+    the API client are shared. A call with different connection, rate limit
+    or retry settings establishes a separate API client with those settings.
+
+    Args:
+        api_key_id (str):
+            The ID of the Intersight API key.
+        api_secret_file (str):
+            The system file path of the Intersight API key.
+        endpoint (str):
+            Optional; The Intersight API base URL. The default value is
+            "https://intersight.com".
+        url_certificate_verification (bool):
+            Optional; The setting for verifying the SSL certificate of the
+            Intersight API base URL. The default value is True.
+        connection_pool_maxsize (int):
+            Optional; The maximum number of connections kept open to the
+            Intersight API by the API client. The value should be at least the
+            number of requests made at the same time. The default value is
+            32.
+        connection_retry_limit (int):
+            Optional; The number of times a request is retried after a
+            connection error. The default value is 3.
+        api_request_rate_limit (float):
+            Optional; The maximum average number of Intersight API requests
+            per second made through the API client, shared by every function
+            and class using the client. The default value is None, which does
+            not limit the request rate.
+        api_retry_limit (int):
+            Optional; The number of times a request is retried after a 429
+            status code, or after a 500, 502, 503 or 504 status code for
+            requests that are safe to repeat. The default value is 5.
+
+    Returns:
+        An ApiClient class instance which handles Intersight client-server
+        communication through the use of API keys.
+    """
+    # Reuse the API client already established for the endpoint, API key and API client settings
+    api_client_cache_key = (endpoint,
+                            api_key_id,
+                            api_secret_file,
+                            url_certificate_verification,
+                            connection_pool_maxsize,
+                            connection_retry_limit,
+                            api_request_rate_limit,
+                            api_retry_limit
+                            )
+    with intersight_api_client_cache_lock:
+        cached_api_client = intersight_api_client_cache.get(api_client_cache_key)
+    if cached_api_client is not None:
+        return cached_api_client
     try:
         with open(api_secret_file, 'r') as f:
             api_key = f.read()
@@ -126,6 +374,13 @@ def get_api_client(api_key_id,
 
         if not url_certificate_verification:
             configuration.verify_ssl = False
+        # Size the connection pool for concurrent requests and retry failed connections
+        ## Failed status codes are retried by the API client with jittered backoff
+        configuration.connection_pool_maxsize = connection_pool_maxsize
+        configuration.retries = urllib3.util.Retry(total=connection_retry_limit,
+                                                   backoff_factor=0.5,
+                                                   raise_on_status=False
+                                                   )
     except Exception:
         print("\nA configuration error has occurred!\n")
         print("Unable to access the Intersight API Key.")
@@ -136,7 +391,125 @@ def get_api_client(api_key_id,
         traceback.print_exc()
         sys.exit(0)
         
-    return intersight.ApiClient(configuration)
+    # Limit the request rate and retry throttled requests for every user of the API client
+    api_client = ThreadSafeApiClient(configuration)
+    api_client.rate_limiter = IntersightRateLimiter(api_request_rate_limit)
+    api_client.api_retry_limit = api_retry_limit
+    with intersight_api_client_cache_lock:
+        return intersight_api_client_cache.setdefault(api_client_cache_key,
+                                                      api_client
+                                                      )
+
+
+# Establish class for an Intersight SDK for Python API client that can be shared across threads
+class ThreadSafeApiClient(RateLimitedApiClient):
+    """This class is used to provide an Intersight SDK for Python API client
+    that can be shared by concurrently running threads. The last response of
+    an API call is stored per thread, so that each thread reads the response
+    of its own API call from the last_response attribute.
+    """
+    def _thread_local_responses(self):
+        """This function retrieves the per thread storage of the last
+        responses.
+
+        Returns:
+            A threading.local class instance.
+        """
+        return self.__dict__.setdefault("thread_local_responses", threading.local())
+
+    @property
+    def last_response(self):
+        return getattr(self._thread_local_responses(), "last_response", None)
+
+    @last_response.setter
+    def last_response(self, response):
+        self._thread_local_responses().last_response = response
+
+
+# Establish class to hold the Intersight account context of an Intersight API client
+class IntersightAccountContext:
+    """This class is used to hold the Intersight account information for a
+    specific Intersight API client, so that the account only needs to be
+    retrieved from Intersight once.
+    """
+    def __init__(self,
+                 api_client
+                 ):
+        self.api_client = api_client
+        self.iam_account = None
+        self.lock = threading.Lock()
+
+    def __repr__(self):
+        return (
+            f"{self.__class__.__name__}"
+            f"({self.api_client})"
+            )
+
+    def __str__(self):
+        if self.iam_account is None:
+            return f"{self.__class__.__name__} class object for an unresolved Intersight account"
+        return (f"{self.__class__.__name__} class object for the Intersight "
+                f"account named '{self.iam_account.get('Name')}'")
+
+    def set_account(self,
+                    iam_account
+                    ):
+        """This function stores the Intersight account information.
+
+        Args:
+            iam_account (dict):
+                The Intersight API object of the Intersight account.
+        """
+        with self.lock:
+            self.iam_account = iam_account
+
+    def get_account_name(self):
+        """This function returns the name of the Intersight account. If the
+        Intersight account information has not been stored yet, it is
+        retrieved from Intersight on first use.
+
+        Returns:
+            A string of the name for the Intersight account. If the Intersight
+            account information cannot be retrieved, the string "Unknown" is
+            returned, so that the calling error message can still be shown.
+        """
+        with self.lock:
+            if self.iam_account is None:
+                try:
+                    self.api_client.call_api(resource_path="/iam/Accounts?$select=Name",
+                                             method="GET",
+                                             auth_settings=['cookieAuth', 'http_signature', 'oAuth2', 'oAuth2']
+                                             )
+                    self.iam_account = json.loads(self.api_client.last_response.data)["Results"][0]
+                except Exception:
+                    return "Unknown"
+            return self.iam_account.get("Name")
+
+
+# Establish function to retrieve the Intersight account context of an Intersight API client
+intersight_account_context_creation_lock = threading.Lock()
+
+
+def get_intersight_account_context(api_client):
+    """This is a function to retrieve the Intersight account context for an
+    Intersight API client. The account context is created and attached to the
+    API client on first use, so that it is shared by every function and class
+    using the client.
+
+    Args:
+        api_client ("ApiClient"):
+            An ApiClient class instance which handles Intersight client-server
+            communication through the use of API keys.
+
+    Returns:
+        An IntersightAccountContext class instance.
+    """
+    with intersight_account_context_creation_lock:
+        intersight_account_context = getattr(api_client, "intersight_account_context", None)
+        if intersight_account_context is None:
+            intersight_account_context = IntersightAccountContext(api_client)
+            api_client.intersight_account_context = intersight_account_context
+    return intersight_account_context
 
 
 # Establish function to test for the availability of the Intersight API and Intersight account
@@ -204,6 +577,8 @@ def test_intersight_api_service(intersight_api_key_id,
             sys.exit(0)
         else:
             intersight_account_name = iam_account["Results"][0]["Name"]
+            # Store the Intersight account context for reuse by later lookups
+            get_intersight_account_context(api_client).set_account(iam_account["Results"][0])
             print("The Intersight API and Account Availability Test has "
                   "passed.\n")
             print(f"The Intersight account named '{intersight_account_name}' "
@@ -220,6 +595,260 @@ def test_intersight_api_service(intersight_api_key_id,
         sys.exit(0)
 
 
+# Establish function to add server-side query options to an Intersight API path
+def intersight_api_query_builder(intersight_api_path,
+                                 filter_attributes=None,
+                                 select_attributes=None
+                                 ):
+    """This is a function to add the $filter and $select query options to an
+    Intersight API path, so that matching of Intersight objects and trimming
+    of returned attributes is performed by Intersight rather than locally.
+    Any query options already present on the Intersight API path are kept and
+    an existing $filter is combined with the new filter expressions.
+
+    Args:
+        intersight_api_path (str):
+            The Intersight API path of the Intersight objects. The path can
+            include existing query options, for example
+            "compute/Blades?$top=1000".
+        filter_attributes (dict):
+            Optional; A dictionary containing the attribute keys and values
+            that the Intersight objects must match. String, number and boolean
+            values are matched with the "eq" operator. Dictionary values
+            containing a "Moid" key, such as object references, are matched on
+            the referenced MOID. Values of any other type are skipped and must
+            be matched locally. The default value is None.
+        select_attributes (list):
+            Optional; A list containing the attribute keys to be returned for
+            each Intersight object. The default value is None, which returns
+            all attributes.
+
+    Returns:
+        A string of the Intersight API path with the query options applied.
+    """
+    def filter_value_formatter(attribute_value):
+        """This is a function to format an attribute value for use in an
+        Intersight API $filter expression.
+
+        Args:
+            attribute_value (str, int, float, bool):
+                The attribute value to be formatted.
+
+        Returns:
+            A string of the formatted attribute value.
+        """
+        if isinstance(attribute_value, bool):
+            return str(attribute_value).lower()
+        if isinstance(attribute_value, (int, float)):
+            return str(attribute_value)
+        escaped_attribute_value = attribute_value.replace("'", "''")
+        return f"'{escaped_attribute_value}'"
+
+    # Separate the base Intersight API path from any existing query options
+    if "?" in intersight_api_path:
+        base_intersight_api_path, existing_query = intersight_api_path.split("?", 1)
+        query_options = existing_query.split("&")
+    else:
+        base_intersight_api_path = intersight_api_path
+        query_options = []
+    # Create the list of filter expressions
+    filter_expressions = []
+    if filter_attributes:
+        for attribute_name, attribute_value in filter_attributes.items():
+            if isinstance(attribute_value, (str, int, float, bool)):
+                filter_expressions.append(f"{attribute_name} eq {filter_value_formatter(attribute_value)}")
+            elif isinstance(attribute_value, dict) and attribute_value.get("Moid"):
+                filter_expressions.append(f"{attribute_name}.Moid eq {filter_value_formatter(attribute_value['Moid'])}")
+    # Combine the filter expressions with any existing $filter query option
+    if filter_expressions:
+        for query_option in query_options:
+            if query_option.startswith("$filter="):
+                query_options.remove(query_option)
+                existing_filter_expression = urllib.parse.unquote(query_option[len("$filter="):])
+                filter_expressions.insert(0, f"({existing_filter_expression})")
+                break
+        combined_filter_expression = " and ".join(filter_expressions)
+        query_options.append(f"$filter={urllib.parse.quote(combined_filter_expression, safe='')}")
+    # Replace any existing $select query option
+    if select_attributes:
+        query_options = [query_option for query_option in query_options if not query_option.startswith("$select=")]
+        unique_select_attributes = list(dict.fromkeys(select_attributes))
+        query_options.append(f"$select={','.join(unique_select_attributes)}")
+    if query_options:
+        return f"{base_intersight_api_path}?{'&'.join(query_options)}"
+    return base_intersight_api_path
+
+
+# Establish class to cache the MOIDs of Intersight API objects retrieved by name
+class IntersightMoidCache:
+    """This class is used to cache the MOIDs of Intersight objects that have
+    been retrieved by name for a specific Intersight API client.
+    """
+    def __init__(self,
+                 time_to_live=900
+                 ):
+        self.time_to_live = time_to_live
+        self.cached_moids = {}
+        self.lock = threading.Lock()
+
+    def __repr__(self):
+        return (
+            f"{self.__class__.__name__}"
+            f"({self.time_to_live})"
+            )
+
+    def __str__(self):
+        return (f"{self.__class__.__name__} class object with "
+                f"{len(self.cached_moids)} cached MOIDs")
+
+    @staticmethod
+    def _cache_key(intersight_api_path,
+                   organization,
+                   object_name
+                   ):
+        """This function creates the cache key for an Intersight object. Any
+        query parameters are removed from the Intersight API path, so that
+        lookups of the same object under varying queries share one entry.
+
+        Args:
+            intersight_api_path (str):
+                The Intersight API path of the Intersight object.
+            organization (str):
+                The Intersight organization of the Intersight object.
+            object_name (str):
+                The name of the Intersight object.
+
+        Returns:
+            A tuple containing the cache key for the Intersight object.
+        """
+        base_intersight_api_path = intersight_api_path.split("?", 1)[0].strip("/")
+        return (base_intersight_api_path, organization, object_name)
+
+    def get(self,
+            intersight_api_path,
+            organization,
+            object_name
+            ):
+        """This function retrieves a cached MOID for an Intersight object.
+
+        Args:
+            intersight_api_path (str):
+                The Intersight API path of the Intersight object.
+            organization (str):
+                The Intersight organization of the Intersight object.
+            object_name (str):
+                The name of the Intersight object.
+
+        Returns:
+            A string of the cached MOID for the provided Intersight object. If
+            the MOID has not been cached or has expired, None will be returned.
+        """
+        cache_key = self._cache_key(intersight_api_path,
+                                    organization,
+                                    object_name
+                                    )
+        with self.lock:
+            cached_entry = self.cached_moids.get(cache_key)
+            if cached_entry is None:
+                return None
+            cached_moid, expiration_time = cached_entry
+            if time.monotonic() >= expiration_time:
+                self.cached_moids.pop(cache_key, None)
+                return None
+            return cached_moid
+
+    def set(self,
+            intersight_api_path,
+            organization,
+            object_name,
+            object_moid
+            ):
+        """This function caches the MOID for an Intersight object.
+
+        Args:
+            intersight_api_path (str):
+                The Intersight API path of the Intersight object.
+            organization (str):
+                The Intersight organization of the Intersight object.
+            object_name (str):
+                The name of the Intersight object.
+            object_moid (str):
+                The MOID of the Intersight object.
+        """
+        cache_key = self._cache_key(intersight_api_path,
+                                    organization,
+                                    object_name
+                                    )
+        with self.lock:
+            self.cached_moids[cache_key] = (object_moid,
+                                            time.monotonic() + self.time_to_live
+                                            )
+
+    def invalidate(self,
+                   intersight_api_path,
+                   organization=None,
+                   object_name=None
+                   ):
+        """This function removes cached MOIDs for Intersight objects under an
+        Intersight API path. This should be performed whenever an Intersight
+        object under the path is created, updated or deleted.
+
+        Args:
+            intersight_api_path (str):
+                The Intersight API path of the Intersight objects.
+            organization (str):
+                Optional; The Intersight organization of the Intersight
+                objects. The default value is None, which matches every
+                organization.
+            object_name (str):
+                Optional; The name of the Intersight object. The default value
+                is None, which matches every object name.
+        """
+        base_intersight_api_path = self._cache_key(intersight_api_path,
+                                                   organization,
+                                                   object_name
+                                                   )[0]
+        with self.lock:
+            for cache_key in list(self.cached_moids):
+                if (
+                    cache_key[0] == base_intersight_api_path and
+                    organization in (None, cache_key[1]) and
+                    object_name in (None, cache_key[2])
+                    ):
+                    self.cached_moids.pop(cache_key)
+
+    def clear(self):
+        """This function removes all cached MOIDs.
+        """
+        with self.lock:
+            self.cached_moids.clear()
+
+
+# Establish function to retrieve the MOID cache of an Intersight API client
+intersight_moid_cache_creation_lock = threading.Lock()
+
+
+def get_intersight_moid_cache(api_client):
+    """This is a function to retrieve the MOID cache for an Intersight API
+    client. The MOID cache is created and attached to the API client on first
+    use, so that it is shared by every function and class using the client.
+
+    Args:
+        api_client ("ApiClient"):
+            An ApiClient class instance which handles Intersight client-server
+            communication through the use of API keys.
+
+    Returns:
+        An IntersightMoidCache class instance.
+    """
+    with intersight_moid_cache_creation_lock:
+        intersight_moid_cache = getattr(api_client, "intersight_moid_cache", None)
+        if intersight_moid_cache is None:
+            intersight_moid_cache = IntersightMoidCache()
+            api_client.intersight_moid_cache = intersight_moid_cache
+    return intersight_moid_cache
+
+
 # Establish function to retrieve the MOID of a specific Intersight API object by name
 def intersight_object_moid_retriever(intersight_api_key_id,
                                      intersight_api_key,
@@ -276,32 +905,21 @@ def intersight_object_moid_retriever(intersight_api_key_id,
                                     )
     else:
         api_client = preconfigured_api_client
-    try:
-        # Retrieve the Intersight Account name
-        api_client.call_api(resource_path="/iam/Accounts",
-                            method="GET",
-                            auth_settings=['cookieAuth', 'http_signature', 'oAuth2', 'oAuth2']
-                            )
-        response = api_client.last_response.data
-        iam_account = json.loads(response)
-        if api_client.last_response.status != 200:
-            print("The provided Intersight account information could not be "
-                  "accessed.")
-            print("Exiting due to the Intersight account being unavailable.\n")
-            print("Please verify that the correct API Key ID and API Key have "
-                  "been entered, then re-attempt execution.\n")
-            sys.exit(0)
-        else:
-            intersight_account_name = iam_account["Results"][0]["Name"]
-    except Exception:
-        print("\nA configuration error has occurred!\n")
-        print("Unable to access the Intersight API.")
-        print("Exiting due to the Intersight API being unavailable.\n")
-        print("Please verify that the correct API Key ID and API Key have "
-              "been entered, then re-attempt execution.\n")
-        sys.exit(0)
+    # Check the MOID cache of the API client for the provided object
+    intersight_moid_cache = get_intersight_moid_cache(api_client)
+    cached_intersight_object_moid = intersight_moid_cache.get(intersight_api_path,
+                                                              organization,
+                                                              object_name
+                                                              )
+    if cached_intersight_object_moid:
+        return cached_intersight_object_moid
+    # Retrieve the Intersight account context of the API client
+    intersight_account_context = get_intersight_account_context(api_client)
     # Retrieving the provided object from Intersight...
-    full_intersight_api_path = f"/{intersight_api_path}"
+    filtered_intersight_api_path = intersight_api_query_builder(intersight_api_path,
+                                                                filter_attributes={"Name": object_name}
+                                                                )
+    full_intersight_api_path = f"/{filtered_intersight_api_path}"
     try:
         api_client.call_api(resource_path=full_intersight_api_path,
                             method="GET",
@@ -323,31 +941,44 @@ def intersight_object_moid_retriever(intersight_api_key_id,
         sys.exit(0)
 
     if intersight_objects.get("Results"):
+        # Resolve the MOID of the provided organization once, on first use
+        provided_organization_moid = None
         for intersight_object in intersight_objects.get("Results"):
             if intersight_object.get("Organization"):
-                provided_organization_moid = intersight_object_moid_retriever(intersight_api_key_id=None,
-                                                                              intersight_api_key=None,
-                                                                              object_name=organization,
-                                                                              intersight_api_path="organization/Organizations",
-                                                                              object_type="Organization",
-                                                                              preconfigured_api_client=api_client
-                                                                              )
+                if provided_organization_moid is None:
+                    provided_organization_moid = intersight_object_moid_retriever(intersight_api_key_id=None,
+                                                                                  intersight_api_key=None,
+                                                                                  object_name=organization,
+                                                                                  intersight_api_path="organization/Organizations",
+                                                                                  object_type="Organization",
+                                                                                  preconfigured_api_client=api_client
+                                                                                  )
                 if intersight_object.get("Organization", {}).get("Moid") == provided_organization_moid:
                     if intersight_object.get("Name") == object_name:
                         intersight_object_moid = intersight_object.get("Moid")
                         # The provided object and MOID has been identified and retrieved.
+                        intersight_moid_cache.set(intersight_api_path,
+                                                  organization,
+                                                  object_name,
+                                                  intersight_object_moid
+                                                  )
                         return intersight_object_moid
             else:
                 if intersight_object.get("Name") == object_name:
                     intersight_object_moid = intersight_object.get("Moid")
                     # The provided object and MOID has been identified and retrieved.
+                    intersight_moid_cache.set(intersight_api_path,
+                                              organization,
+                                              object_name,
+                                              intersight_object_moid
+                                              )
                     return intersight_object_moid
         else:
             print("\nA configuration error has occurred!\n")
             print(f"The provided {object_type} named '{object_name}' was not "
                   "found.")
             print("Please check the Intersight Account named "
-                  f"{intersight_account_name}.")
+                  f"{intersight_account_context.get_account_name()}.")
             print("Verify through the API or GUI that the needed "
                   f"{object_type} is present.")
             print(f"If the needed {object_type} is missing, please create it.")
@@ -358,9 +989,9 @@ def intersight_object_moid_retriever(intersight_api_key_id,
         print(f"The provided {object_type} named '{object_name}' was not "
               "found.")
         print(f"No requested {object_type} instance is currently available in "
-              f"the Intersight account named {intersight_account_name}.")
+              f"the Intersight account named {intersight_account_context.get_account_name()}.")
         print("Please check the Intersight Account named "
-              f"{intersight_account_name}.")
+              f"{intersight_account_context.get_account_name()}.")
         print(f"Verify through the API or GUI that the needed {object_type} "
               "is present.")
         print(f"If the needed {object_type} is missing, please create it.")
@@ -372,7 +1003,9 @@ def intersight_object_moid_retriever(intersight_api_key_id,
 def _request_ucs_fi_device_console_login(
     ucs_fi_device_console_ip,
     ucs_fi_device_console_username,
-    ucs_fi_device_console_password
+    ucs_fi_device_console_password,
+    ucs_fi_device_console_session=None,
+    request_timeout=30
     ):
     """This is a function to request an HTTP response for a login to a UCS
     Fabric Interconnect Device Console under Intersight Managed Mode (IMM).
@@ -387,6 +1020,13 @@ def _request_ucs_fi_device_console_login(
         ucs_fi_device_console_password (str):
             The admin password of a UCS Fabric Interconnect under Intersight
             Managed Mode (IMM).
+        ucs_fi_device_console_session (Session):
+            Optional; A requests Session class instance to be reused for the
+            HTTP request. The default value is None, which sends the HTTP
+            request without a session.
+        request_timeout (int):
+            Optional; The time in seconds to wait for the HTTP response. The
+            default value is 30 seconds.
 
     Returns:
         A Response class instance for the UCS Fabric Interconnect Device
@@ -406,12 +1046,14 @@ def _request_ucs_fi_device_console_login(
         "User": ucs_fi_device_console_username,
         "Password": ucs_fi_device_console_password
         }
+    ucs_fi_device_console_http_client = ucs_fi_device_console_session or requests
     try:
-        ucs_fi_device_console_login_request = requests.post(
+        ucs_fi_device_console_login_request = ucs_fi_device_console_http_client.post(
             ucs_fi_device_console_url,
             headers=ucs_fi_device_console_headers,
             data=json.dumps(ucs_fi_device_console_post_body),
-            verify=False
+            verify=False,
+            timeout=request_timeout
             )
         return ucs_fi_device_console_login_request
     except Exception as exception_message:
@@ -425,7 +1067,9 @@ def _request_ucs_fi_device_console_login(
 # Establish function to request the UCS IMM FI Device Connector Claim Code
 def _request_ucs_fi_device_connector_claim_code(
     ucs_fi_device_console_ip,
-    ucs_fi_device_console_login
+    ucs_fi_device_console_login,
+    ucs_fi_device_console_session=None,
+    request_timeout=30
     ):
     """"This is a function to request an HTTP response for a Claim Code to a
     UCS Fabric Interconnect under Intersight Managed Mode (IMM).
@@ -437,6 +1081,13 @@ def _request_ucs_fi_device_connector_claim_code(
         ucs_fi_device_console_login (Response):
             A Response class instance of a UCS Fabric Interconnect Device
             Console login HTTP request.
+        ucs_fi_device_console_session (Session):
+            Optional; A requests Session class instance to be reused for the
+            HTTP request. The default value is None, which sends the HTTP
+            request without a session.
+        request_timeout (int):
+            Optional; The time in seconds to wait for the HTTP response. The
+            default value is 30 seconds.
 
     Returns:
         A Response class instance for the UCS Fabric Interconnect Claim Code
@@ -452,12 +1103,14 @@ def _request_ucs_fi_device_connector_claim_code(
         "Accept-Language": "application/json"
         }
     ucs_fi_device_connector_claim_code_url = f"https://{ucs_fi_device_console_ip}/connector/SecurityTokens"
+    ucs_fi_device_console_http_client = ucs_fi_device_console_session or requests
     try:
-        ucs_fi_device_connector_claim_code_request = requests.get(
+        ucs_fi_device_connector_claim_code_request = ucs_fi_device_console_http_client.get(
             ucs_fi_device_connector_claim_code_url,
             cookies=ucs_fi_device_console_login.cookies,
             headers=ucs_fi_device_connector_headers,
-            verify=False
+            verify=False,
+            timeout=request_timeout
             ) 
         return ucs_fi_device_connector_claim_code_request
     except Exception as exception_message:
@@ -471,7 +1124,9 @@ def _request_ucs_fi_device_connector_claim_code(
 # Establish function to request a refresh of the UCS IMM FI Device Connector
 def _request_ucs_fi_device_connector_refresh(
     ucs_fi_device_console_ip,
-    ucs_fi_device_console_login
+    ucs_fi_device_console_login,
+    ucs_fi_device_console_session=None,
+    request_timeout=30
     ):
     """"This is a function to request an HTTP response for refreshing the
     Device Connector of a UCS Fabric Interconnect under Intersight Managed
@@ -484,6 +1139,13 @@ def _request_ucs_fi_device_connector_refresh(
         ucs_fi_device_console_login (Response):
             A Response class instance of a UCS Fabric Interconnect Device
             Console login HTTP request.
+        ucs_fi_device_console_session (Session):
+            Optional; A requests Session class instance to be reused for the
+            HTTP request. The default value is None, which sends the HTTP
+            request without a session.
+        request_timeout (int):
+            Optional; The time in seconds to wait for the HTTP response. The
+            default value is 30 seconds.
 
     Returns:
         A Response class instance for the UCS Fabric Interconnect Device
@@ -500,13 +1162,15 @@ def _request_ucs_fi_device_connector_refresh(
         }
     ucs_fi_device_connector_refresh_url = f"https://{ucs_fi_device_console_ip}/connector/Connect"
     ucs_fi_device_connector_post_body = {}
+    ucs_fi_device_console_http_client = ucs_fi_device_console_session or requests
     try:
-        ucs_fi_device_connector_refresh_request = requests.post(
+        ucs_fi_device_connector_refresh_request = ucs_fi_device_console_http_client.post(
             ucs_fi_device_connector_refresh_url,
             cookies=ucs_fi_device_console_login.cookies,
             headers=ucs_fi_device_connector_headers,
             data=json.dumps(ucs_fi_device_connector_post_body),
-            verify=False
+            verify=False,
+            timeout=request_timeout
             ) 
         return ucs_fi_device_connector_refresh_request
     except Exception as exception_message:
@@ -520,7 +1184,9 @@ def _request_ucs_fi_device_connector_refresh(
 # Establish function to request UCS IMM FI Device Connector Device ID
 def _request_ucs_fi_device_connector_device_id(
     ucs_fi_device_console_ip,
-    ucs_fi_device_console_login
+    ucs_fi_device_console_login,
+    ucs_fi_device_console_session=None,
+    request_timeout=30
     ):
     """"This is a function to request an HTTP response for the Device ID
     of a UCS Fabric Interconnect under Intersight Managed Mode (IMM).
@@ -532,6 +1198,13 @@ def _request_ucs_fi_device_connector_device_id(
         ucs_fi_device_console_login (Response):
             A Response class instance of a UCS Fabric Interconnect Device
             Console login HTTP request.
+        ucs_fi_device_console_session (Session):
+            Optional; A requests Session class instance to be reused for the
+            HTTP request. The default value is None, which sends the HTTP
+            request without a session.
+        request_timeout (int):
+            Optional; The time in seconds to wait for the HTTP response. The
+            default value is 30 seconds.
 
     Returns:
         A Response class instance for the UCS Fabric Interconnect Device ID
@@ -547,12 +1220,14 @@ def _request_ucs_fi_device_connector_device_id(
         "Accept-Language": "application/json"
         }
     ucs_fi_device_connector_device_id_url = f"https://{ucs_fi_device_console_ip}/connector/DeviceIdentifiers"
+    ucs_fi_device_console_http_client = ucs_fi_device_console_session or requests
     try:
-        ucs_fi_device_connector_device_id_request = requests.get(
+        ucs_fi_device_connector_device_id_request = ucs_fi_device_console_http_client.get(
             ucs_fi_device_connector_device_id_url,
             cookies=ucs_fi_device_console_login.cookies,
             headers=ucs_fi_device_connector_headers,
-            verify=False
+            verify=False,
+            timeout=request_timeout
             ) 
         return ucs_fi_device_connector_device_id_request
     except Exception as exception_message:
@@ -566,7 +1241,9 @@ def _request_ucs_fi_device_connector_device_id(
 # Establish function to request UCS IMM FI Device Connector system information
 def _request_ucs_fi_device_connector_system_info(
     ucs_fi_device_console_ip,
-    ucs_fi_device_console_login
+    ucs_fi_device_console_login,
+    ucs_fi_device_console_session=None,
+    request_timeout=30
     ):
     """"This is a function to request an HTTP response for the system
     information of a UCS Fabric Interconnect under Intersight Managed Mode
@@ -579,6 +1256,13 @@ def _request_ucs_fi_device_connector_system_info(
         ucs_fi_device_console_login (Response):
             A Response class instance of a UCS Fabric Interconnect Device
             Console login HTTP request.
+        ucs_fi_device_console_session (Session):
+            Optional; A requests Session class instance to be reused for the
+            HTTP request. The default value is None, which sends the HTTP
+            request without a session.
+        request_timeout (int):
+            Optional; The time in seconds to wait for the HTTP response. The
+            default value is 30 seconds.
 
     Returns:
         A Response class instance for the UCS Fabric Interconnect system
@@ -594,12 +1278,14 @@ def _request_ucs_fi_device_connector_system_info(
         "Accept-Language": "application/json"
         }
     ucs_fi_device_connector_system_info_url = f"https://{ucs_fi_device_console_ip}/connector/Systems"
+    ucs_fi_device_console_http_client = ucs_fi_device_console_session or requests
     try:
-        ucs_fi_device_connector_system_info_request = requests.get(
+        ucs_fi_device_connector_system_info_request = ucs_fi_device_console_http_client.get(
             ucs_fi_device_connector_system_info_url,
             cookies=ucs_fi_device_console_login.cookies,
             headers=ucs_fi_device_connector_headers,
-            verify=False
+            verify=False,
+            timeout=request_timeout
             ) 
         return ucs_fi_device_connector_system_info_request
     except Exception as exception_message:
@@ -610,6 +1296,71 @@ def _request_ucs_fi_device_connector_system_info(
         print(exception_message)            
 
 
+# Establish function to poll the UCS IMM FI Device Connector until a Claim Code is available
+def _poll_ucs_fi_device_connector_claim_code(
+    ucs_fi_device_console_ip,
+    ucs_fi_device_console_login,
+    ucs_fi_device_console_session=None,
+    request_timeout=30,
+    readiness_timeout=60,
+    initial_polling_interval=1,
+    maximum_polling_interval=8
+    ):
+    """This is a function to poll the Device Connector of a UCS Fabric
+    Interconnect under Intersight Managed Mode (IMM) until a Claim Code is
+    available, such as after a refresh of the Device Connector. The polling
+    interval is doubled after every poll, and the function returns as soon as
+    a Claim Code is available.
+
+    Args:
+        ucs_fi_device_console_ip (str):
+            The IP address of a UCS Fabric Interconnect under Intersight
+            Managed Mode (IMM).
+        ucs_fi_device_console_login (Response):
+            A Response class instance of a UCS Fabric Interconnect Device
+            Console login HTTP request.
+        ucs_fi_device_console_session (Session):
+            Optional; A requests Session class instance to be reused for the
+            HTTP requests. The default value is None, which sends the HTTP
+            requests without a session.
+        request_timeout (int):
+            Optional; The time in seconds to wait for each HTTP response. The
+            default value is 30 seconds.
+        readiness_timeout (int):
+            Optional; The maximum time in seconds to poll for the Claim Code.
+            The default value is 60 seconds.
+        initial_polling_interval (int):
+            Optional; The time in seconds between the first two polls. The
+            default value is 1 second.
+        maximum_polling_interval (int):
+            Optional; The maximum time in seconds between two polls. The
+            default value is 8 seconds.
+
+    Returns:
+        A Response class instance for the UCS Fabric Interconnect Claim Code
+        HTTP request that returned the Claim Code, or None if a Claim Code did
+        not become available within the readiness timeout.
+    """
+    polling_interval = initial_polling_interval
+    readiness_deadline = time.monotonic() + readiness_timeout
+    while True:
+        get_ucs_fi_device_connector_claim_code = _request_ucs_fi_device_connector_claim_code(
+            ucs_fi_device_console_ip,
+            ucs_fi_device_console_login,
+            ucs_fi_device_console_session=ucs_fi_device_console_session,
+            request_timeout=request_timeout
+            )
+        if (get_ucs_fi_device_connector_claim_code is not None and
+            get_ucs_fi_device_connector_claim_code.status_code == 200 and
+            get_ucs_fi_device_connector_claim_code.json()):
+            return get_ucs_fi_device_connector_claim_code
+        remaining_readiness_time = readiness_deadline - time.monotonic()
+        if remaining_readiness_time <= 0:
+            return None
+        time.sleep(min(polling_interval, remaining_readiness_time))
+        polling_interval = min(polling_interval * 2, maximum_polling_interval)
+
+
 # Establish function to login to UCS FI Device Console
 def obtain_ucs_fi_device_console_login_cookie(
     ucs_fi_device_console_ip,
@@ -748,7 +1499,8 @@ def obtain_ucs_fi_device_connector_device_id(
 def obtain_ucs_fi_device_connector_claim_code(
     ucs_fi_device_console_ip,
     ucs_fi_device_console_username,
-    ucs_fi_device_console_password
+    ucs_fi_device_console_password,
+    device_connector_readiness_timeout=60
     ):
     """This is a function to obtain the Device Connector Claim Code for an
     unclaimed UCS Fabric Interconnect under Intersight Managed Mode (IMM).
@@ -763,6 +1515,10 @@ def obtain_ucs_fi_device_connector_claim_code(
         ucs_fi_device_console_password (str):
             The admin password of a UCS Fabric Interconnect under Intersight
             Managed Mode (IMM).
+        device_connector_readiness_timeout (int):
+            Optional; The maximum time in seconds to poll for a Claim Code
+            after a refresh of the Device Connector. The default value is 60
+            seconds.
 
     Returns:
         A string of the Device Connector Claim Code for an unclaimed UCS Fabric
@@ -813,17 +1569,16 @@ def obtain_ucs_fi_device_connector_claim_code(
                     ucs_fi_device_console_ip,
                     ucs_fi_device_console_login
                     )
-                # Pause to allow Device Connector refresh
-                time.sleep(5)
                 if device_connector_refresh.status_code == 200:
-                    # Obtain Claim Code
-                    print("Attempting to obtain the UCS FI Device Connector "
-                          "Claim Code...")
-                    get_ucs_fi_device_connector_claim_code_second_attempt = _request_ucs_fi_device_connector_claim_code(
+                    # Poll the Device Connector until the Claim Code is available after the refresh
+                    print("Waiting for the UCS FI Device Connector Claim Code "
+                          "to be available...")
+                    get_ucs_fi_device_connector_claim_code_second_attempt = _poll_ucs_fi_device_connector_claim_code(
                         ucs_fi_device_console_ip,
-                        ucs_fi_device_console_login
-                        ) 
-                    if get_ucs_fi_device_connector_claim_code_second_attempt.status_code == 200:
+                        ucs_fi_device_console_login,
+                        readiness_timeout=device_connector_readiness_timeout
+                        )
+                    if get_ucs_fi_device_connector_claim_code_second_attempt is not None:
                         ucs_fi_device_connector_claim_code_list = get_ucs_fi_device_connector_claim_code_second_attempt.json()
                         ucs_fi_device_connector_claim_code = ucs_fi_device_connector_claim_code_list[0]["Token"]
                         print("The Claim Code for the Device Connector of "
@@ -835,8 +1590,9 @@ def obtain_ucs_fi_device_connector_claim_code(
                         print("Unable to obtain the Claim Code for the "
                               "Device Connector of "
                               f"{ucs_fi_device_console_ip}.\n")
-                        print("Exception Message: ")
-                        print(get_ucs_fi_device_connector_claim_code_second_attempt.json())
+                        print("The Claim Code was not available within "
+                              f"{device_connector_readiness_timeout} seconds "
+                              "of the refresh of the Device Connector.")
                 else:
                     print("\nA configuration error has occurred!\n")
                     print("Unable to refresh the Device Connector for "
@@ -943,7 +1699,8 @@ class IntersightDeviceClaim:
                  device_id,
                  claim_code,
                  intersight_base_url="https://www.intersight.com/api/v1",
-                 preconfigured_api_client=None
+                 preconfigured_api_client=None,
+                 claim_confirmation_timeout=300
                  ):
         self.intersight_api_key_id = intersight_api_key_id
         self.intersight_api_key = intersight_api_key
@@ -957,6 +1714,8 @@ class IntersightDeviceClaim:
                                              )
         else:
             self.api_client = preconfigured_api_client
+        self.claim_confirmation_timeout = claim_confirmation_timeout
+        self.intersight_api_response = None
         self.intersight_api_body = {
             "SerialNumber": self.device_id,
             "SecurityToken": self.claim_code
@@ -970,7 +1729,8 @@ class IntersightDeviceClaim:
             f"'{self.device_id}', "
             f"'{self.claim_code}', "
             f"'{self.intersight_base_url}', "
-            f"{self.api_client})"
+            f"{self.api_client}, "
+            f"{self.claim_confirmation_timeout})"
             )
 
     def __str__(self):
@@ -996,6 +1756,7 @@ class IntersightDeviceClaim:
                                      body=self.intersight_api_body,
                                      auth_settings=['cookieAuth', 'http_signature', 'oAuth2', 'oAuth2']
                                      )
+            self.intersight_api_response = json.loads(self.api_client.last_response.data)
             print(f"The configuration of the {self.object_type} "
                   "has completed.")
             return "The POST method was successful."
@@ -1021,6 +1782,7 @@ class IntersightDeviceClaim:
                                              body=self.intersight_api_body,
                                              auth_settings=['cookieAuth', 'http_signature', 'oAuth2', 'oAuth2']
                                              )
+                    self.intersight_api_response = json.loads(self.api_client.last_response.data)
                     print(f"The update of the {self.object_type} has "
                           "completed.")
                     print(f"The pre-existing {existing_intersight_object_name} "
@@ -1053,13 +1815,85 @@ class IntersightDeviceClaim:
             traceback.print_exc()
             return "The POST method failed."
 
+    def _device_registration_waiter(self,
+                                    initial_polling_interval=2,
+                                    maximum_polling_interval=30
+                                    ):
+        """This function polls the Intersight device registration of the
+        claimed device until the device is connected to Intersight, which
+        confirms that the claim has completed. The polling interval is
+        doubled after every poll.
+
+        Args:
+            initial_polling_interval (int):
+                Optional; The time in seconds between the first two polls.
+                The default value is 2 seconds.
+            maximum_polling_interval (int):
+                Optional; The maximum time in seconds between two polls. The
+                default value is 30 seconds.
+
+        Returns:
+            A boolean indicating whether the claim has been confirmed within
+            the claim confirmation timeout.
+        """
+        device_registration_moid = ((self.intersight_api_response or {}).get("Device") or {}).get("Moid")
+        if not device_registration_moid:
+            print("\nA configuration error has occurred!\n")
+            print("The device registration for the claimed device "
+                  f"{self.device_id} was not returned by Intersight.")
+            print("The claim could not be confirmed.\n")
+            return False
+        full_intersight_api_path = f"/asset/DeviceRegistrations/{device_registration_moid}?$select=ConnectionStatus,DeviceHostname"
+        polling_interval = initial_polling_interval
+        claim_confirmation_deadline = time.monotonic() + self.claim_confirmation_timeout
+        while True:
+            try:
+                self.api_client.call_api(resource_path=full_intersight_api_path,
+                                         method="GET",
+                                         auth_settings=['cookieAuth', 'http_signature', 'oAuth2', 'oAuth2']
+                                         )
+                device_registration = json.loads(self.api_client.last_response.data)
+            except Exception:
+                # Poll again after the next polling interval, as the error may be transient
+                device_registration = {}
+            if device_registration.get("ConnectionStatus") == "Connected":
+                print(f"The claim of {self.device_id} has been confirmed.")
+                device_hostnames = device_registration.get("DeviceHostname") or [self.device_id]
+                print(f"The device {', '.join(device_hostnames)} is connected "
+                      "to Intersight.")
+                return True
+            remaining_claim_confirmation_time = claim_confirmation_deadline - time.monotonic()
+            if remaining_claim_confirmation_time <= 0:
+                print("\nA configuration error has occurred!\n")
+                print(f"The claim of {self.device_id} could not be confirmed "
+                      f"within {self.claim_confirmation_timeout} seconds.")
+                print("The last reported connection status was "
+                      f"'{device_registration.get('ConnectionStatus')}'.")
+                print("Please verify the claim of the device in Intersight.\n")
+                return False
+            time.sleep(min(polling_interval, remaining_claim_confirmation_time))
+            polling_interval = min(polling_interval * 2, maximum_polling_interval)
+
     def device_claimer(self):
-        """This function claims the targeted device.
+        """This function claims the targeted device. If a claim
+        confirmation timeout has been set, the claim is confirmed by polling
+        the Intersight device registration of the device.
+
+        Returns:
+            A string with a statement indicating whether the POST method
+            was successful or failed, or whether the claim could not be
+            confirmed.
         """           
         print(f"Configuring the {self.object_type} for "
               f"{self.device_id}...")
         # POST the API body to Intersight
-        self._post_intersight_object()
+        device_claim_result = self._post_intersight_object()
+        # Confirm the claim through the Intersight device registration
+        if device_claim_result == "The POST method was successful." and self.claim_confirmation_timeout:
+            print(f"Confirming the claim of {self.device_id}...")
+            if not self._device_registration_waiter():
+                return "The device claim could not be confirmed."
+        return device_claim_result
 
 
 def intersight_device_claimer(
@@ -1068,7 +1902,8 @@ def intersight_device_claimer(
     device_id,
     claim_code,
     intersight_base_url="https://www.intersight.com/api/v1",
-    preconfigured_api_client=None
+    preconfigured_api_client=None,
+    claim_confirmation_timeout=300
     ):
     """This is a function used to claim a device on Cisco Intersight.
 
@@ -1092,6 +1927,16 @@ def intersight_device_claimer(
             is provided, empty strings ("") or None can be provided for the
             intersight_api_key_id, intersight_api_key, and intersight_base_url
             arguments.
+        claim_confirmation_timeout (int):
+            Optional; The maximum time in seconds to poll the Intersight
+            device registration of the device to confirm the claim. Setting
+            the value to 0 skips the claim confirmation. The default value is
+            300 seconds.
+
+    Returns:
+        A string with a statement indicating whether the POST method of the
+        device claim was successful or failed, or whether the claim could not
+        be confirmed.
     """
     def builder(target_object):
         """This is a function used to build the objects that are components of
@@ -1101,13 +1946,17 @@ def intersight_device_claimer(
             target_object (class):
                 The class representing the object to be built on Intersight.
 
+        Returns:
+            A string with a statement indicating whether the POST method
+            was successful or failed.
+
         Raises:
             Exception:
                 An exception occurred due to an issue accessing the Intersight
                 API path. The status code or error message will be specified.
         """
         try:
-            target_object.device_claimer()
+            return target_object.device_claimer()
         except Exception:
             print("\nA configuration error has occurred!\n")
             print("The builder function failed to configure the "
@@ -1116,19 +1965,398 @@ def intersight_device_claimer(
                   f"{target_object.object_type} settings.\n")
             print("Exception Message: ")
             traceback.print_exc()
+            return "The POST method failed."
 
     # Define and create device claim object in Intersight
-    builder(
+    return builder(
         IntersightDeviceClaim(
             intersight_api_key_id=intersight_api_key_id,
             intersight_api_key=intersight_api_key,
             device_id=device_id,
             claim_code=claim_code,
             intersight_base_url=intersight_base_url,
-            preconfigured_api_client=preconfigured_api_client
+            preconfigured_api_client=preconfigured_api_client,
+            claim_confirmation_timeout=claim_confirmation_timeout
             ))
 
 
+# Establish class to collect the printed output of each thread separately
+class ThreadOutputCollector:
+    """This class is used to collect the output printed by a thread into a
+    separate list, so that the output of concurrently running tasks can be
+    shown together once the tasks have completed. The output of threads that
+    are not collecting output is written to the original output stream.
+    """
+    def __init__(self,
+                 output_stream,
+                 thread_local_storage
+                 ):
+        self.output_stream = output_stream
+        self.thread_local_storage = thread_local_storage
+
+    def __repr__(self):
+        return (
+            f"{self.__class__.__name__}"
+            f"({self.output_stream!r}, "
+            f"{self.thread_local_storage!r})"
+            )
+
+    def __str__(self):
+        return f"{self.__class__.__name__} class object for {self.output_stream}"
+
+    def write(self,
+              text
+              ):
+        """This function writes text to the output list of the current
+        thread or, if the current thread is not collecting output, to the
+        original output stream.
+
+        Args:
+            text (str):
+                The text to be written.
+
+        Returns:
+            The number of characters written.
+        """
+        collected_output = getattr(self.thread_local_storage, "collected_output", None)
+        if collected_output is None:
+            return self.output_stream.write(text)
+        collected_output.append(text)
+        return len(text)
+
+    def flush(self):
+        """This function flushes the original output stream.
+        """
+        self.output_stream.flush()
+
+
+# Establish function to claim a UCS IMM FI cluster in Intersight
+def ucs_fi_cluster_claimer(
+    ucs_fi_device_console_ip,
+    ucs_fi_device_console_username,
+    ucs_fi_device_console_password,
+    request_timeout=30,
+    device_connector_readiness_timeout=60,
+    claim_confirmation_timeout=300,
+    intersight_base_url="https://www.intersight.com/api/v1",
+    preconfigured_api_client=None
+    ):
+    """This is a function to claim a UCS Fabric Interconnect cluster under
+    Intersight Managed Mode (IMM) in Intersight. The Device Console login,
+    Device Connector Claim Code, Device ID and Intersight claim requests all
+    share one HTTP session, so the connection to the UCS Fabric Interconnect
+    is reused. No fixed delays are used: the Device Connector is polled for a
+    Claim Code after a refresh, and the Intersight device registration is
+    polled to confirm the claim.
+
+    Args:
+        ucs_fi_device_console_ip (str):
+            The IP address of a UCS Fabric Interconnect under Intersight
+            Managed Mode (IMM).
+        ucs_fi_device_console_username (str):
+            The admin username of a UCS Fabric Interconnect under Intersight
+            Managed Mode (IMM).
+        ucs_fi_device_console_password (str):
+            The admin password of a UCS Fabric Interconnect under Intersight
+            Managed Mode (IMM).
+        request_timeout (int):
+            Optional; The time in seconds to wait for each HTTP response from
+            the UCS Fabric Interconnect. The default value is 30 seconds.
+        device_connector_readiness_timeout (int):
+            Optional; The maximum time in seconds to poll for a Claim Code
+            after a refresh of the Device Connector. The default value is 60
+            seconds.
+        claim_confirmation_timeout (int):
+            Optional; The maximum time in seconds to poll the Intersight
+            device registration to confirm the claim. Setting the value to 0
+            skips the claim confirmation. The default value is 300 seconds.
+        intersight_base_url (str):
+            Optional; The base URL for Intersight API paths. The default value
+            is "https://www.intersight.com/api/v1". This value typically only
+            needs to be changed if using the Intersight Virtual Appliance.
+        preconfigured_api_client ("ApiClient"):
+            Optional; An ApiClient class instance which handles
+            Intersight client-server communication through the use of API keys.
+            The default value is None. If a preconfigured_api_client argument
+            is provided, empty strings ("") or None can be provided for the
+            intersight_api_key_id, intersight_api_key, and intersight_base_url
+            arguments.
+
+    Returns:
+        A string of the claim result. The value is "Claimed" if the UCS
+        Fabric Interconnect cluster has been claimed, "Claim not confirmed" if
+        the claim was accepted but the device did not connect to Intersight
+        within the claim confirmation timeout, or "Failed" if the claim did not
+        complete.
+    """
+    def request_claim_code(ucs_fi_device_console_login):
+        """This is a function to request the Device Connector Claim Code of
+        the UCS Fabric Interconnect.
+
+        Args:
+            ucs_fi_device_console_login (Response):
+                A Response class instance of a UCS Fabric Interconnect Device
+                Console login HTTP request.
+
+        Returns:
+            A Response class instance for the UCS Fabric Interconnect Claim
+            Code HTTP request.
+        """
+        print("Attempting to obtain the UCS FI Device Connector Claim Code...")
+        return _request_ucs_fi_device_connector_claim_code(
+            ucs_fi_device_console_ip,
+            ucs_fi_device_console_login,
+            ucs_fi_device_console_session=ucs_fi_device_console_session,
+            request_timeout=request_timeout
+            )
+
+    with requests.Session() as ucs_fi_device_console_session:
+        try:
+            # Login to UCS FI Device Console
+            print("\nAttempting login to the UCS FI Device Console for "
+                  f"{ucs_fi_device_console_ip}...")
+            ucs_fi_device_console_login = _request_ucs_fi_device_console_login(
+                ucs_fi_device_console_ip,
+                ucs_fi_device_console_username,
+                ucs_fi_device_console_password,
+                ucs_fi_device_console_session=ucs_fi_device_console_session,
+                request_timeout=request_timeout
+                )
+            # The HTTP request returns None if it could not be sent, after reporting the error
+            if ucs_fi_device_console_login is None:
+                return "Failed"
+            if ucs_fi_device_console_login.status_code != 200:
+                print("\nA configuration error has occurred!\n")
+                print("Unable to login to the UCS FI Device Console for "
+                      f"{ucs_fi_device_console_ip}.\n")
+                print("Exception Message: ")
+                print(ucs_fi_device_console_login.json())
+                return "Failed"
+            print("Login to the UCS FI Device Console for "
+                  f"{ucs_fi_device_console_ip} was successful.")
+            # Obtain Claim Code
+            get_ucs_fi_device_connector_claim_code = request_claim_code(ucs_fi_device_console_login)
+            if get_ucs_fi_device_connector_claim_code is None:
+                return "Failed"
+            if get_ucs_fi_device_connector_claim_code.status_code != 200:
+                print("\nA configuration error has occurred!\n")
+                print("Unable to obtain the Claim Code for the Device "
+                      f"Connector of {ucs_fi_device_console_ip}.\n")
+                print("Exception Message: ")
+                print(get_ucs_fi_device_connector_claim_code.json())
+                print("\nA second attempt will be made to obtain Claim "
+                      "Code by refreshing the Device Connector...")
+                print("Refreshing the Device Connector...")
+                # Refresh the Device Connector
+                print("Attempting to refresh the UCS FI Device Connector...")
+                device_connector_refresh = _request_ucs_fi_device_connector_refresh(
+                    ucs_fi_device_console_ip,
+                    ucs_fi_device_console_login,
+                    ucs_fi_device_console_session=ucs_fi_device_console_session,
+                    request_timeout=request_timeout
+                    )
+                if device_connector_refresh is None:
+                    return "Failed"
+                if device_connector_refresh.status_code != 200:
+                    print("\nA configuration error has occurred!\n")
+                    print("Unable to refresh the Device Connector for "
+                          f"{ucs_fi_device_console_ip}.\n")
+                    print("Exception Message: ")
+                    print(device_connector_refresh.json())
+                    return "Failed"
+                # Poll the Device Connector until the Claim Code is available after the refresh
+                print("Waiting for the UCS FI Device Connector Claim Code to be "
+                      "available...")
+                get_ucs_fi_device_connector_claim_code = _poll_ucs_fi_device_connector_claim_code(
+                    ucs_fi_device_console_ip,
+                    ucs_fi_device_console_login,
+                    ucs_fi_device_console_session=ucs_fi_device_console_session,
+                    request_timeout=request_timeout,
+                    readiness_timeout=device_connector_readiness_timeout
+                    )
+                if get_ucs_fi_device_connector_claim_code is None:
+                    print("\nA configuration error has occurred!\n")
+                    print("Unable to obtain the Claim Code for the Device "
+                          f"Connector of {ucs_fi_device_console_ip}.\n")
+                    print("The Claim Code was not available within "
+                          f"{device_connector_readiness_timeout} seconds of "
+                          "the refresh of the Device Connector.")
+                    return "Failed"
+            ucs_fi_device_connector_claim_code_list = get_ucs_fi_device_connector_claim_code.json()
+            ucs_fi_device_connector_claim_code = ucs_fi_device_connector_claim_code_list[0]["Token"]
+            print("The Claim Code for the Device Connector of "
+                  f"{ucs_fi_device_console_ip} has been retrieved.")
+            # Obtain Device ID
+            print("Attempting to obtain the UCS FI Device Connector Device "
+                  "ID...")
+            get_ucs_fi_device_connector_device_id = _request_ucs_fi_device_connector_device_id(
+                ucs_fi_device_console_ip,
+                ucs_fi_device_console_login,
+                ucs_fi_device_console_session=ucs_fi_device_console_session,
+                request_timeout=request_timeout
+                )
+            if get_ucs_fi_device_connector_device_id is None:
+                return "Failed"
+            if get_ucs_fi_device_connector_device_id.status_code != 200:
+                print("\nA configuration error has occurred!\n")
+                print("Unable to obtain the Device ID for the Device "
+                      f"Connector of {ucs_fi_device_console_ip}.\n")
+                print("Exception Message: ")
+                print(get_ucs_fi_device_connector_device_id.json())
+                return "Failed"
+            ucs_fi_device_connector_device_id_list = get_ucs_fi_device_connector_device_id.json()
+            ucs_fi_device_connector_device_id = ucs_fi_device_connector_device_id_list[0]["Id"]
+            print("The Device ID for the Device Connector of "
+                  f"{ucs_fi_device_console_ip} has been retrieved.")
+            # Claim the device in Intersight
+            ucs_fi_device_claim = intersight_device_claimer(
+                intersight_api_key_id=None,
+                intersight_api_key=None,
+                device_id=ucs_fi_device_connector_device_id,
+                claim_code=ucs_fi_device_connector_claim_code,
+                intersight_base_url=intersight_base_url,
+                preconfigured_api_client=preconfigured_api_client,
+                claim_confirmation_timeout=claim_confirmation_timeout
+                )
+            if ucs_fi_device_claim == "The POST method was successful.":
+                return "Claimed"
+            if ucs_fi_device_claim == "The device claim could not be confirmed.":
+                return "Claim not confirmed"
+            return "Failed"
+        except Exception:
+            print("\nA configuration error has occurred!\n")
+            print("There was an issue claiming the device at "
+                  f"{ucs_fi_device_console_ip}.\n")
+            print("Exception Message: ")
+            traceback.print_exc()
+            return "Failed"
+
+
+# Establish function to claim multiple UCS IMM FI clusters in Intersight concurrently
+def parallel_ucs_fi_cluster_claimer(
+    ucs_fi_device_console_ip_list,
+    ucs_fi_device_console_username,
+    ucs_fi_device_console_password,
+    max_concurrent_claims=8,
+    request_timeout=30,
+    device_connector_readiness_timeout=60,
+    claim_confirmation_timeout=300,
+    intersight_base_url="https://www.intersight.com/api/v1",
+    preconfigured_api_client=None
+    ):
+    """This is a function to claim multiple UCS Fabric Interconnect clusters
+    under Intersight Managed Mode (IMM) in Intersight at the same time on a
+    bounded pool of worker threads. The output printed during the claim of
+    each UCS Fabric Interconnect cluster is collected separately and shown
+    together once the claim has finished, followed by a summary of the
+    results.
+
+    Args:
+        ucs_fi_device_console_ip_list (list):
+            A list of the IP addresses of the UCS Fabric Interconnect
+            clusters to be claimed, with one IP address for each cluster.
+        ucs_fi_device_console_username (str):
+            The admin username of the UCS Fabric Interconnects.
+        ucs_fi_device_console_password (str):
+            The admin password of the UCS Fabric Interconnects.
+        max_concurrent_claims (int):
+            Optional; The maximum number of UCS Fabric Interconnect clusters
+            that can be claimed at the same time. The default value is 8.
+        request_timeout (int):
+            Optional; The time in seconds to wait for each HTTP response from
+            the UCS Fabric Interconnects. The default value is 30 seconds.
+        device_connector_readiness_timeout (int):
+            Optional; The maximum time in seconds to poll for a Claim Code
+            after a refresh of a Device Connector. The default value is 60
+            seconds.
+        claim_confirmation_timeout (int):
+            Optional; The maximum time in seconds to poll the Intersight
+            device registrations to confirm the claims. Setting the value to
+            0 skips the claim confirmations. The default value is 300 seconds.
+        intersight_base_url (str):
+            Optional; The base URL for Intersight API paths. The default value
+            is "https://www.intersight.com/api/v1". This value typically only
+            needs to be changed if using the Intersight Virtual Appliance.
+        preconfigured_api_client ("ApiClient"):
+            Optional; An ApiClient class instance which handles
+            Intersight client-server communication through the use of API keys.
+            The default value is None. If a preconfigured_api_client argument
+            is provided, empty strings ("") or None can be provided for the
+            intersight_api_key_id, intersight_api_key, and intersight_base_url
+            arguments.
+
+    Returns:
+        A dictionary with the IP addresses of the UCS Fabric Interconnect
+        clusters as keys and the claim results as values.
+    """
+    def output_collecting_claimer(ucs_fi_device_console_ip):
+        """This is a function to claim a UCS Fabric Interconnect cluster while
+        collecting the output printed during the claim.
+
+        Args:
+            ucs_fi_device_console_ip (str):
+                The IP address of the UCS Fabric Interconnect cluster.
+
+        Returns:
+            A tuple containing the claim result and the collected output.
+        """
+        thread_local_storage.collected_output = []
+        try:
+            ucs_fi_cluster_claim = ucs_fi_cluster_claimer(
+                ucs_fi_device_console_ip,
+                ucs_fi_device_console_username,
+                ucs_fi_device_console_password,
+                request_timeout=request_timeout,
+                device_connector_readiness_timeout=device_connector_readiness_timeout,
+                claim_confirmation_timeout=claim_confirmation_timeout,
+                intersight_base_url=intersight_base_url,
+                preconfigured_api_client=preconfigured_api_client
+                )
+            return ucs_fi_cluster_claim, "".join(thread_local_storage.collected_output)
+        finally:
+            thread_local_storage.collected_output = None
+
+    ucs_fi_cluster_claims = {}
+    thread_local_storage = threading.local()
+    original_stdout = sys.stdout
+    original_stderr = sys.stderr
+    sys.stdout = ThreadOutputCollector(original_stdout, thread_local_storage)
+    sys.stderr = ThreadOutputCollector(original_stderr, thread_local_storage)
+    try:
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max(1, max_concurrent_claims)) as executor:
+            ucs_fi_cluster_claim_futures = {
+                executor.submit(output_collecting_claimer, ucs_fi_device_console_ip): ucs_fi_device_console_ip
+                for ucs_fi_device_console_ip in ucs_fi_device_console_ip_list
+                }
+            # Show the collected output of each claim as soon as it has finished
+            for ucs_fi_cluster_claim_future in concurrent.futures.as_completed(ucs_fi_cluster_claim_futures):
+                ucs_fi_device_console_ip = ucs_fi_cluster_claim_futures[ucs_fi_cluster_claim_future]
+                try:
+                    ucs_fi_cluster_claim, claim_output = ucs_fi_cluster_claim_future.result()
+                except Exception:
+                    ucs_fi_cluster_claim, claim_output = "Failed", traceback.format_exc()
+                ucs_fi_cluster_claims[ucs_fi_device_console_ip] = ucs_fi_cluster_claim
+                original_stdout.write(claim_output)
+                original_stdout.flush()
+    finally:
+        sys.stdout = original_stdout
+        sys.stderr = original_stderr
+
+    # Show the summary of the claims
+    print("\nUCS FI Claim Summary:")
+    for ucs_fi_device_console_ip in ucs_fi_device_console_ip_list:
+        print(f"{ucs_fi_device_console_ip:<45}"
+              f"{ucs_fi_cluster_claims.get(ucs_fi_device_console_ip, 'Failed')}")
+    claimed_ucs_fi_clusters = [ucs_fi_device_console_ip
+                               for ucs_fi_device_console_ip, ucs_fi_cluster_claim in ucs_fi_cluster_claims.items()
+                               if ucs_fi_cluster_claim == "Claimed"
+                               ]
+    print(f"\n{len(claimed_ucs_fi_clusters)} of "
+          f"{len(ucs_fi_device_console_ip_list)} UCS FI clusters were claimed "
+          "successfully.")
+    return ucs_fi_cluster_claims
+
+
 def main():
     # Establish UCS FI Claim Handler specific variables
     claimer_type = "UCS FI Claim Handler"
@@ -1137,7 +2365,8 @@ def main():
     main_intersight_api_client = get_api_client(api_key_id=key_id,
                                                 api_secret_file=key,
                                                 endpoint=intersight_base_url,
-                                                url_certificate_verification=url_certificate_verification
+                                                url_certificate_verification=url_certificate_verification,
+                                                api_request_rate_limit=intersight_api_request_rate_limit
                                                 )
     
     # Starting the UCS FI Claim Handler for Cisco Intersight
@@ -1151,154 +2380,22 @@ def main():
         preconfigured_api_client=main_intersight_api_client
         )
 
-    # Cycle through provided UCS FI Device Console IP list and claim devices
+    # Claim the UCS FI clusters of the provided UCS FI Device Console IP list
     if ucs_fi_device_console_ip_list:
-        for ucs_fi_device_console_ip in ucs_fi_device_console_ip_list:
-            try:
-                # Login to UCS FI Device Console
-                print("\nAttempting login to the UCS FI Device Console for "
-                      f"{ucs_fi_device_console_ip}...")
-                ucs_fi_device_console_login = _request_ucs_fi_device_console_login(
-                    ucs_fi_device_console_ip,
-                    ucs_fi_device_console_username,
-                    ucs_fi_device_console_password
-                    )
-                if ucs_fi_device_console_login.status_code == 200:
-                    print("Login to the UCS FI Device Console for "
-                          f"{ucs_fi_device_console_ip} was successful.")
-                    # Obtain Claim Code
-                    print("Attempting to obtain the UCS FI Device Connector "
-                          "Claim Code...")
-                    get_ucs_fi_device_connector_claim_code = _request_ucs_fi_device_connector_claim_code(
-                        ucs_fi_device_console_ip,
-                        ucs_fi_device_console_login
-                        ) 
-                    if get_ucs_fi_device_connector_claim_code.status_code == 200:
-                        ucs_fi_device_connector_claim_code_list = get_ucs_fi_device_connector_claim_code.json()
-                        ucs_fi_device_connector_claim_code = ucs_fi_device_connector_claim_code_list[0]["Token"]
-                        print("The Claim Code for the Device Connector of "
-                              f"{ucs_fi_device_console_ip} has been "
-                              "retrieved.")
-                        # Obtain Device ID
-                        print("Attempting to obtain the UCS FI Device "
-                              "Connector Device ID...")
-                        get_ucs_fi_device_connector_device_id = _request_ucs_fi_device_connector_device_id(
-                            ucs_fi_device_console_ip,
-                            ucs_fi_device_console_login
-                            ) 
-                        if get_ucs_fi_device_connector_device_id.status_code == 200:
-                            ucs_fi_device_connector_device_id_list = get_ucs_fi_device_connector_device_id.json()
-                            ucs_fi_device_connector_device_id = ucs_fi_device_connector_device_id_list[0]["Id"]
-                            print("The Device ID for the Device "
-                                  "Connector of "
-                                  f"{ucs_fi_device_console_ip} has "
-                                  "been retrieved.")
-                            # Claim the device in Intersight
-                            intersight_device_claimer(
-                                intersight_api_key_id=None,
-                                intersight_api_key=None,
-                                device_id=ucs_fi_device_connector_device_id,
-                                claim_code=ucs_fi_device_connector_claim_code,
-                                intersight_base_url=intersight_base_url,
-                                preconfigured_api_client=main_intersight_api_client
-                                )                      
-                        else:
-                            print("\nA configuration error has "
-                                  "occurred!\n")
-                            print("Unable to obtain the Device ID for "
-                                  "the Device Connector of "
-                                  f"{ucs_fi_device_console_ip}.\n")
-                            print("Exception Message: ")
-                            print(get_ucs_fi_device_connector_device_id.json())        
-                    else:
-                        print("\nA configuration error has occurred!\n")
-                        print("Unable to obtain the Claim Code for the "
-                              "Device Connector of "
-                              f"{ucs_fi_device_console_ip}.\n")
-                        print("Exception Message: ")
-                        print(get_ucs_fi_device_connector_claim_code.json())
-                        print("\nA second attempt will be made to obtain Claim "
-                              "Code by refreshing the Device Connector...")
-                        print("Refreshing the Device Connector...")
-                        # Refresh the Device Connector
-                        print("Attempting to refresh the UCS FI Device "
-                              "Connector...")
-                        device_connector_refresh = _request_ucs_fi_device_connector_refresh(
-                            ucs_fi_device_console_ip,
-                            ucs_fi_device_console_login
-                            )
-                        # Pause to allow Device Connector refresh
-                        time.sleep(5)
-                        if device_connector_refresh.status_code == 200:
-                            # Obtain Claim Code
-                            print("Attempting to obtain the UCS FI Device "
-                                  "Connector Claim Code...")
-                            get_ucs_fi_device_connector_claim_code_second_attempt = _request_ucs_fi_device_connector_claim_code(
-                                ucs_fi_device_console_ip,
-                                ucs_fi_device_console_login
-                                ) 
-                            if get_ucs_fi_device_connector_claim_code_second_attempt.status_code == 200:
-                                ucs_fi_device_connector_claim_code_list = get_ucs_fi_device_connector_claim_code_second_attempt.json()
-                                ucs_fi_device_connector_claim_code = ucs_fi_device_connector_claim_code_list[0]["Token"]
-                                print("The Claim Code for the Device Connector "
-                                      f"of {ucs_fi_device_console_ip} has been "
-                                      "retrieved.")
-                                # Obtain Device ID
-                                print("Attempting to obtain the UCS FI Device "
-                                      "Connector Device ID...")
-                                get_ucs_fi_device_connector_device_id = _request_ucs_fi_device_connector_device_id(
-                                    ucs_fi_device_console_ip,
-                                    ucs_fi_device_console_login
-                                    ) 
-                                if get_ucs_fi_device_connector_device_id.status_code == 200:
-                                    ucs_fi_device_connector_device_id_list = get_ucs_fi_device_connector_device_id.json()
-                                    ucs_fi_device_connector_device_id = ucs_fi_device_connector_device_id_list[0]["Id"]
-                                    print("The Device ID for the Device "
-                                          "Connector of "
-                                          f"{ucs_fi_device_console_ip} has "
-                                          "been retrieved.")
-                                    # Claim the device in Intersight
-                                    intersight_device_claimer(
-                                        intersight_api_key_id=None,
-                                        intersight_api_key=None,
-                                        device_id=ucs_fi_device_connector_device_id,
-                                        claim_code=ucs_fi_device_connector_claim_code,
-                                        intersight_base_url=intersight_base_url,
-                                        preconfigured_api_client=main_intersight_api_client
-                                        )                      
-                                else:
-                                    print("\nA configuration error has "
-                                          "occurred!\n")
-                                    print("Unable to obtain the Device ID for "
-                                          "the Device Connector of "
-                                          f"{ucs_fi_device_console_ip}.\n")
-                                    print("Exception Message: ")
-                                    print(get_ucs_fi_device_connector_device_id.json())        
-                            else:
-                                print("\nA configuration error has occurred!\n")
-                                print("Unable to obtain the Claim Code for the "
-                                      "Device Connector of "
-                                      f"{ucs_fi_device_console_ip}.\n")
-                                print("Exception Message: ")
-                                print(get_ucs_fi_device_connector_claim_code_second_attempt.json())                        
-                        else:
-                            print("\nA configuration error has occurred!\n")
-                            print("Unable to refresh the Device Connector for "
-                                  f"{ucs_fi_device_console_ip}.\n")
-                            print("Exception Message: ")
-                            print(device_connector_refresh.json())
-                else:
-                    print("\nA configuration error has occurred!\n")
-                    print("Unable to login to the UCS FI Device Console for "
-                          f"{ucs_fi_device_console_ip}.\n")
-                    print("Exception Message: ")
-                    print(ucs_fi_device_console_login.json())
-            except Exception:
-                print("\nA configuration error has occurred!\n")
-                print("There was an issue claiming the device at "
-                      f"{ucs_fi_device_console_ip}.\n")
-                print("Exception Message: ")
-                traceback.print_exc()
+        print(f"\nClaiming {len(ucs_fi_device_console_ip_list)} UCS FI "
+              f"cluster(s) with up to {ucs_fi_max_concurrent_claims} claims at "
+              "a time, please wait...")
+        parallel_ucs_fi_cluster_claimer(
+            ucs_fi_device_console_ip_list=ucs_fi_device_console_ip_list,
+            ucs_fi_device_console_username=ucs_fi_device_console_username,
+            ucs_fi_device_console_password=ucs_fi_device_console_password,
+            max_concurrent_claims=ucs_fi_max_concurrent_claims,
+            request_timeout=ucs_fi_device_console_request_timeout,
+            device_connector_readiness_timeout=ucs_fi_device_connector_readiness_timeout,
+            claim_confirmation_timeout=ucs_fi_claim_confirmation_timeout,
+            intersight_base_url=intersight_base_url,
+            preconfigured_api_client=main_intersight_api_client
+            )
     else:
         print("\nThere are no UCS Fabric Interconnects to claim to Intersight.")
         print("There were no IP addresses provided.")
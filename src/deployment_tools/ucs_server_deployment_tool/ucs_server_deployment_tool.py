@@ -16,6 +16,15 @@ import json
 import copy
 import intersight
 import re
+import threading
+import concurrent.futures
+import urllib.parse
+import hashlib
+import os
+import argparse
+import random
+import email.utils
+import atexit
 import urllib3
 import time
 import base64
@@ -70,6 +79,21 @@ values and replace them with your own, where applicable.
 intersight_base_url = "https://www.intersight.com/api/v1"
 url_certificate_verification = True
 
+# Intersight API Request Rate Settings
+## NOTE - To stay under the request quota of the Intersight account, set the maximum average number of Intersight API requests per second, for example: intersight_api_request_rate_limit = 20
+## Leave the value as None to not limit the request rate. Throttled requests are always retried after the delay requested by Intersight.
+intersight_api_request_rate_limit = None
+
+# Intersight Object State File Setting
+## NOTE - Provide a file path to store a hash of each configured object, so that objects unchanged since the last run are skipped, for example: intersight_object_state_file = "intersight_object_state.json"
+## Leave the value empty to compare every pre-existing object with Intersight on each run.
+intersight_object_state_file = ""
+
+# Deployment Journal Settings
+## NOTE - Each completed deployment step is recorded in the deployment journal file. If a deployment stops before completion, run the UCS Server Deployment Tool again with the --resume option to skip the completed steps, for example: python ucs_server_deployment_tool.py --resume
+## The default value of None does not record a deployment journal. To record one, set the value to a file path, for example: deployment_journal_file = "ucs_server_deployment_tool_journal.jsonl"
+deployment_journal_file = None
+
 # Global Deployment Name Settings (Optional - These settings will attach a global prefix or suffix to the names of the created UCS Server Profile, Policies, and Pools)
 deployment_name_prefix = ""
 ## If a deployment name suffix is desired, change the value of the following deployment_name_suffix variable, for example: deployment_name_suffix = "-1"
@@ -119,10 +143,34 @@ ucs_server_profile_uuid_assignment_type = "Pool"       # Options: "Pool", "Stati
 ucs_server_profile_uuid_pool_name = "UUID-Pool-1"       # If the uuid_assignment_type variable is set to "Pool", provide a string value e.g. "UUID-Pool-1" for the uuid_pool_name variable
 ucs_server_profile_uuid_static_address = ""        # If the uuid_assignment_type variable is set to "Static", provide a string value e.g. "F733776E-1ED8-11E2-0000-000000000001" for the uuid_static_address variable
 
+# Deployment Concurrency Configuration
+## NOTE - This argument sets the maximum number of Pools, Policies and UCS Server Profiles that are created in Intersight at the same time.
+## Each Pool, Policy or UCS Server Profile is created as soon as the Pools, Policies and UCS Server Profiles it depends on have been created.
+## Set to 1 to create the Pools, Policies and UCS Server Profiles one at a time.
+deployment_max_concurrent_tasks = 8
+
+# Adaptive Concurrency Configuration
+## NOTE - When deployment_adaptive_concurrency is set to True, the number of deployment tasks, UCS Server Profile assignments and deployment requests running at the same time is adapted to the Intersight API.
+## The concurrency starts at half of the configured maximum, is raised while the Intersight API responds normally and is halved when requests are throttled, fail with server errors or slow down.
+## The configured maximums above and below are never exceeded. Set to False to always use the configured maximums.
+deployment_adaptive_concurrency = True
+
+# Deployment Wave Configuration
+## NOTE - The UCS Server Profiles are assigned at the same time, up to the number of UCS Server Profiles set in ucs_server_profile_max_concurrent_assignments.
+## The assigned UCS Server Profiles are then deployed in waves. Each wave deploys up to ucs_server_profile_deployment_wave_size_per_chassis UCS Server Profiles per chassis,
+## and the next wave starts once the deployments of the current wave have finished. This limits the number of Servers rebooting at the same time in each chassis.
+## Rack Servers and any Servers with an unknown chassis are not limited by the wave size. Set ucs_server_profile_deployment_wave_size_per_chassis to 0 to deploy all the UCS Server Profiles in one wave.
+ucs_server_profile_max_concurrent_assignments = 8
+ucs_server_profile_deployment_wave_size_per_chassis = 2
+
 # Deployment Start Delay Configuration
-## NOTE - This argument sets the delay time between UCS Server Profile assignment and deployment.
-## The delay allows for system time that may be needed for clearing previous configurations, etc. before a new UCS Server Profile may be deployed.
-ucs_server_profile_deployment_start_delay = 5
+## NOTE - This argument sets an additional fixed delay time between UCS Server Profile assignment and deployment.
+## Each UCS Server Profile is polled until it is ready before it is deployed, so a fixed delay is normally not needed.
+ucs_server_profile_deployment_start_delay = 0
+
+# Deployment Wait Configuration
+## NOTE - This argument sets the maximum time in seconds to wait for each UCS Server Profile to be ready for deployment and for each deployment to finish.
+ucs_server_profile_deployment_wait_timeout = 1800
 
 # Profile Default Settings (Change only if needed)
 ucs_server_profile_ucs_server_type = "FI-Attached"     # Options: "FI-Attached", "Standalone"
@@ -1171,6 +1219,9 @@ resource_pool_ucs_server_type = "FI-Attached"     # Options: "FI-Attached", "Sta
 resource_pool_resource_assignment_order = "default"       # Options: "default", "sequential"
 resource_pool_resource_type = "Server"        # Options: "Server", "None"
 resource_pool_pool_type = "Static"        # Options: "Static", "Dynamic"
+## NOTE - When resource_pool_server_side_selectors is set to True, the resources above are translated into selectors that are evaluated by Intersight, so the server inventory is not downloaded.
+## This is recommended with the "Dynamic" pool type, as the selectors also match servers that are added after the Resource Pool has been created.
+resource_pool_server_side_selectors = False
 
 
 #----------------------------------Section 31----------------------------------#
@@ -1981,13 +2032,255 @@ wwpn_pool_wwpn_assignment_order = "default"       # Options: "default", "sequent
 # Suppress InsecureRequestWarning error messages
 urllib3.disable_warnings()
 
+# Establish the process-wide cache of Intersight API clients
+intersight_api_client_cache = {}
+intersight_api_client_cache_lock = threading.Lock()
+
+
+# Establish class to limit the request rate of an Intersight API client
+class IntersightRateLimiter:
+    """This class is used to limit the rate of Intersight API requests made
+    through an Intersight API client with a token bucket. Every function and
+    class sharing the API client draws from the same bucket, so the combined
+    request rate stays under the request quota of the Intersight account.
+    Requests can also be paused for every thread, for example after the
+    Intersight API has throttled a request.
+    """
+    def __init__(self,
+                 request_rate_limit=None,
+                 burst_size=None
+                 ):
+        self.request_rate_limit = request_rate_limit
+        self.burst_size = burst_size or max(1, request_rate_limit or 1)
+        self.available_tokens = self.burst_size
+        self.last_refill_time = time.monotonic()
+        self.paused_until = 0
+        self.lock = threading.Lock()
+
+    def __repr__(self):
+        return (
+            f"{self.__class__.__name__}"
+            f"({self.request_rate_limit}, "
+            f"{self.burst_size})"
+            )
+
+    def __str__(self):
+        return (f"{self.__class__.__name__} class object with a limit of "
+                f"{self.request_rate_limit} request(s) per second")
+
+    def acquire(self):
+        """This function waits until a request can be made, then consumes a
+        token from the bucket.
+        """
+        while True:
+            with self.lock:
+                current_time = time.monotonic()
+                wait_time = self.paused_until - current_time
+                if wait_time <= 0:
+                    if not self.request_rate_limit:
+                        return
+                    # Refill the bucket for the time elapsed since the last request
+                    self.available_tokens = min(self.burst_size,
+                                                self.available_tokens + (current_time - self.last_refill_time) * self.request_rate_limit
+                                                )
+                    self.last_refill_time = current_time
+                    if self.available_tokens >= 1:
+                        self.available_tokens -= 1
+                        return
+                    wait_time = (1 - self.available_tokens) / self.request_rate_limit
+            time.sleep(wait_time)
+
+    def pause(self,
+              pause_duration
+              ):
+        """This function pauses all requests for a duration.
+
+        Args:
+            pause_duration (float):
+                The duration of the pause in seconds.
+        """
+        with self.lock:
+            self.paused_until = max(self.paused_until, time.monotonic() + pause_duration)
+
+
+# Establish class for an Intersight SDK for Python API client with rate limiting and retries
+class RateLimitedApiClient(intersight.ApiClient):
+    """This class is used to provide an Intersight SDK for Python API client
+    that limits the rate of Intersight API requests and retries requests that
+    have been throttled or have failed temporarily. Throttled requests (429)
+    are retried for every method after the delay requested by the
+    Retry-After header. Requests that failed with a 500, 502, 503 or 504
+    status code are only retried for methods that are safe to repeat. Each
+    retry waits with jittered exponential backoff. The latency and status
+    code of each response are reported to the concurrency controller of the
+    API client, if attached.
+    """
+    idempotent_methods = ("GET", "HEAD", "OPTIONS", "PUT", "DELETE")
+    retryable_status_codes = (500, 502, 503, 504)
+    rate_limiter = None
+    api_retry_limit = 5
+    api_retry_backoff = 1
+    api_retry_max_delay = 60
+    concurrency_controller = None
+
+    def _retry_delay(self,
+                     error,
+                     retry_attempt
+                     ):
+        """This function determines the delay before a request is retried.
+
+        Args:
+            error (intersight.exceptions.ApiException):
+                The exception raised by the failed request.
+            retry_attempt (int):
+                The number of retries already performed for the request.
+
+        Returns:
+            A float of the delay in seconds.
+        """
+        retry_after = (error.headers or {}).get("Retry-After")
+        if retry_after:
+            # The Retry-After header is either a number of seconds or an HTTP date
+            try:
+                return max(float(retry_after), 0) + random.uniform(0, self.api_retry_backoff)
+            except ValueError:
+                try:
+                    return max(email.utils.mktime_tz(email.utils.parsedate_tz(retry_after)) - time.time(), 0) + random.uniform(0, self.api_retry_backoff)
+                except (TypeError, ValueError, OverflowError):
+                    pass
+        exponential_delay = min(self.api_retry_max_delay, self.api_retry_backoff * 2 ** retry_attempt)
+        return random.uniform(exponential_delay / 2, exponential_delay)
+
+    def call_api(self,
+                 resource_path,
+                 method,
+                 *args,
+                 **kwargs
+                 ):
+        """This function performs an Intersight API request, waiting for the
+        rate limiter and retrying throttled or temporarily failed requests.
+
+        Args:
+            resource_path (str):
+                The Intersight API resource path of the request.
+            method (str):
+                The HTTP method of the request.
+            *args:
+                The additional positional arguments of the request.
+            **kwargs:
+                The additional keyword arguments of the request.
+
+        Returns:
+            The response of the request.
+
+        Raises:
+            intersight.exceptions.ApiException:
+                The request failed and could not be retried.
+        """
+        if kwargs.get("async_req"):
+            return super().call_api(resource_path, method, *args, **kwargs)
+        retry_attempt = 0
+        while True:
+            if self.rate_limiter:
+                self.rate_limiter.acquire()
+            request_start_time = time.monotonic()
+            try:
+                api_response = super().call_api(resource_path, method, *args, **kwargs)
+                if self.concurrency_controller:
+                    self.concurrency_controller.record_response(time.monotonic() - request_start_time,
+                                                                request_method=method,
+                                                                request_path=resource_path
+                                                                )
+                return api_response
+            except intersight.exceptions.ApiException as error:
+                if self.concurrency_controller:
+                    self.concurrency_controller.record_response(time.monotonic() - request_start_time,
+                                                                error.status,
+                                                                request_method=method,
+                                                                request_path=resource_path
+                                                                )
+                if retry_attempt >= self.api_retry_limit or not (
+                    error.status == 429 or
+                    (error.status in self.retryable_status_codes and method.upper() in self.idempotent_methods)
+                    ):
+                    raise
+                retry_delay = self._retry_delay(error, retry_attempt)
+                if error.status == 429 and self.rate_limiter:
+                    # Pause every request sharing the API client while throttled
+                    self.rate_limiter.pause(retry_delay)
+                print(f"The Intersight API request for '{resource_path}' "
+                      f"returned the status code {error.status}. The request "
+                      f"will be retried in {retry_delay:.1f} seconds.")
+                time.sleep(retry_delay)
+                retry_attempt += 1
+
+
 # Function to get Intersight API client as specified in the Intersight Python SDK documentation for OpenAPI 3.x
 ## Modified to align with overall formatting, try/except blocks added for additional error handling, certificate verification option added
+## Modified to reuse one pooled API client per endpoint, API key and API client settings, connection pool sizing and connection retries added
 def get_api_client(api_key_id,
                    api_secret_file,
                    endpoint="https://intersight.com",
-                   url_certificate_verification=True
+                   url_certificate_verification=True,
+                   connection_pool_maxsize=32,
+                   connection_retry_limit=3,
+                   api_request_rate_limit=None,
+                   api_retry_limit=5
                    ):
+    """This is a function to get an Intersight API client. One API client is
+    established per endpoint, API key and set of API client settings, then
+    reused by every later call in the process with the same arguments, so
+    the API key is only loaded once and the pooled keep-alive connections of
+    the API client are shared. A call with different connection, rate limit
+    or retry settings establishes a separate API client with those settings.
+
+    Args:
+        api_key_id (str):
+            The ID of the Intersight API key.
+        api_secret_file (str):
+            The system file path of the Intersight API key.
+        endpoint (str):
+            Optional; The Intersight API base URL. The default value is
+            "https://intersight.com".
+        url_certificate_verification (bool):
+            Optional; The setting for verifying the SSL certificate of the
+            Intersight API base URL. The default value is True.
+        connection_pool_maxsize (int):
+            Optional; The maximum number of connections kept open to the
+            Intersight API by the API client. The value should be at least the
+            number of requests made at the same time. The default value is
+            32.
+        connection_retry_limit (int):
+            Optional; The number of times a request is retried after a
+            connection error. The default value is 3.
+        api_request_rate_limit (float):
+            Optional; The maximum average number of Intersight API requests
+            per second made through the API client, shared by every function
+            and class using the client. The default value is None, which does
+            not limit the request rate.
+        api_retry_limit (int):
+            Optional; The number of times a request is retried after a 429
+            status code, or after a 500, 502, 503 or 504 status code for
+            requests that are safe to repeat. The default value is 5.
+
+    Returns:
+        An ApiClient class instance which handles Intersight client-server
+        communication through the use of API keys.
+    """
+    # Reuse the API client already established for the endpoint, API key and API client settings
+    api_client_cache_key = (endpoint,
+                            api_key_id,
+                            api_secret_file,
+                            url_certificate_verification,
+                            connection_pool_maxsize,
+                            connection_retry_limit,
+                            api_request_rate_limit,
+                            api_retry_limit
+                            )
+    with intersight_api_client_cache_lock:
+        cached_api_client = intersight_api_client_cache.get(api_client_cache_key)
+    if cached_api_client is not None:
+        return cached_api_client
     try:
         with open(api_secret_file, 'r') as f:
             api_key = f.read()
@@ -2023,6 +2316,13 @@ def get_api_client(api_key_id,
 
         if not url_certificate_verification:
             configuration.verify_ssl = False
+        # Size the connection pool for concurrent requests and retry failed connections
+        ## Failed status codes are retried by the API client with jittered backoff
+        configuration.connection_pool_maxsize = connection_pool_maxsize
+        configuration.retries = urllib3.util.Retry(total=connection_retry_limit,
+                                                   backoff_factor=0.5,
+                                                   raise_on_status=False
+                                                   )
     except Exception:
         print("\nA configuration error has occurred!\n")
         print("Unable to access the Intersight API Key.")
@@ -2033,172 +2333,1535 @@ def get_api_client(api_key_id,
         traceback.print_exc()
         sys.exit(0)
         
-    return intersight.ApiClient(configuration)
+    # Limit the request rate and retry throttled requests for every user of the API client
+    api_client = ThreadSafeApiClient(configuration)
+    api_client.rate_limiter = IntersightRateLimiter(api_request_rate_limit)
+    api_client.api_retry_limit = api_retry_limit
+    with intersight_api_client_cache_lock:
+        return intersight_api_client_cache.setdefault(api_client_cache_key,
+                                                      api_client
+                                                      )
+
+
+# Establish class for an Intersight SDK for Python API client that can be shared across threads
+class ThreadSafeApiClient(RateLimitedApiClient):
+    """This class is used to provide an Intersight SDK for Python API client
+    that can be shared by concurrently running threads. The last response of
+    an API call is stored per thread, so that each thread reads the response
+    of its own API call from the last_response attribute.
+    """
+    def _thread_local_responses(self):
+        """This function retrieves the per thread storage of the last
+        responses.
 
+        Returns:
+            A threading.local class instance.
+        """
+        return self.__dict__.setdefault("thread_local_responses", threading.local())
+
+    @property
+    def last_response(self):
+        return getattr(self._thread_local_responses(), "last_response", None)
+
+    @last_response.setter
+    def last_response(self, response):
+        self._thread_local_responses().last_response = response
+
+
+# Establish class to hold the Intersight account context of an Intersight API client
+class IntersightAccountContext:
+    """This class is used to hold the Intersight account information for a
+    specific Intersight API client, so that the account only needs to be
+    retrieved from Intersight once.
+    """
+    def __init__(self,
+                 api_client
+                 ):
+        self.api_client = api_client
+        self.iam_account = None
+        self.lock = threading.Lock()
+
+    def __repr__(self):
+        return (
+            f"{self.__class__.__name__}"
+            f"({self.api_client})"
+            )
+
+    def __str__(self):
+        if self.iam_account is None:
+            return f"{self.__class__.__name__} class object for an unresolved Intersight account"
+        return (f"{self.__class__.__name__} class object for the Intersight "
+                f"account named '{self.iam_account.get('Name')}'")
+
+    def set_account(self,
+                    iam_account
+                    ):
+        """This function stores the Intersight account information.
+
+        Args:
+            iam_account (dict):
+                The Intersight API object of the Intersight account.
+        """
+        with self.lock:
+            self.iam_account = iam_account
+
+    def get_account_name(self):
+        """This function returns the name of the Intersight account. If the
+        Intersight account information has not been stored yet, it is
+        retrieved from Intersight on first use.
+
+        Returns:
+            A string of the name for the Intersight account. If the Intersight
+            account information cannot be retrieved, the string "Unknown" is
+            returned, so that the calling error message can still be shown.
+        """
+        with self.lock:
+            if self.iam_account is None:
+                try:
+                    self.api_client.call_api(resource_path="/iam/Accounts?$select=Name",
+                                             method="GET",
+                                             auth_settings=['cookieAuth', 'http_signature', 'oAuth2', 'oAuth2']
+                                             )
+                    self.iam_account = json.loads(self.api_client.last_response.data)["Results"][0]
+                except Exception:
+                    return "Unknown"
+            return self.iam_account.get("Name")
+
+
+# Establish function to retrieve the Intersight account context of an Intersight API client
+intersight_account_context_creation_lock = threading.Lock()
 
-# Establish function to test for the availability of the Intersight API and Intersight account
-def test_intersight_api_service(intersight_api_key_id,
-                                intersight_api_key,
-                                intersight_base_url="https://www.intersight.com/api/v1",
-                                preconfigured_api_client=None
-                                ):
-    """This is a function to test the availability of the Intersight API and
-    Intersight account. The tested Intersight account contains the user who is
-    the owner of the provided Intersight API Key and Key ID.
+
+def get_intersight_account_context(api_client):
+    """This is a function to retrieve the Intersight account context for an
+    Intersight API client. The account context is created and attached to the
+    API client on first use, so that it is shared by every function and class
+    using the client.
 
     Args:
-        intersight_api_key_id (str):
-            The ID of the Intersight API key.
-        intersight_api_key (str):
-            The system file path of the Intersight API key.
-        intersight_base_url (str):
-            Optional; The base URL for Intersight API paths. The default value
-            is "https://www.intersight.com/api/v1". This value typically only
-            needs to be changed if using the Intersight Virtual Appliance. The
-            default value is "https://www.intersight.com/api/v1".
-        preconfigured_api_client ("ApiClient"):
-            Optional; An ApiClient class instance which handles
-            Intersight client-server communication through the use of API keys.
-            The default value is None. If a preconfigured_api_client argument
-            is provided, empty strings ("") or None can be provided for the
-            intersight_api_key_id, intersight_api_key, and intersight_base_url
-            arguments.
+        api_client ("ApiClient"):
+            An ApiClient class instance which handles Intersight client-server
+            communication through the use of API keys.
 
     Returns:
-        A string of the name for the Intersight account tested, verifying the
-        Intersight API service is up and the Intersight account is accessible.
-        
-    Raises:
-        Exception:
-            An exception occurred due to an issue with the provided API Key
-            and/or API Key ID.
+        An IntersightAccountContext class instance.
     """
-    # Define Intersight SDK ApiClient variable
-    if preconfigured_api_client is None:
-        api_client = get_api_client(api_key_id=intersight_api_key_id,
-                                    api_secret_file=intersight_api_key,
-                                    endpoint=intersight_base_url
-                                    )
-    else:
-        api_client = preconfigured_api_client
-    try:
-        # Check that Intersight Account is accessible
-        print("Testing access to the Intersight API by verifying the "
-              "Intersight account information...")
-        api_client.call_api(resource_path="/iam/Accounts",
-                            method="GET",
-                            auth_settings=['cookieAuth', 'http_signature', 'oAuth2', 'oAuth2']
-                            )
-        response = api_client.last_response.data
-        iam_account = json.loads(response)
-        if api_client.last_response.status != 200:
-            print("\nThe Intersight API and Account Availability Test did not "
-                  "pass.")
-            print("The Intersight account information could not be verified.")
-            print("Exiting due to the Intersight account being unavailable.\n")
-            print("Please verify that the correct API Key ID and API Key have "
-                  "been entered, then re-attempt execution.\n")
-            sys.exit(0)
-        else:
-            intersight_account_name = iam_account["Results"][0]["Name"]
-            print("The Intersight API and Account Availability Test has "
-                  "passed.\n")
-            print(f"The Intersight account named '{intersight_account_name}' "
-                  "has been found.")
-            return intersight_account_name
-    except Exception:
-        print("\nA configuration error has occurred!\n")
-        print("Unable to access the Intersight API.")
-        print("Exiting due to the Intersight API being unavailable.\n")
-        print("Please verify that the correct API Key ID and API Key have "
-              "been entered, then re-attempt execution.\n")
-        print("Exception Message: ")
-        traceback.print_exc()
-        sys.exit(0)
+    with intersight_account_context_creation_lock:
+        intersight_account_context = getattr(api_client, "intersight_account_context", None)
+        if intersight_account_context is None:
+            intersight_account_context = IntersightAccountContext(api_client)
+            api_client.intersight_account_context = intersight_account_context
+    return intersight_account_context
+
+
+# Establish class to index the Server inventory of an Intersight API client
+class IntersightServerInventory:
+    """This class is used to hold the Server inventory for a specific
+    Intersight API client. The Servers of each form factor and management
+    mode are retrieved from Intersight once and indexed by serial, name,
+    model and user label, so that each Server assignment is a lookup.
+    """
+    server_identifier_attributes = ("Serial", "Name", "Model", "UserLabel")
 
+    def __init__(self,
+                 api_client
+                 ):
+        self.api_client = api_client
+        self.server_indexes = {}
+        self.lock = threading.Lock()
 
-# Establish function to retrieve the MOID of a specific Intersight API object by name
-def intersight_object_moid_retriever(intersight_api_key_id,
-                                     intersight_api_key,
-                                     object_name,
-                                     intersight_api_path,
-                                     object_type="object",
-                                     organization="default",
-                                     intersight_base_url="https://www.intersight.com/api/v1",
-                                     preconfigured_api_client=None
-                                     ):
-    """This is a function to retrieve the MOID of Intersight objects
-    using the Intersight API.
+    def __repr__(self):
+        return (
+            f"{self.__class__.__name__}"
+            f"({self.api_client})"
+            )
+
+    def __str__(self):
+        return (f"{self.__class__.__name__} class object with "
+                f"{len(self.server_indexes)} indexed Server type(s)")
+
+    def _get_server_index(self,
+                          intersight_api_path,
+                          management_mode,
+                          object_type="Server"
+                          ):
+        """This function returns the index of the Servers under an
+        Intersight API path with the provided management mode. The Servers
+        are retrieved from Intersight on first use.
+
+        Args:
+            intersight_api_path (str):
+                The Intersight API path of the Servers, e.g. "compute/Blades".
+            management_mode (str):
+                The management mode of the Servers, e.g. "Intersight".
+            object_type (str):
+                Optional; The type of Server. The default value is "Server".
+
+        Returns:
+            A dictionary with the keys "Servers" (list), containing the
+            retrieved Servers in inventory order, and "Identifiers" (dict),
+            containing the serials, names, models and user labels as keys
+            and the inventory position of the first matching Server as
+            values.
+        """
+        server_index_key = (intersight_api_path, management_mode)
+        with self.lock:
+            server_index = self.server_indexes.get(server_index_key)
+            if server_index is None:
+                retrieved_intersight_servers = get_intersight_objects(
+                    intersight_api_key_id=None,
+                    intersight_api_key=None,
+                    intersight_api_path=intersight_api_path,
+                    object_type=object_type,
+                    preconfigured_api_client=self.api_client,
+                    filter_attributes={"ManagementMode": management_mode},
+                    select_attributes=["Moid", *self.server_identifier_attributes]
+                    )
+                intersight_servers = retrieved_intersight_servers.get("Results") or []
+                server_identifiers = {}
+                for server_position, intersight_server in enumerate(intersight_servers):
+                    for server_identifier_attribute in self.server_identifier_attributes:
+                        server_identifier = intersight_server.get(server_identifier_attribute)
+                        if server_identifier:
+                            server_identifiers.setdefault(server_identifier, server_position)
+                server_index = {
+                    "Servers": intersight_servers,
+                    "Identifiers": server_identifiers
+                    }
+                self.server_indexes[server_index_key] = server_index
+        return server_index
+
+    def get_server_count(self,
+                         intersight_api_path,
+                         management_mode,
+                         object_type="Server"
+                         ):
+        """This function returns the number of Servers under an Intersight API
+        path with the provided management mode.
+
+        Args:
+            intersight_api_path (str):
+                The Intersight API path of the Servers, e.g. "compute/Blades".
+            management_mode (str):
+                The management mode of the Servers, e.g. "Intersight".
+            object_type (str):
+                Optional; The type of Server. The default value is "Server".
+
+        Returns:
+            An integer of the number of Servers.
+        """
+        return len(self._get_server_index(intersight_api_path,
+                                          management_mode,
+                                          object_type
+                                          )["Servers"])
+
+    def find_server(self,
+                    intersight_api_path,
+                    management_mode,
+                    server_identifiers,
+                    object_type="Server"
+                    ):
+        """This function finds the first Server in the inventory that matches
+        any of the provided identifiers by serial, name, model or user label.
+
+        Args:
+            intersight_api_path (str):
+                The Intersight API path of the Servers, e.g. "compute/Blades".
+            management_mode (str):
+                The management mode of the Servers, e.g. "Intersight".
+            server_identifiers (list):
+                A list of the Server identifiers to be matched.
+            object_type (str):
+                Optional; The type of Server. The default value is "Server".
+
+        Returns:
+            A dictionary of the matching Server. If no Server matches, None is
+            returned.
+        """
+        server_index = self._get_server_index(intersight_api_path,
+                                              management_mode,
+                                              object_type
+                                              )
+        matching_server_positions = [server_index["Identifiers"][server_identifier]
+                                     for server_identifier in server_identifiers
+                                     if server_identifier in server_index["Identifiers"]
+                                     ]
+        if not matching_server_positions:
+            return None
+        return server_index["Servers"][min(matching_server_positions)]
+
+
+# Establish function to retrieve the Server inventory of an Intersight API client
+intersight_server_inventory_creation_lock = threading.Lock()
+
+
+def get_intersight_server_inventory(api_client):
+    """This is a function to retrieve the Server inventory for an Intersight
+    API client. The Server inventory is created and attached to the API
+    client on first use, so that it is shared by every Server assignment
+    using the client.
 
     Args:
-        intersight_api_key_id (str):
-            The ID of the Intersight API key.
-        intersight_api_key (str):
-            The system file path of the Intersight API key.
-        object_name (str):
-            The name of the Intersight object.
-        intersight_api_path (str):
-            The Intersight API path of the Intersight object.
-        object_type (str):
-            Optional; The type of Intersight object. The default value is
-            "object".
-        organization (str):
-            Optional; The Intersight organization of the Intersight object.
-            The default value is "default".
-        intersight_base_url (str):
-            Optional; The base URL for Intersight API paths. The default value
-            is "https://www.intersight.com/api/v1". This value typically only
-            needs to be changed if using the Intersight Virtual Appliance.
-        preconfigured_api_client ("ApiClient"):
-            Optional; An ApiClient class instance which handles
-            Intersight client-server communication through the use of API keys.
-            The default value is None. If a preconfigured_api_client argument
-            is provided, empty strings ("") or None can be provided for the
-            intersight_api_key_id, intersight_api_key, and intersight_base_url
-            arguments.
+        api_client ("ApiClient"):
+            An ApiClient class instance which handles Intersight client-server
+            communication through the use of API keys.
 
     Returns:
-        A string of the MOID for the provided Intersight object.
-        
-    Raises:
-        Exception:
-            An exception occurred due to an issue accessing the Intersight API
-            path. The status code or error message will be specified.
+        An IntersightServerInventory class instance.
     """
-    # Define Intersight SDK ApiClient variable
-    if preconfigured_api_client is None:
-        api_client = get_api_client(api_key_id=intersight_api_key_id,
-                                    api_secret_file=intersight_api_key,
-                                    endpoint=intersight_base_url
-                                    )
-    else:
-        api_client = preconfigured_api_client
-    try:
-        # Retrieve the Intersight Account name
-        api_client.call_api(resource_path="/iam/Accounts",
-                            method="GET",
+    with intersight_server_inventory_creation_lock:
+        intersight_server_inventory = getattr(api_client, "intersight_server_inventory", None)
+        if intersight_server_inventory is None:
+            intersight_server_inventory = IntersightServerInventory(api_client)
+            api_client.intersight_server_inventory = intersight_server_inventory
+    return intersight_server_inventory
+
+
+# Establish class to store the state of configured Intersight API objects across runs
+class IntersightObjectStateFile:
+    """This class is used to store a hash of the Intersight API body of each
+    configured Intersight object in a local JSON state file, along with the
+    MOID and modification time of the Intersight object. Intersight objects
+    with an unchanged Intersight API body and modification time can then be
+    skipped on later runs. The state file is saved after each batch of
+    stored object states and when flushed, rather than after every object.
+    """
+    def __init__(self,
+                 state_file_path,
+                 save_batch_size=50
+                 ):
+        self.state_file_path = state_file_path
+        self.save_batch_size = max(1, save_batch_size)
+        self.unsaved_object_state_count = 0
+        self.lock = threading.Lock()
+        self.object_states = {}
+        try:
+            with open(state_file_path, "r") as state_file:
+                self.object_states = json.load(state_file)
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError):
+            print(f"The state file '{state_file_path}' could not be read. "
+                  "A new state file will be created.")
+
+    def __repr__(self):
+        return (
+            f"{self.__class__.__name__}"
+            f"('{self.state_file_path}', "
+            f"{self.save_batch_size})"
+            )
+
+    def __str__(self):
+        return (f"{self.__class__.__name__} class object with "
+                f"{len(self.object_states)} stored object state(s)")
+
+    @staticmethod
+    def _state_key(intersight_api_path,
+                   organization_moid,
+                   object_name
+                   ):
+        """This function creates the state key for an Intersight object.
+
+        Args:
+            intersight_api_path (str):
+                The Intersight API path of the Intersight object.
+            organization_moid (str):
+                The MOID of the Intersight organization of the Intersight
+                object.
+            object_name (str):
+                The name of the Intersight object.
+
+        Returns:
+            A string containing the state key for the Intersight object.
+        """
+        base_intersight_api_path = intersight_api_path.split("?", 1)[0].strip("/")
+        return f"{base_intersight_api_path}|{organization_moid}|{object_name}"
+
+    @staticmethod
+    def api_body_hash(intersight_api_body):
+        """This function creates a canonical hash of an Intersight API body.
+
+        Args:
+            intersight_api_body (dict):
+                The Intersight API body of the Intersight object.
+
+        Returns:
+            A string of the SHA-256 hash of the Intersight API body.
+        """
+        canonical_intersight_api_body = json.dumps(intersight_api_body,
+                                                   sort_keys=True,
+                                                   separators=(",", ":"),
+                                                   default=str
+                                                   )
+        return hashlib.sha256(canonical_intersight_api_body.encode("utf-8")).hexdigest()
+
+    def is_unchanged(self,
+                     intersight_api_path,
+                     organization_moid,
+                     object_name,
+                     intersight_api_body,
+                     existing_intersight_object
+                     ):
+        """This function determines whether an Intersight object is unchanged
+        since it was last stored, both in the provided Intersight API body and
+        on Intersight.
+
+        Args:
+            intersight_api_path (str):
+                The Intersight API path of the Intersight object.
+            organization_moid (str):
+                The MOID of the Intersight organization of the Intersight
+                object.
+            object_name (str):
+                The name of the Intersight object.
+            intersight_api_body (dict):
+                The Intersight API body of the Intersight object.
+            existing_intersight_object (dict):
+                The pre-existing Intersight object.
+
+        Returns:
+            A boolean indicating whether the Intersight object is unchanged.
+        """
+        state_key = self._state_key(intersight_api_path,
+                                    organization_moid,
+                                    object_name
+                                    )
+        with self.lock:
+            object_state = self.object_states.get(state_key)
+        if not object_state or not existing_intersight_object.get("ModTime"):
+            return False
+        return (
+            object_state.get("Hash") == self.api_body_hash(intersight_api_body) and
+            object_state.get("Moid") == existing_intersight_object.get("Moid") and
+            object_state.get("ModTime") == existing_intersight_object.get("ModTime")
+            )
+
+    def set(self,
+            intersight_api_path,
+            organization_moid,
+            object_name,
+            intersight_api_body,
+            intersight_object
+            ):
+        """This function stores the state of a configured Intersight object.
+        The state file is saved once a full batch of object states has been
+        stored.
+
+        Args:
+            intersight_api_path (str):
+                The Intersight API path of the Intersight object.
+            organization_moid (str):
+                The MOID of the Intersight organization of the Intersight
+                object.
+            object_name (str):
+                The name of the Intersight object.
+            intersight_api_body (dict):
+                The Intersight API body of the Intersight object.
+            intersight_object (dict):
+                The Intersight object as returned by Intersight, including the
+                MOID and modification time.
+        """
+        if not intersight_object.get("Moid") or not intersight_object.get("ModTime"):
+            return
+        state_key = self._state_key(intersight_api_path,
+                                    organization_moid,
+                                    object_name
+                                    )
+        with self.lock:
+            self.object_states[state_key] = {
+                "Hash": self.api_body_hash(intersight_api_body),
+                "Moid": intersight_object["Moid"],
+                "ModTime": intersight_object["ModTime"]
+                }
+            self.unsaved_object_state_count += 1
+            if self.unsaved_object_state_count >= self.save_batch_size:
+                self._save()
+
+    def _save(self):
+        """This function saves the stored object states to the state file.
+        The lock of the state file must be held by the caller.
+        """
+        # Write the state file atomically, so an interrupted run leaves the previous state file intact
+        temporary_state_file_path = f"{self.state_file_path}.tmp"
+        try:
+            with open(temporary_state_file_path, "w") as state_file:
+                json.dump(self.object_states, state_file, indent=2, sort_keys=True)
+            os.replace(temporary_state_file_path, self.state_file_path)
+            self.unsaved_object_state_count = 0
+        except OSError:
+            print(f"The state file '{self.state_file_path}' could not be "
+                  "saved.")
+
+    def flush(self):
+        """This function saves any object states stored since the state file
+        was last saved.
+        """
+        with self.lock:
+            if self.unsaved_object_state_count:
+                self._save()
+
+
+# Establish function to attach a state file to an Intersight API client
+def set_intersight_object_state_file(api_client,
+                                     state_file_path
+                                     ):
+    """This is a function to attach a state file to an Intersight API client,
+    so that every Intersight object configured using the client is stored in
+    the state file and skipped on later runs if unchanged. The state file is
+    flushed when the process exits.
+
+    Args:
+        api_client ("ApiClient"):
+            An ApiClient class instance which handles Intersight client-server
+            communication through the use of API keys.
+        state_file_path (str):
+            The system file path of the state file.
+
+    Returns:
+        An IntersightObjectStateFile class instance.
+    """
+    intersight_object_state_file = IntersightObjectStateFile(state_file_path)
+    api_client.intersight_object_state_file = intersight_object_state_file
+    atexit.register(intersight_object_state_file.flush)
+    return intersight_object_state_file
+
+
+# Establish class to journal the completed steps of a deployment
+class IntersightDeploymentJournal:
+    """This class is used to record the completed steps of a deployment in an
+    append-only journal file, with one JSON entry per line. When a deployment
+    is resumed, the journaled steps are skipped and the journaled MOIDs are
+    used to pre-seed the MOID cache of the API client.
+    """
+    def __init__(self,
+                 journal_file_path,
+                 resume=False
+                 ):
+        self.journal_file_path = journal_file_path
+        self.resume = resume
+        self.completed_steps = {}
+        self.lock = threading.Lock()
+        if resume:
+            try:
+                with open(journal_file_path, "r") as journal_file:
+                    for journal_line in journal_file:
+                        try:
+                            journal_entry = json.loads(journal_line)
+                        except ValueError:
+                            # A partially written final entry is ignored
+                            continue
+                        if journal_entry.get("Step"):
+                            self.completed_steps[journal_entry["Step"]] = journal_entry
+            except FileNotFoundError:
+                print(f"The deployment journal '{journal_file_path}' was not "
+                      "found. All deployment steps will be performed.")
+        else:
+            # Start a new journal for a new deployment
+            try:
+                open(journal_file_path, "w").close()
+            except OSError:
+                print(f"The deployment journal '{journal_file_path}' could "
+                      "not be created.")
+
+    def __repr__(self):
+        return (
+            f"{self.__class__.__name__}"
+            f"('{self.journal_file_path}', "
+            f"{self.resume})"
+            )
+
+    def __str__(self):
+        return (f"{self.__class__.__name__} class object with "
+                f"{len(self.completed_steps)} completed step(s)")
+
+    def is_completed(self,
+                     step_name
+                     ):
+        """This function determines whether a deployment step was completed in
+        the previous run of the deployment.
+
+        Args:
+            step_name (str):
+                The name of the deployment step.
+
+        Returns:
+            A boolean indicating whether the deployment step was completed.
+        """
+        with self.lock:
+            return self.resume and step_name in self.completed_steps
+
+    def record(self,
+               step_name,
+               object_type,
+               object_name,
+               object_moid=None,
+               intersight_api_path=None,
+               organization=None
+               ):
+        """This function appends a completed deployment step to the journal
+        file. Each entry is flushed to disk before the deployment continues.
+
+        Args:
+            step_name (str):
+                The name of the deployment step.
+            object_type (str):
+                The type of Intersight object of the deployment step.
+            object_name (str):
+                The name of the Intersight object of the deployment step.
+            object_moid (str):
+                Optional; The MOID of the Intersight object. The default value
+                is None.
+            intersight_api_path (str):
+                Optional; The Intersight API path of the Intersight object.
+                The default value is None.
+            organization (str):
+                Optional; The Intersight organization of the Intersight object.
+                The default value is None.
+        """
+        journal_entry = {
+            "Step": step_name,
+            "ObjectType": object_type,
+            "Name": object_name,
+            "Moid": object_moid,
+            "Path": intersight_api_path.split("?", 1)[0].strip("/") if intersight_api_path else None,
+            "Organization": organization
+            }
+        with self.lock:
+            self.completed_steps[step_name] = journal_entry
+            try:
+                with open(self.journal_file_path, "a") as journal_file:
+                    journal_file.write(json.dumps(journal_entry) + "\n")
+                    journal_file.flush()
+                    os.fsync(journal_file.fileno())
+            except OSError:
+                print(f"The deployment journal '{self.journal_file_path}' "
+                      "could not be updated.")
+
+    def seed_moid_cache(self,
+                        intersight_moid_cache
+                        ):
+        """This function adds the MOIDs of the journaled Intersight objects to
+        a MOID cache.
+
+        Args:
+            intersight_moid_cache ("IntersightMoidCache"):
+                An IntersightMoidCache class instance.
+
+        Returns:
+            An integer of the number of MOIDs added to the MOID cache.
+        """
+        seeded_moid_count = 0
+        with self.lock:
+            journal_entries = list(self.completed_steps.values())
+        for journal_entry in journal_entries:
+            if all(journal_entry.get(journal_key) for journal_key in ("Path", "Organization", "Name", "Moid")):
+                intersight_moid_cache.set(journal_entry["Path"],
+                                          journal_entry["Organization"],
+                                          journal_entry["Name"],
+                                          journal_entry["Moid"]
+                                          )
+                seeded_moid_count += 1
+        return seeded_moid_count
+
+
+# Establish function to attach a deployment journal to an Intersight API client
+def set_intersight_deployment_journal(api_client,
+                                      journal_file_path,
+                                      resume=False
+                                      ):
+    """This is a function to attach a deployment journal to an Intersight API
+    client, so that every Intersight object configured using the client is
+    journaled. If the deployment is resumed, the MOID cache of the API client
+    is pre-seeded from the journal.
+
+    Args:
+        api_client ("ApiClient"):
+            An ApiClient class instance which handles Intersight client-server
+            communication through the use of API keys.
+        journal_file_path (str):
+            The system file path of the deployment journal.
+        resume (bool):
+            Optional; The setting to skip the deployment steps completed in
+            the previous run of the deployment. The default value is False.
+
+    Returns:
+        An IntersightDeploymentJournal class instance.
+    """
+    intersight_deployment_journal = IntersightDeploymentJournal(journal_file_path,
+                                                                resume=resume
+                                                                )
+    api_client.intersight_deployment_journal = intersight_deployment_journal
+    if resume:
+        seeded_moid_count = intersight_deployment_journal.seed_moid_cache(get_intersight_moid_cache(api_client))
+        print("Resuming the deployment from the deployment journal "
+              f"'{journal_file_path}'.")
+        print(f"{len(intersight_deployment_journal.completed_steps)} completed "
+              f"step(s) will be skipped and {seeded_moid_count} MOID(s) have "
+              "been restored.")
+    return intersight_deployment_journal
+
+
+# Establish function to check the deployment journal for a configured Intersight object
+def intersight_deployment_journal_checker(api_client,
+                                          object_type,
+                                          object_name,
+                                          organization
+                                          ):
+    """This is a function to determine whether an Intersight object was
+    configured in the previous run of a resumed deployment.
+
+    Args:
+        api_client ("ApiClient"):
+            An ApiClient class instance which handles Intersight client-server
+            communication through the use of API keys.
+        object_type (str):
+            The type of Intersight object.
+        object_name (str):
+            The name of the Intersight object.
+        organization (str):
+            The Intersight organization of the Intersight object.
+
+    Returns:
+        A boolean indicating whether the Intersight object was configured in
+        the previous run and can be skipped.
+    """
+    intersight_deployment_journal = getattr(api_client, "intersight_deployment_journal", None)
+    if intersight_deployment_journal and intersight_deployment_journal.is_completed(f"Configure {object_type} {object_name} in {organization}"):
+        print(f"The {object_type} named {object_name} was configured in the "
+              "previous run. The configuration will be skipped.")
+        return True
+    return False
+
+
+# Establish function to record a configured Intersight object in the deployment journal
+def intersight_deployment_journal_recorder(api_client,
+                                           intersight_api_path,
+                                           intersight_api_body,
+                                           object_type,
+                                           organization
+                                           ):
+    """This is a function to record a configured Intersight object in the
+    deployment journal of an Intersight API client, if provided. The MOID of
+    the Intersight object is taken from the object state cache, or otherwise
+    from the last response of the API client.
+
+    Args:
+        api_client ("ApiClient"):
+            An ApiClient class instance which handles Intersight client-server
+            communication through the use of API keys.
+        intersight_api_path (str):
+            The Intersight API path of the Intersight object.
+        intersight_api_body (dict):
+            The Intersight API body of the Intersight object.
+        object_type (str):
+            The type of Intersight object.
+        organization (str):
+            The Intersight organization of the Intersight object.
+    """
+    intersight_deployment_journal = getattr(api_client, "intersight_deployment_journal", None)
+    if not intersight_deployment_journal:
+        return
+    object_name = intersight_api_body.get("Name")
+    organization_moid = (intersight_api_body.get("Organization") or {}).get("Moid")
+    existing_intersight_object = None
+    if object_name and organization_moid:
+        existing_intersight_object = get_intersight_object_state_cache(api_client).get(intersight_api_path,
+                                                                                       organization_moid,
+                                                                                       object_name
+                                                                                       )
+    if existing_intersight_object:
+        object_moid = existing_intersight_object.get("Moid")
+    else:
+        try:
+            object_moid = json.loads(api_client.last_response.data).get("Moid")
+        except Exception:
+            object_moid = None
+    intersight_deployment_journal.record(f"Configure {object_type} {object_name} in {organization}",
+                                         object_type,
+                                         object_name,
+                                         object_moid=object_moid,
+                                         intersight_api_path=intersight_api_path,
+                                         organization=organization
+                                         )
+
+
+# Establish class to cache the live state of Intersight API objects for updates
+class IntersightObjectStateCache:
+    """This class is used to hold the live state of Intersight objects for a
+    specific Intersight API client. The Intersight objects under each
+    Intersight API path and organization are retrieved from Intersight once
+    with one filtered, paged query that selects only the compared attributes,
+    then indexed by name, so that pre-existing objects can be compared with
+    the provided configuration before any changes are made.
+    """
+    def __init__(self,
+                 api_client,
+                 page_size=1000
+                 ):
+        self.api_client = api_client
+        self.page_size = page_size
+        self.object_indexes = {}
+        self.object_index_attributes = {}
+        self.object_index_locks = {}
+        self.lock = threading.Lock()
+
+    def __repr__(self):
+        return (
+            f"{self.__class__.__name__}"
+            f"({self.api_client}, "
+            f"{self.page_size})"
+            )
+
+    def __str__(self):
+        return (f"{self.__class__.__name__} class object with "
+                f"{len(self.object_indexes)} indexed object type(s)")
+
+    def _get_object_index(self,
+                          intersight_api_path,
+                          organization_moid,
+                          select_attributes=None
+                          ):
+        """This function returns the index of the Intersight objects under an
+        Intersight API path and organization. The Intersight objects are
+        retrieved from Intersight on first use with one filtered query, and
+        retrieved again only if attributes that were not previously selected
+        are needed.
+
+        Args:
+            intersight_api_path (str):
+                The Intersight API path of the Intersight objects.
+            organization_moid (str):
+                The MOID of the Intersight organization of the Intersight
+                objects. If None, the Intersight objects are not filtered by
+                organization.
+            select_attributes (list):
+                Optional; A list of the attributes to be retrieved for each
+                Intersight object. The "Name", "Moid" and "ModTime" attributes
+                are always retrieved. The default value is None, which
+                retrieves all attributes.
+
+        Returns:
+            A dictionary with the names of the Intersight objects as keys and
+            the Intersight objects as values. If the Intersight objects could
+            not be retrieved, None is returned.
+        """
+        base_intersight_api_path = intersight_api_path.split("?", 1)[0].strip("/")
+        object_index_key = (base_intersight_api_path, organization_moid)
+        if select_attributes is None:
+            required_attributes = None
+        else:
+            required_attributes = {"Name", "Moid", "ModTime", *select_attributes}
+        with self.lock:
+            object_index_lock = self.object_index_locks.setdefault(object_index_key, threading.Lock())
+        with object_index_lock:
+            if object_index_key in self.object_indexes:
+                indexed_attributes = self.object_index_attributes[object_index_key]
+                if indexed_attributes is None or (required_attributes is not None and required_attributes <= indexed_attributes):
+                    return self.object_indexes[object_index_key]
+                # Retrieve the Intersight objects again with the previously selected attributes and the newly needed attributes
+                if required_attributes is not None:
+                    required_attributes |= indexed_attributes
+            filter_attributes = {"Organization": {"Moid": organization_moid}} if organization_moid else None
+            query_intersight_api_path = intersight_api_query_builder(base_intersight_api_path,
+                                                                     filter_attributes=filter_attributes,
+                                                                     select_attributes=sorted(required_attributes) if required_attributes else None
+                                                                     )
+            query_separator = "&" if "?" in query_intersight_api_path else "?"
+            object_index = {}
+            try:
+                skip_count = 0
+                while True:
+                    self.api_client.call_api(resource_path=f"/{query_intersight_api_path}{query_separator}$top={self.page_size}&$skip={skip_count}",
+                                             method="GET",
+                                             auth_settings=['cookieAuth', 'http_signature', 'oAuth2', 'oAuth2']
+                                             )
+                    retrieved_intersight_objects = json.loads(self.api_client.last_response.data).get("Results") or []
+                    for intersight_object in retrieved_intersight_objects:
+                        if intersight_object.get("Name"):
+                            object_index.setdefault(intersight_object["Name"], intersight_object)
+                    if len(retrieved_intersight_objects) < self.page_size:
+                        break
+                    skip_count += self.page_size
+            except Exception:
+                # Retrieve the Intersight objects again on the next use, as the error may be transient
+                print("The pre-existing objects under the Intersight API "
+                      f"resource path '{base_intersight_api_path}' could not "
+                      "be retrieved for comparison.")
+                return None
+            self.object_indexes[object_index_key] = object_index
+            self.object_index_attributes[object_index_key] = required_attributes
+            return object_index
+
+    def get(self,
+            intersight_api_path,
+            organization_moid,
+            object_name,
+            select_attributes=None
+            ):
+        """This function retrieves the live state of an Intersight object.
+
+        Args:
+            intersight_api_path (str):
+                The Intersight API path of the Intersight object.
+            organization_moid (str):
+                The MOID of the Intersight organization of the Intersight
+                object. If None, the Intersight object is not filtered by
+                organization.
+            object_name (str):
+                The name of the Intersight object.
+            select_attributes (list):
+                Optional; A list of the attributes of the Intersight object
+                to be compared. The default value is None, which retrieves all
+                attributes.
+
+        Returns:
+            A dictionary of the Intersight object. If the Intersight object
+            does not exist or the Intersight objects could not be retrieved,
+            None is returned.
+        """
+        object_index = self._get_object_index(intersight_api_path,
+                                              organization_moid,
+                                              select_attributes
+                                              )
+        if object_index is None:
+            return None
+        return object_index.get(object_name)
+
+    def set(self,
+            intersight_api_path,
+            organization_moid,
+            object_name,
+            intersight_object
+            ):
+        """This function stores the live state of an Intersight object after
+        it has been updated.
+
+        Args:
+            intersight_api_path (str):
+                The Intersight API path of the Intersight object.
+            organization_moid (str):
+                The MOID of the Intersight organization of the Intersight
+                object.
+            object_name (str):
+                The name of the Intersight object.
+            intersight_object (dict):
+                The Intersight object.
+        """
+        base_intersight_api_path = intersight_api_path.split("?", 1)[0].strip("/")
+        with self.lock:
+            object_index = self.object_indexes.get((base_intersight_api_path, organization_moid))
+            if object_index is not None:
+                object_index[object_name] = intersight_object
+
+
+# Establish function to retrieve the object state cache of an Intersight API client
+intersight_object_state_cache_creation_lock = threading.Lock()
+
+
+def get_intersight_object_state_cache(api_client):
+    """This is a function to retrieve the object state cache for an
+    Intersight API client. The object state cache is created and attached to
+    the API client on first use, so that it is shared by every function and
+    class using the client.
+
+    Args:
+        api_client ("ApiClient"):
+            An ApiClient class instance which handles Intersight client-server
+            communication through the use of API keys.
+
+    Returns:
+        An IntersightObjectStateCache class instance.
+    """
+    with intersight_object_state_cache_creation_lock:
+        intersight_object_state_cache = getattr(api_client, "intersight_object_state_cache", None)
+        if intersight_object_state_cache is None:
+            intersight_object_state_cache = IntersightObjectStateCache(api_client)
+            api_client.intersight_object_state_cache = intersight_object_state_cache
+    return intersight_object_state_cache
+
+
+# Establish function to compare a provided attribute value with the live state of an Intersight object
+def intersight_attribute_matcher(provided_attribute_value,
+                                 existing_attribute_value
+                                 ):
+    """This is a function to determine whether a provided attribute value
+    already matches the attribute value of a pre-existing Intersight object.
+    Dictionaries are matched on the provided keys only, since Intersight
+    returns additional read-only attributes such as "ClassId" and "link" on
+    each object reference.
+
+    Args:
+        provided_attribute_value (any):
+            The provided attribute value.
+        existing_attribute_value (any):
+            The attribute value of the pre-existing Intersight object.
+
+    Returns:
+        A boolean indicating whether the provided attribute value matches.
+    """
+    if isinstance(provided_attribute_value, dict):
+        if not isinstance(existing_attribute_value, dict):
+            return False
+        return all(
+            intersight_attribute_matcher(provided_sub_value, existing_attribute_value.get(provided_sub_key))
+            for provided_sub_key, provided_sub_value in provided_attribute_value.items()
+            )
+    if isinstance(provided_attribute_value, list):
+        if not isinstance(existing_attribute_value, list) or len(provided_attribute_value) != len(existing_attribute_value):
+            return False
+        return all(
+            intersight_attribute_matcher(provided_item, existing_item)
+            for provided_item, existing_item in zip(provided_attribute_value, existing_attribute_value)
+            )
+    return provided_attribute_value == existing_attribute_value
+
+
+# Establish function to update a pre-existing Intersight object with only the changed attributes
+def intersight_object_updater(api_client,
+                              intersight_api_path,
+                              intersight_api_body,
+                              object_type="object",
+                              update_api_body_maker=None,
+                              existing_object_attributes=None
+                              ):
+    """This is a function to update a pre-existing Intersight object. The
+    provided Intersight API body is compared with the live state of the
+    Intersight object and a PATCH is performed with only the changed
+    attributes. No changes are made if the Intersight object already matches.
+
+    Args:
+        api_client ("ApiClient"):
+            An ApiClient class instance which handles Intersight client-server
+            communication through the use of API keys.
+        intersight_api_path (str):
+            The Intersight API path of the Intersight object.
+        intersight_api_body (dict):
+            The Intersight API body of the Intersight object.
+        object_type (str):
+            Optional; The type of Intersight object. The default value is
+            "object".
+        update_api_body_maker (function):
+            Optional; A function that receives the pre-existing Intersight
+            object and returns the Intersight API body to be compared, or
+            None if the pre-existing Intersight object must be updated
+            through a POST instead. The default value is None, which compares
+            the provided Intersight API body.
+        existing_object_attributes (list):
+            Optional; A list of additional attributes of the pre-existing
+            Intersight object that are needed by the update_api_body_maker
+            function. Only the attributes of the provided Intersight API body
+            and these attributes are retrieved. The default value is None.
+
+    If a state file is attached to the API client, Intersight objects with an
+    unchanged Intersight API body and modification time since the last run
+    are skipped without comparison.
+
+    Returns:
+        A string with a statement indicating whether the update was
+        successful or failed, using the same statements as the POST method.
+        If the Intersight object already matches and no update was made,
+        "The object is unchanged." is returned. If the Intersight object does
+        not already exist or must be updated through a POST, None is
+        returned. None is also returned if the Intersight API body has no
+        name or organization.
+    """
+    existing_intersight_object_name = intersight_api_body.get("Name")
+    organization_moid = (intersight_api_body.get("Organization") or {}).get("Moid")
+    if not existing_intersight_object_name or not organization_moid:
+        return None
+    intersight_object_state_cache = get_intersight_object_state_cache(api_client)
+    existing_intersight_object = intersight_object_state_cache.get(intersight_api_path,
+                                                                   organization_moid,
+                                                                   existing_intersight_object_name,
+                                                                   select_attributes=[*intersight_api_body, *(existing_object_attributes or [])]
+                                                                   )
+    if existing_intersight_object is None:
+        return None
+    intersight_object_state_file = getattr(api_client, "intersight_object_state_file", None)
+    if intersight_object_state_file and intersight_object_state_file.is_unchanged(intersight_api_path,
+                                                                                  organization_moid,
+                                                                                  existing_intersight_object_name,
+                                                                                  intersight_api_body,
+                                                                                  existing_intersight_object
+                                                                                  ):
+        print(f"The {object_type} named {existing_intersight_object_name} is "
+              "unchanged since the last run. No update is needed.")
+        return "The object is unchanged."
+    if update_api_body_maker:
+        update_api_body = update_api_body_maker(existing_intersight_object)
+        if update_api_body is None:
+            return None
+    else:
+        update_api_body = intersight_api_body
+    # Determine the attributes that differ from the pre-existing object
+    changed_attributes = {
+        attribute_name: attribute_value
+        for attribute_name, attribute_value in update_api_body.items()
+        if not intersight_attribute_matcher(attribute_value, existing_intersight_object.get(attribute_name))
+        }
+    print(f"The targeted {object_type} already exists.")
+    if not changed_attributes:
+        print(f"The pre-existing {existing_intersight_object_name} already "
+              "matches the provided configuration. No update is needed.")
+        if intersight_object_state_file:
+            intersight_object_state_file.set(intersight_api_path,
+                                             organization_moid,
+                                             existing_intersight_object_name,
+                                             intersight_api_body,
+                                             existing_intersight_object
+                                             )
+        return "The object is unchanged."
+    print("An attempt will be made to update the changed attributes of the "
+          f"pre-existing {existing_intersight_object_name}: "
+          f"{', '.join(changed_attributes)}...")
+    full_intersight_api_path_with_moid = f"/{intersight_api_path.split('?', 1)[0].strip('/')}/{existing_intersight_object['Moid']}"
+    try:
+        api_client.call_api(resource_path=full_intersight_api_path_with_moid,
+                            method="PATCH",
+                            body=changed_attributes,
+                            auth_settings=['cookieAuth', 'http_signature', 'oAuth2', 'oAuth2']
+                            )
+        # Use the modification time returned by Intersight for the updated object
+        updated_intersight_object = {**existing_intersight_object, **changed_attributes, "ModTime": None}
+        try:
+            updated_intersight_object["ModTime"] = json.loads(api_client.last_response.data).get("ModTime")
+        except Exception:
+            pass
+        intersight_object_state_cache.set(intersight_api_path,
+                                          organization_moid,
+                                          existing_intersight_object_name,
+                                          updated_intersight_object
+                                          )
+        if intersight_object_state_file:
+            intersight_object_state_file.set(intersight_api_path,
+                                             organization_moid,
+                                             existing_intersight_object_name,
+                                             intersight_api_body,
+                                             updated_intersight_object
+                                             )
+        print(f"The update of the {object_type} has completed.")
+        print(f"The pre-existing {existing_intersight_object_name} has been "
+              "updated.")
+        return "The POST method was successful."
+    except Exception:
+        print("\nA configuration error has occurred!\n")
+        print(f"Unable to update the {object_type} under the Intersight API "
+              f"resource path '{full_intersight_api_path_with_moid}'.\n")
+        print(f"The pre-existing {existing_intersight_object_name} could not "
+              "be updated.")
+        print("Exception Message: ")
+        traceback.print_exc()
+        return "The POST method failed."
+
+
+# Establish function to test for the availability of the Intersight API and Intersight account
+def test_intersight_api_service(intersight_api_key_id,
+                                intersight_api_key,
+                                intersight_base_url="https://www.intersight.com/api/v1",
+                                preconfigured_api_client=None
+                                ):
+    """This is a function to test the availability of the Intersight API and
+    Intersight account. The tested Intersight account contains the user who is
+    the owner of the provided Intersight API Key and Key ID.
+
+    Args:
+        intersight_api_key_id (str):
+            The ID of the Intersight API key.
+        intersight_api_key (str):
+            The system file path of the Intersight API key.
+        intersight_base_url (str):
+            Optional; The base URL for Intersight API paths. The default value
+            is "https://www.intersight.com/api/v1". This value typically only
+            needs to be changed if using the Intersight Virtual Appliance. The
+            default value is "https://www.intersight.com/api/v1".
+        preconfigured_api_client ("ApiClient"):
+            Optional; An ApiClient class instance which handles
+            Intersight client-server communication through the use of API keys.
+            The default value is None. If a preconfigured_api_client argument
+            is provided, empty strings ("") or None can be provided for the
+            intersight_api_key_id, intersight_api_key, and intersight_base_url
+            arguments.
+
+    Returns:
+        A string of the name for the Intersight account tested, verifying the
+        Intersight API service is up and the Intersight account is accessible.
+        
+    Raises:
+        Exception:
+            An exception occurred due to an issue with the provided API Key
+            and/or API Key ID.
+    """
+    # Define Intersight SDK ApiClient variable
+    if preconfigured_api_client is None:
+        api_client = get_api_client(api_key_id=intersight_api_key_id,
+                                    api_secret_file=intersight_api_key,
+                                    endpoint=intersight_base_url
+                                    )
+    else:
+        api_client = preconfigured_api_client
+    try:
+        # Check that Intersight Account is accessible
+        print("Testing access to the Intersight API by verifying the "
+              "Intersight account information...")
+        api_client.call_api(resource_path="/iam/Accounts",
+                            method="GET",
                             auth_settings=['cookieAuth', 'http_signature', 'oAuth2', 'oAuth2']
                             )
         response = api_client.last_response.data
         iam_account = json.loads(response)
         if api_client.last_response.status != 200:
-            print("The provided Intersight account information could not be "
-                  "accessed.")
+            print("\nThe Intersight API and Account Availability Test did not "
+                  "pass.")
+            print("The Intersight account information could not be verified.")
             print("Exiting due to the Intersight account being unavailable.\n")
             print("Please verify that the correct API Key ID and API Key have "
                   "been entered, then re-attempt execution.\n")
             sys.exit(0)
         else:
             intersight_account_name = iam_account["Results"][0]["Name"]
+            # Store the Intersight account context for reuse by later lookups
+            get_intersight_account_context(api_client).set_account(iam_account["Results"][0])
+            print("The Intersight API and Account Availability Test has "
+                  "passed.\n")
+            print(f"The Intersight account named '{intersight_account_name}' "
+                  "has been found.")
+            return intersight_account_name
     except Exception:
         print("\nA configuration error has occurred!\n")
         print("Unable to access the Intersight API.")
         print("Exiting due to the Intersight API being unavailable.\n")
         print("Please verify that the correct API Key ID and API Key have "
               "been entered, then re-attempt execution.\n")
+        print("Exception Message: ")
+        traceback.print_exc()
         sys.exit(0)
+
+
+# Establish function to add server-side query options to an Intersight API path
+def intersight_api_query_builder(intersight_api_path,
+                                 filter_attributes=None,
+                                 select_attributes=None
+                                 ):
+    """This is a function to add the $filter and $select query options to an
+    Intersight API path, so that matching of Intersight objects and trimming
+    of returned attributes is performed by Intersight rather than locally.
+    Any query options already present on the Intersight API path are kept and
+    an existing $filter is combined with the new filter expressions.
+
+    Args:
+        intersight_api_path (str):
+            The Intersight API path of the Intersight objects. The path can
+            include existing query options, for example
+            "compute/Blades?$top=1000".
+        filter_attributes (dict):
+            Optional; A dictionary containing the attribute keys and values
+            that the Intersight objects must match. String, number and boolean
+            values are matched with the "eq" operator. Dictionary values
+            containing a "Moid" key, such as object references, are matched on
+            the referenced MOID. Values of any other type are skipped and must
+            be matched locally. The default value is None.
+        select_attributes (list):
+            Optional; A list containing the attribute keys to be returned for
+            each Intersight object. The default value is None, which returns
+            all attributes.
+
+    Returns:
+        A string of the Intersight API path with the query options applied.
+    """
+    def filter_value_formatter(attribute_value):
+        """This is a function to format an attribute value for use in an
+        Intersight API $filter expression.
+
+        Args:
+            attribute_value (str, int, float, bool):
+                The attribute value to be formatted.
+
+        Returns:
+            A string of the formatted attribute value.
+        """
+        if isinstance(attribute_value, bool):
+            return str(attribute_value).lower()
+        if isinstance(attribute_value, (int, float)):
+            return str(attribute_value)
+        escaped_attribute_value = attribute_value.replace("'", "''")
+        return f"'{escaped_attribute_value}'"
+
+    # Separate the base Intersight API path from any existing query options
+    if "?" in intersight_api_path:
+        base_intersight_api_path, existing_query = intersight_api_path.split("?", 1)
+        query_options = existing_query.split("&")
+    else:
+        base_intersight_api_path = intersight_api_path
+        query_options = []
+    # Create the list of filter expressions
+    filter_expressions = []
+    if filter_attributes:
+        for attribute_name, attribute_value in filter_attributes.items():
+            if isinstance(attribute_value, (str, int, float, bool)):
+                filter_expressions.append(f"{attribute_name} eq {filter_value_formatter(attribute_value)}")
+            elif isinstance(attribute_value, dict) and attribute_value.get("Moid"):
+                filter_expressions.append(f"{attribute_name}.Moid eq {filter_value_formatter(attribute_value['Moid'])}")
+    # Combine the filter expressions with any existing $filter query option
+    if filter_expressions:
+        for query_option in query_options:
+            if query_option.startswith("$filter="):
+                query_options.remove(query_option)
+                existing_filter_expression = urllib.parse.unquote(query_option[len("$filter="):])
+                filter_expressions.insert(0, f"({existing_filter_expression})")
+                break
+        combined_filter_expression = " and ".join(filter_expressions)
+        query_options.append(f"$filter={urllib.parse.quote(combined_filter_expression, safe='')}")
+    # Replace any existing $select query option
+    if select_attributes:
+        query_options = [query_option for query_option in query_options if not query_option.startswith("$select=")]
+        unique_select_attributes = list(dict.fromkeys(select_attributes))
+        query_options.append(f"$select={','.join(unique_select_attributes)}")
+    if query_options:
+        return f"{base_intersight_api_path}?{'&'.join(query_options)}"
+    return base_intersight_api_path
+
+
+# Establish class to cache the MOIDs of Intersight API objects retrieved by name
+class IntersightMoidCache:
+    """This class is used to cache the MOIDs of Intersight objects that have
+    been retrieved by name for a specific Intersight API client.
+    """
+    def __init__(self,
+                 time_to_live=900
+                 ):
+        self.time_to_live = time_to_live
+        self.cached_moids = {}
+        self.lock = threading.Lock()
+
+    def __repr__(self):
+        return (
+            f"{self.__class__.__name__}"
+            f"({self.time_to_live})"
+            )
+
+    def __str__(self):
+        return (f"{self.__class__.__name__} class object with "
+                f"{len(self.cached_moids)} cached MOIDs")
+
+    @staticmethod
+    def _cache_key(intersight_api_path,
+                   organization,
+                   object_name
+                   ):
+        """This function creates the cache key for an Intersight object. Any
+        query parameters are removed from the Intersight API path, so that
+        lookups of the same object under varying queries share one entry.
+
+        Args:
+            intersight_api_path (str):
+                The Intersight API path of the Intersight object.
+            organization (str):
+                The Intersight organization of the Intersight object.
+            object_name (str):
+                The name of the Intersight object.
+
+        Returns:
+            A tuple containing the cache key for the Intersight object.
+        """
+        base_intersight_api_path = intersight_api_path.split("?", 1)[0].strip("/")
+        return (base_intersight_api_path, organization, object_name)
+
+    def get(self,
+            intersight_api_path,
+            organization,
+            object_name
+            ):
+        """This function retrieves a cached MOID for an Intersight object.
+
+        Args:
+            intersight_api_path (str):
+                The Intersight API path of the Intersight object.
+            organization (str):
+                The Intersight organization of the Intersight object.
+            object_name (str):
+                The name of the Intersight object.
+
+        Returns:
+            A string of the cached MOID for the provided Intersight object. If
+            the MOID has not been cached or has expired, None will be returned.
+        """
+        cache_key = self._cache_key(intersight_api_path,
+                                    organization,
+                                    object_name
+                                    )
+        with self.lock:
+            cached_entry = self.cached_moids.get(cache_key)
+            if cached_entry is None:
+                return None
+            cached_moid, expiration_time = cached_entry
+            if time.monotonic() >= expiration_time:
+                self.cached_moids.pop(cache_key, None)
+                return None
+            return cached_moid
+
+    def set(self,
+            intersight_api_path,
+            organization,
+            object_name,
+            object_moid
+            ):
+        """This function caches the MOID for an Intersight object.
+
+        Args:
+            intersight_api_path (str):
+                The Intersight API path of the Intersight object.
+            organization (str):
+                The Intersight organization of the Intersight object.
+            object_name (str):
+                The name of the Intersight object.
+            object_moid (str):
+                The MOID of the Intersight object.
+        """
+        cache_key = self._cache_key(intersight_api_path,
+                                    organization,
+                                    object_name
+                                    )
+        with self.lock:
+            self.cached_moids[cache_key] = (object_moid,
+                                            time.monotonic() + self.time_to_live
+                                            )
+
+    def invalidate(self,
+                   intersight_api_path,
+                   organization=None,
+                   object_name=None
+                   ):
+        """This function removes cached MOIDs for Intersight objects under an
+        Intersight API path. This should be performed whenever an Intersight
+        object under the path is created, updated or deleted.
+
+        Args:
+            intersight_api_path (str):
+                The Intersight API path of the Intersight objects.
+            organization (str):
+                Optional; The Intersight organization of the Intersight
+                objects. The default value is None, which matches every
+                organization.
+            object_name (str):
+                Optional; The name of the Intersight object. The default value
+                is None, which matches every object name.
+        """
+        base_intersight_api_path = self._cache_key(intersight_api_path,
+                                                   organization,
+                                                   object_name
+                                                   )[0]
+        with self.lock:
+            for cache_key in list(self.cached_moids):
+                if (
+                    cache_key[0] == base_intersight_api_path and
+                    organization in (None, cache_key[1]) and
+                    object_name in (None, cache_key[2])
+                    ):
+                    self.cached_moids.pop(cache_key)
+
+    def clear(self):
+        """This function removes all cached MOIDs.
+        """
+        with self.lock:
+            self.cached_moids.clear()
+
+
+# Establish function to retrieve the MOID cache of an Intersight API client
+intersight_moid_cache_creation_lock = threading.Lock()
+
+
+def get_intersight_moid_cache(api_client):
+    """This is a function to retrieve the MOID cache for an Intersight API
+    client. The MOID cache is created and attached to the API client on first
+    use, so that it is shared by every function and class using the client.
+
+    Args:
+        api_client ("ApiClient"):
+            An ApiClient class instance which handles Intersight client-server
+            communication through the use of API keys.
+
+    Returns:
+        An IntersightMoidCache class instance.
+    """
+    with intersight_moid_cache_creation_lock:
+        intersight_moid_cache = getattr(api_client, "intersight_moid_cache", None)
+        if intersight_moid_cache is None:
+            intersight_moid_cache = IntersightMoidCache()
+            api_client.intersight_moid_cache = intersight_moid_cache
+    return intersight_moid_cache
+
+
+# Establish function to retrieve the MOID of a specific Intersight API object by name
+def intersight_object_moid_retriever(intersight_api_key_id,
+                                     intersight_api_key,
+                                     object_name,
+                                     intersight_api_path,
+                                     object_type="object",
+                                     organization="default",
+                                     intersight_base_url="https://www.intersight.com/api/v1",
+                                     preconfigured_api_client=None
+                                     ):
+    """This is a function to retrieve the MOID of Intersight objects
+    using the Intersight API.
+
+    Args:
+        intersight_api_key_id (str):
+            The ID of the Intersight API key.
+        intersight_api_key (str):
+            The system file path of the Intersight API key.
+        object_name (str):
+            The name of the Intersight object.
+        intersight_api_path (str):
+            The Intersight API path of the Intersight object.
+        object_type (str):
+            Optional; The type of Intersight object. The default value is
+            "object".
+        organization (str):
+            Optional; The Intersight organization of the Intersight object.
+            The default value is "default".
+        intersight_base_url (str):
+            Optional; The base URL for Intersight API paths. The default value
+            is "https://www.intersight.com/api/v1". This value typically only
+            needs to be changed if using the Intersight Virtual Appliance.
+        preconfigured_api_client ("ApiClient"):
+            Optional; An ApiClient class instance which handles
+            Intersight client-server communication through the use of API keys.
+            The default value is None. If a preconfigured_api_client argument
+            is provided, empty strings ("") or None can be provided for the
+            intersight_api_key_id, intersight_api_key, and intersight_base_url
+            arguments.
+
+    Returns:
+        A string of the MOID for the provided Intersight object.
+        
+    Raises:
+        Exception:
+            An exception occurred due to an issue accessing the Intersight API
+            path. The status code or error message will be specified.
+    """
+    # Define Intersight SDK ApiClient variable
+    if preconfigured_api_client is None:
+        api_client = get_api_client(api_key_id=intersight_api_key_id,
+                                    api_secret_file=intersight_api_key,
+                                    endpoint=intersight_base_url
+                                    )
+    else:
+        api_client = preconfigured_api_client
+    # Check the MOID cache of the API client for the provided object
+    intersight_moid_cache = get_intersight_moid_cache(api_client)
+    cached_intersight_object_moid = intersight_moid_cache.get(intersight_api_path,
+                                                              organization,
+                                                              object_name
+                                                              )
+    if cached_intersight_object_moid:
+        return cached_intersight_object_moid
+    # Retrieve the Intersight account context of the API client
+    intersight_account_context = get_intersight_account_context(api_client)
     # Retrieving the provided object from Intersight...
-    full_intersight_api_path = f"/{intersight_api_path}"
+    filtered_intersight_api_path = intersight_api_query_builder(intersight_api_path,
+                                                                filter_attributes={"Name": object_name}
+                                                                )
+    full_intersight_api_path = f"/{filtered_intersight_api_path}"
     try:
         api_client.call_api(resource_path=full_intersight_api_path,
                             method="GET",
@@ -2220,31 +3883,44 @@ def intersight_object_moid_retriever(intersight_api_key_id,
         sys.exit(0)
 
     if intersight_objects.get("Results"):
+        # Resolve the MOID of the provided organization once, on first use
+        provided_organization_moid = None
         for intersight_object in intersight_objects.get("Results"):
             if intersight_object.get("Organization"):
-                provided_organization_moid = intersight_object_moid_retriever(intersight_api_key_id=None,
-                                                                              intersight_api_key=None,
-                                                                              object_name=organization,
-                                                                              intersight_api_path="organization/Organizations?$top=1000",
-                                                                              object_type="Organization",
-                                                                              preconfigured_api_client=api_client
-                                                                              )
+                if provided_organization_moid is None:
+                    provided_organization_moid = intersight_object_moid_retriever(intersight_api_key_id=None,
+                                                                                  intersight_api_key=None,
+                                                                                  object_name=organization,
+                                                                                  intersight_api_path="organization/Organizations?$top=1000",
+                                                                                  object_type="Organization",
+                                                                                  preconfigured_api_client=api_client
+                                                                                  )
                 if intersight_object.get("Organization", {}).get("Moid") == provided_organization_moid:
                     if intersight_object.get("Name") == object_name:
                         intersight_object_moid = intersight_object.get("Moid")
                         # The provided object and MOID has been identified and retrieved.
+                        intersight_moid_cache.set(intersight_api_path,
+                                                  organization,
+                                                  object_name,
+                                                  intersight_object_moid
+                                                  )
                         return intersight_object_moid
             else:
                 if intersight_object.get("Name") == object_name:
                     intersight_object_moid = intersight_object.get("Moid")
                     # The provided object and MOID has been identified and retrieved.
+                    intersight_moid_cache.set(intersight_api_path,
+                                              organization,
+                                              object_name,
+                                              intersight_object_moid
+                                              )
                     return intersight_object_moid
         else:
             print("\nA configuration error has occurred!\n")
             print(f"The provided {object_type} named '{object_name}' was not "
                   "found.")
             print("Please check the Intersight Account named "
-                  f"{intersight_account_name}.")
+                  f"{intersight_account_context.get_account_name()}.")
             print("Verify through the API or GUI that the needed "
                   f"{object_type} is present.")
             print(f"If the needed {object_type} is missing, please create it.")
@@ -2255,9 +3931,9 @@ def intersight_object_moid_retriever(intersight_api_key_id,
         print(f"The provided {object_type} named '{object_name}' was not "
               "found.")
         print(f"No requested {object_type} instance is currently available in "
-              f"the Intersight account named {intersight_account_name}.")
+              f"the Intersight account named {intersight_account_context.get_account_name()}.")
         print("Please check the Intersight Account named "
-              f"{intersight_account_name}.")
+              f"{intersight_account_context.get_account_name()}.")
         print(f"Verify through the API or GUI that the needed {object_type} "
               "is present.")
         print(f"If the needed {object_type} is missing, please create it.")
@@ -2265,16 +3941,166 @@ def intersight_object_moid_retriever(intersight_api_key_id,
         sys.exit(0)
 
 
+# Establish function to retrieve all instances of a particular Intersight API object type one page at a time
+def get_intersight_object_pages(intersight_api_key_id,
+                                intersight_api_key,
+                                intersight_api_path,
+                                object_type="object",
+                                intersight_base_url="https://www.intersight.com/api/v1",
+                                preconfigured_api_client=None,
+                                filter_attributes=None,
+                                select_attributes=None,
+                                page_size=1000,
+                                count_preflight=False
+                                ):
+    """This is a generator function to perform paginated HTTP GETs on all
+    objects under an available Intersight API type. The objects are retrieved
+    using the $top and $skip query options and provided one page at a time,
+    so that large object types can be processed without holding every
+    object in memory.
+
+    Args:
+        intersight_api_key_id (str):
+            The ID of the Intersight API key.
+        intersight_api_key (str):
+            The system file path of the Intersight API key.
+        intersight_api_path (str):
+            The path to the targeted Intersight API object type. For example,
+            to specify the Intersight API type for adapter configuration
+            policies, enter "adapter/ConfigPolicies". Any $top or $skip query
+            options on the path are replaced by the pagination settings.
+        object_type (str):
+            Optional; The type of Intersight object. The default value is
+            "object".
+        intersight_base_url (str):
+            Optional; The base URL for Intersight API paths. The default value
+            is "https://www.intersight.com/api/v1". This value typically only
+            needs to be changed if using the Intersight Virtual Appliance.
+        preconfigured_api_client ("ApiClient"):
+            Optional; An ApiClient class instance which handles
+            Intersight client-server communication through the use of API keys.
+            The default value is None. If a preconfigured_api_client argument
+            is provided, empty strings ("") or None can be provided for the
+            intersight_api_key_id, intersight_api_key, and intersight_base_url
+            arguments.
+        filter_attributes (dict):
+            Optional; A dictionary containing the attribute keys and values
+            that the returned objects must match. The default value is None.
+        select_attributes (list):
+            Optional; A list containing the attribute keys to be returned for
+            each object. The default value is None.
+        page_size (int):
+            Optional; The number of objects to be retrieved per page. The
+            maximum accepted by Intersight is 1000. The default value is 1000.
+        count_preflight (bool):
+            Optional; The option to retrieve the total number of matching
+            objects with the $count query option before the pages are
+            retrieved, so that the exact number of pages is requested. The
+            default value is False.
+
+    Yields:
+        A list containing the objects of the specified API type for each
+        retrieved page.
+
+    Raises:
+        Exception:
+            An exception occurred due to an issue accessing the Intersight API
+            path. The status code or error message will be specified.
+    """
+    def paginated_api_path_maker(additional_query_options):
+        """This is a function to add query options to the filtered Intersight
+        API path, after removing any existing pagination query options.
+
+        Args:
+            additional_query_options (list):
+                A list of the query options to be added.
+
+        Returns:
+            A string of the Intersight API path with the query options added.
+        """
+        if "?" in filtered_intersight_api_path:
+            base_intersight_api_path, existing_query = filtered_intersight_api_path.split("?", 1)
+            query_options = [query_option for query_option in existing_query.split("&")
+                             if not query_option.startswith(("$top=", "$skip=", "$count="))]
+        else:
+            base_intersight_api_path = filtered_intersight_api_path
+            query_options = []
+        query_options.extend(additional_query_options)
+        return f"/{base_intersight_api_path}?{'&'.join(query_options)}"
+
+    def intersight_api_get(full_intersight_api_path):
+        """This is a function to perform an HTTP GET on an Intersight API path.
+
+        Args:
+            full_intersight_api_path (str):
+                The full Intersight API path to be retrieved.
+
+        Returns:
+            A dictionary containing the retrieved Intersight API response.
+        """
+        try:
+            api_client.call_api(resource_path=full_intersight_api_path,
+                                method="GET",
+                                auth_settings=['cookieAuth', 'http_signature', 'oAuth2', 'oAuth2']
+                                )
+            response = api_client.last_response.data
+            # The Intersight API resource path has been accessed successfully.
+            return json.loads(response)
+        except Exception:
+            print("\nA configuration error has occurred!\n")
+            print(f"There was an issue retrieving the requested {object_type} "
+                  "instances from Intersight.")
+            print("Unable to access the provided Intersight API resource path "
+                  f"'{intersight_api_path}'.")
+            print("Please review and resolve any error messages, then re-attempt "
+                  "execution.\n")
+            print("Exception Message: ")
+            traceback.print_exc()
+            sys.exit(0)
+
+    # Define Intersight SDK ApiClient variable
+    if preconfigured_api_client is None:
+        api_client = get_api_client(api_key_id=intersight_api_key_id,
+                                    api_secret_file=intersight_api_key,
+                                    endpoint=intersight_base_url
+                                    )
+    else:
+        api_client = preconfigured_api_client
+    filtered_intersight_api_path = intersight_api_query_builder(intersight_api_path,
+                                                                filter_attributes=filter_attributes,
+                                                                select_attributes=select_attributes
+                                                                )
+    # Retrieve the total number of matching objects, if requested
+    total_object_count = None
+    if count_preflight:
+        intersight_object_count = intersight_api_get(paginated_api_path_maker(["$count=true"]))
+        total_object_count = intersight_object_count.get("Count", 0)
+    # Retrieve the matching objects one page at a time
+    skip_count = 0
+    while total_object_count is None or skip_count < total_object_count:
+        intersight_objects_page = intersight_api_get(paginated_api_path_maker([f"$top={page_size}", f"$skip={skip_count}"]))
+        intersight_objects_page_results = intersight_objects_page.get("Results") or []
+        if intersight_objects_page_results:
+            yield intersight_objects_page_results
+        if len(intersight_objects_page_results) < page_size:
+            break
+        skip_count += page_size
+
+
 # Establish function to retrieve all instances of a particular Intersight API object type
 def get_intersight_objects(intersight_api_key_id,
                            intersight_api_key,
                            intersight_api_path,
                            object_type="object",
                            intersight_base_url="https://www.intersight.com/api/v1",
-                           preconfigured_api_client=None
+                           preconfigured_api_client=None,
+                           filter_attributes=None,
+                           select_attributes=None
                            ):
     """This is a function to perform an HTTP GET on all objects under an
-    available Intersight API type.
+    available Intersight API type. Every page of objects is retrieved, so the
+    results are not limited by the page size of a single request. To process
+    large object types one page at a time, use get_intersight_object_pages.
 
     Args:
         intersight_api_key_id (str):
@@ -2301,6 +4127,15 @@ def get_intersight_objects(intersight_api_key_id,
             is provided, empty strings ("") or None can be provided for the
             intersight_api_key_id, intersight_api_key, and intersight_base_url
             arguments.
+        filter_attributes (dict):
+            Optional; A dictionary containing the attribute keys and values
+            that the returned objects must match. The matching is performed
+            by Intersight through the $filter query option. The default value
+            is None.
+        select_attributes (list):
+            Optional; A list containing the attribute keys to be returned for
+            each object through the $select query option. The default value is
+            None, which returns all attributes.
 
     Returns:
         A dictionary containing all objects of the specified API type. If the
@@ -2311,36 +4146,23 @@ def get_intersight_objects(intersight_api_key_id,
             An exception occurred due to an issue accessing the Intersight API
             path. The status code or error message will be specified.
     """
-    # Define Intersight SDK ApiClient variable
-    if preconfigured_api_client is None:
-        api_client = get_api_client(api_key_id=intersight_api_key_id,
-                                    api_secret_file=intersight_api_key,
-                                    endpoint=intersight_base_url
-                                    )
-    else:
-        api_client = preconfigured_api_client
-    # Retrieving the provided object from Intersight...
-    full_intersight_api_path = f"/{intersight_api_path}"
-    try:
-        api_client.call_api(resource_path=full_intersight_api_path,
-                            method="GET",
-                            auth_settings=['cookieAuth', 'http_signature', 'oAuth2', 'oAuth2']
-                            )
-        response = api_client.last_response.data
-        intersight_objects = json.loads(response)
-        # The Intersight API resource path has been accessed successfully.
-        return intersight_objects
-    except Exception:
-        print("\nA configuration error has occurred!\n")
-        print(f"There was an issue retrieving the requested {object_type} "
-              "instances from Intersight.")
-        print("Unable to access the provided Intersight API resource path "
-              f"'{intersight_api_path}'.")
-        print("Please review and resolve any error messages, then re-attempt "
-              "execution.\n")
-        print("Exception Message: ")
-        traceback.print_exc()
-        sys.exit(0)
+    # Retrieve every page of matching objects from Intersight
+    intersight_objects_results = []
+    for intersight_objects_page_results in get_intersight_object_pages(intersight_api_key_id,
+                                                                       intersight_api_key,
+                                                                       intersight_api_path,
+                                                                       object_type=object_type,
+                                                                       intersight_base_url=intersight_base_url,
+                                                                       preconfigured_api_client=preconfigured_api_client,
+                                                                       filter_attributes=filter_attributes,
+                                                                       select_attributes=select_attributes
+                                                                       ):
+        intersight_objects_results.extend(intersight_objects_page_results)
+    intersight_objects = {
+        "ObjectType": "mo.List",
+        "Results": intersight_objects_results
+        }
+    return intersight_objects
 
 
 # Establish function to retrieve a particular instance of a particular Intersight API object type
@@ -2481,32 +4303,13 @@ def advanced_intersight_object_moid_retriever(intersight_api_key_id,
                                     )
     else:
         api_client = preconfigured_api_client
-    try:
-        # Retrieve the Intersight Account name
-        api_client.call_api(resource_path="/iam/Accounts",
-                            method="GET",
-                            auth_settings=['cookieAuth', 'http_signature', 'oAuth2', 'oAuth2']
-                            )
-        response = api_client.last_response.data
-        iam_account = json.loads(response)
-        if api_client.last_response.status != 200:
-            print("The provided Intersight account information could not be "
-                  "accessed.")
-            print("Exiting due to the Intersight account being unavailable.\n")
-            print("Please verify that the correct API Key ID and API Key have "
-                  "been entered, then re-attempt execution.\n")
-            sys.exit(0)
-        else:
-            intersight_account_name = iam_account["Results"][0]["Name"]
-    except Exception:
-        print("\nA configuration error has occurred!\n")
-        print("Unable to access the Intersight API.")
-        print("Exiting due to the Intersight API being unavailable.\n")
-        print("Please verify that the correct API Key ID and API Key have "
-              "been entered, then re-attempt execution.\n")
-        sys.exit(0)
+    # Retrieve the Intersight account context of the API client
+    intersight_account_context = get_intersight_account_context(api_client)
     # Retrieving the provided object from Intersight...
-    full_intersight_api_path = f"/{intersight_api_path}"
+    filtered_intersight_api_path = intersight_api_query_builder(intersight_api_path,
+                                                                filter_attributes=object_attributes
+                                                                )
+    full_intersight_api_path = f"/{filtered_intersight_api_path}"
     try:
         api_client.call_api(resource_path=full_intersight_api_path,
                             method="GET",
@@ -2528,15 +4331,18 @@ def advanced_intersight_object_moid_retriever(intersight_api_key_id,
         sys.exit(0)
 
     if intersight_objects.get("Results"):
+        # Resolve the MOID of the provided organization once, on first use
+        provided_organization_moid = None
         for intersight_object in intersight_objects.get("Results"):
             if intersight_object.get("Organization"):
-                provided_organization_moid = intersight_object_moid_retriever(intersight_api_key_id=None,
-                                                                              intersight_api_key=None,
-                                                                              object_name=organization,
-                                                                              intersight_api_path="organization/Organizations?$top=1000",
-                                                                              object_type="Organization",
-                                                                              preconfigured_api_client=api_client
-                                                                              )
+                if provided_organization_moid is None:
+                    provided_organization_moid = intersight_object_moid_retriever(intersight_api_key_id=None,
+                                                                                  intersight_api_key=None,
+                                                                                  object_name=organization,
+                                                                                  intersight_api_path="organization/Organizations?$top=1000",
+                                                                                  object_type="Organization",
+                                                                                  preconfigured_api_client=api_client
+                                                                                  )
                 if intersight_object.get("Organization", {}).get("Moid") == provided_organization_moid:
                     for object_attribute in object_attributes:
                         try:
@@ -2565,7 +4371,7 @@ def advanced_intersight_object_moid_retriever(intersight_api_key_id,
             print("\nA configuration error has occurred!\n")
             print(f"The provided {object_type} was not found.")
             print("Please check the Intersight Account named "
-                  f"{intersight_account_name}.")
+                  f"{intersight_account_context.get_account_name()}.")
             print("Verify through the API or GUI that the needed "
                   f"{object_type} is present.")
             print(f"If the needed {object_type} is missing, please create it.")
@@ -2575,9 +4381,9 @@ def advanced_intersight_object_moid_retriever(intersight_api_key_id,
         print("\nA configuration error has occurred!\n")
         print(f"The provided {object_type} was not found.")
         print(f"No requested {object_type} instance is currently available in "
-              f"the Intersight account named {intersight_account_name}.")
+              f"the Intersight account named {intersight_account_context.get_account_name()}.")
         print("Please check the Intersight Account named "
-              f"{intersight_account_name}.")
+              f"{intersight_account_context.get_account_name()}.")
         print(f"Verify through the API or GUI that the needed {object_type} "
               "is present.")
         print(f"If the needed {object_type} is missing, please create it.")
@@ -2628,50 +4434,35 @@ def intersight_object_backup(intersight_api_key_id,
             Intersight client-server communication through the use of API keys.
             The default value is None. If a preconfigured_api_client argument
             is provided, empty strings ("") or None can be provided for the
-            intersight_api_key_id, intersight_api_key, and intersight_base_url
-            arguments.
-    Returns:
-        A string of the MOID for the provided Intersight object.
-        
-    Raises:
-        Exception:
-            An exception occurred due to an issue accessing the Intersight API
-            path. The status code or error message will be specified.
-    """
-    # Define Intersight SDK ApiClient variable
-    if preconfigured_api_client is None:
-        api_client = get_api_client(api_key_id=intersight_api_key_id,
-                                    api_secret_file=intersight_api_key,
-                                    endpoint=intersight_base_url
-                                    )
-    else:
-        api_client = preconfigured_api_client
-    try:
-        # Retrieve the Intersight Account name
-        api_client.call_api(resource_path="/iam/Accounts",
-                            method="GET",
-                            auth_settings=['cookieAuth', 'http_signature', 'oAuth2', 'oAuth2']
-                            )
-        response = api_client.last_response.data
-        iam_account = json.loads(response)
-        if api_client.last_response.status != 200:
-            print("The provided Intersight account information could not be "
-                  "accessed.")
-            print("Exiting due to the Intersight account being unavailable.\n")
-            print("Please verify that the correct API Key ID and API Key have "
-                  "been entered, then re-attempt execution.\n")
-            sys.exit(0)
-        else:
-            intersight_account_name = iam_account["Results"][0]["Name"]
-    except Exception:
-        print("\nA configuration error has occurred!\n")
-        print("Unable to access the Intersight API.")
-        print("Exiting due to the Intersight API being unavailable.\n")
-        print("Please verify that the correct API Key ID and API Key have "
-              "been entered, then re-attempt execution.\n")
-        sys.exit(0)
+            intersight_api_key_id, intersight_api_key, and intersight_base_url
+            arguments.
+    Returns:
+        A string of the MOID for the provided Intersight object.
+        
+    Raises:
+        Exception:
+            An exception occurred due to an issue accessing the Intersight API
+            path. The status code or error message will be specified.
+    """
+    # Define Intersight SDK ApiClient variable
+    if preconfigured_api_client is None:
+        api_client = get_api_client(api_key_id=intersight_api_key_id,
+                                    api_secret_file=intersight_api_key,
+                                    endpoint=intersight_base_url
+                                    )
+    else:
+        api_client = preconfigured_api_client
+    # Retrieve the Intersight account context of the API client
+    intersight_account_context = get_intersight_account_context(api_client)
     # Retrieving the provided object from Intersight...
-    full_intersight_api_path = f"/{intersight_api_path}"
+    selected_attributes = [*object_attributes, *backup_attribute_list, "Moid"]
+    if organization:
+        selected_attributes.append("Organization")
+    filtered_intersight_api_path = intersight_api_query_builder(intersight_api_path,
+                                                                filter_attributes=object_attributes,
+                                                                select_attributes=selected_attributes
+                                                                )
+    full_intersight_api_path = f"/{filtered_intersight_api_path}"
     try:
         api_client.call_api(resource_path=full_intersight_api_path,
                             method="GET",
@@ -2694,15 +4485,18 @@ def intersight_object_backup(intersight_api_key_id,
     
     if intersight_objects.get("Results"):
         if organization:
+            # Resolve the MOID of the provided organization once, on first use
+            provided_organization_moid = None
             for intersight_object in intersight_objects.get("Results"):
                 if intersight_object.get("Organization"):
-                    provided_organization_moid = intersight_object_moid_retriever(intersight_api_key_id=None,
-                                                                                  intersight_api_key=None,
-                                                                                  object_name=organization,
-                                                                                  intersight_api_path="organization/Organizations?$top=1000",
-                                                                                  object_type="Organization",
-                                                                                  preconfigured_api_client=api_client
-                                                                                  )
+                    if provided_organization_moid is None:
+                        provided_organization_moid = intersight_object_moid_retriever(intersight_api_key_id=None,
+                                                                                      intersight_api_key=None,
+                                                                                      object_name=organization,
+                                                                                      intersight_api_path="organization/Organizations?$top=1000",
+                                                                                      object_type="Organization",
+                                                                                      preconfigured_api_client=api_client
+                                                                                      )
                     if intersight_object.get("Organization", {}).get("Moid") == provided_organization_moid:
                         for object_attribute in object_attributes:
                             try:
@@ -2739,7 +4533,7 @@ def intersight_object_backup(intersight_api_key_id,
                 print("\nA configuration error has occurred!\n")
                 print(f"The provided {object_type} was not found.")
                 print("Please check the Intersight Account named "
-                      f"{intersight_account_name}.")
+                      f"{intersight_account_context.get_account_name()}.")
                 print("Verify through the API or GUI that the needed "
                       f"{object_type} is present.")
                 print(f"If the needed {object_type} is missing, please create it.")
@@ -2766,7 +4560,7 @@ def intersight_object_backup(intersight_api_key_id,
                 print("\nA configuration error has occurred!\n")
                 print(f"The provided {object_type} was not found.")
                 print("Please check the Intersight Account named "
-                      f"{intersight_account_name}.")
+                      f"{intersight_account_context.get_account_name()}.")
                 print("Verify through the API or GUI that the needed "
                       f"{object_type} is present.")
                 print(f"If the needed {object_type} is missing, please create it.")
@@ -2776,9 +4570,9 @@ def intersight_object_backup(intersight_api_key_id,
         print("\nA configuration error has occurred!\n")
         print(f"The provided {object_type} was not found.")
         print(f"No requested {object_type} instance is currently available in "
-              f"the Intersight account named {intersight_account_name}.")
+              f"the Intersight account named {intersight_account_context.get_account_name()}.")
         print("Please check the Intersight Account named "
-              f"{intersight_account_name}.")
+              f"{intersight_account_context.get_account_name()}.")
         print(f"Verify through the API or GUI that the needed {object_type} "
               "is present.")
         print(f"If the needed {object_type} is missing, please create it.")
@@ -3125,14 +4919,46 @@ class UcsPolicy:
                 The status code or error message will be specified.
         """
         full_intersight_api_path = f"/{self.intersight_api_path}"
+        # Skip the object if it was configured in the previous run of a resumed deployment
+        if intersight_deployment_journal_checker(api_client=self.api_client,
+                                                 object_type=self.object_type,
+                                                 object_name=self.intersight_api_body.get("Name"),
+                                                 organization=self.organization
+                                                 ):
+            return "The POST method was successful."
+        # Compare the provided configuration with any pre-existing object and update only the changed attributes
+        intersight_object_update_status = intersight_object_updater(api_client=self.api_client,
+                                                                    intersight_api_path=self.intersight_api_path,
+                                                                    intersight_api_body=self.intersight_api_body,
+                                                                    object_type=self.object_type
+                                                                    )
+        if intersight_object_update_status is not None:
+            if intersight_object_update_status in ("The POST method was successful.", "The object is unchanged."):
+                intersight_deployment_journal_recorder(api_client=self.api_client,
+                                                       intersight_api_path=self.intersight_api_path,
+                                                       intersight_api_body=self.intersight_api_body,
+                                                       object_type=self.object_type,
+                                                       organization=self.organization
+                                                       )
+            return intersight_object_update_status
         try:
             self.api_client.call_api(resource_path=full_intersight_api_path,
                                      method="POST",
                                      body=self.intersight_api_body,
                                      auth_settings=['cookieAuth', 'http_signature', 'oAuth2', 'oAuth2']
                                      )
+            # Invalidate any cached MOID for the newly configured object
+            get_intersight_moid_cache(self.api_client).invalidate(self.intersight_api_path,
+                                                                   object_name=self.intersight_api_body.get("Name")
+                                                                   )
             print(f"The configuration of the base {self.object_type} "
                   "has completed.")
+            intersight_deployment_journal_recorder(api_client=self.api_client,
+                                                   intersight_api_path=self.intersight_api_path,
+                                                   intersight_api_body=self.intersight_api_body,
+                                                   object_type=self.object_type,
+                                                   organization=self.organization
+                                                   )
             return "The POST method was successful."
         except intersight.exceptions.ApiException as error:
             if error.status == 409:
@@ -3161,6 +4987,12 @@ class UcsPolicy:
                           "completed.")
                     print(f"The pre-existing {existing_intersight_object_name} "
                           "has been updated.")
+                    intersight_deployment_journal_recorder(api_client=self.api_client,
+                                                           intersight_api_path=self.intersight_api_path,
+                                                           intersight_api_body=self.intersight_api_body,
+                                                           object_type=self.object_type,
+                                                           organization=self.organization
+                                                           )
                     return "The POST method was successful."
                 except Exception:
                     print("\nA configuration error has occurred!\n")
@@ -4200,14 +6032,46 @@ class UcsPool:
                 The status code or error message will be specified.
         """
         full_intersight_api_path = f"/{self.intersight_api_path}"
+        # Skip the object if it was configured in the previous run of a resumed deployment
+        if intersight_deployment_journal_checker(api_client=self.api_client,
+                                                 object_type=self.object_type,
+                                                 object_name=self.intersight_api_body.get("Name"),
+                                                 organization=self.organization
+                                                 ):
+            return "The POST method was successful."
+        # Compare the provided configuration with any pre-existing object and update only the changed attributes
+        intersight_object_update_status = intersight_object_updater(api_client=self.api_client,
+                                                                    intersight_api_path=self.intersight_api_path,
+                                                                    intersight_api_body=self.intersight_api_body,
+                                                                    object_type=self.object_type
+                                                                    )
+        if intersight_object_update_status is not None:
+            if intersight_object_update_status in ("The POST method was successful.", "The object is unchanged."):
+                intersight_deployment_journal_recorder(api_client=self.api_client,
+                                                       intersight_api_path=self.intersight_api_path,
+                                                       intersight_api_body=self.intersight_api_body,
+                                                       object_type=self.object_type,
+                                                       organization=self.organization
+                                                       )
+            return intersight_object_update_status
         try:
             self.api_client.call_api(resource_path=full_intersight_api_path,
                                      method="POST",
                                      body=self.intersight_api_body,
                                      auth_settings=['cookieAuth', 'http_signature', 'oAuth2', 'oAuth2']
                                      )
+            # Invalidate any cached MOID for the newly configured object
+            get_intersight_moid_cache(self.api_client).invalidate(self.intersight_api_path,
+                                                                   object_name=self.intersight_api_body.get("Name")
+                                                                   )
             print(f"The configuration of the base {self.object_type} "
                   "has completed.")
+            intersight_deployment_journal_recorder(api_client=self.api_client,
+                                                   intersight_api_path=self.intersight_api_path,
+                                                   intersight_api_body=self.intersight_api_body,
+                                                   object_type=self.object_type,
+                                                   organization=self.organization
+                                                   )
             return "The POST method was successful."
         except intersight.exceptions.ApiException as error:
             if error.status == 409:
@@ -4236,6 +6100,12 @@ class UcsPool:
                           "completed.")
                     print(f"The pre-existing {existing_intersight_object_name} "
                           "has been updated.")
+                    intersight_deployment_journal_recorder(api_client=self.api_client,
+                                                           intersight_api_path=self.intersight_api_path,
+                                                           intersight_api_body=self.intersight_api_body,
+                                                           object_type=self.object_type,
+                                                           organization=self.organization
+                                                           )
                     return "The POST method was successful."
                 except Exception:
                     print("\nA configuration error has occurred!\n")
@@ -4649,6 +6519,27 @@ class UcsServerProfile:
     def __str__(self):
         return f"{self.__class__.__name__} class object for '{self.ucs_server_profile_name}'"
 
+    def _ucs_server_profile_update_api_body_maker(self,
+                                                  existing_ucs_server_profile
+                                                  ):
+        """This function determines whether a pre-existing UCS Server Profile
+        can be updated with only the changed attributes. UCS Server Profiles
+        derived from a UCS Server Profile Template are updated through a POST,
+        so that the template attachment can be handled.
+
+        Args:
+            existing_ucs_server_profile (dict):
+                A dictionary of the pre-existing UCS Server Profile.
+
+        Returns:
+            A dictionary of the Intersight API body for the update of the
+            pre-existing UCS Server Profile. If the UCS Server Profile is
+            derived from a UCS Server Profile Template, None is returned.
+        """
+        if existing_ucs_server_profile.get("SrcTemplate"):
+            return None
+        return self.intersight_api_body
+
     def _post_intersight_object(self):
         """This is a function to configure an Intersight object by
         performing a POST through the Intersight API.
@@ -4663,14 +6554,48 @@ class UcsServerProfile:
                 The status code or error message will be specified.
         """
         full_intersight_api_path = f"/{self.intersight_api_path}"
+        # Skip the object if it was configured in the previous run of a resumed deployment
+        if intersight_deployment_journal_checker(api_client=self.api_client,
+                                                 object_type=self.object_type,
+                                                 object_name=self.intersight_api_body.get("Name"),
+                                                 organization=self.organization
+                                                 ):
+            return "The POST method was successful."
+        # Compare the provided configuration with any pre-existing object and update only the changed attributes
+        intersight_object_update_status = intersight_object_updater(api_client=self.api_client,
+                                                                    intersight_api_path=self.intersight_api_path,
+                                                                    intersight_api_body=self.intersight_api_body,
+                                                                    object_type=self.object_type,
+                                                                    update_api_body_maker=self._ucs_server_profile_update_api_body_maker,
+                                                                    existing_object_attributes=["SrcTemplate"]
+                                                                    )
+        if intersight_object_update_status is not None:
+            if intersight_object_update_status in ("The POST method was successful.", "The object is unchanged."):
+                intersight_deployment_journal_recorder(api_client=self.api_client,
+                                                       intersight_api_path=self.intersight_api_path,
+                                                       intersight_api_body=self.intersight_api_body,
+                                                       object_type=self.object_type,
+                                                       organization=self.organization
+                                                       )
+            return intersight_object_update_status
         try:
             self.api_client.call_api(resource_path=full_intersight_api_path,
                                      method="POST",
                                      body=self.intersight_api_body,
                                      auth_settings=['cookieAuth', 'http_signature', 'oAuth2', 'oAuth2']
                                      )
+            # Invalidate any cached MOID for the newly configured object
+            get_intersight_moid_cache(self.api_client).invalidate(self.intersight_api_path,
+                                                                   object_name=self.intersight_api_body.get("Name")
+                                                                   )
             print(f"The configuration of the base {self.object_type} "
                   "has completed.")
+            intersight_deployment_journal_recorder(api_client=self.api_client,
+                                                   intersight_api_path=self.intersight_api_path,
+                                                   intersight_api_body=self.intersight_api_body,
+                                                   object_type=self.object_type,
+                                                   organization=self.organization
+                                                   )
             return "The POST method was successful."
         except intersight.exceptions.ApiException as error:
             error_body_dictionary = ast.literal_eval(error.body)
@@ -4699,6 +6624,12 @@ class UcsServerProfile:
                           "completed.")
                     print(f"The pre-existing {self.ucs_server_profile_name} "
                           "has been updated.")
+                    intersight_deployment_journal_recorder(api_client=self.api_client,
+                                                           intersight_api_path=self.intersight_api_path,
+                                                           intersight_api_body=self.intersight_api_body,
+                                                           object_type=self.object_type,
+                                                           organization=self.organization
+                                                           )
                     return "The POST method was successful."
                 except Exception:
                     print("\nA configuration error has occurred!\n")
@@ -4756,6 +6687,12 @@ class UcsServerProfile:
                               "completed.")
                         print(f"The pre-existing {self.ucs_server_profile_name} "
                               "has been updated.")
+                        intersight_deployment_journal_recorder(api_client=self.api_client,
+                                                               intersight_api_path=self.intersight_api_path,
+                                                               intersight_api_body=self.intersight_api_body,
+                                                               object_type=self.object_type,
+                                                               organization=self.organization
+                                                               )
                         return "The POST method was successful."
                     else:                        
                         # Get UCS Server Profile MOID
@@ -4803,6 +6740,12 @@ class UcsServerProfile:
                                   "completed.")
                             print(f"The pre-existing {self.ucs_server_profile_name} "
                                   "has been updated.")
+                            intersight_deployment_journal_recorder(api_client=self.api_client,
+                                                                   intersight_api_path=self.intersight_api_path,
+                                                                   intersight_api_body=self.intersight_api_body,
+                                                                   object_type=self.object_type,
+                                                                   organization=self.organization
+                                                                   )
                             return "The POST method was successful."
                         else:
                             print("\nA configuration error has occurred!\n")
@@ -5125,6 +7068,342 @@ def ucs_server_profile_maker(
             ))
 
 
+# Establish function to wait for multiple UCS Server Profiles to be ready for deployment or deployed
+def ucs_server_profiles_state_waiter(
+    intersight_api_key_id,
+    intersight_api_key,
+    ucs_server_profiles,
+    wait_for_deployment=False,
+    deployment_request_mod_times=None,
+    wait_timeout=1800,
+    initial_polling_interval=2,
+    maximum_polling_interval=30,
+    polling_chunk_size=50,
+    intersight_base_url="https://www.intersight.com/api/v1",
+    preconfigured_api_client=None
+    ):
+    """This is a function to wait for multiple UCS Server Profiles to be
+    ready for deployment or for multiple UCS Server Profile deployments to
+    finish. On each poll, the ConfigContext and the running workflows of all
+    the UCS Server Profiles still being waited on are retrieved together with
+    one "Moid in" filtered query per chunk of UCS Server Profiles, so the
+    number of requests does not grow with each additional UCS Server Profile.
+    The polling interval is increased exponentially between polls.
+
+    Args:
+        intersight_api_key_id (str):
+            The ID of the Intersight API key.
+        intersight_api_key (str):
+            The system file path of the Intersight API key.
+        ucs_server_profiles (dict):
+            A dictionary with the Intersight MOIDs of the UCS Server Profiles
+            as keys and the names of the UCS Server Profiles as values.
+        wait_for_deployment (bool):
+            Optional; This argument sets whether to wait for requested
+            deployments of the UCS Server Profiles to finish. If set to False,
+            the function waits until the UCS Server Profiles have no
+            configuration changes or workflows in progress, so that they are
+            ready for deployment. A UCS Server Profile in a failed state from a
+            previous deployment is considered ready for deployment. A
+            requested deployment is only considered finished or failed after
+            the UCS Server Profile has been seen with the deployment in
+            progress, or has been modified after the deployment request. The
+            default value is False.
+        deployment_request_mod_times (dict):
+            Optional; A dictionary with the Intersight MOIDs of the UCS Server
+            Profiles as keys and the modification times returned by the
+            deployment requests as values. A UCS Server Profile in the
+            "Associated" state with a later modification time is considered
+            deployed, even if the deployment finished before the first poll.
+            The default value is None.
+        wait_timeout (int):
+            Optional; The maximum time in seconds to wait. The default value
+            is 1800 seconds.
+        initial_polling_interval (int):
+            Optional; The time in seconds between the first two polls of the
+            UCS Server Profiles. The polling interval is doubled after every
+            poll. The default value is 2 seconds.
+        maximum_polling_interval (int):
+            Optional; The maximum time in seconds between two polls of the
+            UCS Server Profiles. The default value is 30 seconds.
+        polling_chunk_size (int):
+            Optional; The maximum number of MOIDs included in each filtered
+            query. The default value is 50.
+        intersight_base_url (str):
+            Optional; The base URL for Intersight API paths. The default value
+            is "https://www.intersight.com/api/v1". This value typically only
+            needs to be changed if using the Intersight Virtual Appliance.
+        preconfigured_api_client ("ApiClient"):
+            Optional; An ApiClient class instance which handles
+            Intersight client-server communication through the use of API keys.
+            The default value is None. If a preconfigured_api_client argument
+            is provided, empty strings ("") or None can be provided for the
+            intersight_api_key_id, intersight_api_key, and intersight_base_url
+            arguments.
+
+    Returns:
+        A dictionary with the Intersight MOIDs of the UCS Server Profiles as
+        keys and the wait results as values. A wait result is "Completed" if
+        the UCS Server Profile is ready or the deployment has finished,
+        "Failed" if the UCS Server Profile or one of its workflows has failed,
+        or "Timed out" if the wait timeout has been reached.
+    """
+    def get_intersight_objects_by_moid(intersight_api_path,
+                                       intersight_object_moids,
+                                       select_attributes
+                                       ):
+        """This is a function to retrieve Intersight objects by MOID with one
+        "Moid in" filtered query per chunk of MOIDs.
+
+        Args:
+            intersight_api_path (str):
+                The Intersight API path of the Intersight objects.
+            intersight_object_moids (list):
+                A list of the Intersight MOIDs of the Intersight objects.
+            select_attributes (list):
+                A list containing the attribute keys to be returned for each
+                Intersight object.
+
+        Returns:
+            A dictionary with the Intersight MOIDs as keys and the retrieved
+            Intersight objects as values. Intersight objects in chunks that
+            could not be retrieved are left out, so that they are polled again
+            on the next poll.
+        """
+        retrieved_intersight_objects = {}
+        for chunk_start in range(0, len(intersight_object_moids), polling_chunk_size):
+            intersight_object_moid_chunk = intersight_object_moids[chunk_start:chunk_start + polling_chunk_size]
+            moid_filter_expression = "Moid in ({})".format(
+                ",".join(f"'{intersight_object_moid}'" for intersight_object_moid in intersight_object_moid_chunk)
+                )
+            filtered_intersight_api_path = intersight_api_query_builder(
+                f"{intersight_api_path}?$top={len(intersight_object_moid_chunk)}&$filter={urllib.parse.quote(moid_filter_expression, safe='')}",
+                select_attributes=["Moid", *select_attributes]
+                )
+            try:
+                api_client.call_api(resource_path=f"/{filtered_intersight_api_path}",
+                                    method="GET",
+                                    auth_settings=['cookieAuth', 'http_signature', 'oAuth2', 'oAuth2']
+                                    )
+                intersight_objects = json.loads(api_client.last_response.data)
+            except Exception:
+                # Poll the chunk again on the next poll, as the error may be transient
+                continue
+            for intersight_object in intersight_objects.get("Results") or []:
+                retrieved_intersight_objects[intersight_object.get("Moid")] = intersight_object
+        return retrieved_intersight_objects
+
+    # Define Intersight SDK ApiClient variable
+    if preconfigured_api_client is None:
+        api_client = get_api_client(api_key_id=intersight_api_key_id,
+                                    api_secret_file=intersight_api_key,
+                                    endpoint=intersight_base_url
+                                    )
+    else:
+        api_client = preconfigured_api_client
+    in_progress_config_states = ("Validating", "Configuring", "Activating")
+    failed_workflow_statuses = ("FAILED", "TERMINATED", "TIME_OUT")
+    polling_interval = initial_polling_interval
+    wait_deadline = time.monotonic() + wait_timeout
+    wait_results = {}
+    deployment_started_moids = set()
+    reported_config_states = {}
+    while True:
+        pending_ucs_server_profile_moids = [ucs_server_profile_moid
+                                            for ucs_server_profile_moid in ucs_server_profiles
+                                            if ucs_server_profile_moid not in wait_results
+                                            ]
+        if not pending_ucs_server_profile_moids:
+            return wait_results
+        ucs_server_profile_objects = get_intersight_objects_by_moid("server/Profiles",
+                                                                    pending_ucs_server_profile_moids,
+                                                                    ["ConfigContext", "RunningWorkflows", "ModTime"]
+                                                                    )
+        running_workflow_moids = list(dict.fromkeys(
+            running_workflow.get("Moid")
+            for ucs_server_profile_object in ucs_server_profile_objects.values()
+            for running_workflow in ucs_server_profile_object.get("RunningWorkflows") or []
+            if running_workflow.get("Moid")
+            ))
+        if running_workflow_moids:
+            running_workflow_infos = get_intersight_objects_by_moid("workflow/WorkflowInfos",
+                                                                    running_workflow_moids,
+                                                                    ["Name", "Status"]
+                                                                    )
+        else:
+            running_workflow_infos = {}
+        for ucs_server_profile_moid, ucs_server_profile_object in ucs_server_profile_objects.items():
+            if ucs_server_profile_moid not in pending_ucs_server_profile_moids:
+                continue
+            ucs_server_profile_name = ucs_server_profiles.get(ucs_server_profile_moid)
+            ucs_server_profile_config_context = ucs_server_profile_object.get("ConfigContext") or {}
+            ucs_server_profile_config_state = ucs_server_profile_config_context.get("ConfigState")
+            ucs_server_profile_oper_state = ucs_server_profile_config_context.get("OperState")
+            ucs_server_profile_control_action = ucs_server_profile_config_context.get("ControlAction")
+            ucs_server_profile_running_workflows = [
+                running_workflow_infos.get(running_workflow.get("Moid"), {})
+                for running_workflow in ucs_server_profile_object.get("RunningWorkflows") or []
+                if running_workflow.get("Moid")
+                ]
+            if ucs_server_profile_config_state != reported_config_states.get(ucs_server_profile_moid):
+                print(f"The UCS Server Profile named {ucs_server_profile_name} "
+                      f"is in the '{ucs_server_profile_config_state}' state.")
+                reported_config_states[ucs_server_profile_moid] = ucs_server_profile_config_state
+            # Check the running workflows of the UCS Server Profile for failures
+            failed_running_workflow = next((running_workflow_info
+                                            for running_workflow_info in ucs_server_profile_running_workflows
+                                            if running_workflow_info.get("Status") in failed_workflow_statuses
+                                            ), None)
+            if failed_running_workflow:
+                print("\nA configuration error has occurred!\n")
+                print(f"The workflow named {failed_running_workflow.get('Name')} "
+                      "for the UCS Server Profile named "
+                      f"{ucs_server_profile_name} has the status "
+                      f"{failed_running_workflow.get('Status')}.")
+                print("Please review the workflow in Intersight, then "
+                      "re-attempt execution.\n")
+                wait_results[ucs_server_profile_moid] = "Failed"
+                continue
+            ucs_server_profile_failed = "Failed" in (ucs_server_profile_config_state, ucs_server_profile_oper_state)
+            ucs_server_profile_busy = (
+                bool(ucs_server_profile_running_workflows) or
+                ucs_server_profile_config_state in in_progress_config_states or
+                ucs_server_profile_control_action not in (None, "", "No-op")
+                )
+            if wait_for_deployment:
+                # Only accept the "Associated" or "Failed" states once the requested deployment has been seen in progress or has modified the UCS Server Profile
+                deployment_request_mod_time = (deployment_request_mod_times or {}).get(ucs_server_profile_moid)
+                if ucs_server_profile_busy:
+                    deployment_started_moids.add(ucs_server_profile_moid)
+                    continue
+                deployment_request_modified_profile = bool(
+                    deployment_request_mod_time and
+                    (ucs_server_profile_object.get("ModTime") or "") > deployment_request_mod_time
+                    )
+                if ucs_server_profile_moid not in deployment_started_moids and not deployment_request_modified_profile:
+                    continue
+                if ucs_server_profile_failed:
+                    print("\nA configuration error has occurred!\n")
+                    print(f"The UCS Server Profile named {ucs_server_profile_name} "
+                          "is in a failed state.")
+                    print("Please review the UCS Server Profile in Intersight, then "
+                          "re-attempt execution.\n")
+                    wait_results[ucs_server_profile_moid] = "Failed"
+                elif (ucs_server_profile_moid in deployment_started_moids or
+                      ucs_server_profile_config_state == "Associated"):
+                    wait_results[ucs_server_profile_moid] = "Completed"
+            elif not ucs_server_profile_busy:
+                # A failed state from a previous deployment does not prevent the UCS Server Profile from being deployed again
+                if ucs_server_profile_failed:
+                    print(f"The UCS Server Profile named {ucs_server_profile_name} "
+                          "is in a failed state from a previous deployment and "
+                          "can be deployed again.")
+                wait_results[ucs_server_profile_moid] = "Completed"
+        # Show the progress of the UCS Server Profiles with more than one UCS Server Profile
+        if len(ucs_server_profiles) > 1 and len(wait_results) < len(ucs_server_profiles):
+            print(f"{len(wait_results)} of {len(ucs_server_profiles)} UCS "
+                  "Server Profiles have finished, please wait...")
+        if len(wait_results) == len(ucs_server_profiles):
+            continue
+        # Wait for the next poll of the UCS Server Profiles
+        remaining_wait_time = wait_deadline - time.monotonic()
+        if remaining_wait_time <= 0:
+            for ucs_server_profile_moid in ucs_server_profiles:
+                if ucs_server_profile_moid not in wait_results:
+                    print("\nA configuration error has occurred!\n")
+                    print("The UCS Server Profile named "
+                          f"{ucs_server_profiles.get(ucs_server_profile_moid)} did "
+                          f"not reach the expected state within {wait_timeout} seconds.")
+                    print("Please review the UCS Server Profile in Intersight, then "
+                          "re-attempt execution if needed.\n")
+                    wait_results[ucs_server_profile_moid] = "Timed out"
+            return wait_results
+        time.sleep(min(polling_interval, remaining_wait_time))
+        polling_interval = min(polling_interval * 2, maximum_polling_interval)
+
+
+# Establish function to wait for a UCS Server Profile to be ready for deployment or deployed
+def ucs_server_profile_state_waiter(
+    intersight_api_key_id,
+    intersight_api_key,
+    ucs_server_profile_moid,
+    ucs_server_profile_name,
+    wait_for_deployment=False,
+    deployment_request_mod_time=None,
+    wait_timeout=1800,
+    initial_polling_interval=2,
+    maximum_polling_interval=30,
+    intersight_base_url="https://www.intersight.com/api/v1",
+    preconfigured_api_client=None
+    ):
+    """This is a function to wait for a UCS Server Profile to be ready for
+    deployment or for a UCS Server Profile deployment to finish. The
+    ConfigContext and the running workflows of the UCS Server Profile are
+    polled with an exponentially increasing polling interval, so that fast
+    Servers are not kept waiting and slow Servers are not raced. To wait for
+    multiple UCS Server Profiles, use ucs_server_profiles_state_waiter.
+
+    Args:
+        intersight_api_key_id (str):
+            The ID of the Intersight API key.
+        intersight_api_key (str):
+            The system file path of the Intersight API key.
+        ucs_server_profile_moid (str):
+            The Intersight MOID of the UCS Server Profile.
+        ucs_server_profile_name (str):
+            The name of the UCS Server Profile.
+        wait_for_deployment (bool):
+            Optional; This argument sets whether to wait for a requested
+            deployment of the UCS Server Profile to finish. If set to False,
+            the function waits until the UCS Server Profile has no
+            configuration changes or workflows in progress, so that it is
+            ready for deployment. The default value is False.
+        deployment_request_mod_time (str):
+            Optional; The modification time of the UCS Server Profile returned
+            by the deployment request. The default value is None.
+        wait_timeout (int):
+            Optional; The maximum time in seconds to wait. The default value
+            is 1800 seconds.
+        initial_polling_interval (int):
+            Optional; The time in seconds between the first two polls of the
+            UCS Server Profile. The polling interval is doubled after every
+            poll. The default value is 2 seconds.
+        maximum_polling_interval (int):
+            Optional; The maximum time in seconds between two polls of the
+            UCS Server Profile. The default value is 30 seconds.
+        intersight_base_url (str):
+            Optional; The base URL for Intersight API paths. The default value
+            is "https://www.intersight.com/api/v1". This value typically only
+            needs to be changed if using the Intersight Virtual Appliance.
+        preconfigured_api_client ("ApiClient"):
+            Optional; An ApiClient class instance which handles
+            Intersight client-server communication through the use of API keys.
+            The default value is None. If a preconfigured_api_client argument
+            is provided, empty strings ("") or None can be provided for the
+            intersight_api_key_id, intersight_api_key, and intersight_base_url
+            arguments.
+
+    Returns:
+        A string of the wait result. The value is "Completed" if the UCS
+        Server Profile is ready or the deployment has finished, "Failed" if
+        the UCS Server Profile or one of its workflows has failed, or
+        "Timed out" if the wait timeout has been reached.
+    """
+    ucs_server_profile_wait_results = ucs_server_profiles_state_waiter(
+        intersight_api_key_id=intersight_api_key_id,
+        intersight_api_key=intersight_api_key,
+        ucs_server_profiles={ucs_server_profile_moid: ucs_server_profile_name},
+        wait_for_deployment=wait_for_deployment,
+        deployment_request_mod_times={ucs_server_profile_moid: deployment_request_mod_time},
+        wait_timeout=wait_timeout,
+        initial_polling_interval=initial_polling_interval,
+        maximum_polling_interval=maximum_polling_interval,
+        intersight_base_url=intersight_base_url,
+        preconfigured_api_client=preconfigured_api_client
+        )
+    return ucs_server_profile_wait_results.get(ucs_server_profile_moid)
+
+
 # Establish function to assign Server profile
 def assign_and_deploy_ucs_server_profile(
     intersight_api_key_id,
@@ -5136,8 +7415,13 @@ def assign_and_deploy_ucs_server_profile(
     ucs_server_type="FI-Attached",
     assign_ucs_server_profile=True,
     deploy_ucs_server_profile=False,
-    deployment_start_delay=5,
+    deployment_start_delay=0,
+    verify_deployment_readiness=True,
+    wait_for_deployment_completion=True,
+    deployment_wait_timeout=1800,
+    deployment_request_mod_times=None,
     ucs_server_profile_organization="default",
+    ucs_server_profile_moid=None,
     intersight_base_url="https://www.intersight.com/api/v1",
     preconfigured_api_client=None
     ):
@@ -5185,14 +7469,37 @@ def assign_and_deploy_ucs_server_profile(
             the provided UCS Server Profile to the provided Server or a
             previously assigned Server. The default value is False.
         deployment_start_delay (int):
-            Optional; This argument sets the delay time between UCS Server
-            Profile assignment and deployment. The delay allows for system time
-            that may be needed for clearing previous configurations, etc.
-            before a new UCS Server Profile may be deployed. The default value
-            is 5 seconds.
+            Optional; This argument sets an additional fixed delay time
+            between UCS Server Profile assignment and deployment. Before
+            deployment, the UCS Server Profile is always polled until it is
+            ready, so a fixed delay is normally not needed. The default value
+            is 0 seconds.
+        verify_deployment_readiness (bool):
+            Optional; This argument enables or disables the option to poll the
+            UCS Server Profile until it is ready before deployment. This can
+            be disabled if the readiness of the UCS Server Profile has already
+            been verified, such as by the ucs_server_profiles_state_waiter
+            function. The deployment start delay is also skipped if disabled.
+            The default value is True.
+        wait_for_deployment_completion (bool):
+            Optional; This argument enables or disables the option to wait
+            for the deployment of the UCS Server Profile to finish. The
+            default value is True.
+        deployment_wait_timeout (int):
+            Optional; The maximum time in seconds to wait for the UCS Server
+            Profile to be ready for deployment and, if enabled, for the
+            deployment to finish. The default value is 1800 seconds.
+        deployment_request_mod_times (dict):
+            Optional; A dictionary that the modification time returned by the
+            deployment request is added to, with the Intersight MOID of the
+            UCS Server Profile as the key. The default value is None.
         ucs_server_profile_organization (str):
             Optional; The Intersight account organization of the UCS Server
             Profile. The default value is "default".
+        ucs_server_profile_moid (str):
+            Optional; The Intersight MOID of the UCS Server Profile. The
+            default value is None. If a MOID is provided, the UCS Server
+            Profile is not retrieved again by name.
         intersight_base_url (str):
             Optional; The base URL for Intersight API paths. The default value
             is "https://www.intersight.com/api/v1". This value typically only
@@ -5204,6 +7511,14 @@ def assign_and_deploy_ucs_server_profile(
             is provided, empty strings ("") or None can be provided for the
             intersight_api_key_id, intersight_api_key, and intersight_base_url
             arguments.
+
+    Returns:
+        A string of the deployment result. The value is "Completed",
+        "Failed" or "Timed out" as returned by
+        ucs_server_profile_state_waiter, "Deployment requested" if the
+        deployment was started without waiting for it to finish,
+        "Assignment failed" if the UCS Server Profile could not be assigned,
+        or None if no deployment was requested.
     """
     def post_intersight_server_profile_update(
         server_profile_moid,
@@ -5256,47 +7571,18 @@ def assign_and_deploy_ucs_server_profile(
                                     )
     else:
         api_client = preconfigured_api_client
-    try:
-        # Retrieve the Intersight Account name
-        api_client.call_api(resource_path="/iam/Accounts",
-                            method="GET",
-                            auth_settings=['cookieAuth', 'http_signature', 'oAuth2', 'oAuth2']
-                            )
-        response = api_client.last_response.data
-        iam_account = json.loads(response)
-        if api_client.last_response.status != 200:
-            print("The provided Intersight account information could not be "
-                  "accessed.")
-            print("Exiting due to the Intersight account being unavailable.\n")
-            print("Please verify that the correct API Key ID and API Key have "
-                  "been entered, then re-attempt execution.\n")
-            sys.exit(0)
-        else:
-            intersight_account_name = iam_account["Results"][0]["Name"]
-    except Exception:
-        print("\nA configuration error has occurred!\n")
-        print("Unable to access the Intersight API.")
-        print("Exiting due to the Intersight API being unavailable.\n")
-        print("Please verify that the correct API Key ID and API Key have "
-              "been entered, then re-attempt execution.\n")
-        sys.exit(0)
+    # Retrieve the Intersight account context of the API client
+    intersight_account_context = get_intersight_account_context(api_client)
     # Get UCS Server Profile MOID
-    ucs_server_profile_moid = intersight_object_moid_retriever(intersight_api_key_id=None,
-                                                               intersight_api_key=None,
-                                                               object_name=ucs_server_profile_name,
-                                                               intersight_api_path="server/Profiles?$top=1000",
-                                                               object_type="UCS Server Profile",
-                                                               organization=ucs_server_profile_organization,
-                                                               preconfigured_api_client=api_client
-                                                               )
-    # Get UCS Server Profile object dictionary attributes
-    ucs_server_profile_object = get_single_intersight_object(intersight_api_key_id=None,
-                                                             intersight_api_key=None,
-                                                             intersight_api_path="server/Profiles",
-                                                             object_moid=ucs_server_profile_moid,
-                                                             object_type="UCS Server Profile",
-                                                             preconfigured_api_client=api_client
-                                                             )
+    if not ucs_server_profile_moid:
+        ucs_server_profile_moid = intersight_object_moid_retriever(intersight_api_key_id=None,
+                                                                   intersight_api_key=None,
+                                                                   object_name=ucs_server_profile_name,
+                                                                   intersight_api_path="server/Profiles?$top=1000",
+                                                                   object_type="UCS Server Profile",
+                                                                   organization=ucs_server_profile_organization,
+                                                                   preconfigured_api_client=api_client
+                                                                   )
     # Assign UCS Server Profile
     if assign_ucs_server_profile:
         print("\nAssigning the UCS Server Profile named "
@@ -5349,32 +7635,19 @@ def assign_and_deploy_ucs_server_profile(
                 print("Please update the configuration, then re-attempt "
                       "execution.\n")
                 sys.exit(0)
-            # Find provided Server
-            retrieved_intersight_servers = get_intersight_objects(
-                intersight_api_key_id=None,
-                intersight_api_key=None,
-                intersight_api_path=f"compute/{provided_ucs_server_form_factor}?$top=1000&$filter=ManagementMode%20eq%20%27{provided_ucs_server_management_mode}%27",
-                object_type=f"{provided_ucs_server_object_type}",
-                preconfigured_api_client=api_client
-                )
-            if retrieved_intersight_servers.get("Results"):
-                matching_intersight_server = None
-                for intersight_server in retrieved_intersight_servers.get("Results"):
-                    server_serial = intersight_server.get("Serial", "")
-                    server_name = intersight_server.get("Name", "")
-                    server_model = intersight_server.get("Model", "")
-                    server_user_label = intersight_server.get("UserLabel", "")
-                    for server_identifier in provided_server_identifiers:
-                        if server_identifier in [server_serial,
-                                                 server_name,
-                                                 server_model,
-                                                 server_user_label
-                                                 ]:
-                            matching_intersight_server = intersight_server
-                            break
-                    if matching_intersight_server:
-                        break
-                else:
+            # Find provided Server in the Server inventory shared by the API client
+            intersight_server_inventory = get_intersight_server_inventory(api_client)
+            if intersight_server_inventory.get_server_count(f"compute/{provided_ucs_server_form_factor}",
+                                                            provided_ucs_server_management_mode,
+                                                            object_type=provided_ucs_server_object_type
+                                                            ):
+                matching_intersight_server = intersight_server_inventory.find_server(
+                    f"compute/{provided_ucs_server_form_factor}",
+                    provided_ucs_server_management_mode,
+                    provided_server_identifiers,
+                    object_type=provided_ucs_server_object_type
+                    )
+                if not matching_intersight_server:
                     print("\nA configuration error has occurred!\n")
                     print("There was an issue assigning the UCS Server Profile to "
                           f"a {provided_ucs_server_object_type} in Intersight.")
@@ -5382,7 +7655,7 @@ def assign_and_deploy_ucs_server_profile(
                           f"identifier of '{ucs_server_assignment_identifier}' was "
                           "not found.")
                     print("Please check the Intersight Account named "
-                          f"{intersight_account_name}.")
+                          f"{intersight_account_context.get_account_name()}.")
                     print("Verify through the API or GUI that the needed "
                           f"{provided_ucs_server_object_type} and matching "
                           "identifier are present.")
@@ -5401,11 +7674,11 @@ def assign_and_deploy_ucs_server_profile(
                       "found.")
                 print(f"No {provided_ucs_server_object_type}s that are compatible "
                       "with the UCS Server Profile could be found in the "
-                      f"Intersight account named {intersight_account_name}.")
+                      f"Intersight account named {intersight_account_context.get_account_name()}.")
                 print(f"Compatible {provided_ucs_server_object_type}s need to be "
                       f"{provided_ucs_server_type}.")
                 print("Please check the Intersight Account named "
-                      f"{intersight_account_name}.")
+                      f"{intersight_account_context.get_account_name()}.")
                 print("Verify through the API or GUI that the needed "
                       f"{provided_ucs_server_object_type} and matching "
                       "identifier are present.")
@@ -5432,7 +7705,7 @@ def assign_and_deploy_ucs_server_profile(
                     "link": f"{intersight_base_url}/compute/Blades/{matching_intersight_server_moid}"
                     }
                 }
-            post_intersight_server_profile_update(
+            ucs_server_profile_assignment_request = post_intersight_server_profile_update(
                 server_profile_moid=ucs_server_profile_moid,
                 server_profile_api_body=ucs_server_profile_assignment_api_body
                 )
@@ -5453,47 +7726,444 @@ def assign_and_deploy_ucs_server_profile(
             ucs_server_profile_assignment_api_body["ServerPool"] = {
                 "Moid": resource_pool_moid
                 }            
-            post_intersight_server_profile_update(
+            ucs_server_profile_assignment_request = post_intersight_server_profile_update(
                 server_profile_moid=ucs_server_profile_moid,
                 server_profile_api_body=ucs_server_profile_assignment_api_body
                 )
-        # Check for provided Server Identifier or Resource Pool
-        else:
-            print("\nA configuration error has occurred!\n")
-            print("There was an issue assigning the UCS Server "
-                  "Profile in Intersight.")
-            print("In order to assign the provided UCS Server Profile, a "
-                  "Server identifier or Resource Pool must also be provided.")
-            print("Please check the value provided for the "
-                  "Server identifier or Resource Pool.")
-            print("Once the issue has been resolved, re-attempt execution.\n")
-            sys.exit(0)            
-        
-    # Deploy UCS Server Profile
-    if deploy_ucs_server_profile:
-        print("\nDeploying the UCS Server Profile named "
-              f"{ucs_server_profile_name}...")
-        if deployment_start_delay:
-            print(f"A deployment start delay of {deployment_start_delay} "
-                  "seconds has been set, please wait...\n")
-            delay_timer(deployment_start_delay)
-            print("\n")
-        # Deploy the UCS Server Profile
-        print("Deploying the UCS Server Profile...")
-        ucs_server_profile_deployment_api_body = {
-            "ScheduledActions":[
-                {"Action": "Deploy",
-                 "ProceedOnReboot": False
-                 },
-                {"Action": "Activate",
-                 "ProceedOnReboot": True
+        # Check for provided Server Identifier or Resource Pool
+        else:
+            print("\nA configuration error has occurred!\n")
+            print("There was an issue assigning the UCS Server "
+                  "Profile in Intersight.")
+            print("In order to assign the provided UCS Server Profile, a "
+                  "Server identifier or Resource Pool must also be provided.")
+            print("Please check the value provided for the "
+                  "Server identifier or Resource Pool.")
+            print("Once the issue has been resolved, re-attempt execution.\n")
+            sys.exit(0)            
+        if ucs_server_profile_assignment_request != "The POST method was successful.":
+            print(f"The UCS Server Profile named {ucs_server_profile_name} "
+                  "could not be assigned and will not be deployed.")
+            return "Assignment failed"
+        
+    # Deploy UCS Server Profile
+    if deploy_ucs_server_profile:
+        print("\nDeploying the UCS Server Profile named "
+              f"{ucs_server_profile_name}...")
+        if verify_deployment_readiness:
+            if deployment_start_delay:
+                print(f"A deployment start delay of {deployment_start_delay} "
+                      "seconds has been set, please wait...\n")
+                delay_timer(deployment_start_delay)
+                print("\n")
+            # Wait for the UCS Server Profile to be ready for deployment
+            print("Verifying that the UCS Server Profile is ready for "
+                  "deployment...")
+            ucs_server_profile_readiness = ucs_server_profile_state_waiter(
+                intersight_api_key_id=None,
+                intersight_api_key=None,
+                ucs_server_profile_moid=ucs_server_profile_moid,
+                ucs_server_profile_name=ucs_server_profile_name,
+                wait_for_deployment=False,
+                wait_timeout=deployment_wait_timeout,
+                preconfigured_api_client=api_client
+                )
+            if ucs_server_profile_readiness != "Completed":
+                print(f"The UCS Server Profile named {ucs_server_profile_name} "
+                      "will not be deployed.")
+                return ucs_server_profile_readiness
+        # Deploy the UCS Server Profile
+        print("Deploying the UCS Server Profile...")
+        ucs_server_profile_deployment_api_body = {
+            "ScheduledActions":[
+                {"Action": "Deploy",
+                 "ProceedOnReboot": False
+                 },
+                {"Action": "Activate",
+                 "ProceedOnReboot": True
+                 }
+                ]
+            }
+        ucs_server_profile_deployment_request = post_intersight_server_profile_update(
+            server_profile_moid=ucs_server_profile_moid,
+            server_profile_api_body=ucs_server_profile_deployment_api_body
+            )
+        if ucs_server_profile_deployment_request != "The POST method was successful.":
+            return "Failed"
+        ucs_server_profile_deployment_request_mod_time = json.loads(api_client.last_response.data).get("ModTime")
+        if deployment_request_mod_times is not None:
+            deployment_request_mod_times[ucs_server_profile_moid] = ucs_server_profile_deployment_request_mod_time
+        if not wait_for_deployment_completion:
+            return "Deployment requested"
+        # Wait for the deployment of the UCS Server Profile to finish
+        print("Waiting for the deployment of the UCS Server Profile to "
+              "finish...")
+        ucs_server_profile_deployment = ucs_server_profile_state_waiter(
+            intersight_api_key_id=None,
+            intersight_api_key=None,
+            ucs_server_profile_moid=ucs_server_profile_moid,
+            ucs_server_profile_name=ucs_server_profile_name,
+            wait_for_deployment=True,
+            deployment_request_mod_time=ucs_server_profile_deployment_request_mod_time,
+            wait_timeout=deployment_wait_timeout,
+            preconfigured_api_client=api_client
+            )
+        if ucs_server_profile_deployment == "Completed":
+            print(f"The deployment of the UCS Server Profile named "
+                  f"{ucs_server_profile_name} has completed.")
+        return ucs_server_profile_deployment
+
+
+# Establish function to assign and deploy multiple UCS Server Profiles in waves
+def ucs_server_profile_wave_deployer(
+    intersight_api_key_id,
+    intersight_api_key,
+    ucs_server_profile_assignments,
+    ucs_server_form_factor="Blade",
+    ucs_server_type="FI-Attached",
+    max_concurrent_requests=8,
+    concurrency_controller=None,
+    deployment_wave_size_per_chassis=2,
+    deployment_start_delay=0,
+    deployment_wait_timeout=1800,
+    ucs_server_profile_organization="default",
+    intersight_base_url="https://www.intersight.com/api/v1",
+    preconfigured_api_client=None
+    ):
+    """This is a function to assign and deploy multiple UCS Server Profiles.
+    The UCS Server Profiles are first assigned at the same time, up to the
+    provided number of concurrent requests. The assigned UCS Server Profiles
+    are then deployed in waves. Each wave deploys up to the provided number
+    of UCS Server Profiles per chassis and the next wave is started once the
+    deployments of the current wave have finished, which limits the number of
+    Servers rebooting at the same time in each chassis.
+
+    Args:
+        intersight_api_key_id (str):
+            The ID of the Intersight API key.
+        intersight_api_key (str):
+            The system file path of the Intersight API key.
+        ucs_server_profile_assignments (list):
+            A list of dictionaries containing the UCS Server Profile
+            assignments. Each dictionary contains the keys "Server Profile
+            Name" (str), "Server Resource Pool" (str), "Server Assignment
+            Identifier" (str) and "Deploy Server Profile" (bool), as used by
+            the assign_and_deploy_ucs_server_profile function.
+        ucs_server_form_factor (str):
+            Optional; The form factor of the Servers that the UCS Server
+            Profiles should be assigned to. The accepted values are "Blade" or
+            "Rack". The default value is "Blade".
+        ucs_server_type (str):
+            Optional; The UCS Server type (Target Platform) of the UCS Server
+            Profiles. The accepted values are "FI-Attached" or "Standalone".
+            The default value is "FI-Attached".
+        max_concurrent_requests (int):
+            Optional; The maximum number of UCS Server Profiles that are
+            assigned or sent a deployment request at the same time. The
+            default value is 8.
+        concurrency_controller ("IntersightConcurrencyController"):
+            Optional; An IntersightConcurrencyController class instance. If
+            provided, the number of UCS Server Profiles assigned or sent a
+            deployment request at the same time
+            follows the adaptive concurrency limit, up to the value of
+            max_concurrent_requests. The default value is None.
+        deployment_wave_size_per_chassis (int):
+            Optional; The maximum number of UCS Server Profiles deployed at
+            the same time to the Servers of each chassis. Rack Servers and
+            Servers with an unknown chassis are each deployed in the first
+            wave, as they do not share a chassis. Setting the value to 0
+            deploys all the UCS Server Profiles in one wave. The default value
+            is 2.
+        deployment_start_delay (int):
+            Optional; This argument sets an additional fixed delay time
+            between the UCS Server Profile assignments and the first
+            deployment wave. The default value is 0 seconds.
+        deployment_wait_timeout (int):
+            Optional; The maximum time in seconds to wait for the UCS Server
+            Profiles to be ready for deployment and for the deployments of
+            each wave to finish. The default value is 1800 seconds.
+        ucs_server_profile_organization (str):
+            Optional; The Intersight account organization of the UCS Server
+            Profiles. The default value is "default".
+        intersight_base_url (str):
+            Optional; The base URL for Intersight API paths. The default value
+            is "https://www.intersight.com/api/v1". This value typically only
+            needs to be changed if using the Intersight Virtual Appliance.
+        preconfigured_api_client ("ApiClient"):
+            Optional; An ApiClient class instance which handles
+            Intersight client-server communication through the use of API keys.
+            The default value is None. If a preconfigured_api_client argument
+            is provided, empty strings ("") or None can be provided for the
+            intersight_api_key_id, intersight_api_key, and intersight_base_url
+            arguments.
+
+    Returns:
+        A dictionary with the names of the UCS Server Profiles as keys and
+        the results as values. A result is "Assigned" if no deployment was
+        requested, "Assignment failed" if the assignment did not complete,
+        "Not deployed" if the deployment was not started, or "Completed",
+        "Failed" or "Timed out" as returned by
+        ucs_server_profiles_state_waiter.
+    """
+    def get_assigned_server_chassis_moids(ucs_server_profile_moids):
+        """This is a function to retrieve the chassis of the Servers assigned
+        to UCS Server Profiles with one "Moid in" filtered query per chunk of
+        UCS Server Profiles.
+
+        Args:
+            ucs_server_profile_moids (list):
+                A list of the Intersight MOIDs of the UCS Server Profiles.
+
+        Returns:
+            A dictionary with the Intersight MOIDs of the UCS Server Profiles
+            as keys and the Intersight MOIDs of the chassis of the assigned
+            Servers as values. The value is None for Rack Servers and for
+            UCS Server Profiles that could not be retrieved.
+        """
+        assigned_server_chassis_moids = dict.fromkeys(ucs_server_profile_moids)
+        if ucs_server_form_factor != "Blade":
+            return assigned_server_chassis_moids
+        for chunk_start in range(0, len(ucs_server_profile_moids), 50):
+            ucs_server_profile_moid_chunk = ucs_server_profile_moids[chunk_start:chunk_start + 50]
+            moid_filter_expression = "Moid in ({})".format(
+                ",".join(f"'{ucs_server_profile_moid}'" for ucs_server_profile_moid in ucs_server_profile_moid_chunk)
+                )
+            full_intersight_api_path = (
+                f"/server/Profiles?$top={len(ucs_server_profile_moid_chunk)}"
+                f"&$filter={urllib.parse.quote(moid_filter_expression, safe='')}"
+                "&$select=Moid,AssignedServer"
+                f"&$expand={urllib.parse.quote('AssignedServer($select=EquipmentChassis)', safe='')}"
+                )
+            try:
+                api_client.call_api(resource_path=full_intersight_api_path,
+                                    method="GET",
+                                    auth_settings=['cookieAuth', 'http_signature', 'oAuth2', 'oAuth2']
+                                    )
+                ucs_server_profile_objects = json.loads(api_client.last_response.data)
+            except Exception:
+                print("\nA configuration error has occurred!\n")
+                print("Unable to retrieve the chassis of the assigned Servers "
+                      "for the deployment waves.")
+                print("The affected UCS Server Profiles will each be "
+                      "deployed in the first wave without a chassis.\n")
+                continue
+            for ucs_server_profile_object in ucs_server_profile_objects.get("Results") or []:
+                assigned_server = ucs_server_profile_object.get("AssignedServer") or {}
+                assigned_server_chassis = assigned_server.get("EquipmentChassis") or {}
+                assigned_server_chassis_moids[ucs_server_profile_object.get("Moid")] = assigned_server_chassis.get("Moid")
+        return assigned_server_chassis_moids
+
+    # Define Intersight SDK ApiClient variable
+    if preconfigured_api_client is None:
+        api_client = get_api_client(api_key_id=intersight_api_key_id,
+                                    api_secret_file=intersight_api_key,
+                                    endpoint=intersight_base_url
+                                    )
+    else:
+        api_client = preconfigured_api_client
+    ucs_server_profile_results = {}
+    ucs_server_profile_moids = {}
+    # Retrieve the MOID of each UCS Server Profile once
+    for ucs_server_profile_assignment in ucs_server_profile_assignments:
+        ucs_server_profile_name = ucs_server_profile_assignment["Server Profile Name"]
+        ucs_server_profile_moids[ucs_server_profile_name] = intersight_object_moid_retriever(
+            intersight_api_key_id=None,
+            intersight_api_key=None,
+            object_name=ucs_server_profile_name,
+            intersight_api_path="server/Profiles?$top=1000",
+            object_type="UCS Server Profile",
+            organization=ucs_server_profile_organization,
+            preconfigured_api_client=api_client
+            )
+
+    def ucs_server_profile_assigner(**assignment_arguments):
+        """This is a function to assign a UCS Server Profile and keep the
+        result of the assignment.
+
+        Args:
+            **assignment_arguments:
+                The keyword arguments for the
+                assign_and_deploy_ucs_server_profile function.
+        """
+        ucs_server_profile_assignment_statuses[assignment_arguments["ucs_server_profile_name"]] = assign_and_deploy_ucs_server_profile(**assignment_arguments)
+
+    # Assign the UCS Server Profiles at the same time
+    ucs_server_profile_assignment_statuses = {}
+    print(f"\nAssigning {len(ucs_server_profile_assignments)} UCS Server "
+          f"Profile(s) with up to {max_concurrent_requests} UCS Server "
+          "Profile(s) at a time, please wait...")
+    ucs_server_profile_assignment_results = deployment_task_runner(
+        deployment_tasks=[
+            {"Task Name": ucs_server_profile_assignment["Server Profile Name"],
+             "Task Function": ucs_server_profile_assigner,
+             "Task Arguments": {
+                 "intersight_api_key_id": None,
+                 "intersight_api_key": None,
+                 "ucs_server_profile_name": ucs_server_profile_assignment["Server Profile Name"],
+                 "ucs_server_profile_moid": ucs_server_profile_moids[ucs_server_profile_assignment["Server Profile Name"]],
+                 "resource_pool_name": ucs_server_profile_assignment.get("Server Resource Pool"),
+                 "ucs_server_assignment_identifier": ucs_server_profile_assignment.get("Server Assignment Identifier"),
+                 "ucs_server_form_factor": ucs_server_form_factor,
+                 "ucs_server_type": ucs_server_type,
+                 "assign_ucs_server_profile": True,
+                 "deploy_ucs_server_profile": False,
+                 "ucs_server_profile_organization": ucs_server_profile_organization,
+                 "preconfigured_api_client": api_client
                  }
-                ]
+             }
+            for ucs_server_profile_assignment in ucs_server_profile_assignments
+            ],
+        max_concurrent_tasks=max_concurrent_requests,
+        concurrency_controller=concurrency_controller
+        )
+    for ucs_server_profile_assignment in ucs_server_profile_assignments:
+        ucs_server_profile_name = ucs_server_profile_assignment["Server Profile Name"]
+        if (
+            ucs_server_profile_name not in ucs_server_profile_assignment_results["Completed Tasks"] or
+            ucs_server_profile_assignment_statuses.get(ucs_server_profile_name) == "Assignment failed"
+            ):
+            ucs_server_profile_results[ucs_server_profile_name] = "Assignment failed"
+        elif not ucs_server_profile_assignment.get("Deploy Server Profile"):
+            ucs_server_profile_results[ucs_server_profile_name] = "Assigned"
+    deployment_ucs_server_profiles = {
+        ucs_server_profile_moids[ucs_server_profile_assignment["Server Profile Name"]]: ucs_server_profile_assignment["Server Profile Name"]
+        for ucs_server_profile_assignment in ucs_server_profile_assignments
+        if ucs_server_profile_assignment["Server Profile Name"] not in ucs_server_profile_results
+        }
+    if ucs_server_profile_assignment_results["Exit Requested"] or not deployment_ucs_server_profiles:
+        for ucs_server_profile_name in deployment_ucs_server_profiles.values():
+            ucs_server_profile_results[ucs_server_profile_name] = "Not deployed"
+        return ucs_server_profile_results
+
+    # Wait for the assigned UCS Server Profiles to be ready for deployment
+    if deployment_start_delay:
+        print("\nA UCS Server Profile Deployment start delay of "
+              f"{deployment_start_delay} seconds has been set, please "
+              "wait...\n")
+        delay_timer(deployment_start_delay)
+        print("\n")
+    print(f"\nVerifying that {len(deployment_ucs_server_profiles)} UCS Server "
+          "Profile(s) are ready for deployment...")
+    ucs_server_profile_readiness = ucs_server_profiles_state_waiter(
+        intersight_api_key_id=None,
+        intersight_api_key=None,
+        ucs_server_profiles=deployment_ucs_server_profiles,
+        wait_for_deployment=False,
+        wait_timeout=deployment_wait_timeout,
+        preconfigured_api_client=api_client
+        )
+    ready_ucs_server_profile_moids = []
+    for ucs_server_profile_moid, ucs_server_profile_name in deployment_ucs_server_profiles.items():
+        if ucs_server_profile_readiness.get(ucs_server_profile_moid) == "Completed":
+            ready_ucs_server_profile_moids.append(ucs_server_profile_moid)
+        else:
+            print(f"The UCS Server Profile named {ucs_server_profile_name} "
+                  "will not be deployed.")
+            ucs_server_profile_results[ucs_server_profile_name] = ucs_server_profile_readiness.get(ucs_server_profile_moid)
+
+    # Group the UCS Server Profiles into deployment waves by the chassis of the assigned Servers
+    # UCS Server Profiles without a chassis, such as those of Rack Servers, are each placed in a group of their own
+    assigned_server_chassis_moids = get_assigned_server_chassis_moids(ready_ucs_server_profile_moids)
+    chassis_ucs_server_profile_moids = {}
+    for ucs_server_profile_moid in ready_ucs_server_profile_moids:
+        chassis_ucs_server_profile_moids.setdefault(assigned_server_chassis_moids.get(ucs_server_profile_moid) or ucs_server_profile_moid, []).append(ucs_server_profile_moid)
+    if deployment_wave_size_per_chassis:
+        deployment_wave_count = max((len(chassis_moids) for chassis_moids in chassis_ucs_server_profile_moids.values()), default=0)
+        deployment_wave_count = -(-deployment_wave_count // deployment_wave_size_per_chassis)
+        deployment_waves = [
+            [ucs_server_profile_moid
+             for chassis_moids in chassis_ucs_server_profile_moids.values()
+             for ucs_server_profile_moid in chassis_moids[wave_index * deployment_wave_size_per_chassis:(wave_index + 1) * deployment_wave_size_per_chassis]
+             ]
+            for wave_index in range(deployment_wave_count)
+            ]
+    else:
+        deployment_waves = [ready_ucs_server_profile_moids] if ready_ucs_server_profile_moids else []
+
+    def ucs_server_profile_deployment_requester(**deployment_request_arguments):
+        """This is a function to send a deployment request for a UCS Server
+        Profile, within the adaptive concurrency limit if provided.
+
+        Args:
+            **deployment_request_arguments:
+                The keyword arguments for the
+                assign_and_deploy_ucs_server_profile function.
+
+        Returns:
+            The result of the assign_and_deploy_ucs_server_profile function.
+        """
+        if concurrency_controller is None:
+            deployment_request_result = assign_and_deploy_ucs_server_profile(**deployment_request_arguments)
+        else:
+            with concurrency_controller:
+                deployment_request_result = assign_and_deploy_ucs_server_profile(**deployment_request_arguments)
+            concurrency_controller.record_completion(deployment_request_result == "Deployment requested")
+        return deployment_request_result
+
+    # Deploy the UCS Server Profiles wave by wave
+    deployment_request_mod_times = {}
+    for wave_index, deployment_wave in enumerate(deployment_waves, start=1):
+        print(f"\nStarting deployment wave {wave_index} of "
+              f"{len(deployment_waves)} with {len(deployment_wave)} UCS Server "
+              "Profile(s)...")
+        deployment_wave_results = {}
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max(1, max_concurrent_requests)) as executor:
+            deployment_requests = {
+                executor.submit(ucs_server_profile_deployment_requester,
+                                intersight_api_key_id=None,
+                                intersight_api_key=None,
+                                ucs_server_profile_name=deployment_ucs_server_profiles[ucs_server_profile_moid],
+                                ucs_server_profile_moid=ucs_server_profile_moid,
+                                ucs_server_form_factor=ucs_server_form_factor,
+                                ucs_server_type=ucs_server_type,
+                                assign_ucs_server_profile=False,
+                                deploy_ucs_server_profile=True,
+                                verify_deployment_readiness=False,
+                                wait_for_deployment_completion=False,
+                                deployment_wait_timeout=deployment_wait_timeout,
+                                deployment_request_mod_times=deployment_request_mod_times,
+                                ucs_server_profile_organization=ucs_server_profile_organization,
+                                preconfigured_api_client=api_client
+                                ): ucs_server_profile_moid
+                for ucs_server_profile_moid in deployment_wave
+                }
+            for deployment_request in concurrent.futures.as_completed(deployment_requests):
+                ucs_server_profile_moid = deployment_requests[deployment_request]
+                try:
+                    deployment_request_result = deployment_request.result()
+                except Exception:
+                    print("\nA configuration error has occurred!\n")
+                    print("Unable to deploy the UCS Server Profile named "
+                          f"{deployment_ucs_server_profiles[ucs_server_profile_moid]}.")
+                    print("Exception Message: ")
+                    traceback.print_exc()
+                    deployment_request_result = "Failed"
+                except SystemExit:
+                    deployment_request_result = "Failed"
+                if deployment_request_result == "Deployment requested":
+                    deployment_wave_results[ucs_server_profile_moid] = None
+                else:
+                    ucs_server_profile_results[deployment_ucs_server_profiles[ucs_server_profile_moid]] = deployment_request_result or "Not deployed"
+        # Wait for the deployments of the wave to finish before starting the next wave
+        if deployment_wave_results:
+            print(f"\nWaiting for the deployment of {len(deployment_wave_results)} "
+                  f"UCS Server Profile(s) in wave {wave_index} to finish...")
+            deployment_wave_results = ucs_server_profiles_state_waiter(
+                intersight_api_key_id=None,
+                intersight_api_key=None,
+                ucs_server_profiles={ucs_server_profile_moid: deployment_ucs_server_profiles[ucs_server_profile_moid]
+                                     for ucs_server_profile_moid in deployment_wave_results
+                                     },
+                wait_for_deployment=True,
+                deployment_request_mod_times=deployment_request_mod_times,
+                wait_timeout=deployment_wait_timeout,
+                preconfigured_api_client=api_client
+                )
+            for ucs_server_profile_moid, deployment_wave_result in deployment_wave_results.items():
+                ucs_server_profile_results[deployment_ucs_server_profiles[ucs_server_profile_moid]] = deployment_wave_result
+    return {ucs_server_profile_assignment["Server Profile Name"]: ucs_server_profile_results.get(ucs_server_profile_assignment["Server Profile Name"], "Not deployed")
+            for ucs_server_profile_assignment in ucs_server_profile_assignments
             }
-        post_intersight_server_profile_update(
-            server_profile_moid=ucs_server_profile_moid,
-            server_profile_api_body=ucs_server_profile_deployment_api_body
-            )
 
 
 # Establish classes and functions to make UCS Server Profile Template
@@ -5585,14 +8255,46 @@ class UcsServerProfileTemplate:
                 The status code or error message will be specified.
         """
         full_intersight_api_path = f"/{self.intersight_api_path}"
+        # Skip the object if it was configured in the previous run of a resumed deployment
+        if intersight_deployment_journal_checker(api_client=self.api_client,
+                                                 object_type=self.object_type,
+                                                 object_name=self.intersight_api_body.get("Name"),
+                                                 organization=self.organization
+                                                 ):
+            return "The POST method was successful."
+        # Compare the provided configuration with any pre-existing object and update only the changed attributes
+        intersight_object_update_status = intersight_object_updater(api_client=self.api_client,
+                                                                    intersight_api_path=self.intersight_api_path,
+                                                                    intersight_api_body=self.intersight_api_body,
+                                                                    object_type=self.object_type
+                                                                    )
+        if intersight_object_update_status is not None:
+            if intersight_object_update_status in ("The POST method was successful.", "The object is unchanged."):
+                intersight_deployment_journal_recorder(api_client=self.api_client,
+                                                       intersight_api_path=self.intersight_api_path,
+                                                       intersight_api_body=self.intersight_api_body,
+                                                       object_type=self.object_type,
+                                                       organization=self.organization
+                                                       )
+            return intersight_object_update_status
         try:
             self.api_client.call_api(resource_path=full_intersight_api_path,
                                      method="POST",
                                      body=self.intersight_api_body,
                                      auth_settings=['cookieAuth', 'http_signature', 'oAuth2', 'oAuth2']
                                      )
+            # Invalidate any cached MOID for the newly configured object
+            get_intersight_moid_cache(self.api_client).invalidate(self.intersight_api_path,
+                                                                   object_name=self.intersight_api_body.get("Name")
+                                                                   )
             print(f"The configuration of the base {self.object_type} "
                   "has completed.")
+            intersight_deployment_journal_recorder(api_client=self.api_client,
+                                                   intersight_api_path=self.intersight_api_path,
+                                                   intersight_api_body=self.intersight_api_body,
+                                                   object_type=self.object_type,
+                                                   organization=self.organization
+                                                   )
             return "The POST method was successful."
         except intersight.exceptions.ApiException as error:
             if error.status == 409:
@@ -5621,6 +8323,12 @@ class UcsServerProfileTemplate:
                           "completed.")
                     print(f"The pre-existing {existing_intersight_object_name} "
                           "has been updated.")
+                    intersight_deployment_journal_recorder(api_client=self.api_client,
+                                                           intersight_api_path=self.intersight_api_path,
+                                                           intersight_api_body=self.intersight_api_body,
+                                                           object_type=self.object_type,
+                                                           organization=self.organization
+                                                           )
                     return "The POST method was successful."
                 except Exception:
                     print("\nA configuration error has occurred!\n")
@@ -10046,14 +12754,46 @@ class IpPool:
                 The status code or error message will be specified.
         """
         full_intersight_api_path = f"/{self.intersight_api_path}"
+        # Skip the object if it was configured in the previous run of a resumed deployment
+        if intersight_deployment_journal_checker(api_client=self.api_client,
+                                                 object_type=self.object_type,
+                                                 object_name=self.intersight_api_body.get("Name"),
+                                                 organization=self.organization
+                                                 ):
+            return "The POST method was successful."
+        # Compare the provided configuration with any pre-existing object and update only the changed attributes
+        intersight_object_update_status = intersight_object_updater(api_client=self.api_client,
+                                                                    intersight_api_path=self.intersight_api_path,
+                                                                    intersight_api_body=self.intersight_api_body,
+                                                                    object_type=self.object_type
+                                                                    )
+        if intersight_object_update_status is not None:
+            if intersight_object_update_status in ("The POST method was successful.", "The object is unchanged."):
+                intersight_deployment_journal_recorder(api_client=self.api_client,
+                                                       intersight_api_path=self.intersight_api_path,
+                                                       intersight_api_body=self.intersight_api_body,
+                                                       object_type=self.object_type,
+                                                       organization=self.organization
+                                                       )
+            return intersight_object_update_status
         try:
             self.api_client.call_api(resource_path=full_intersight_api_path,
                                      method="POST",
                                      body=self.intersight_api_body,
                                      auth_settings=['cookieAuth', 'http_signature', 'oAuth2', 'oAuth2']
                                      )
+            # Invalidate any cached MOID for the newly configured object
+            get_intersight_moid_cache(self.api_client).invalidate(self.intersight_api_path,
+                                                                   object_name=self.intersight_api_body.get("Name")
+                                                                   )
             print(f"The configuration of the base {self.object_type} "
                   "has completed.")
+            intersight_deployment_journal_recorder(api_client=self.api_client,
+                                                   intersight_api_path=self.intersight_api_path,
+                                                   intersight_api_body=self.intersight_api_body,
+                                                   object_type=self.object_type,
+                                                   organization=self.organization
+                                                   )
             return "The POST method was successful."
         except intersight.exceptions.ApiException as error:
             if error.status == 409:
@@ -10082,6 +12822,12 @@ class IpPool:
                           "completed.")
                     print(f"The pre-existing {existing_intersight_object_name} "
                           "has been updated.")
+                    intersight_deployment_journal_recorder(api_client=self.api_client,
+                                                           intersight_api_path=self.intersight_api_path,
+                                                           intersight_api_body=self.intersight_api_body,
+                                                           object_type=self.object_type,
+                                                           organization=self.organization
+                                                           )
                     return "The POST method was successful."
                 except Exception:
                     print("\nA configuration error has occurred!\n")
@@ -13943,7 +16689,8 @@ class ResourcePool:
                  rack_server_resources_list=None,
                  ucs_server_type="FI-Attached",
                  resource_type="Server",
-                 pool_type="Static"
+                 pool_type="Static",
+                 server_side_selectors=False
                  ):
         self.intersight_api_key_id = intersight_api_key_id
         self.intersight_api_key = intersight_api_key
@@ -13978,6 +16725,9 @@ class ResourcePool:
         self.ucs_server_type = ucs_server_type
         self.resource_type = resource_type
         self.pool_type = pool_type
+        self.server_side_selectors = server_side_selectors
+        self.chassis_resource_indexes = None
+        self.domain_registration_moids = None
         self.intersight_api_body = {
             "Name": self.pool_name,
             "Description": self.pool_description,
@@ -14002,7 +16752,8 @@ class ResourcePool:
             f"{self.rack_server_resources_list}, "
             f"'{self.ucs_server_type}', "
             f"'{self.resource_type}', "
-            f"'{self.pool_type}')"
+            f"'{self.pool_type}', "
+            f"{self.server_side_selectors})"
             )
 
     def __str__(self):
@@ -14022,14 +16773,47 @@ class ResourcePool:
                 The status code or error message will be specified.
         """
         full_intersight_api_path = f"/{self.intersight_api_path}"
+        # Skip the object if it was configured in the previous run of a resumed deployment
+        if intersight_deployment_journal_checker(api_client=self.api_client,
+                                                 object_type=self.object_type,
+                                                 object_name=self.intersight_api_body.get("Name"),
+                                                 organization=self.organization
+                                                 ):
+            return "The POST method was successful."
+        # Compare the provided configuration with any pre-existing object and update only the changed attributes
+        intersight_object_update_status = intersight_object_updater(api_client=self.api_client,
+                                                                    intersight_api_path=self.intersight_api_path,
+                                                                    intersight_api_body=self.intersight_api_body,
+                                                                    object_type=self.object_type,
+                                                                    update_api_body_maker=self._resource_pool_update_api_body_maker
+                                                                    )
+        if intersight_object_update_status is not None:
+            if intersight_object_update_status in ("The POST method was successful.", "The object is unchanged."):
+                intersight_deployment_journal_recorder(api_client=self.api_client,
+                                                       intersight_api_path=self.intersight_api_path,
+                                                       intersight_api_body=self.intersight_api_body,
+                                                       object_type=self.object_type,
+                                                       organization=self.organization
+                                                       )
+            return intersight_object_update_status
         try:
             self.api_client.call_api(resource_path=full_intersight_api_path,
                                      method="POST",
                                      body=self.intersight_api_body,
                                      auth_settings=['cookieAuth', 'http_signature', 'oAuth2', 'oAuth2']
                                      )
+            # Invalidate any cached MOID for the newly configured object
+            get_intersight_moid_cache(self.api_client).invalidate(self.intersight_api_path,
+                                                                   object_name=self.intersight_api_body.get("Name")
+                                                                   )
             print(f"The configuration of the base {self.object_type} "
                   "has completed.")
+            intersight_deployment_journal_recorder(api_client=self.api_client,
+                                                   intersight_api_path=self.intersight_api_path,
+                                                   intersight_api_body=self.intersight_api_body,
+                                                   object_type=self.object_type,
+                                                   organization=self.organization
+                                                   )
             return "The POST method was successful."
         except intersight.exceptions.ApiException as error:
             if error.status == 409:
@@ -14039,25 +16823,40 @@ class ResourcePool:
                 print("An attempt will be made to update the pre-existing "
                       f"{existing_intersight_object_name}...")
                 try:
-                    existing_intersight_object_moid = intersight_object_moid_retriever(intersight_api_key_id=None,
-                                                                                       intersight_api_key=None,
-                                                                                       object_name=existing_intersight_object_name,
-                                                                                       intersight_api_path=f"{self.intersight_api_path}?$top=1000",
-                                                                                       object_type=self.object_type,
-                                                                                       organization=self.organization,
-                                                                                       preconfigured_api_client=self.api_client
-                                                                                       )
+                    # Retrieve the current membership of the existing object once
+                    existing_resource_pool = self._get_existing_resource_pool()
+                    if existing_resource_pool:
+                        existing_intersight_object_moid = existing_resource_pool.get("Moid")
+                        resource_pool_update_api_body = self._resource_pool_update_api_body_maker(
+                            existing_resource_pool
+                            )
+                    else:
+                        existing_intersight_object_moid = intersight_object_moid_retriever(intersight_api_key_id=None,
+                                                                                           intersight_api_key=None,
+                                                                                           object_name=existing_intersight_object_name,
+                                                                                           intersight_api_path=f"{self.intersight_api_path}?$top=1000",
+                                                                                           object_type=self.object_type,
+                                                                                           organization=self.organization,
+                                                                                           preconfigured_api_client=self.api_client
+                                                                                           )
+                        resource_pool_update_api_body = self.intersight_api_body
                     # Update full Intersight API path with the MOID of the existing object
                     full_intersight_api_path_with_moid = f"/{self.intersight_api_path}/{existing_intersight_object_moid}"
                     self.api_client.call_api(resource_path=full_intersight_api_path_with_moid,
                                              method="POST",
-                                             body=self.intersight_api_body,
+                                             body=resource_pool_update_api_body,
                                              auth_settings=['cookieAuth', 'http_signature', 'oAuth2', 'oAuth2']
                                              )
                     print(f"The update of the {self.object_type} has "
                           "completed.")
                     print(f"The pre-existing {existing_intersight_object_name} "
                           "has been updated.")
+                    intersight_deployment_journal_recorder(api_client=self.api_client,
+                                                           intersight_api_path=self.intersight_api_path,
+                                                           intersight_api_body=self.intersight_api_body,
+                                                           object_type=self.object_type,
+                                                           organization=self.organization
+                                                           )
                     return "The POST method was successful."
                 except Exception:
                     print("\nA configuration error has occurred!\n")
@@ -14086,6 +16885,101 @@ class ResourcePool:
             traceback.print_exc()
             return "The POST method failed."
 
+    def _get_existing_resource_pool(self):
+        """This function retrieves the MOID and the Selectors of the
+        pre-existing Resource Pool with the same name and organization, using
+        one filtered query.
+
+        Returns:
+            A dictionary of the pre-existing Resource Pool. If the Resource
+            Pool is not found, None is returned.
+        """
+        retrieved_resource_pools = get_intersight_objects(
+            intersight_api_key_id=None,
+            intersight_api_key=None,
+            intersight_api_path=self.intersight_api_path,
+            object_type=self.object_type,
+            preconfigured_api_client=self.api_client,
+            filter_attributes={
+                "Name": self.intersight_api_body.get("Name"),
+                "Organization": self.intersight_api_body.get("Organization")
+                },
+            select_attributes=["Moid", "Selectors"]
+            )
+        retrieved_resource_pool_results = retrieved_resource_pools.get("Results") or []
+        if retrieved_resource_pool_results:
+            return retrieved_resource_pool_results[0]
+        return None
+
+    def _get_selector_membership(self,
+                                 selectors
+                                 ):
+        """This function extracts the Server MOIDs from a list of Resource
+        Pool Selectors.
+
+        Args:
+            selectors (list):
+                A list of the Resource Pool Selectors.
+
+        Returns:
+            A tuple containing a dictionary with the Intersight API paths of
+            the Servers (e.g. "compute/Blades") as keys and sets of the Server
+            MOIDs as values, and a set of any Selectors that are not a list of
+            Server MOIDs, such as server-side Selectors.
+        """
+        selector_server_moids = {}
+        other_selectors = set()
+        for selector in selectors:
+            selector_string = selector.get("Selector", "")
+            selector_match = re.fullmatch(r"/api/v1/(compute/\w+)\?\$filter=\(Moid in \(([^)]*)\)\)", selector_string)
+            if selector_match:
+                selector_server_moids.setdefault(selector_match.group(1), set()).update(
+                    server_moid for server_moid in re.findall(r"'([^']*)'", selector_match.group(2)) if server_moid
+                    )
+            else:
+                other_selectors.add(selector_string)
+        return selector_server_moids, other_selectors
+
+    def _resource_pool_update_api_body_maker(self,
+                                             existing_resource_pool
+                                             ):
+        """This function compares the Server membership of the Resource Pool
+        with the membership of the pre-existing Resource Pool. The added and
+        removed Server MOIDs are reported and the Selectors are only included
+        in the update if the membership has changed.
+
+        Args:
+            existing_resource_pool (dict):
+                A dictionary of the pre-existing Resource Pool, including the
+                Selectors.
+
+        Returns:
+            A dictionary of the Intersight API body for the update of the
+            pre-existing Resource Pool.
+        """
+        server_object_types = {
+            "compute/Blades": "Blade Server",
+            "compute/RackUnits": "Rack Server"
+            }
+        existing_server_moids, existing_other_selectors = self._get_selector_membership(existing_resource_pool.get("Selectors") or [])
+        staged_server_moids, staged_other_selectors = self._get_selector_membership(self.intersight_api_body.get("Selectors", []))
+        resource_pool_membership_changed = existing_other_selectors != staged_other_selectors
+        for server_api_path in sorted(set(existing_server_moids) | set(staged_server_moids)):
+            added_server_moids = staged_server_moids.get(server_api_path, set()) - existing_server_moids.get(server_api_path, set())
+            removed_server_moids = existing_server_moids.get(server_api_path, set()) - staged_server_moids.get(server_api_path, set())
+            if added_server_moids or removed_server_moids:
+                resource_pool_membership_changed = True
+                print(f"{len(added_server_moids)} "
+                      f"{server_object_types.get(server_api_path, server_api_path)}(s) "
+                      f"will be added and {len(removed_server_moids)} will be "
+                      f"removed from the {self.object_type}.")
+        resource_pool_update_api_body = dict(self.intersight_api_body)
+        if not resource_pool_membership_changed:
+            print(f"The Server membership of the {self.object_type} is "
+                  "unchanged.")
+            resource_pool_update_api_body.pop("Selectors", None)
+        return resource_pool_update_api_body
+
     def _update_api_body_general_attributes(self):
         """This function updates the Intersight API body with general
         attributes for the Intersight object.
@@ -14329,6 +17223,257 @@ class ResourcePool:
                 # Update Intersight API body with the converted object variable value
                 self.intersight_api_body[object_variable["AttributeName"]] = backend_object_variable_value
 
+    def _get_chassis_resource_indexes(self):
+        """This function retrieves the Chassis and the Blade Servers under
+        Intersight Managed Mode from Intersight once and indexes them by the
+        MOID of the domain registration (RegisteredDevice), the Chassis ID and
+        the Slot ID, so that each provided Chassis or Blade Server resource is
+        resolved with lookups instead of repeated searches.
+
+        Returns:
+            A dictionary containing the retrieved "Chassis" (list) and "Blade
+            Servers" (list), along with the indexes of the Blade Server MOIDs.
+            Each index is a dictionary with the lookup keys as keys and lists
+            of Blade Server MOIDs as values.
+        """
+        if self.chassis_resource_indexes is not None:
+            return self.chassis_resource_indexes
+        retrieved_intersight_chassis = get_intersight_objects(
+            intersight_api_key_id=None,
+            intersight_api_key=None,
+            intersight_api_path="equipment/Chasses",
+            object_type="Chassis",
+            preconfigured_api_client=self.api_client,
+            select_attributes=["Moid", "ChassisId", "Serial", "ManagementMode", "RegisteredDevice", "Blades"]
+            )
+        retrieved_intersight_blade_servers = get_intersight_objects(
+            intersight_api_key_id=None,
+            intersight_api_key=None,
+            intersight_api_path="compute/Blades",
+            object_type="Blade Server",
+            preconfigured_api_client=self.api_client,
+            filter_attributes={"ManagementMode": "Intersight"},
+            select_attributes=["Moid", "Name", "Serial", "ChassisId", "SlotId", "EquipmentChassis"]
+            )
+        chassis_resource_indexes = {
+            "Chassis": retrieved_intersight_chassis.get("Results") or [],
+            "Blade Servers": retrieved_intersight_blade_servers.get("Results") or [],
+            "Chassis by Domain": {},
+            "Chassis by Domain and Chassis ID": {},
+            "Chassis by Chassis ID": {},
+            "Chassis by Serial": {},
+            "Blade Servers by Domain, Chassis ID and Slot ID": {},
+            "Blade Servers by Domain and Slot ID": {},
+            "Blade Servers by Chassis ID and Slot ID": {},
+            "Blade Servers by Slot ID": {},
+            "Blade Servers by Name": {},
+            "Blade Servers by Serial": {}
+            }
+
+        def add_to_index(index_name, index_key, blade_server_moids):
+            """This is a function to add Blade Server MOIDs to an index.
+
+            Args:
+                index_name (str):
+                    The name of the index.
+                index_key (tuple):
+                    The lookup key of the Blade Server MOIDs.
+                blade_server_moids (list):
+                    A list of the Blade Server MOIDs to be added.
+            """
+            chassis_resource_indexes[index_name].setdefault(index_key, []).extend(blade_server_moids)
+
+        # Index the Blade Servers of each Chassis
+        chassis_by_moid = {}
+        for chassis in chassis_resource_indexes["Chassis"]:
+            chassis_by_moid[chassis.get("Moid")] = chassis
+            chassis_domain_moid = (chassis.get("RegisteredDevice") or {}).get("Moid")
+            chassis_blade_server_moids = [chassis_blade_server["Moid"] for chassis_blade_server in chassis.get("Blades") or []]
+            add_to_index("Chassis by Serial", chassis.get("Serial"), chassis_blade_server_moids)
+            if chassis.get("ManagementMode") == "Intersight":
+                add_to_index("Chassis by Domain", chassis_domain_moid, chassis_blade_server_moids)
+                add_to_index("Chassis by Domain and Chassis ID", (chassis_domain_moid, chassis.get("ChassisId")), chassis_blade_server_moids)
+                add_to_index("Chassis by Chassis ID", chassis.get("ChassisId"), chassis_blade_server_moids)
+        # Index each Blade Server by the domain registration of its Chassis, Chassis ID and Slot ID
+        for blade_server in chassis_resource_indexes["Blade Servers"]:
+            blade_server_moid = [blade_server["Moid"]]
+            blade_server_chassis = chassis_by_moid.get((blade_server.get("EquipmentChassis") or {}).get("Moid"), {})
+            blade_server_domain_moid = (blade_server_chassis.get("RegisteredDevice") or {}).get("Moid")
+            blade_server_chassis_id = int(blade_server.get("ChassisId") or 0)
+            blade_server_slot_id = blade_server.get("SlotId")
+            add_to_index("Blade Servers by Name", blade_server.get("Name"), blade_server_moid)
+            add_to_index("Blade Servers by Serial", blade_server.get("Serial"), blade_server_moid)
+            add_to_index("Blade Servers by Slot ID", blade_server_slot_id, blade_server_moid)
+            add_to_index("Blade Servers by Domain and Slot ID", (blade_server_domain_moid, blade_server_slot_id), blade_server_moid)
+            if blade_server_chassis.get("ManagementMode") == "Intersight":
+                add_to_index("Blade Servers by Chassis ID and Slot ID", (blade_server_chassis_id, blade_server_slot_id), blade_server_moid)
+                add_to_index("Blade Servers by Domain, Chassis ID and Slot ID", (blade_server_domain_moid, blade_server_chassis_id, blade_server_slot_id), blade_server_moid)
+        self.chassis_resource_indexes = chassis_resource_indexes
+        return chassis_resource_indexes
+
+    def _get_domain_registration_moid(self,
+                                      domain_name
+                                      ):
+        """This function returns the MOID of the domain registration for a
+        provided Domain Name. The domain registrations are retrieved from
+        Intersight once and indexed by hostname.
+
+        Args:
+            domain_name (str):
+                The Domain Name of the Chassis.
+
+        Returns:
+            A string of the MOID of the domain registration.
+        """
+        if self.domain_registration_moids is None:
+            retrieved_intersight_domain_registrations = get_intersight_objects(
+                intersight_api_key_id=None,
+                intersight_api_key=None,
+                intersight_api_path="asset/DeviceRegistrations",
+                object_type="Domain Name",
+                preconfigured_api_client=self.api_client,
+                select_attributes=["Moid", "DeviceHostname"]
+                )
+            self.domain_registration_moids = {}
+            for domain_registration in retrieved_intersight_domain_registrations.get("Results") or []:
+                self.domain_registration_moids.setdefault(tuple(domain_registration.get("DeviceHostname") or []),
+                                                          domain_registration.get("Moid")
+                                                          )
+        domain_registration_moid = self.domain_registration_moids.get((domain_name,))
+        if domain_registration_moid is None:
+            # Retrieve the domain registration by name to report a missing Domain Name
+            domain_registration_moid = advanced_intersight_object_moid_retriever(
+                intersight_api_key_id=None,
+                intersight_api_key=None,
+                object_attributes={
+                    "DeviceHostname": [domain_name]
+                    },
+                intersight_api_path="asset/DeviceRegistrations?$top=1000",
+                object_type="Domain Name",
+                organization=self.organization,
+                preconfigured_api_client=self.api_client
+                )
+            self.domain_registration_moids[(domain_name,)] = domain_registration_moid
+        return domain_registration_moid
+
+    def _update_api_body_server_side_selectors(self,
+                                               management_mode
+                                               ):
+        """This function translates the provided Chassis, Blade Server and
+        Rack Server resource criteria into server-side Selectors. Each
+        Selector is an OData $filter expression on compute/Blades or
+        compute/RackUnits that is evaluated by Intersight, so the Server
+        inventory does not need to be retrieved. Only the domain
+        registrations and any Chassis with provided serials are retrieved.
+
+        Args:
+            management_mode (str):
+                The management mode of the Rack Servers, e.g. "Intersight".
+        """
+        def odata_list(values, value_type=str):
+            """This is a function to format a list of values for an OData
+            "in" expression.
+
+            Args:
+                values (list):
+                    A list of the values to be formatted.
+                value_type (type):
+                    Optional; The type of the values. String values are quoted
+                    and integer values are not. The default value is str.
+
+            Returns:
+                A string of the formatted values, e.g. "('A','B')".
+            """
+            if value_type is int:
+                return "({})".format(",".join(str(value) for value in values))
+            return "({})".format(",".join("'{}'".format(str(value).replace("'", "''")) for value in values))
+
+        def add_selector(intersight_api_path, filter_expressions):
+            """This is a function to add a Selector to the API body.
+
+            Args:
+                intersight_api_path (str):
+                    The Intersight API path of the selected Servers.
+                filter_expressions (list):
+                    A list of the filter expressions that the selected Servers
+                    must all match.
+            """
+            self.intersight_api_body.setdefault("Selectors", []).append(
+                {"ClassId": "resource.Selector",
+                 "ObjectType": "resource.Selector",
+                 "Selector": f"/api/v1/{intersight_api_path}?$filter=" + " and ".join(
+                     f"({filter_expression})" for filter_expression in filter_expressions
+                     )
+                 }
+                )
+
+        blade_server_selector_count = 0
+        rack_server_selector_count = 0
+        # Translate the provided Chassis resources into Blade Server Selectors
+        for chassis_resources_dictionary in self.chassis_resources_list:
+            chassis_filter_expressions = ["ManagementMode eq 'Intersight'"]
+            if chassis_resources_dictionary.get("DomainName"):
+                chassis_domain_name_moid = self._get_domain_registration_moid(chassis_resources_dictionary["DomainName"])
+                chassis_filter_expressions.append(f"RegisteredDevice.Moid eq '{chassis_domain_name_moid}'")
+            if chassis_resources_dictionary.get("ChassisIds"):
+                provided_chassis_id_list = integer_number_list_maker(chassis_resources_dictionary["ChassisIds"])
+                chassis_filter_expressions.append(f"ChassisId in {odata_list(provided_chassis_id_list)}")
+            if chassis_resources_dictionary.get("SlotIds"):
+                provided_chassis_slot_ids_list = integer_number_list_maker(chassis_resources_dictionary["SlotIds"])
+                chassis_filter_expressions.append(f"SlotId in {odata_list(provided_chassis_slot_ids_list, int)}")
+            # A Domain Name provided with Chassis serials only is used for the Chassis serials
+            if chassis_resources_dictionary.get("ChassisIds") or chassis_resources_dictionary.get("SlotIds") or (
+                chassis_resources_dictionary.get("DomainName") and not chassis_resources_dictionary.get("Serials")
+                ):
+                add_selector("compute/Blades", chassis_filter_expressions)
+                blade_server_selector_count += 1
+            if chassis_resources_dictionary.get("Serials"):
+                # Retrieve the MOIDs of the Chassis with matching serials
+                provided_chassis_serials_list = string_to_list_maker(chassis_resources_dictionary["Serials"])
+                chassis_serial_filter_expression = f"Serial in {odata_list(provided_chassis_serials_list)}"
+                retrieved_intersight_chassis = get_intersight_objects(
+                    intersight_api_key_id=None,
+                    intersight_api_key=None,
+                    intersight_api_path=f"equipment/Chasses?$filter={urllib.parse.quote(chassis_serial_filter_expression, safe='')}",
+                    object_type="Chassis",
+                    preconfigured_api_client=self.api_client,
+                    select_attributes=["Moid"]
+                    )
+                retrieved_chassis_moid_list = [chassis["Moid"] for chassis in retrieved_intersight_chassis.get("Results") or []]
+                if retrieved_chassis_moid_list:
+                    add_selector("compute/Blades", [f"EquipmentChassis.Moid in {odata_list(retrieved_chassis_moid_list)}"])
+                    blade_server_selector_count += 1
+                else:
+                    print("No Chassis with the serials "
+                          f"{', '.join(provided_chassis_serials_list)} were found "
+                          "in the Intersight Account.")
+        # Translate the provided Blade Server and Rack Server resources into Selectors
+        for server_resources_list, intersight_api_path, server_management_mode in (
+            (self.blade_server_resources_list, "compute/Blades", "Intersight"),
+            (self.rack_server_resources_list, "compute/RackUnits", management_mode)
+            ):
+            for server_resources_dictionary in server_resources_list:
+                for server_attribute in ("Name", "Serial"):
+                    if server_resources_dictionary.get(f"{server_attribute}s"):
+                        provided_server_identifiers = string_to_list_maker(server_resources_dictionary[f"{server_attribute}s"])
+                        add_selector(intersight_api_path,
+                                     [f"ManagementMode eq '{server_management_mode}'",
+                                      f"{server_attribute} in {odata_list(provided_server_identifiers)}"
+                                      ])
+                        if intersight_api_path == "compute/Blades":
+                            blade_server_selector_count += 1
+                        else:
+                            rack_server_selector_count += 1
+        # Add empty Selectors for Server types without any provided resources
+        print("Based on the resource criteria provided, "
+              f"{blade_server_selector_count} Blade Server and "
+              f"{rack_server_selector_count} Rack Server Selector(s) will be "
+              "evaluated by Intersight for the Resource Pool.")
+        if not blade_server_selector_count:
+            add_selector("compute/Blades", ["Moid in ('')"])
+        if not rack_server_selector_count:
+            add_selector("compute/RackUnits", ["Moid in ('')"])
+
     def object_maker(self):
         """This function makes the targeted pool object.
         """           
@@ -14384,54 +17529,46 @@ class ResourcePool:
                   "execution.\n")
             sys.exit(0)
 
+        # Update the API body with server-side Selectors for the provided Resource Pool Resources
+        if self.server_side_selectors:
+            print("Translating the provided resources into server-side "
+                  "Selectors...")
+            self._update_api_body_server_side_selectors(
+                self.intersight_api_body["ResourcePoolParameters"]["ManagementMode"]
+                )
+            # POST the API body to Intersight
+            self._post_intersight_object()
+            return
+
         # Update the API body with the provided Resource Pool Resources
         # Setup lists for MOIDs of retrieved Blade and Rack Servers
         retrieved_blade_server_moid_list = []
         retrieved_rack_server_moid_list = []
-        
+
         # Check for provided Chassis resources
         if self.chassis_resources_list:
             print("Checking for the provided Chassis resources...")
-            retrieved_intersight_chassis = get_intersight_objects(
-                intersight_api_key_id=None,
-                intersight_api_key=None,
-                intersight_api_path="equipment/Chasses?$top=1000",
-                object_type="Chassis",
-                preconfigured_api_client=self.api_client
-                )
-            if not retrieved_intersight_chassis.get("Results"):
+            chassis_resource_indexes = self._get_chassis_resource_indexes()
+            if not chassis_resource_indexes["Chassis"]:
                 print("No Chassis were found in the Intersight Account.")
             for chassis_resources_dictionary in self.chassis_resources_list:
-                # Chassis Blade Server MOID extraction process if only the Domain Name is provided
+                # Convert provided Chassis IDs and Chassis Blade Server Slot IDs into list format
+                provided_chassis_id_list = integer_number_list_maker(chassis_resources_dictionary["ChassisIds"]) if chassis_resources_dictionary.get("ChassisIds") else []
+                provided_chassis_slot_ids_list = integer_number_list_maker(chassis_resources_dictionary["SlotIds"]) if chassis_resources_dictionary.get("SlotIds") else []
+                # Get the MOID of the provided Domain Name for the Chassis
                 if chassis_resources_dictionary.get("DomainName"):
+                    chassis_domain_name_moid = self._get_domain_registration_moid(chassis_resources_dictionary["DomainName"])
+                    # Chassis Blade Server MOID extraction process if only the Domain Name is provided
                     if not any(
                         (chassis_resources_dictionary.get("ChassisIds"),
                          chassis_resources_dictionary.get("SlotIds"),
                          chassis_resources_dictionary.get("Serials")
                          )
                         ):
-                        # Get the MOID of the provided Domain Name for the Chassis
-                        chassis_domain_name_moid = advanced_intersight_object_moid_retriever(
-                            intersight_api_key_id=None,
-                            intersight_api_key=None,
-                            object_attributes={
-                                "DeviceHostname": [chassis_resources_dictionary["DomainName"]]
-                                },
-                            intersight_api_path="asset/DeviceRegistrations?$top=1000",
-                            object_type="Domain Name",
-                            organization=self.organization,
-                            preconfigured_api_client=self.api_client
+                        # Extract MOIDs from the Blade Servers in any Chassis in the provided Domain Name
+                        retrieved_blade_server_moid_list.extend(
+                            chassis_resource_indexes["Chassis by Domain"].get(chassis_domain_name_moid, [])
                             )
-                        # Search for Chassis in the provided Domain Name under the Intersight Account
-                        for chassis in retrieved_intersight_chassis.get("Results"):
-                            if (
-                                chassis["RegisteredDevice"]["Moid"] == chassis_domain_name_moid
-                                and
-                                chassis["ManagementMode"] == "Intersight"
-                                ):
-                                # Extract MOIDs from the Blade Servers in any matched Chassis
-                                for chassis_blade_server in chassis["Blades"]:
-                                    retrieved_blade_server_moid_list.append(chassis_blade_server["Moid"])
                 # Chassis Blade Server MOID extraction process if the Domain Name and Chassis IDs are provided without any corresponding Slot IDs
                 if all(
                     (chassis_resources_dictionary.get("DomainName"),
@@ -14439,32 +17576,11 @@ class ResourcePool:
                      )
                     ):
                     if not chassis_resources_dictionary.get("SlotIds"):
-                        # Convert provided Chassis IDs into list format
-                        provided_chassis_id_list = integer_number_list_maker(chassis_resources_dictionary["ChassisIds"])
-                        # Get the MOID of the provided Domain Name for the Chassis
-                        chassis_domain_name_moid = advanced_intersight_object_moid_retriever(
-                            intersight_api_key_id=None,
-                            intersight_api_key=None,
-                            object_attributes={
-                                "DeviceHostname": [chassis_resources_dictionary["DomainName"]]
-                                },
-                            intersight_api_path="asset/DeviceRegistrations?$top=1000",
-                            object_type="Domain Name",
-                            organization=self.organization,
-                            preconfigured_api_client=self.api_client
-                            )
-                        # Search for Chassis in the provided Domain Name with matching Chassis IDs under the Intersight Account
-                        for chassis in retrieved_intersight_chassis.get("Results"):
-                            if (
-                                chassis["RegisteredDevice"]["Moid"] == chassis_domain_name_moid
-                                and
-                                chassis["ChassisId"] in provided_chassis_id_list
-                                and
-                                chassis["ManagementMode"] == "Intersight"
-                                ):
-                                # Extract MOIDs from the Blade Servers in any matched Chassis
-                                for chassis_blade_server in chassis["Blades"]:
-                                    retrieved_blade_server_moid_list.append(chassis_blade_server["Moid"])
+                        # Extract MOIDs from the Blade Servers in any Chassis in the provided Domain Name with matching Chassis IDs
+                        for provided_chassis_id in provided_chassis_id_list:
+                            retrieved_blade_server_moid_list.extend(
+                                chassis_resource_indexes["Chassis by Domain and Chassis ID"].get((chassis_domain_name_moid, provided_chassis_id), [])
+                                )
                 # Chassis Blade Server MOID extraction process if the Domain Name, Chassis IDs and Slot IDs are provided
                 if all(
                     (chassis_resources_dictionary.get("DomainName"),
@@ -14472,50 +17588,12 @@ class ResourcePool:
                      chassis_resources_dictionary.get("SlotIds")
                      )
                     ):
-                    # Convert provided Chassis IDs into list format
-                    provided_chassis_id_list = integer_number_list_maker(chassis_resources_dictionary["ChassisIds"])
-                    # Convert provided Chassis Blade Server Slot IDs into list format
-                    provided_chassis_slot_ids_list = integer_number_list_maker(chassis_resources_dictionary["SlotIds"])
-                    # Get the MOID of the provided Domain Name for the Chassis
-                    chassis_domain_name_moid = advanced_intersight_object_moid_retriever(
-                        intersight_api_key_id=None,
-                        intersight_api_key=None,
-                        object_attributes={
-                            "DeviceHostname": [chassis_resources_dictionary["DomainName"]]
-                            },
-                        intersight_api_path="asset/DeviceRegistrations?$top=1000",
-                        object_type="Domain Name",
-                        organization=self.organization,
-                        preconfigured_api_client=self.api_client
-                        )
-                    # Check for Blade Server resources located under the Intersight Account
-                    retrieved_intersight_blade_servers = get_intersight_objects(
-                        intersight_api_key_id=None,
-                        intersight_api_key=None,
-                        intersight_api_path=f"compute/Blades?$top=1000&$filter=ManagementMode%20eq%20%27Intersight%27",
-                        object_type="Blade Server",
-                        preconfigured_api_client=self.api_client
-                        )                    
-                    # Search for Chassis Blade Servers in the provided Domain Name with matching Chassis and Slot IDs under the Intersight Account
-                    for blade_server in retrieved_intersight_blade_servers.get("Results"):
-                        if (
-                            int(blade_server["ChassisId"]) in provided_chassis_id_list
-                            and
-                            blade_server["SlotId"] in provided_chassis_slot_ids_list
-                            and
-                            blade_server["ManagementMode"] == "Intersight"
-                            ):
-                            current_chassis_id = int(blade_server["ChassisId"])
-                            # Search for Chassis in the provided Domain Name with matching Chassis IDs under the Intersight Account
-                            for chassis in retrieved_intersight_chassis.get("Results"):
-                                if (
-                                    chassis["RegisteredDevice"]["Moid"] == chassis_domain_name_moid
-                                    and
-                                    chassis["ChassisId"] == current_chassis_id
-                                    and
-                                    chassis["ManagementMode"] == "Intersight"
-                                    ):
-                                    retrieved_blade_server_moid_list.append(blade_server["Moid"])
+                    # Extract MOIDs from the Chassis Blade Servers in the provided Domain Name with matching Chassis and Slot IDs
+                    for provided_chassis_id in provided_chassis_id_list:
+                        for provided_chassis_slot_id in provided_chassis_slot_ids_list:
+                            retrieved_blade_server_moid_list.extend(
+                                chassis_resource_indexes["Blade Servers by Domain, Chassis ID and Slot ID"].get((chassis_domain_name_moid, provided_chassis_id, provided_chassis_slot_id), [])
+                                )
                 # Chassis Blade Server MOID extraction process if the Chassis IDs are provided without the Domain Name or Slot IDs
                 if chassis_resources_dictionary.get("ChassisIds"):
                     if not any(
@@ -14523,18 +17601,11 @@ class ResourcePool:
                          chassis_resources_dictionary.get("SlotIds")
                          )
                         ):
-                        # Convert provided Chassis IDs into list format
-                        provided_chassis_id_list = integer_number_list_maker(chassis_resources_dictionary["ChassisIds"])
-                        # Search for Chassis with matching Chassis IDs under the Intersight Account
-                        for chassis in retrieved_intersight_chassis.get("Results"):
-                            if (
-                                chassis["ChassisId"] in provided_chassis_id_list
-                                and
-                                chassis["ManagementMode"] == "Intersight"
-                                ):
-                                # Extract MOIDs from the Blade Servers in any matched Chassis
-                                for chassis_blade_server in chassis["Blades"]:
-                                    retrieved_blade_server_moid_list.append(chassis_blade_server["Moid"])
+                        # Extract MOIDs from the Blade Servers in any Chassis with matching Chassis IDs
+                        for provided_chassis_id in provided_chassis_id_list:
+                            retrieved_blade_server_moid_list.extend(
+                                chassis_resource_indexes["Chassis by Chassis ID"].get(provided_chassis_id, [])
+                                )
                 # Chassis Blade Server MOID extraction process if the Chassis IDs and Slot IDs are provided without any corresponding Domain Name
                 if all(
                     (chassis_resources_dictionary.get("ChassisIds"),
@@ -14542,36 +17613,12 @@ class ResourcePool:
                      )
                     ):
                     if not chassis_resources_dictionary.get("DomainName"):
-                        # Convert provided Chassis IDs into list format
-                        provided_chassis_id_list = integer_number_list_maker(chassis_resources_dictionary["ChassisIds"])
-                        # Convert provided Chassis Blade Server Slot IDs into list format
-                        provided_chassis_slot_ids_list = integer_number_list_maker(chassis_resources_dictionary["SlotIds"])
-                        # Check for Blade Server resources located under the Intersight Account
-                        retrieved_intersight_blade_servers = get_intersight_objects(
-                            intersight_api_key_id=None,
-                            intersight_api_key=None,
-                            intersight_api_path=f"compute/Blades?$top=1000&$filter=ManagementMode%20eq%20%27Intersight%27",
-                            object_type="Blade Server",
-                            preconfigured_api_client=self.api_client
-                            )                        
-                        # Search for Chassis Blade Servers with matching Chassis and Slot IDs under the Intersight Account
-                        for blade_server in retrieved_intersight_blade_servers.get("Results"):
-                            if (
-                                int(blade_server["ChassisId"]) in provided_chassis_id_list
-                                and
-                                blade_server["SlotId"] in provided_chassis_slot_ids_list
-                                and
-                                blade_server["ManagementMode"] == "Intersight"
-                                ):
-                                current_chassis_id = int(blade_server["ChassisId"])
-                                # Search for Chassis with matching Chassis IDs under the Intersight Account
-                                for chassis in retrieved_intersight_chassis.get("Results"):
-                                    if (
-                                        chassis["ChassisId"] == current_chassis_id
-                                        and
-                                        chassis["ManagementMode"] == "Intersight"
-                                        ):
-                                        retrieved_blade_server_moid_list.append(blade_server["Moid"])
+                        # Extract MOIDs from the Chassis Blade Servers with matching Chassis and Slot IDs
+                        for provided_chassis_id in provided_chassis_id_list:
+                            for provided_chassis_slot_id in provided_chassis_slot_ids_list:
+                                retrieved_blade_server_moid_list.extend(
+                                    chassis_resource_indexes["Blade Servers by Chassis ID and Slot ID"].get((provided_chassis_id, provided_chassis_slot_id), [])
+                                    )
                 # Chassis Blade Server MOID extraction process if the Slot IDs are provided without the Domain Name or Chassis IDs
                 if chassis_resources_dictionary.get("SlotIds"):
                     if not any(
@@ -14579,24 +17626,11 @@ class ResourcePool:
                          chassis_resources_dictionary.get("ChassisIds")
                          )
                         ):
-                        # Convert provided Chassis Blade Server Slot IDs into list format
-                        provided_chassis_slot_ids_list = integer_number_list_maker(chassis_resources_dictionary["SlotIds"])
-                        # Check for Blade Server resources located under the Intersight Account
-                        retrieved_intersight_blade_servers = get_intersight_objects(
-                            intersight_api_key_id=None,
-                            intersight_api_key=None,
-                            intersight_api_path=f"compute/Blades?$top=1000&$filter=ManagementMode%20eq%20%27Intersight%27",
-                            object_type="Blade Server",
-                            preconfigured_api_client=self.api_client
-                            )                        
-                        # Search for Chassis Blade Servers in the provided Domain Name with matching Slot IDs under the Intersight Account
-                        for blade_server in retrieved_intersight_blade_servers.get("Results"):
-                            if (
-                                blade_server["SlotId"] in provided_chassis_slot_ids_list
-                                and
-                                blade_server["ManagementMode"] == "Intersight"
-                                ):
-                                retrieved_blade_server_moid_list.append(blade_server["Moid"])
+                        # Extract MOIDs from the Chassis Blade Servers with matching Slot IDs
+                        for provided_chassis_slot_id in provided_chassis_slot_ids_list:
+                            retrieved_blade_server_moid_list.extend(
+                                chassis_resource_indexes["Blade Servers by Slot ID"].get(provided_chassis_slot_id, [])
+                                )
                 # Chassis Blade Server MOID extraction process if the Domain Name and Slot IDs are provided without any corresponding Chassis IDs
                 if all(
                     (chassis_resources_dictionary.get("DomainName"),
@@ -14604,93 +17638,46 @@ class ResourcePool:
                      )
                     ):
                     if not chassis_resources_dictionary.get("ChassisIds"):
-                        # Convert provided Chassis Blade Server Slot IDs into list format
-                        provided_chassis_slot_ids_list = integer_number_list_maker(chassis_resources_dictionary["SlotIds"])
-                        # Get the MOID of the provided Domain Name for the Chassis
-                        chassis_domain_name_moid = advanced_intersight_object_moid_retriever(
-                            intersight_api_key_id=None,
-                            intersight_api_key=None,
-                            object_attributes={
-                                "DeviceHostname": [chassis_resources_dictionary["DomainName"]]
-                                },
-                            intersight_api_path="asset/DeviceRegistrations?$top=1000",
-                            object_type="Domain Name",
-                            organization=self.organization,
-                            preconfigured_api_client=self.api_client
-                            )                        
-                        # Check for Blade Server resources located under the Intersight Account
-                        retrieved_intersight_blade_servers = get_intersight_objects(
-                            intersight_api_key_id=None,
-                            intersight_api_key=None,
-                            intersight_api_path=f"compute/Blades?$top=1000&$filter=ManagementMode%20eq%20%27Intersight%27",
-                            object_type="Blade Server",
-                            preconfigured_api_client=self.api_client
-                            )                        
-                        # Search for Chassis Blade Servers in the provided Domain Name with matching Slot IDs under the Intersight Account
-                        for blade_server in retrieved_intersight_blade_servers.get("Results"):
-                            if (
-                                blade_server["SlotId"] in provided_chassis_slot_ids_list
-                                and
-                                blade_server["ManagementMode"] == "Intersight"
-                                ):
-                                # Get the MOID of the Chassis associated with the current Blade Server
-                                current_chassis_moid = blade_server["EquipmentChassis"]["Moid"]
-                                # Get the associated Chassis object details
-                                current_chassis_object = get_single_intersight_object(
-                                    intersight_api_key_id=None,
-                                    intersight_api_key=None,
-                                    intersight_api_path="equipment/Chasses?$top=1000",
-                                    object_moid=current_chassis_moid,
-                                    object_type="UCS Chassis",
-                                    preconfigured_api_client=self.api_client
-                                    )
-                                # Get the MOID of the Domain Name for the Chassis associated with the current Blade Server
-                                current_chassis_object_domain_name_moid = current_chassis_object["RegisteredDevice"]["Moid"]
-                                # Retrieve the current Blade Server MOID if the Chassis Domain Name matches the provided Domain Name
-                                if current_chassis_object_domain_name_moid == chassis_domain_name_moid:
-                                    retrieved_blade_server_moid_list.append(blade_server["Moid"])
+                        # Extract MOIDs from the Chassis Blade Servers in the provided Domain Name with matching Slot IDs
+                        for provided_chassis_slot_id in provided_chassis_slot_ids_list:
+                            retrieved_blade_server_moid_list.extend(
+                                chassis_resource_indexes["Blade Servers by Domain and Slot ID"].get((chassis_domain_name_moid, provided_chassis_slot_id), [])
+                                )
                 # Chassis Blade Server MOID extraction process if any Chassis serials are provided
                 if chassis_resources_dictionary.get("Serials"):
                     # Convert provided Chassis serials into list format
                     provided_chassis_serials_list = string_to_list_maker(chassis_resources_dictionary["Serials"])
-                    # Search for Chassis with matching serials under the Intersight Account
-                    for chassis in retrieved_intersight_chassis.get("Results"):
-                        if chassis["Serial"] in provided_chassis_serials_list:
-                            # Extract MOIDs from the Blade Servers in any matched Chassis
-                            for chassis_blade_server in chassis["Blades"]:
-                                retrieved_blade_server_moid_list.append(chassis_blade_server["Moid"])
+                    # Extract MOIDs from the Blade Servers in any Chassis with matching serials
+                    for provided_chassis_serial in provided_chassis_serials_list:
+                        retrieved_blade_server_moid_list.extend(
+                            chassis_resource_indexes["Chassis by Serial"].get(provided_chassis_serial, [])
+                            )
 
         # Check for provided Blade Server resources
         if self.blade_server_resources_list:
             print("Checking for the provided Blade Server resources...")
-            retrieved_intersight_blade_servers = get_intersight_objects(
-                intersight_api_key_id=None,
-                intersight_api_key=None,
-                intersight_api_path=f"compute/Blades?$top=1000&$filter=ManagementMode%20eq%20%27Intersight%27",
-                object_type="Blade Server",
-                preconfigured_api_client=self.api_client
-                )
-            if not retrieved_intersight_blade_servers.get("Results"):
+            chassis_resource_indexes = self._get_chassis_resource_indexes()
+            if not chassis_resource_indexes["Blade Servers"]:
                 print("No Blade Servers were found in the Intersight Account.")
             for blade_server_resources_dictionary in self.blade_server_resources_list:
                 # Blade Server MOID extraction process if any Blade Server names are provided
                 if blade_server_resources_dictionary.get("Names"):
                     # Convert provided Blade Server names into list format
                     provided_blade_server_names_list = string_to_list_maker(blade_server_resources_dictionary["Names"])
-                    # Search for Blade Servers with matching names under the Intersight Account
-                    for blade_server in retrieved_intersight_blade_servers.get("Results"):
-                        if blade_server["Name"] in provided_blade_server_names_list:
-                            # Extract MOIDs from the matched Blade Servers
-                            retrieved_blade_server_moid_list.append(blade_server["Moid"])
+                    # Extract MOIDs from the Blade Servers with matching names
+                    for provided_blade_server_name in provided_blade_server_names_list:
+                        retrieved_blade_server_moid_list.extend(
+                            chassis_resource_indexes["Blade Servers by Name"].get(provided_blade_server_name, [])
+                            )
                 # Blade Server MOID extraction process if any Blade Server serials are provided
                 if blade_server_resources_dictionary.get("Serials"):
                     # Convert provided Blade Server serials into list format
                     provided_blade_server_serials_list = string_to_list_maker(blade_server_resources_dictionary["Serials"])
-                    # Search for Blade Servers with matching serials under the Intersight Account
-                    for blade_server in retrieved_intersight_blade_servers.get("Results"):
-                        if blade_server["Serial"] in provided_blade_server_serials_list:
-                            # Extract MOIDs from the matched Blade Servers
-                            retrieved_blade_server_moid_list.append(blade_server["Moid"])
+                    # Extract MOIDs from the Blade Servers with matching serials
+                    for provided_blade_server_serial in provided_blade_server_serials_list:
+                        retrieved_blade_server_moid_list.extend(
+                            chassis_resource_indexes["Blade Servers by Serial"].get(provided_blade_server_serial, [])
+                            )
 
         # Setup API body with retrieved Blade Server MOIDs from any provided resources
         if retrieved_blade_server_moid_list:
@@ -14881,6 +17868,7 @@ def resource_pool_maker(
     ucs_server_type="FI-Attached",
     resource_type="Server",
     pool_type="Static",
+    server_side_selectors=False,
     pool_description="",
     pool_assignment_order="default",
     organization="default",
@@ -14967,6 +17955,13 @@ def resource_pool_maker(
             Optional; The resource management type of the pool. Static pools
             will not change unless manually updated by a user. The accepted
             values are "Static" or "Dynamic". The default value is "Static".
+        server_side_selectors (bool):
+            Optional; The option to translate the provided chassis, blade
+            server and rack server resources into server-side selectors that
+            are evaluated by Intersight, instead of retrieving the server
+            inventory and adding the MOIDs of the matching servers. This is
+            recommended for Dynamic pools, as the selectors also match servers
+            added after the pool has been created. The default value is False.
         pool_description (str):
             Optional; The description of the pool to be created. The default
             value is an empty string ("").
@@ -15035,7 +18030,8 @@ def resource_pool_maker(
             rack_server_resources_list=rack_server_resources_list,
             ucs_server_type=ucs_server_type,
             resource_type=resource_type,
-            pool_type=pool_type
+            pool_type=pool_type,
+            server_side_selectors=server_side_selectors
             ))
 
 
@@ -19682,21 +22678,403 @@ def wwpn_pool_maker(
             ))
 
 
+# Establish class to adapt the concurrency of parallel Intersight operations
+class IntersightConcurrencyController:
+    """This class is used to adapt the number of parallel operations, such as
+    deployment tasks, that run at the same time against the Intersight API.
+    The concurrency limit is raised by one after each window of operations
+    that completed successfully, with one operation per allowed slot, and
+    halved after a throttled (429) response, a server error (5xx) or a
+    latency spike (additive increase, multiplicative decrease). The
+    responses are reported by the API client the controller is attached to
+    and the latency of each response is compared with the baseline of the
+    same request method and Intersight API path. The completed operations
+    are reported by the function running them.
+    """
+    def __init__(self,
+                 initial_limit=4,
+                 min_limit=1,
+                 max_limit=16,
+                 latency_spike_factor=3,
+                 latency_smoothing=0.2
+                 ):
+        self.max_limit = max(1, max_limit)
+        self.min_limit = max(1, min(min_limit, self.max_limit))
+        self.limit = max(self.min_limit, min(initial_limit, self.max_limit))
+        self.latency_spike_factor = latency_spike_factor
+        self.latency_smoothing = latency_smoothing
+        self.in_flight = 0
+        self.healthy_completions = 0
+        self.last_decrease_time = 0
+        self.average_latency = None
+        self.baseline_latencies = {}
+        self.metrics = {
+            "Requests": 0,
+            "Completed Operations": 0,
+            "Throttled Responses": 0,
+            "Server Error Responses": 0,
+            "Latency Spikes": 0,
+            "Limit Increases": 0,
+            "Limit Decreases": 0,
+            "Peak Limit": self.limit
+            }
+        self.condition = threading.Condition()
+
+    def __repr__(self):
+        return (
+            f"{self.__class__.__name__}"
+            f"({self.limit}, "
+            f"{self.min_limit}, "
+            f"{self.max_limit}, "
+            f"{self.latency_spike_factor}, "
+            f"{self.latency_smoothing})"
+            )
+
+    def __str__(self):
+        return (f"{self.__class__.__name__} class object with a concurrency "
+                f"limit of {self.limit}")
+
+    def __enter__(self):
+        self.acquire()
+        return self
+
+    def __exit__(self, exception_type, exception_value, exception_traceback):
+        self.release()
+
+    def acquire(self):
+        """This function waits until the number of running operations is
+        under the concurrency limit, then starts an operation.
+        """
+        with self.condition:
+            while self.in_flight >= self.limit:
+                self.condition.wait()
+            self.in_flight += 1
+
+    def release(self):
+        """This function finishes an operation started with acquire.
+        """
+        with self.condition:
+            self.in_flight -= 1
+            self.condition.notify_all()
+
+    def _decrease_limit(self,
+                        decrease_reason
+                        ):
+        """This function halves the concurrency limit. The concurrency limit
+        is decreased at most once per average response time, so that several
+        failed responses to requests made at the same time count as one
+        signal.
+
+        Args:
+            decrease_reason (str):
+                The reason for the decrease, to be reported.
+        """
+        current_time = time.monotonic()
+        if current_time - self.last_decrease_time < max(1, self.average_latency or 0):
+            return
+        self.last_decrease_time = current_time
+        self.healthy_completions = 0
+        decreased_limit = max(self.min_limit, self.limit // 2)
+        if decreased_limit < self.limit:
+            self.limit = decreased_limit
+            self.metrics["Limit Decreases"] += 1
+            print(f"The concurrency limit has been reduced to {self.limit} "
+                  f"due to {decrease_reason}.")
+
+    @staticmethod
+    def _latency_baseline_key(request_method,
+                              request_path
+                              ):
+        """This function creates the key of the latency baseline for a
+        request. The query options and MOIDs are removed from the Intersight
+        API path, so that requests for different objects of the same type
+        share a baseline.
+
+        Args:
+            request_method (str):
+                The HTTP method of the request.
+            request_path (str):
+                The Intersight API resource path of the request.
+
+        Returns:
+            A string of the latency baseline key.
+        """
+        request_path = re.sub(r"/[0-9a-f]{24}(?=/|$)", "/{Moid}", (request_path or "").split("?")[0])
+        return f"{(request_method or '').upper()} {request_path}"
+
+    def record_response(self,
+                        response_latency,
+                        status_code=None,
+                        request_method=None,
+                        request_path=None
+                        ):
+        """This function adapts the concurrency limit to the latency and
+        status code of an Intersight API response. Successful responses do
+        not raise the concurrency limit on their own, as one operation can
+        make many requests.
+
+        Args:
+            response_latency (float):
+                The latency of the response in seconds.
+            status_code (int):
+                Optional; The status code of a failed response. The default
+                value is None, for a successful response.
+            request_method (str):
+                Optional; The HTTP method of the request. The default value
+                is None.
+            request_path (str):
+                Optional; The Intersight API resource path of the request.
+                The default value is None.
+        """
+        with self.condition:
+            self.metrics["Requests"] += 1
+            if self.average_latency is None:
+                self.average_latency = response_latency
+            else:
+                self.average_latency += self.latency_smoothing * (response_latency - self.average_latency)
+            if status_code == 429:
+                self.metrics["Throttled Responses"] += 1
+                self._decrease_limit("throttling by the Intersight API")
+                return
+            if status_code is not None and status_code >= 500:
+                self.metrics["Server Error Responses"] += 1
+                self._decrease_limit("Intersight API server errors")
+                return
+            if status_code is not None:
+                return
+            # Compare the latency with the slowly adapting baseline of healthy responses to the same kind of request
+            latency_baseline_key = self._latency_baseline_key(request_method, request_path)
+            baseline_latency = self.baseline_latencies.get(latency_baseline_key)
+            if baseline_latency is None:
+                self.baseline_latencies[latency_baseline_key] = response_latency
+            elif response_latency > self.latency_spike_factor * baseline_latency:
+                self.metrics["Latency Spikes"] += 1
+                self._decrease_limit("increased Intersight API latency")
+            else:
+                self.baseline_latencies[latency_baseline_key] = baseline_latency + self.latency_smoothing / 4 * (response_latency - baseline_latency)
+
+    def record_completion(self,
+                          operation_succeeded=True
+                          ):
+        """This function adapts the concurrency limit to a completed
+        operation. The concurrency limit is raised by one after a full
+        window of successful operations, with one operation per allowed
+        slot, since the last change of the limit.
+
+        Args:
+            operation_succeeded (bool):
+                Optional; Whether the operation completed successfully. The
+                default value is True.
+        """
+        with self.condition:
+            self.metrics["Completed Operations"] += 1
+            if not operation_succeeded:
+                self.healthy_completions = 0
+                return
+            self.healthy_completions += 1
+            if self.healthy_completions >= self.limit and self.limit < self.max_limit:
+                self.healthy_completions = 0
+                self.limit += 1
+                self.metrics["Limit Increases"] += 1
+                self.metrics["Peak Limit"] = max(self.metrics["Peak Limit"], self.limit)
+                self.condition.notify_all()
+
+    def get_metrics(self):
+        """This function retrieves the current concurrency limit and the
+        observed Intersight API response metrics.
+
+        Returns:
+            A dictionary of the metrics.
+        """
+        with self.condition:
+            return {
+                "Concurrency Limit": self.limit,
+                "Operations In Progress": self.in_flight,
+                "Average Latency": round(self.average_latency or 0, 3),
+                "Latency Baselines": len(self.baseline_latencies),
+                **self.metrics
+                }
+
+
+# Establish function to attach a concurrency controller to an Intersight API client
+def set_intersight_concurrency_controller(api_client,
+                                          max_limit,
+                                          initial_limit=None
+                                          ):
+    """This is a function to attach an adaptive concurrency controller to an
+    Intersight API client, so that the responses of every request made
+    through the client adapt the concurrency limit.
+
+    Args:
+        api_client ("ApiClient"):
+            An ApiClient class instance which handles Intersight client-server
+            communication through the use of API keys.
+        max_limit (int):
+            The maximum number of parallel operations.
+        initial_limit (int):
+            Optional; The initial number of parallel operations. The default
+            value is None, which starts at half of the maximum.
+
+    Returns:
+        An IntersightConcurrencyController class instance.
+    """
+    intersight_concurrency_controller = IntersightConcurrencyController(
+        initial_limit=initial_limit or max(1, max_limit // 2),
+        max_limit=max_limit
+        )
+    api_client.concurrency_controller = intersight_concurrency_controller
+    return intersight_concurrency_controller
+
+
+# Establish function to run deployment tasks concurrently in dependency order
+def deployment_task_runner(deployment_tasks,
+                           max_concurrent_tasks=8,
+                           concurrency_controller=None
+                           ):
+    """This is a function to run a set of deployment tasks, such as the
+    creation of Pools, Policies and Profiles, on a pool of worker threads.
+    Each deployment task is started as soon as every deployment task it
+    depends on has completed, so that unrelated Pools and Policies are
+    created at the same time.
+
+    Args:
+        deployment_tasks (list):
+            A list of dictionaries containing the deployment tasks. Each
+            dictionary contains the keys "Task Name" (str), "Task Function"
+            (function) and "Dependencies" (list). The "Dependencies" key
+            contains the task names of the deployment tasks that must complete
+            first. Task names that are not present in the list are considered
+            to be complete, e.g. for a Pool or Policy that was not enabled for
+            creation. An optional "Task Arguments" (dict) key contains the
+            keyword arguments for the task function. Deployment tasks that are
+            ready at the same time are started in list order.
+        max_concurrent_tasks (int):
+            Optional; The maximum number of deployment tasks that can run at
+            the same time. Setting the value to 1 runs the deployment tasks
+            one at a time. The default value is 8.
+        concurrency_controller ("IntersightConcurrencyController"):
+            Optional; An IntersightConcurrencyController class instance. If
+            provided, the number of deployment tasks started at the same time
+            follows the adaptive concurrency limit, up to the value of
+            max_concurrent_tasks. The default value is None.
+
+    Returns:
+        A dictionary containing the lists of task names for the "Completed
+        Tasks", "Failed Tasks" and "Skipped Tasks" keys. Deployment tasks
+        are skipped if a deployment task they depend on has failed. The
+        "Exit Requested" key is set to True if a deployment task requested
+        an exit of the deployment tool, in which case no further deployment
+        tasks are started.
+    """
+    # Establish the pending deployment tasks and their remaining dependencies
+    pending_deployment_tasks = {deployment_task["Task Name"]: deployment_task for deployment_task in deployment_tasks}
+    remaining_task_dependencies = {
+        deployment_task["Task Name"]: {task_dependency for task_dependency in deployment_task.get("Dependencies", [])
+                                       if task_dependency in pending_deployment_tasks}
+        for deployment_task in deployment_tasks
+        }
+    deployment_task_results = {
+        "Completed Tasks": [],
+        "Failed Tasks": [],
+        "Skipped Tasks": [],
+        "Exit Requested": False
+        }
+    running_deployment_tasks = {}
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max(1, max_concurrent_tasks)) as executor:
+        while pending_deployment_tasks or running_deployment_tasks:
+            # Start every deployment task with completed dependencies, up to the concurrency limit
+            if not deployment_task_results["Exit Requested"]:
+                concurrent_task_limit = min(max_concurrent_tasks, concurrency_controller.limit) if concurrency_controller else max_concurrent_tasks
+                for task_name in list(pending_deployment_tasks):
+                    if len(running_deployment_tasks) >= concurrent_task_limit:
+                        break
+                    if not remaining_task_dependencies[task_name]:
+                        deployment_task = pending_deployment_tasks.pop(task_name)
+                        running_deployment_task = executor.submit(deployment_task["Task Function"],
+                                                                  **deployment_task.get("Task Arguments", {})
+                                                                  )
+                        running_deployment_tasks[running_deployment_task] = task_name
+            if not running_deployment_tasks:
+                break
+            # Wait for a running deployment task to finish
+            finished_deployment_tasks, _ = concurrent.futures.wait(running_deployment_tasks,
+                                                                   return_when=concurrent.futures.FIRST_COMPLETED
+                                                                   )
+            for finished_deployment_task in finished_deployment_tasks:
+                task_name = running_deployment_tasks.pop(finished_deployment_task)
+                task_exception = finished_deployment_task.exception()
+                if concurrency_controller:
+                    concurrency_controller.record_completion(task_exception is None)
+                if task_exception is None:
+                    deployment_task_results["Completed Tasks"].append(task_name)
+                    for task_dependencies in remaining_task_dependencies.values():
+                        task_dependencies.discard(task_name)
+                else:
+                    deployment_task_results["Failed Tasks"].append(task_name)
+                    if isinstance(task_exception, SystemExit):
+                        deployment_task_results["Exit Requested"] = True
+                    else:
+                        print("\nA configuration error has occurred!\n")
+                        print(f"The deployment task for the {task_name} did "
+                              "not complete.")
+                        print("Exception Message: ")
+                        traceback.print_exception(type(task_exception),
+                                                  task_exception,
+                                                  task_exception.__traceback__
+                                                  )
+    deployment_task_results["Skipped Tasks"].extend(pending_deployment_tasks)
+    return deployment_task_results
+
+
 def main():
 
     # Establish UCS Server Deployment Tool specific variables
     deployment_tool_type = "Intersight UCS Server Deployment Tool"
 
+    # Parse the command line options
+    argument_parser = argparse.ArgumentParser(description=f"The {deployment_tool_type} for Cisco Intersight.")
+    argument_parser.add_argument("--resume",
+                                 action="store_true",
+                                 help="Skip the deployment steps completed in the previous run, as recorded in the deployment journal."
+                                 )
+    deployment_tool_arguments = argument_parser.parse_args()
+
     # Establish Intersight SDK for Python API client instance
     main_intersight_api_client = get_api_client(api_key_id=key_id,
                                                 api_secret_file=key,
                                                 endpoint=intersight_base_url,
-                                                url_certificate_verification=url_certificate_verification
+                                                url_certificate_verification=url_certificate_verification,
+                                                api_request_rate_limit=intersight_api_request_rate_limit
                                                 )
+
+    # Attach the object state file to the API client, if provided
+    if intersight_object_state_file:
+        set_intersight_object_state_file(main_intersight_api_client,
+                                         intersight_object_state_file
+                                         )
     
     # Starting the UCS Server Deployment Tool for Cisco Intersight
     print(f"\nStarting the {deployment_tool_type} for Cisco Intersight.\n")
 
+    # Attach the deployment journal to the API client, if provided
+    deployment_journal = None
+    if deployment_journal_file:
+        deployment_journal = set_intersight_deployment_journal(main_intersight_api_client,
+                                                               deployment_journal_file,
+                                                               resume=deployment_tool_arguments.resume
+                                                               )
+    elif deployment_tool_arguments.resume:
+        print("No deployment journal file has been provided. All deployment "
+              "steps will be performed.")
+
+    # Attach the adaptive concurrency controller to the API client, if enabled
+    deployment_concurrency_controller = None
+    if deployment_adaptive_concurrency:
+        deployment_concurrency_controller = set_intersight_concurrency_controller(
+            main_intersight_api_client,
+            max_limit=max(deployment_max_concurrent_tasks, ucs_server_profile_max_concurrent_assignments)
+            )
+
     # Run the Intersight API and Account Availability Test
     print("Running the Intersight API and Account Availability Test.")
     test_intersight_api_service(
@@ -19729,11 +23107,74 @@ def main():
     deployment_tool_fibre_channel_adapter_policy_name = ""
     deployment_tool_fc_zone_policy_name = ""
     deployment_tool_uuid_pool_name = ""
+    deployment_tool_iscsi_boot_ip_pool_name = ""
 
-    # Create the UUID Pool in Intersight
+    # Update Pool, Policy and/or Profile names with UCS Server Deployment Tool provided prefix and/or suffix
     if deploy_uuid_pool:
-        # Update Pool name with UCS Server Deployment Tool provided prefix and/or suffix
         deployment_tool_uuid_pool_name = f"{deployment_name_prefix}{uuid_pool_name}{deployment_name_suffix}"
+    if deploy_resource_pool:
+        deployment_tool_resource_pool_name = f"{deployment_name_prefix}{resource_pool_name}{deployment_name_suffix}"
+    if ucs_server_profile_template_creation_during_deployment and ucs_server_profile_template_name:
+        deployment_tool_ucs_server_profile_template_name = f"{deployment_name_prefix}{ucs_server_profile_template_name}{deployment_name_suffix}"
+    if deploy_ip_pool_in_band:
+        deployment_tool_in_band_ip_pool_name = f"{deployment_name_prefix}{in_band_ip_pool_name}{deployment_name_suffix}"
+    if deploy_ip_pool_out_of_band:
+        deployment_tool_out_of_band_ip_pool_name = f"{deployment_name_prefix}{out_of_band_ip_pool_name}{deployment_name_suffix}"
+    if deploy_iqn_pool:
+        deployment_tool_iqn_pool_name = f"{deployment_name_prefix}{iqn_pool_name}{deployment_name_suffix}"
+    if deploy_mac_pool:
+        deployment_tool_mac_pool_name = f"{deployment_name_prefix}{mac_pool_name}{deployment_name_suffix}"
+    if deploy_ethernet_network_group_policy:
+        deployment_tool_ethernet_network_group_policy_name = f"{deployment_name_prefix}{ethernet_network_group_policy_name}{deployment_name_suffix}"
+    if deploy_ethernet_network_control_policy:
+        deployment_tool_ethernet_network_control_policy_name = f"{deployment_name_prefix}{ethernet_network_control_policy_name}{deployment_name_suffix}"
+    if deploy_ethernet_qos_policy:
+        deployment_tool_ethernet_qos_policy_name = f"{deployment_name_prefix}{ethernet_qos_policy_name}{deployment_name_suffix}"
+    if deploy_ethernet_adapter_policy:
+        deployment_tool_ethernet_adapter_policy_name = f"{deployment_name_prefix}{ethernet_adapter_policy_name}{deployment_name_suffix}"
+    if deploy_iscsi_adapter_policy:
+        deployment_tool_iscsi_adapter_policy_name = f"{deployment_name_prefix}{iscsi_adapter_policy_name}{deployment_name_suffix}"
+    if deploy_iscsi_static_target_policy_primary:
+        deployment_tool_primary_iscsi_static_target_policy_name = f"{deployment_name_prefix}{primary_iscsi_static_target_policy_name}{deployment_name_suffix}"
+    if deploy_iscsi_static_target_policy_secondary:
+        deployment_tool_secondary_iscsi_static_target_policy_name = f"{deployment_name_prefix}{secondary_iscsi_static_target_policy_name}{deployment_name_suffix}"
+    if deploy_ip_pool_iscsi_boot:
+        deployment_tool_iscsi_boot_ip_pool_name = f"{deployment_name_prefix}{iscsi_boot_ip_pool_name}{deployment_name_suffix}"
+    if deploy_iscsi_boot_policy:
+        deployment_tool_iscsi_boot_policy_name = f"{deployment_name_prefix}{iscsi_boot_policy_name}{deployment_name_suffix}"
+    if deploy_usnic_ethernet_adapter_policy:
+        deployment_tool_usnic_adapter_policy_name = f"{deployment_name_prefix}{usnic_adapter_policy_name}{deployment_name_suffix}"
+    if deploy_vmmq_ethernet_adapter_policy:
+        deployment_tool_vmmq_adapter_policy_name = f"{deployment_name_prefix}{vmmq_adapter_policy_name}{deployment_name_suffix}"
+    if deploy_wwnn_pool:
+        deployment_tool_wwnn_pool_name = f"{deployment_name_prefix}{wwnn_pool_name}{deployment_name_suffix}"
+    if deploy_wwpn_pool:
+        deployment_tool_wwpn_pool_name = f"{deployment_name_prefix}{wwpn_pool_name}{deployment_name_suffix}"
+    if deploy_fibre_channel_network_policy:
+        deployment_tool_fibre_channel_network_policy_name = f"{deployment_name_prefix}{fibre_channel_network_policy_name}{deployment_name_suffix}"
+    if deploy_fibre_channel_qos_policy:
+        deployment_tool_fibre_channel_qos_policy_name = f"{deployment_name_prefix}{fibre_channel_qos_policy_name}{deployment_name_suffix}"
+    if deploy_fibre_channel_adapter_policy:
+        deployment_tool_fibre_channel_adapter_policy_name = f"{deployment_name_prefix}{fibre_channel_adapter_policy_name}{deployment_name_suffix}"
+    if deploy_fc_zone_policy:
+        deployment_tool_fc_zone_policy_name = f"{deployment_name_prefix}{fc_zone_policy_name}{deployment_name_suffix}"
+
+    ## Establish default support UUID Pool names for UCS Server Profiles and UCS Server Profile Templates
+    if ucs_server_profile_uuid_pool_name == uuid_pool_name:
+        deployment_tool_ucs_server_profile_uuid_pool_name = deployment_tool_uuid_pool_name
+    else:
+        deployment_tool_ucs_server_profile_uuid_pool_name = ucs_server_profile_uuid_pool_name
+
+    ## Establish the UCS Server Profile names
+    deployment_tool_ucs_server_profile_names_list = []
+    for ucs_server_profile_config in ucs_server_profile_names_and_assignments:
+        if ucs_server_profile_config.get('Server Profile Name'):
+            # Update UCS Server Profile name with UCS Server Deployment Tool provided prefix and/or suffix
+            deployment_tool_ucs_server_profile_names_list.append(f"{deployment_name_prefix}{ucs_server_profile_config['Server Profile Name']}{deployment_name_suffix}")
+    deployment_tool_ucs_server_profile_names = ', '.join(deployment_tool_ucs_server_profile_names_list)
+
+    # Create the UUID Pool in Intersight
+    def uuid_pool_creation_task():
         uuid_pool_maker(
             intersight_api_key_id=None,
             intersight_api_key=None,
@@ -19747,16 +23188,8 @@ def main():
             preconfigured_api_client=main_intersight_api_client
             )
 
-    ## Establish default support UUID Pool names for UCS Server Profiles and UCS Server Profile Templates
-    if ucs_server_profile_uuid_pool_name == uuid_pool_name:
-        deployment_tool_ucs_server_profile_uuid_pool_name = deployment_tool_uuid_pool_name
-    else:
-        deployment_tool_ucs_server_profile_uuid_pool_name = ucs_server_profile_uuid_pool_name
-
     # Create the Resource Pool in Intersight
-    if deploy_resource_pool:
-        # Update Pool name with UCS Server Deployment Tool provided prefix and/or suffix
-        deployment_tool_resource_pool_name = f"{deployment_name_prefix}{resource_pool_name}{deployment_name_suffix}"
+    def resource_pool_creation_task():
         resource_pool_maker(
             intersight_api_key_id=None,
             intersight_api_key=None,
@@ -19767,6 +23200,7 @@ def main():
             ucs_server_type=resource_pool_ucs_server_type,
             resource_type=resource_pool_resource_type,
             pool_type=resource_pool_pool_type,
+            server_side_selectors=resource_pool_server_side_selectors,
             pool_description=resource_pool_description,
             pool_assignment_order=resource_pool_resource_assignment_order,
             organization=ucs_server_profile_organization,
@@ -19775,9 +23209,7 @@ def main():
             )
 
     # Create the UCS Server Profile Template in Intersight
-    if ucs_server_profile_template_creation_during_deployment and ucs_server_profile_template_name:
-        # Update UCS Server Profile Template name with UCS Server Deployment Tool provided prefix and/or suffix
-        deployment_tool_ucs_server_profile_template_name = f"{deployment_name_prefix}{ucs_server_profile_template_name}{deployment_name_suffix}"
+    def ucs_server_profile_template_creation_task():
         # Create the Profile in Intersight
         ucs_server_profile_template_maker(
             intersight_api_key_id=None,
@@ -19792,32 +23224,26 @@ def main():
             )
 
     # Create the UCS Server Profile(s) in Intersight
-    staged_ucs_server_profile_names_list = []
-    for ucs_server_profile_config in ucs_server_profile_names_and_assignments:
-        if ucs_server_profile_config.get('Server Profile Name'):
-            # Update UCS Server Profile name with UCS Server Deployment Tool provided prefix and/or suffix
-            deployment_tool_ucs_server_profile_name = f"{deployment_name_prefix}{ucs_server_profile_config['Server Profile Name']}{deployment_name_suffix}"
-            # Create the Profile in Intersight
-            ucs_server_profile_maker(
-                intersight_api_key_id=None,
-                intersight_api_key=None,
-                ucs_server_profile_name=deployment_tool_ucs_server_profile_name,
-                uuid_pool_name=deployment_tool_ucs_server_profile_uuid_pool_name,
-                uuid_assignment_type=ucs_server_profile_uuid_assignment_type,
-                uuid_static_address=ucs_server_profile_uuid_static_address,
-                ucs_server_profile_template_name_for_attachment=deployment_tool_ucs_server_profile_template_name,
-                overwrite_conflicting_ucs_server_profile_template_attachments=True,                
-                ucs_server_type=ucs_server_profile_ucs_server_type,
-                ucs_server_profile_description=ucs_server_profile_description,
-                ucs_server_profile_organization=ucs_server_profile_organization,
-                tags=ucs_server_profile_tags,
-                preconfigured_api_client=main_intersight_api_client
-                )
-            staged_ucs_server_profile_names_list.append(deployment_tool_ucs_server_profile_name)
-    deployment_tool_ucs_server_profile_names = ', '.join(staged_ucs_server_profile_names_list)
+    def ucs_server_profile_creation_task(deployment_tool_ucs_server_profile_name):
+        # Create the Profile in Intersight
+        ucs_server_profile_maker(
+            intersight_api_key_id=None,
+            intersight_api_key=None,
+            ucs_server_profile_name=deployment_tool_ucs_server_profile_name,
+            uuid_pool_name=deployment_tool_ucs_server_profile_uuid_pool_name,
+            uuid_assignment_type=ucs_server_profile_uuid_assignment_type,
+            uuid_static_address=ucs_server_profile_uuid_static_address,
+            ucs_server_profile_template_name_for_attachment=deployment_tool_ucs_server_profile_template_name,
+            overwrite_conflicting_ucs_server_profile_template_attachments=True,                
+            ucs_server_type=ucs_server_profile_ucs_server_type,
+            ucs_server_profile_description=ucs_server_profile_description,
+            ucs_server_profile_organization=ucs_server_profile_organization,
+            tags=ucs_server_profile_tags,
+            preconfigured_api_client=main_intersight_api_client
+            )
 
     # Create the BIOS Policy in Intersight
-    if deploy_bios_policy:
+    def bios_policy_creation_task():
         # Update Policy name with UCS Server Deployment Tool provided prefix and/or suffix
         deployment_tool_bios_policy_name = f"{deployment_name_prefix}{bios_policy_name}{deployment_name_suffix}"
         bios_policy_maker(
@@ -19834,7 +23260,7 @@ def main():
             )
 
     # Create the Boot Order Policy in Intersight
-    if deploy_boot_order_policy:
+    def boot_order_policy_creation_task():
         # Update Policy name with UCS Server Deployment Tool provided prefix and/or suffix
         deployment_tool_boot_order_policy_name = f"{deployment_name_prefix}{boot_order_policy_name}{deployment_name_suffix}"
         boot_order_policy_maker(
@@ -19853,7 +23279,7 @@ def main():
             )
 
     # Create the Power Policy in Intersight
-    if deploy_power_policy:
+    def power_policy_creation_task():
         # Update Policy name with UCS Server Deployment Tool provided prefix and/or suffix
         deployment_tool_power_policy_name = f"{deployment_name_prefix}{power_policy_name}{deployment_name_suffix}"
         power_policy_maker(
@@ -19877,7 +23303,7 @@ def main():
             )
 
     # Create the Virtual Media Policy in Intersight
-    if deploy_virtual_media_policy:
+    def virtual_media_policy_creation_task():
         # Update Policy name with UCS Server Deployment Tool provided prefix and/or suffix
         deployment_tool_virtual_media_policy_name = f"{deployment_name_prefix}{virtual_media_policy_name}{deployment_name_suffix}"
         virtual_media_policy_maker(
@@ -19897,7 +23323,7 @@ def main():
             )
 
     # Create the Certificate Management Policy in Intersight
-    if deploy_cert_mgmt_policy:
+    def cert_mgmt_policy_creation_task():
         # Update Policy name with UCS Server Deployment Tool provided prefix and/or suffix
         deployment_tool_cert_mgmt_policy_name = f"{deployment_name_prefix}{cert_mgmt_policy_name}{deployment_name_suffix}"
         cert_mgmt_policy_maker(
@@ -19916,9 +23342,7 @@ def main():
             )
 
     # Create the In-Band IP Pool in Intersight
-    if deploy_ip_pool_in_band:
-        # Update Pool name with UCS Server Deployment Tool provided prefix and/or suffix
-        deployment_tool_in_band_ip_pool_name = f"{deployment_name_prefix}{in_band_ip_pool_name}{deployment_name_suffix}"
+    def ip_pool_in_band_creation_task():
         ip_pool_maker(
             intersight_api_key_id=None,
             intersight_api_key=None,
@@ -19943,9 +23367,7 @@ def main():
             )
 
     # Create the Out-Of-Band IP Pool in Intersight
-    if deploy_ip_pool_out_of_band:
-        # Update Pool name with UCS Server Deployment Tool provided prefix and/or suffix
-        deployment_tool_out_of_band_ip_pool_name = f"{deployment_name_prefix}{out_of_band_ip_pool_name}{deployment_name_suffix}"
+    def ip_pool_out_of_band_creation_task():
         ip_pool_maker(
             intersight_api_key_id=None,
             intersight_api_key=None,
@@ -19970,7 +23392,7 @@ def main():
             )
 
     # Create the IMC Access Policy in Intersight
-    if deploy_imc_access_policy:
+    def imc_access_policy_creation_task():
         # Establish default pre-requisite and support Pool and/or Policy names for IMC Access Policies
         ## In-Band IP Pool
         if imc_access_policy_in_band_ip_pool_name == in_band_ip_pool_name:
@@ -20006,7 +23428,7 @@ def main():
             )
 
     # Create the IPMI Over LAN Policy in Intersight
-    if deploy_ipmi_over_lan_policy:
+    def ipmi_over_lan_policy_creation_task():
         # Update Policy name with UCS Server Deployment Tool provided prefix and/or suffix
         deployment_tool_ipmi_over_lan_policy_name = f"{deployment_name_prefix}{ipmi_over_lan_policy_name}{deployment_name_suffix}"
         ipmi_over_lan_policy_maker(
@@ -20025,7 +23447,7 @@ def main():
             )
 
     # Create the Local User Policy in Intersight
-    if deploy_local_user_policy:
+    def local_user_policy_creation_task():
         # Update Policy name with UCS Server Deployment Tool provided prefix and/or suffix
         deployment_tool_local_user_policy_name = f"{deployment_name_prefix}{local_user_policy_name}{deployment_name_suffix}"
         local_user_policy_maker(
@@ -20049,7 +23471,7 @@ def main():
             )
 
     # Create the Serial Over LAN Policy in Intersight
-    if deploy_serial_over_lan_policy:
+    def serial_over_lan_policy_creation_task():
         # Update Policy name with UCS Server Deployment Tool provided prefix and/or suffix
         deployment_tool_serial_over_lan_policy_name = f"{deployment_name_prefix}{serial_over_lan_policy_name}{deployment_name_suffix}"
         serial_over_lan_policy_maker(
@@ -20069,7 +23491,7 @@ def main():
             )
 
     # Create the SNMP Policy in Intersight
-    if deploy_snmp_policy:
+    def snmp_policy_creation_task():
         # Update Policy name with UCS Server Deployment Tool provided prefix and/or suffix
         deployment_tool_snmp_policy_name = f"{deployment_name_prefix}{snmp_policy_name}{deployment_name_suffix}"
         snmp_policy_maker(
@@ -20097,7 +23519,7 @@ def main():
             )
 
     # Create the Syslog Policy in Intersight
-    if deploy_syslog_policy:
+    def syslog_policy_creation_task():
         # Update Policy name with UCS Server Deployment Tool provided prefix and/or suffix
         deployment_tool_syslog_policy_name = f"{deployment_name_prefix}{syslog_policy_name}{deployment_name_suffix}"
         syslog_policy_maker(
@@ -20115,7 +23537,7 @@ def main():
             )
 
     # Create the Virtual KVM Policy in Intersight
-    if deploy_virtual_kvm_policy:
+    def virtual_kvm_policy_creation_task():
         # Update Policy name with UCS Server Deployment Tool provided prefix and/or suffix
         deployment_tool_virtual_kvm_policy_name = f"{deployment_name_prefix}{virtual_kvm_policy_name}{deployment_name_suffix}"
         virtual_kvm_policy_maker(
@@ -20136,7 +23558,7 @@ def main():
             )
 
     # Create the SD Card Policy in Intersight
-    if deploy_sd_card_policy:
+    def sd_card_policy_creation_task():
         # Update Policy name with UCS Server Deployment Tool provided prefix and/or suffix
         deployment_tool_sd_card_policy_name = f"{deployment_name_prefix}{sd_card_policy_name}{deployment_name_suffix}"
         sd_card_policy_maker(
@@ -20161,7 +23583,7 @@ def main():
             )
 
     # Create the Storage Policy in Intersight
-    if deploy_storage_policy:
+    def storage_policy_creation_task():
         # Update Policy name with UCS Server Deployment Tool provided prefix and/or suffix
         deployment_tool_storage_policy_name = f"{deployment_name_prefix}{storage_policy_name}{deployment_name_suffix}"
         storage_policy_maker(
@@ -20192,9 +23614,7 @@ def main():
             )
 
     # Create the IQN Pool in Intersight
-    if deploy_iqn_pool:
-        # Update Policy name with UCS Server Deployment Tool provided prefix and/or suffix
-        deployment_tool_iqn_pool_name = f"{deployment_name_prefix}{iqn_pool_name}{deployment_name_suffix}"
+    def iqn_pool_creation_task():
         iqn_pool_maker(
             intersight_api_key_id=None,
             intersight_api_key=None,
@@ -20209,9 +23629,7 @@ def main():
             )
 
     # Create the MAC Address Pool in Intersight
-    if deploy_mac_pool:
-        # Update Policy name with UCS Server Deployment Tool provided prefix and/or suffix
-        deployment_tool_mac_pool_name = f"{deployment_name_prefix}{mac_pool_name}{deployment_name_suffix}"
+    def mac_pool_creation_task():
         mac_pool_maker(
             intersight_api_key_id=None,
             intersight_api_key=None,
@@ -20225,9 +23643,7 @@ def main():
             )
 
     # Create the Ethernet Network Group Policy in Intersight
-    if deploy_ethernet_network_group_policy:
-        # Update Policy name with UCS Server Deployment Tool provided prefix and/or suffix
-        deployment_tool_ethernet_network_group_policy_name = f"{deployment_name_prefix}{ethernet_network_group_policy_name}{deployment_name_suffix}"
+    def ethernet_network_group_policy_creation_task():
         ethernet_network_group_policy_maker(
             intersight_api_key_id=None,
             intersight_api_key=None,
@@ -20241,7 +23657,7 @@ def main():
             )
 
     # Create the Ethernet Network Group Policy in Intersight - Supplementary 1
-    if deploy_ethernet_network_group_policy_supplementary1:
+    def ethernet_network_group_policy_supplementary1_creation_task():
         # Update Policy name with UCS Server Deployment Tool provided prefix and/or suffix
         deployment_tool_ethernet_network_group_policy_name_supplementary1 = f"{deployment_name_prefix}{ethernet_network_group_policy_name_supplementary1}{deployment_name_suffix}"
         ethernet_network_group_policy_maker(
@@ -20257,7 +23673,7 @@ def main():
             )
 
     # Create the Ethernet Network Group Policy in Intersight - Supplementary 2
-    if deploy_ethernet_network_group_policy_supplementary2:
+    def ethernet_network_group_policy_supplementary2_creation_task():
         # Update Policy name with UCS Server Deployment Tool provided prefix and/or suffix
         deployment_tool_ethernet_network_group_policy_name_supplementary2 = f"{deployment_name_prefix}{ethernet_network_group_policy_name_supplementary2}{deployment_name_suffix}"
         ethernet_network_group_policy_maker(
@@ -20273,7 +23689,7 @@ def main():
             )
 
     # Create the Ethernet Network Group Policy in Intersight - Supplementary 3
-    if deploy_ethernet_network_group_policy_supplementary3:
+    def ethernet_network_group_policy_supplementary3_creation_task():
         # Update Policy name with UCS Server Deployment Tool provided prefix and/or suffix
         deployment_tool_ethernet_network_group_policy_name_supplementary3 = f"{deployment_name_prefix}{ethernet_network_group_policy_name_supplementary3}{deployment_name_suffix}"
         ethernet_network_group_policy_maker(
@@ -20289,7 +23705,7 @@ def main():
             )
 
     # Create the Ethernet Network Group Policy in Intersight - Supplementary 4
-    if deploy_ethernet_network_group_policy_supplementary4:
+    def ethernet_network_group_policy_supplementary4_creation_task():
         # Update Policy name with UCS Server Deployment Tool provided prefix and/or suffix
         deployment_tool_ethernet_network_group_policy_name_supplementary4 = f"{deployment_name_prefix}{ethernet_network_group_policy_name_supplementary4}{deployment_name_suffix}"
         ethernet_network_group_policy_maker(
@@ -20305,9 +23721,7 @@ def main():
             )
 
     # Create the Ethernet Network Control Policy in Intersight
-    if deploy_ethernet_network_control_policy:
-        # Update Policy name with UCS Server Deployment Tool provided prefix and/or suffix
-        deployment_tool_ethernet_network_control_policy_name = f"{deployment_name_prefix}{ethernet_network_control_policy_name}{deployment_name_suffix}"
+    def ethernet_network_control_policy_creation_task():
         ethernet_network_control_policy_maker(
             intersight_api_key_id=None,
             intersight_api_key=None,
@@ -20325,9 +23739,7 @@ def main():
             )
 
     # Create the Ethernet QoS Policy in Intersight
-    if deploy_ethernet_qos_policy:
-        # Update Policy name with UCS Server Deployment Tool provided prefix and/or suffix
-        deployment_tool_ethernet_qos_policy_name = f"{deployment_name_prefix}{ethernet_qos_policy_name}{deployment_name_suffix}"
+    def ethernet_qos_policy_creation_task():
         ethernet_qos_policy_maker(
             intersight_api_key_id=None,
             intersight_api_key=None,
@@ -20345,9 +23757,7 @@ def main():
             )
 
     # Create the Ethernet Adapter Policy in Intersight
-    if deploy_ethernet_adapter_policy:
-        # Update Policy name with UCS Server Deployment Tool provided prefix and/or suffix
-        deployment_tool_ethernet_adapter_policy_name = f"{deployment_name_prefix}{ethernet_adapter_policy_name}{deployment_name_suffix}"
+    def ethernet_adapter_policy_creation_task():
         ethernet_adapter_policy_maker(
             intersight_api_key_id=None,
             intersight_api_key=None,
@@ -20397,9 +23807,7 @@ def main():
             )
 
     # Create the iSCSI Adapter Policy in Intersight
-    if deploy_iscsi_adapter_policy:
-        # Update Policy name with UCS Server Deployment Tool provided prefix and/or suffix
-        deployment_tool_iscsi_adapter_policy_name = f"{deployment_name_prefix}{iscsi_adapter_policy_name}{deployment_name_suffix}"
+    def iscsi_adapter_policy_creation_task():
         iscsi_adapter_policy_maker(
             intersight_api_key_id=None,
             intersight_api_key=None,
@@ -20414,9 +23822,7 @@ def main():
             )
 
     # Create the Primary iSCSI Static Target Policy in Intersight
-    if deploy_iscsi_static_target_policy_primary:
-        # Update Policy name with UCS Server Deployment Tool provided prefix and/or suffix
-        deployment_tool_primary_iscsi_static_target_policy_name = f"{deployment_name_prefix}{primary_iscsi_static_target_policy_name}{deployment_name_suffix}"
+    def iscsi_static_target_policy_primary_creation_task():
         iscsi_static_target_policy_maker(
             intersight_api_key_id=None,
             intersight_api_key=None,
@@ -20433,9 +23839,7 @@ def main():
             )
 
     # Create the Secondary iSCSI Static Target Policy in Intersight
-    if deploy_iscsi_static_target_policy_secondary:
-        # Update Policy name with UCS Server Deployment Tool provided prefix and/or suffix
-        deployment_tool_secondary_iscsi_static_target_policy_name = f"{deployment_name_prefix}{secondary_iscsi_static_target_policy_name}{deployment_name_suffix}"
+    def iscsi_static_target_policy_secondary_creation_task():
         iscsi_static_target_policy_maker(
             intersight_api_key_id=None,
             intersight_api_key=None,
@@ -20452,9 +23856,7 @@ def main():
             )
 
     # Create the iSCSI Boot IP Pool in Intersight
-    if deploy_ip_pool_iscsi_boot:
-        # Update Pool name with UCS Server Deployment Tool provided prefix and/or suffix
-        deployment_tool_iscsi_boot_ip_pool_name = f"{deployment_name_prefix}{iscsi_boot_ip_pool_name}{deployment_name_suffix}"
+    def ip_pool_iscsi_boot_creation_task():
         ip_pool_maker(
             intersight_api_key_id=None,
             intersight_api_key=None,
@@ -20479,7 +23881,7 @@ def main():
             )
 
     # Create the iSCSI Boot Policy in Intersight
-    if deploy_iscsi_boot_policy:
+    def iscsi_boot_policy_creation_task():
         # Establish default pre-requisite and support Pool and/or Policy names for LAN Connectivity Policies
         ## iSCSI Adapter Policy
         if iscsi_boot_policy_iscsi_adapter_policy_name == iscsi_adapter_policy_name:
@@ -20505,8 +23907,6 @@ def main():
         else:
             deployment_tool_iscsi_boot_policy_static_initiator_ip_source_pool_ip_pool_name = iscsi_boot_policy_static_initiator_ip_source_pool_ip_pool_name            
             
-        # Update Policy name with UCS Server Deployment Tool provided prefix and/or suffix
-        deployment_tool_iscsi_boot_policy_name = f"{deployment_name_prefix}{iscsi_boot_policy_name}{deployment_name_suffix}"
         iscsi_boot_policy_maker(
             intersight_api_key_id=None,
             intersight_api_key=None,
@@ -20534,9 +23934,7 @@ def main():
             )
 
     # Create the usNIC Ethernet Adapter Policy in Intersight
-    if deploy_usnic_ethernet_adapter_policy:
-        # Update Policy name with UCS Server Deployment Tool provided prefix and/or suffix
-        deployment_tool_usnic_adapter_policy_name = f"{deployment_name_prefix}{usnic_adapter_policy_name}{deployment_name_suffix}"
+    def usnic_ethernet_adapter_policy_creation_task():
         ethernet_adapter_policy_maker(
             intersight_api_key_id=None,
             intersight_api_key=None,
@@ -20586,9 +23984,7 @@ def main():
             )
 
     # Create the VMMQ Ethernet Adapter Policy in Intersight
-    if deploy_vmmq_ethernet_adapter_policy:
-        # Update Policy name with UCS Server Deployment Tool provided prefix and/or suffix
-        deployment_tool_vmmq_adapter_policy_name = f"{deployment_name_prefix}{vmmq_adapter_policy_name}{deployment_name_suffix}"
+    def vmmq_ethernet_adapter_policy_creation_task():
         ethernet_adapter_policy_maker(
             intersight_api_key_id=None,
             intersight_api_key=None,
@@ -20638,7 +24034,7 @@ def main():
             )
 
     # Create the LAN Connectivity Policy in Intersight
-    if deploy_lan_connectivity_policy:
+    def lan_connectivity_policy_creation_task():
         # Establish default pre-requisite and support Pool and/or Policy names for LAN Connectivity Policies
         ## IQN Pool
         if lan_connectivity_policy_iqn_pool_name == iqn_pool_name:
@@ -20724,9 +24120,7 @@ def main():
             )
 
     # Create the WWNN Pool in Intersight
-    if deploy_wwnn_pool:
-        # Update Policy name with UCS Server Deployment Tool provided prefix and/or suffix
-        deployment_tool_wwnn_pool_name = f"{deployment_name_prefix}{wwnn_pool_name}{deployment_name_suffix}"
+    def wwnn_pool_creation_task():
         wwnn_pool_maker(
             intersight_api_key_id=None,
             intersight_api_key=None,
@@ -20740,9 +24134,7 @@ def main():
             )
 
     # Create the WWPN Pool in Intersight
-    if deploy_wwpn_pool:
-        # Update Policy name with UCS Server Deployment Tool provided prefix and/or suffix
-        deployment_tool_wwpn_pool_name = f"{deployment_name_prefix}{wwpn_pool_name}{deployment_name_suffix}"
+    def wwpn_pool_creation_task():
         wwpn_pool_maker(
             intersight_api_key_id=None,
             intersight_api_key=None,
@@ -20756,9 +24148,7 @@ def main():
             )
 
     # Create the Fibre Channel Network Policy in Intersight
-    if deploy_fibre_channel_network_policy:
-        # Update Policy name with UCS Server Deployment Tool provided prefix and/or suffix
-        deployment_tool_fibre_channel_network_policy_name = f"{deployment_name_prefix}{fibre_channel_network_policy_name}{deployment_name_suffix}"
+    def fibre_channel_network_policy_creation_task():
         fibre_channel_network_policy_maker(
             intersight_api_key_id=None,
             intersight_api_key=None,
@@ -20772,9 +24162,7 @@ def main():
             )
 
     # Create the Fibre Channel QoS Policy in Intersight
-    if deploy_fibre_channel_qos_policy:
-        # Update Policy name with UCS Server Deployment Tool provided prefix and/or suffix
-        deployment_tool_fibre_channel_qos_policy_name = f"{deployment_name_prefix}{fibre_channel_qos_policy_name}{deployment_name_suffix}"
+    def fibre_channel_qos_policy_creation_task():
         fibre_channel_qos_policy_maker(
             intersight_api_key_id=None,
             intersight_api_key=None,
@@ -20790,9 +24178,7 @@ def main():
             )
 
     # Create the Fibre Channel Adapter Policy in Intersight
-    if deploy_fibre_channel_adapter_policy:
-        # Update Policy name with UCS Server Deployment Tool provided prefix and/or suffix
-        deployment_tool_fibre_channel_adapter_policy_name = f"{deployment_name_prefix}{fibre_channel_adapter_policy_name}{deployment_name_suffix}"
+    def fibre_channel_adapter_policy_creation_task():
         fibre_channel_adapter_policy_maker(
             intersight_api_key_id=None,
             intersight_api_key=None,
@@ -20824,9 +24210,7 @@ def main():
             )
 
     # Create the FC Zone Policy in Intersight
-    if deploy_fc_zone_policy:
-        # Update Policy name with UCS Server Deployment Tool provided prefix and/or suffix
-        deployment_tool_fc_zone_policy_name = f"{deployment_name_prefix}{fc_zone_policy_name}{deployment_name_suffix}"
+    def fc_zone_policy_creation_task():
         fc_zone_policy_maker(
             intersight_api_key_id=None,
             intersight_api_key=None,
@@ -20840,7 +24224,7 @@ def main():
             )
 
     # Create the SAN Connectivity Policy in Intersight
-    if deploy_san_connectivity_policy:
+    def san_connectivity_policy_creation_task():
         # Establish default pre-requisite and support Pool and/or Policy names for SAN Connectivity Policies
         ## WWNN Pool
         if san_connectivity_policy_wwnn_pool_name == wwnn_pool_name:
@@ -20903,7 +24287,84 @@ def main():
             ucs_server_profile_template_names=deployment_tool_ucs_server_profile_template_name
             )
 
-    # Assign the UCS Server Profile to an Intersight Target
+    # Establish the UCS Server Deployment Tool deployment tasks and dependencies
+    ## Policies attached to the UCS Server Profiles and UCS Server Profile Template are created after the UCS Server Profiles
+    ucs_server_profile_task_names = ["UCS Server Profile Template"]
+    ucs_server_profile_tasks = []
+    for deployment_tool_ucs_server_profile_name in deployment_tool_ucs_server_profile_names_list:
+        ucs_server_profile_task_names.append(f"UCS Server Profile {deployment_tool_ucs_server_profile_name}")
+        ucs_server_profile_tasks.append(
+            {"Task Name": f"UCS Server Profile {deployment_tool_ucs_server_profile_name}", "Task Function": ucs_server_profile_creation_task,
+             "Task Arguments": {"deployment_tool_ucs_server_profile_name": deployment_tool_ucs_server_profile_name},
+             "Dependencies": ["UUID Pool", "UCS Server Profile Template"], "Enabled": True}
+            )
+
+    deployment_tasks = [
+        {"Task Name": "UUID Pool", "Task Function": uuid_pool_creation_task, "Dependencies": [], "Enabled": deploy_uuid_pool},
+        {"Task Name": "Resource Pool", "Task Function": resource_pool_creation_task, "Dependencies": [], "Enabled": deploy_resource_pool},
+        {"Task Name": "UCS Server Profile Template", "Task Function": ucs_server_profile_template_creation_task, "Dependencies": ["UUID Pool"], "Enabled": ucs_server_profile_template_creation_during_deployment and ucs_server_profile_template_name},
+        *ucs_server_profile_tasks,
+        {"Task Name": "BIOS Policy", "Task Function": bios_policy_creation_task, "Dependencies": ucs_server_profile_task_names, "Enabled": deploy_bios_policy},
+        {"Task Name": "Boot Order Policy", "Task Function": boot_order_policy_creation_task, "Dependencies": ucs_server_profile_task_names, "Enabled": deploy_boot_order_policy},
+        {"Task Name": "Power Policy", "Task Function": power_policy_creation_task, "Dependencies": ucs_server_profile_task_names, "Enabled": deploy_power_policy},
+        {"Task Name": "Virtual Media Policy", "Task Function": virtual_media_policy_creation_task, "Dependencies": ucs_server_profile_task_names, "Enabled": deploy_virtual_media_policy},
+        {"Task Name": "Certificate Management Policy", "Task Function": cert_mgmt_policy_creation_task, "Dependencies": ucs_server_profile_task_names, "Enabled": deploy_cert_mgmt_policy},
+        {"Task Name": "In-Band IP Pool", "Task Function": ip_pool_in_band_creation_task, "Dependencies": [], "Enabled": deploy_ip_pool_in_band},
+        {"Task Name": "Out-Of-Band IP Pool", "Task Function": ip_pool_out_of_band_creation_task, "Dependencies": [], "Enabled": deploy_ip_pool_out_of_band},
+        {"Task Name": "IMC Access Policy", "Task Function": imc_access_policy_creation_task, "Dependencies": [*ucs_server_profile_task_names, "In-Band IP Pool", "Out-Of-Band IP Pool"], "Enabled": deploy_imc_access_policy},
+        {"Task Name": "IPMI Over LAN Policy", "Task Function": ipmi_over_lan_policy_creation_task, "Dependencies": ucs_server_profile_task_names, "Enabled": deploy_ipmi_over_lan_policy},
+        {"Task Name": "Local User Policy", "Task Function": local_user_policy_creation_task, "Dependencies": ucs_server_profile_task_names, "Enabled": deploy_local_user_policy},
+        {"Task Name": "Serial Over LAN Policy", "Task Function": serial_over_lan_policy_creation_task, "Dependencies": ucs_server_profile_task_names, "Enabled": deploy_serial_over_lan_policy},
+        {"Task Name": "SNMP Policy", "Task Function": snmp_policy_creation_task, "Dependencies": ucs_server_profile_task_names, "Enabled": deploy_snmp_policy},
+        {"Task Name": "Syslog Policy", "Task Function": syslog_policy_creation_task, "Dependencies": ucs_server_profile_task_names, "Enabled": deploy_syslog_policy},
+        {"Task Name": "Virtual KVM Policy", "Task Function": virtual_kvm_policy_creation_task, "Dependencies": ucs_server_profile_task_names, "Enabled": deploy_virtual_kvm_policy},
+        {"Task Name": "SD Card Policy", "Task Function": sd_card_policy_creation_task, "Dependencies": ucs_server_profile_task_names, "Enabled": deploy_sd_card_policy},
+        {"Task Name": "Storage Policy", "Task Function": storage_policy_creation_task, "Dependencies": ucs_server_profile_task_names, "Enabled": deploy_storage_policy},
+        {"Task Name": "IQN Pool", "Task Function": iqn_pool_creation_task, "Dependencies": [], "Enabled": deploy_iqn_pool},
+        {"Task Name": "MAC Address Pool", "Task Function": mac_pool_creation_task, "Dependencies": [], "Enabled": deploy_mac_pool},
+        {"Task Name": "Ethernet Network Group Policy", "Task Function": ethernet_network_group_policy_creation_task, "Dependencies": [], "Enabled": deploy_ethernet_network_group_policy},
+        {"Task Name": "Ethernet Network Group Policy - Supplementary 1", "Task Function": ethernet_network_group_policy_supplementary1_creation_task, "Dependencies": [], "Enabled": deploy_ethernet_network_group_policy_supplementary1},
+        {"Task Name": "Ethernet Network Group Policy - Supplementary 2", "Task Function": ethernet_network_group_policy_supplementary2_creation_task, "Dependencies": [], "Enabled": deploy_ethernet_network_group_policy_supplementary2},
+        {"Task Name": "Ethernet Network Group Policy - Supplementary 3", "Task Function": ethernet_network_group_policy_supplementary3_creation_task, "Dependencies": [], "Enabled": deploy_ethernet_network_group_policy_supplementary3},
+        {"Task Name": "Ethernet Network Group Policy - Supplementary 4", "Task Function": ethernet_network_group_policy_supplementary4_creation_task, "Dependencies": [], "Enabled": deploy_ethernet_network_group_policy_supplementary4},
+        {"Task Name": "Ethernet Network Control Policy", "Task Function": ethernet_network_control_policy_creation_task, "Dependencies": [], "Enabled": deploy_ethernet_network_control_policy},
+        {"Task Name": "Ethernet QoS Policy", "Task Function": ethernet_qos_policy_creation_task, "Dependencies": [], "Enabled": deploy_ethernet_qos_policy},
+        {"Task Name": "Ethernet Adapter Policy", "Task Function": ethernet_adapter_policy_creation_task, "Dependencies": [], "Enabled": deploy_ethernet_adapter_policy},
+        {"Task Name": "iSCSI Adapter Policy", "Task Function": iscsi_adapter_policy_creation_task, "Dependencies": [], "Enabled": deploy_iscsi_adapter_policy},
+        {"Task Name": "Primary iSCSI Static Target Policy", "Task Function": iscsi_static_target_policy_primary_creation_task, "Dependencies": [], "Enabled": deploy_iscsi_static_target_policy_primary},
+        {"Task Name": "Secondary iSCSI Static Target Policy", "Task Function": iscsi_static_target_policy_secondary_creation_task, "Dependencies": [], "Enabled": deploy_iscsi_static_target_policy_secondary},
+        {"Task Name": "iSCSI Boot IP Pool", "Task Function": ip_pool_iscsi_boot_creation_task, "Dependencies": [], "Enabled": deploy_ip_pool_iscsi_boot},
+        {"Task Name": "iSCSI Boot Policy", "Task Function": iscsi_boot_policy_creation_task, "Dependencies": ["iSCSI Adapter Policy", "Primary iSCSI Static Target Policy", "Secondary iSCSI Static Target Policy", "iSCSI Boot IP Pool"], "Enabled": deploy_iscsi_boot_policy},
+        {"Task Name": "usNIC Ethernet Adapter Policy", "Task Function": usnic_ethernet_adapter_policy_creation_task, "Dependencies": [], "Enabled": deploy_usnic_ethernet_adapter_policy},
+        {"Task Name": "VMMQ Ethernet Adapter Policy", "Task Function": vmmq_ethernet_adapter_policy_creation_task, "Dependencies": [], "Enabled": deploy_vmmq_ethernet_adapter_policy},
+        {"Task Name": "LAN Connectivity Policy", "Task Function": lan_connectivity_policy_creation_task, "Dependencies": [*ucs_server_profile_task_names, "IQN Pool", "MAC Address Pool", "Ethernet Network Group Policy", "Ethernet Network Group Policy - Supplementary 1", "Ethernet Network Group Policy - Supplementary 2", "Ethernet Network Group Policy - Supplementary 3", "Ethernet Network Group Policy - Supplementary 4", "Ethernet Network Control Policy", "Ethernet QoS Policy", "Ethernet Adapter Policy", "iSCSI Boot Policy", "usNIC Ethernet Adapter Policy", "VMMQ Ethernet Adapter Policy"], "Enabled": deploy_lan_connectivity_policy},
+        {"Task Name": "WWNN Pool", "Task Function": wwnn_pool_creation_task, "Dependencies": [], "Enabled": deploy_wwnn_pool},
+        {"Task Name": "WWPN Pool", "Task Function": wwpn_pool_creation_task, "Dependencies": [], "Enabled": deploy_wwpn_pool},
+        {"Task Name": "Fibre Channel Network Policy", "Task Function": fibre_channel_network_policy_creation_task, "Dependencies": [], "Enabled": deploy_fibre_channel_network_policy},
+        {"Task Name": "Fibre Channel QoS Policy", "Task Function": fibre_channel_qos_policy_creation_task, "Dependencies": [], "Enabled": deploy_fibre_channel_qos_policy},
+        {"Task Name": "Fibre Channel Adapter Policy", "Task Function": fibre_channel_adapter_policy_creation_task, "Dependencies": [], "Enabled": deploy_fibre_channel_adapter_policy},
+        {"Task Name": "FC Zone Policy", "Task Function": fc_zone_policy_creation_task, "Dependencies": [], "Enabled": deploy_fc_zone_policy},
+        {"Task Name": "SAN Connectivity Policy", "Task Function": san_connectivity_policy_creation_task, "Dependencies": [*ucs_server_profile_task_names, "WWNN Pool", "WWPN Pool", "Fibre Channel Network Policy", "Fibre Channel QoS Policy", "Fibre Channel Adapter Policy", "FC Zone Policy"], "Enabled": deploy_san_connectivity_policy},
+        ]
+
+    # Create the Pools, Policies and UCS Server Profile(s) in Intersight
+    deployment_task_results = deployment_task_runner(
+        deployment_tasks=[deployment_task for deployment_task in deployment_tasks if deployment_task["Enabled"]],
+        max_concurrent_tasks=deployment_max_concurrent_tasks,
+        concurrency_controller=deployment_concurrency_controller
+        )
+    if deployment_task_results["Failed Tasks"] or deployment_task_results["Skipped Tasks"]:
+        print("\nThe following deployment tasks did not complete:")
+        for task_name in deployment_task_results["Failed Tasks"]:
+            print(f"{task_name} - Failed")
+        for task_name in deployment_task_results["Skipped Tasks"]:
+            print(f"{task_name} - Not started")
+    if deployment_task_results["Exit Requested"]:
+        print(f"\nExiting the {deployment_tool_type}.\n")
+        sys.exit(0)
+
+    # Assign and deploy the UCS Server Profiles to Intersight Targets
+    ucs_server_profile_assignments = []
     for ucs_server_profile_config in ucs_server_profile_names_and_assignments:
         if ucs_server_profile_config.get('Server Profile Name') and ucs_server_profile_config.get("Assign Server Profile"):
             # Establish default pre-requisite and support Pool and/or Policy names for UCS Server Profile(s)
@@ -20914,47 +24375,53 @@ def main():
                 deployment_tool_ucs_server_profile_resource_pool_name = ucs_server_profile_config.get("Server Resource Pool")
 
             # Update UCS Server Profile name with UCS Server Deployment Tool provided prefix and/or suffix
-            deployment_tool_ucs_server_profile_name = f"{deployment_name_prefix}{ucs_server_profile_config['Server Profile Name']}{deployment_name_suffix}"            
-            assign_and_deploy_ucs_server_profile(
-                intersight_api_key_id=None,
-                intersight_api_key=None,
-                ucs_server_profile_name=deployment_tool_ucs_server_profile_name,
-                resource_pool_name=deployment_tool_ucs_server_profile_resource_pool_name,
-                ucs_server_assignment_identifier=ucs_server_profile_config.get("Server Assignment Identifier"),
-                ucs_server_form_factor=ucs_server_profile_ucs_server_form_factor,
-                ucs_server_type=ucs_server_profile_ucs_server_type,
-                assign_ucs_server_profile=True,
-                deploy_ucs_server_profile=False,
-                deployment_start_delay=0,
-                ucs_server_profile_organization=ucs_server_profile_organization,
-                preconfigured_api_client=main_intersight_api_client
-                )
-
-    # Deploy the UCS Server Profile to an Intersight Target
-    if ucs_server_profile_deployment_start_delay:
-        print("\nA UCS Server Profile Deployment start delay of "
-              f"{ucs_server_profile_deployment_start_delay} seconds has been "
-              "set, please wait...\n")
-        delay_timer(ucs_server_profile_deployment_start_delay)
-        print("\n")
-    for ucs_server_profile_config in ucs_server_profile_names_and_assignments:
-        if ucs_server_profile_config.get('Server Profile Name') and ucs_server_profile_config.get("Assign Server Profile"):
-            # Update UCS Server Profile name with UCS Server Deployment Tool provided prefix and/or suffix
-            deployment_tool_ucs_server_profile_name = f"{deployment_name_prefix}{ucs_server_profile_config['Server Profile Name']}{deployment_name_suffix}"            
-            assign_and_deploy_ucs_server_profile(
-                intersight_api_key_id=None,
-                intersight_api_key=None,
-                ucs_server_profile_name=deployment_tool_ucs_server_profile_name,
-                resource_pool_name="",
-                ucs_server_assignment_identifier="",
-                ucs_server_form_factor=ucs_server_profile_ucs_server_form_factor,
-                ucs_server_type=ucs_server_profile_ucs_server_type,
-                assign_ucs_server_profile=False,
-                deploy_ucs_server_profile=ucs_server_profile_config.get("Deploy Server Profile", False),
-                deployment_start_delay=0,
-                ucs_server_profile_organization=ucs_server_profile_organization,
-                preconfigured_api_client=main_intersight_api_client
-                )
+            deployment_tool_ucs_server_profile_name = f"{deployment_name_prefix}{ucs_server_profile_config['Server Profile Name']}{deployment_name_suffix}"
+            ucs_server_profile_assignments.append({
+                "Server Profile Name": deployment_tool_ucs_server_profile_name,
+                "Server Resource Pool": deployment_tool_ucs_server_profile_resource_pool_name,
+                "Server Assignment Identifier": ucs_server_profile_config.get("Server Assignment Identifier"),
+                "Deploy Server Profile": ucs_server_profile_config.get("Deploy Server Profile", False)
+                })
+    # Skip the UCS Server Profiles assigned and deployed in the previous run of a resumed deployment
+    if deployment_journal:
+        for ucs_server_profile_assignment in list(ucs_server_profile_assignments):
+            if deployment_journal.is_completed(f"Assign and Deploy UCS Server Profile {ucs_server_profile_assignment['Server Profile Name']}"):
+                print("\nThe UCS Server Profile named "
+                      f"{ucs_server_profile_assignment['Server Profile Name']} was "
+                      "assigned and deployed in the previous run. The assignment "
+                      "and deployment will be skipped.")
+                ucs_server_profile_assignments.remove(ucs_server_profile_assignment)
+    if ucs_server_profile_assignments:
+        ucs_server_profile_deployments = ucs_server_profile_wave_deployer(
+            intersight_api_key_id=None,
+            intersight_api_key=None,
+            ucs_server_profile_assignments=ucs_server_profile_assignments,
+            ucs_server_form_factor=ucs_server_profile_ucs_server_form_factor,
+            ucs_server_type=ucs_server_profile_ucs_server_type,
+            max_concurrent_requests=ucs_server_profile_max_concurrent_assignments,
+            concurrency_controller=deployment_concurrency_controller,
+            deployment_wave_size_per_chassis=ucs_server_profile_deployment_wave_size_per_chassis,
+            deployment_start_delay=ucs_server_profile_deployment_start_delay,
+            deployment_wait_timeout=ucs_server_profile_deployment_wait_timeout,
+            ucs_server_profile_organization=ucs_server_profile_organization,
+            preconfigured_api_client=main_intersight_api_client
+            )
+        print("\nUCS Server Profile Deployment Summary:")
+        for deployed_ucs_server_profile_name, ucs_server_profile_deployment in ucs_server_profile_deployments.items():
+            print(f"{deployed_ucs_server_profile_name:<45}"
+                  f"{ucs_server_profile_deployment}")
+            if deployment_journal and ucs_server_profile_deployment in ("Assigned", "Completed"):
+                deployment_journal.record(f"Assign and Deploy UCS Server Profile {deployed_ucs_server_profile_name}",
+                                          "UCS Server Profile",
+                                          deployed_ucs_server_profile_name
+                                          )
+
+    # Show the adaptive concurrency metrics
+    if deployment_concurrency_controller:
+        print("\nAdaptive Concurrency Metrics:")
+        for metric_name, metric_value in deployment_concurrency_controller.get_metrics().items():
+            print(f"{metric_name:<45}"
+                  f"{metric_value}")
 
     # UCS Server Deployment Tool completion
     print(f"\nThe {deployment_tool_type} has completed.\n")
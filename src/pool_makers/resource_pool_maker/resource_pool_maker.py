@@ -80,11 +80,24 @@ ucs_server_type = "FI-Attached"     # Options: "FI-Attached", "Standalone"
 resource_assignment_order = "default"       # Options: "default", "sequential"
 resource_type = "Server"        # Options: "Server", "None"
 pool_type = "Static"        # Options: "Static", "Dynamic"
+## NOTE - When server_side_selectors is set to True, the resources above are translated into selectors that are evaluated by Intersight, so the server inventory is not downloaded.
+## This is recommended with the "Dynamic" pool type, as the selectors also match servers that are added after the Resource Pool has been created.
+server_side_selectors = False
 
 # Intersight Base URL Setting (Change only if using the Intersight Virtual Appliance)
 intersight_base_url = "https://www.intersight.com/api/v1"
 url_certificate_verification = True
 
+# Intersight API Request Rate Settings
+## NOTE - To stay under the request quota of the Intersight account, set the maximum average number of Intersight API requests per second, for example: intersight_api_request_rate_limit = 20
+## Leave the value as None to not limit the request rate. Throttled requests are always retried after the delay requested by Intersight.
+intersight_api_request_rate_limit = None
+
+# Intersight Object State File Setting
+## NOTE - Provide a file path to store a hash of each configured object, so that objects unchanged since the last run are skipped, for example: intersight_object_state_file = "intersight_object_state.json"
+## Leave the value empty to compare every pre-existing object with Intersight on each run.
+intersight_object_state_file = ""
+
 ####### Finish Configuration Settings - The required value entries are complete. #######
 
 
@@ -98,18 +111,252 @@ import json
 import copy
 import intersight
 import re
+import threading
+import time
+import urllib.parse
+import hashlib
+import os
+import random
+import email.utils
+import atexit
 import urllib3
 
 # Suppress InsecureRequestWarning error messages
 urllib3.disable_warnings()
 
+# Establish the process-wide cache of Intersight API clients
+intersight_api_client_cache = {}
+intersight_api_client_cache_lock = threading.Lock()
+
+
+# Establish class to limit the request rate of an Intersight API client
+class IntersightRateLimiter:
+    """This class is used to limit the rate of Intersight API requests made
+    through an Intersight API client with a token bucket. Every function and
+    class sharing the API client draws from the same bucket, so the combined
+    request rate stays under the request quota of the Intersight account.
+    Requests can also be paused for every thread, for example after the
+    Intersight API has throttled a request.
+    """
+    def __init__(self,
+                 request_rate_limit=None,
+                 burst_size=None
+                 ):
+        self.request_rate_limit = request_rate_limit
+        self.burst_size = burst_size or max(1, request_rate_limit or 1)
+        self.available_tokens = self.burst_size
+        self.last_refill_time = time.monotonic()
+        self.paused_until = 0
+        self.lock = threading.Lock()
+
+    def __repr__(self):
+        return (
+            f"{self.__class__.__name__}"
+            f"({self.request_rate_limit}, "
+            f"{self.burst_size})"
+            )
+
+    def __str__(self):
+        return (f"{self.__class__.__name__} class object with a limit of "
+                f"{self.request_rate_limit} request(s) per second")
+
+    def acquire(self):
+        """This function waits until a request can be made, then consumes a
+        token from the bucket.
+        """
+        while True:
+            with self.lock:
+                current_time = time.monotonic()
+                wait_time = self.paused_until - current_time
+                if wait_time <= 0:
+                    if not self.request_rate_limit:
+                        return
+                    # Refill the bucket for the time elapsed since the last request
+                    self.available_tokens = min(self.burst_size,
+                                                self.available_tokens + (current_time - self.last_refill_time) * self.request_rate_limit
+                                                )
+                    self.last_refill_time = current_time
+                    if self.available_tokens >= 1:
+                        self.available_tokens -= 1
+                        return
+                    wait_time = (1 - self.available_tokens) / self.request_rate_limit
+            time.sleep(wait_time)
+
+    def pause(self,
+              pause_duration
+              ):
+        """This function pauses all requests for a duration.
+
+        Args:
+            pause_duration (float):
+                The duration of the pause in seconds.
+        """
+        with self.lock:
+            self.paused_until = max(self.paused_until, time.monotonic() + pause_duration)
+
+
+# Establish class for an Intersight SDK for Python API client with rate limiting and retries
+class RateLimitedApiClient(intersight.ApiClient):
+    """This class is used to provide an Intersight SDK for Python API client
+    that limits the rate of Intersight API requests and retries requests that
+    have been throttled or have failed temporarily. Throttled requests (429)
+    are retried for every method after the delay requested by the
+    Retry-After header. Requests that failed with a 500, 502, 503 or 504
+    status code are only retried for methods that are safe to repeat. Each
+    retry waits with jittered exponential backoff.
+    """
+    idempotent_methods = ("GET", "HEAD", "OPTIONS", "PUT", "DELETE")
+    retryable_status_codes = (500, 502, 503, 504)
+    rate_limiter = None
+    api_retry_limit = 5
+    api_retry_backoff = 1
+    api_retry_max_delay = 60
+
+    def _retry_delay(self,
+                     error,
+                     retry_attempt
+                     ):
+        """This function determines the delay before a request is retried.
+
+        Args:
+            error (intersight.exceptions.ApiException):
+                The exception raised by the failed request.
+            retry_attempt (int):
+                The number of retries already performed for the request.
+
+        Returns:
+            A float of the delay in seconds.
+        """
+        retry_after = (error.headers or {}).get("Retry-After")
+        if retry_after:
+            # The Retry-After header is either a number of seconds or an HTTP date
+            try:
+                return max(float(retry_after), 0) + random.uniform(0, self.api_retry_backoff)
+            except ValueError:
+                try:
+                    return max(email.utils.mktime_tz(email.utils.parsedate_tz(retry_after)) - time.time(), 0) + random.uniform(0, self.api_retry_backoff)
+                except (TypeError, ValueError, OverflowError):
+                    pass
+        exponential_delay = min(self.api_retry_max_delay, self.api_retry_backoff * 2 ** retry_attempt)
+        return random.uniform(exponential_delay / 2, exponential_delay)
+
+    def call_api(self,
+                 resource_path,
+                 method,
+                 *args,
+                 **kwargs
+                 ):
+        """This function performs an Intersight API request, waiting for the
+        rate limiter and retrying throttled or temporarily failed requests.
+
+        Args:
+            resource_path (str):
+                The Intersight API resource path of the request.
+            method (str):
+                The HTTP method of the request.
+            *args:
+                The additional positional arguments of the request.
+            **kwargs:
+                The additional keyword arguments of the request.
+
+        Returns:
+            The response of the request.
+
+        Raises:
+            intersight.exceptions.ApiException:
+                The request failed and could not be retried.
+        """
+        if kwargs.get("async_req"):
+            return super().call_api(resource_path, method, *args, **kwargs)
+        retry_attempt = 0
+        while True:
+            if self.rate_limiter:
+                self.rate_limiter.acquire()
+            try:
+                return super().call_api(resource_path, method, *args, **kwargs)
+            except intersight.exceptions.ApiException as error:
+                if retry_attempt >= self.api_retry_limit or not (
+                    error.status == 429 or
+                    (error.status in self.retryable_status_codes and method.upper() in self.idempotent_methods)
+                    ):
+                    raise
+                retry_delay = self._retry_delay(error, retry_attempt)
+                if error.status == 429 and self.rate_limiter:
+                    # Pause every request sharing the API client while throttled
+                    self.rate_limiter.pause(retry_delay)
+                print(f"The Intersight API request for '{resource_path}' "
+                      f"returned the status code {error.status}. The request "
+                      f"will be retried in {retry_delay:.1f} seconds.")
+                time.sleep(retry_delay)
+                retry_attempt += 1
+
+
 # Function to get Intersight API client as specified in the Intersight Python SDK documentation for OpenAPI 3.x
 ## Modified to align with overall formatting, try/except blocks added for additional error handling, certificate verification option added
+## Modified to reuse one pooled API client per endpoint, API key and API client settings, connection pool sizing and connection retries added
 def get_api_client(api_key_id,
                    api_secret_file,
                    endpoint="https://intersight.com",
-                   url_certificate_verification=True
+                   url_certificate_verification=True,
+                   connection_pool_maxsize=32,
+                   connection_retry_limit=3,
+                   api_request_rate_limit=None,
+                   api_retry_limit=5
                    ):
+    """This is a function to get an Intersight API client. One API client is
+    established per endpoint, API key and set of API client settings, then
+    reused by every later call in the process with the same arguments, so
+    the API key is only loaded once and the pooled keep-alive connections of
+    the API client are shared. A call with different connection, rate limit
+    or retry settings establishes a separate API client with those settings.
+
+    Args:
+        api_key_id (str):
+            The ID of the Intersight API key.
+        api_secret_file (str):
+            The system file path of the Intersight API key.
+        endpoint (str):
+            Optional; The Intersight API base URL. The default value is
+            "https://intersight.com".
+        url_certificate_verification (bool):
+            Optional; The setting for verifying the SSL certificate of the
+            Intersight API base URL. The default value is True.
+        connection_pool_maxsize (int):
+            Optional; The maximum number of connections kept open to the
+            Intersight API by the API client. The value should be at least the
+            number of requests made at the same time. The default value is
+            32.
+        connection_retry_limit (int):
+            Optional; The number of times a request is retried after a
+            connection error. The default value is 3.
+        api_request_rate_limit (float):
+            Optional; The maximum average number of Intersight API requests
+            per second made through the API client, shared by every function
+            and class using the client. The default value is None, which does
+            not limit the request rate.
+        api_retry_limit (int):
+            Optional; The number of times a request is retried after a 429
+            status code, or after a 500, 502, 503 or 504 status code for
+            requests that are safe to repeat. The default value is 5.
+
+    Returns:
+        An ApiClient class instance which handles Intersight client-server
+        communication through the use of API keys.
+    """
+    # Reuse the API client already established for the endpoint, API key and API client settings
+    api_client_cache_key = (endpoint,
+                            api_key_id,
+                            api_secret_file,
+                            url_certificate_verification,
+                            connection_pool_maxsize,
+                            connection_retry_limit,
+                            api_request_rate_limit,
+                            api_retry_limit
+                            )
+    with intersight_api_client_cache_lock:
+        cached_api_client = intersight_api_client_cache.get(api_client_cache_key)
+    if cached_api_client is not None:
+        return cached_api_client
     try:
         with open(api_secret_file, 'r') as f:
             api_key = f.read()
@@ -145,6 +392,13 @@ def get_api_client(api_key_id,
 
         if not url_certificate_verification:
             configuration.verify_ssl = False
+        # Size the connection pool for concurrent requests and retry failed connections
+        ## Failed status codes are retried by the API client with jittered backoff
+        configuration.connection_pool_maxsize = connection_pool_maxsize
+        configuration.retries = urllib3.util.Retry(total=connection_retry_limit,
+                                                   backoff_factor=0.5,
+                                                   raise_on_status=False
+                                                   )
     except Exception:
         print("\nA configuration error has occurred!\n")
         print("Unable to access the Intersight API Key.")
@@ -155,7 +409,678 @@ def get_api_client(api_key_id,
         traceback.print_exc()
         sys.exit(0)
         
-    return intersight.ApiClient(configuration)
+    # Limit the request rate and retry throttled requests for every user of the API client
+    api_client = RateLimitedApiClient(configuration)
+    api_client.rate_limiter = IntersightRateLimiter(api_request_rate_limit)
+    api_client.api_retry_limit = api_retry_limit
+    with intersight_api_client_cache_lock:
+        return intersight_api_client_cache.setdefault(api_client_cache_key,
+                                                      api_client
+                                                      )
+
+
+# Establish class to hold the Intersight account context of an Intersight API client
+class IntersightAccountContext:
+    """This class is used to hold the Intersight account information for a
+    specific Intersight API client, so that the account only needs to be
+    retrieved from Intersight once.
+    """
+    def __init__(self,
+                 api_client
+                 ):
+        self.api_client = api_client
+        self.iam_account = None
+        self.lock = threading.Lock()
+
+    def __repr__(self):
+        return (
+            f"{self.__class__.__name__}"
+            f"({self.api_client})"
+            )
+
+    def __str__(self):
+        if self.iam_account is None:
+            return f"{self.__class__.__name__} class object for an unresolved Intersight account"
+        return (f"{self.__class__.__name__} class object for the Intersight "
+                f"account named '{self.iam_account.get('Name')}'")
+
+    def set_account(self,
+                    iam_account
+                    ):
+        """This function stores the Intersight account information.
+
+        Args:
+            iam_account (dict):
+                The Intersight API object of the Intersight account.
+        """
+        with self.lock:
+            self.iam_account = iam_account
+
+    def get_account_name(self):
+        """This function returns the name of the Intersight account. If the
+        Intersight account information has not been stored yet, it is
+        retrieved from Intersight on first use.
+
+        Returns:
+            A string of the name for the Intersight account. If the Intersight
+            account information cannot be retrieved, the string "Unknown" is
+            returned, so that the calling error message can still be shown.
+        """
+        with self.lock:
+            if self.iam_account is None:
+                try:
+                    self.api_client.call_api(resource_path="/iam/Accounts?$select=Name",
+                                             method="GET",
+                                             auth_settings=['cookieAuth', 'http_signature', 'oAuth2', 'oAuth2']
+                                             )
+                    self.iam_account = json.loads(self.api_client.last_response.data)["Results"][0]
+                except Exception:
+                    return "Unknown"
+            return self.iam_account.get("Name")
+
+
+# Establish function to retrieve the Intersight account context of an Intersight API client
+intersight_account_context_creation_lock = threading.Lock()
+
+
+def get_intersight_account_context(api_client):
+    """This is a function to retrieve the Intersight account context for an
+    Intersight API client. The account context is created and attached to the
+    API client on first use, so that it is shared by every function and class
+    using the client.
+
+    Args:
+        api_client ("ApiClient"):
+            An ApiClient class instance which handles Intersight client-server
+            communication through the use of API keys.
+
+    Returns:
+        An IntersightAccountContext class instance.
+    """
+    with intersight_account_context_creation_lock:
+        intersight_account_context = getattr(api_client, "intersight_account_context", None)
+        if intersight_account_context is None:
+            intersight_account_context = IntersightAccountContext(api_client)
+            api_client.intersight_account_context = intersight_account_context
+    return intersight_account_context
+
+
+# Establish class to store the state of configured Intersight API objects across runs
+class IntersightObjectStateFile:
+    """This class is used to store a hash of the Intersight API body of each
+    configured Intersight object in a local JSON state file, along with the
+    MOID and modification time of the Intersight object. Intersight objects
+    with an unchanged Intersight API body and modification time can then be
+    skipped on later runs. The state file is saved after each batch of
+    stored object states and when flushed, rather than after every object.
+    """
+    def __init__(self,
+                 state_file_path,
+                 save_batch_size=50
+                 ):
+        self.state_file_path = state_file_path
+        self.save_batch_size = max(1, save_batch_size)
+        self.unsaved_object_state_count = 0
+        self.lock = threading.Lock()
+        self.object_states = {}
+        try:
+            with open(state_file_path, "r") as state_file:
+                self.object_states = json.load(state_file)
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError):
+            print(f"The state file '{state_file_path}' could not be read. "
+                  "A new state file will be created.")
+
+    def __repr__(self):
+        return (
+            f"{self.__class__.__name__}"
+            f"('{self.state_file_path}', "
+            f"{self.save_batch_size})"
+            )
+
+    def __str__(self):
+        return (f"{self.__class__.__name__} class object with "
+                f"{len(self.object_states)} stored object state(s)")
+
+    @staticmethod
+    def _state_key(intersight_api_path,
+                   organization_moid,
+                   object_name
+                   ):
+        """This function creates the state key for an Intersight object.
+
+        Args:
+            intersight_api_path (str):
+                The Intersight API path of the Intersight object.
+            organization_moid (str):
+                The MOID of the Intersight organization of the Intersight
+                object.
+            object_name (str):
+                The name of the Intersight object.
+
+        Returns:
+            A string containing the state key for the Intersight object.
+        """
+        base_intersight_api_path = intersight_api_path.split("?", 1)[0].strip("/")
+        return f"{base_intersight_api_path}|{organization_moid}|{object_name}"
+
+    @staticmethod
+    def api_body_hash(intersight_api_body):
+        """This function creates a canonical hash of an Intersight API body.
+
+        Args:
+            intersight_api_body (dict):
+                The Intersight API body of the Intersight object.
+
+        Returns:
+            A string of the SHA-256 hash of the Intersight API body.
+        """
+        canonical_intersight_api_body = json.dumps(intersight_api_body,
+                                                   sort_keys=True,
+                                                   separators=(",", ":"),
+                                                   default=str
+                                                   )
+        return hashlib.sha256(canonical_intersight_api_body.encode("utf-8")).hexdigest()
+
+    def is_unchanged(self,
+                     intersight_api_path,
+                     organization_moid,
+                     object_name,
+                     intersight_api_body,
+                     existing_intersight_object
+                     ):
+        """This function determines whether an Intersight object is unchanged
+        since it was last stored, both in the provided Intersight API body and
+        on Intersight.
+
+        Args:
+            intersight_api_path (str):
+                The Intersight API path of the Intersight object.
+            organization_moid (str):
+                The MOID of the Intersight organization of the Intersight
+                object.
+            object_name (str):
+                The name of the Intersight object.
+            intersight_api_body (dict):
+                The Intersight API body of the Intersight object.
+            existing_intersight_object (dict):
+                The pre-existing Intersight object.
+
+        Returns:
+            A boolean indicating whether the Intersight object is unchanged.
+        """
+        state_key = self._state_key(intersight_api_path,
+                                    organization_moid,
+                                    object_name
+                                    )
+        with self.lock:
+            object_state = self.object_states.get(state_key)
+        if not object_state or not existing_intersight_object.get("ModTime"):
+            return False
+        return (
+            object_state.get("Hash") == self.api_body_hash(intersight_api_body) and
+            object_state.get("Moid") == existing_intersight_object.get("Moid") and
+            object_state.get("ModTime") == existing_intersight_object.get("ModTime")
+            )
+
+    def set(self,
+            intersight_api_path,
+            organization_moid,
+            object_name,
+            intersight_api_body,
+            intersight_object
+            ):
+        """This function stores the state of a configured Intersight object.
+        The state file is saved once a full batch of object states has been
+        stored.
+
+        Args:
+            intersight_api_path (str):
+                The Intersight API path of the Intersight object.
+            organization_moid (str):
+                The MOID of the Intersight organization of the Intersight
+                object.
+            object_name (str):
+                The name of the Intersight object.
+            intersight_api_body (dict):
+                The Intersight API body of the Intersight object.
+            intersight_object (dict):
+                The Intersight object as returned by Intersight, including the
+                MOID and modification time.
+        """
+        if not intersight_object.get("Moid") or not intersight_object.get("ModTime"):
+            return
+        state_key = self._state_key(intersight_api_path,
+                                    organization_moid,
+                                    object_name
+                                    )
+        with self.lock:
+            self.object_states[state_key] = {
+                "Hash": self.api_body_hash(intersight_api_body),
+                "Moid": intersight_object["Moid"],
+                "ModTime": intersight_object["ModTime"]
+                }
+            self.unsaved_object_state_count += 1
+            if self.unsaved_object_state_count >= self.save_batch_size:
+                self._save()
+
+    def _save(self):
+        """This function saves the stored object states to the state file.
+        The lock of the state file must be held by the caller.
+        """
+        # Write the state file atomically, so an interrupted run leaves the previous state file intact
+        temporary_state_file_path = f"{self.state_file_path}.tmp"
+        try:
+            with open(temporary_state_file_path, "w") as state_file:
+                json.dump(self.object_states, state_file, indent=2, sort_keys=True)
+            os.replace(temporary_state_file_path, self.state_file_path)
+            self.unsaved_object_state_count = 0
+        except OSError:
+            print(f"The state file '{self.state_file_path}' could not be "
+                  "saved.")
+
+    def flush(self):
+        """This function saves any object states stored since the state file
+        was last saved.
+        """
+        with self.lock:
+            if self.unsaved_object_state_count:
+                self._save()
+
+
+# Establish function to attach a state file to an Intersight API client
+def set_intersight_object_state_file(api_client,
+                                     state_file_path
+                                     ):
+    """This is a function to attach a state file to an Intersight API client,
+    so that every Intersight object configured using the client is stored in
+    the state file and skipped on later runs if unchanged. The state file is
+    flushed when the process exits.
+
+    Args:
+        api_client ("ApiClient"):
+            An ApiClient class instance which handles Intersight client-server
+            communication through the use of API keys.
+        state_file_path (str):
+            The system file path of the state file.
+
+    Returns:
+        An IntersightObjectStateFile class instance.
+    """
+    intersight_object_state_file = IntersightObjectStateFile(state_file_path)
+    api_client.intersight_object_state_file = intersight_object_state_file
+    atexit.register(intersight_object_state_file.flush)
+    return intersight_object_state_file
+
+
+# Establish class to cache the live state of Intersight API objects for updates
+class IntersightObjectStateCache:
+    """This class is used to hold the live state of Intersight objects for a
+    specific Intersight API client. The Intersight objects under each
+    Intersight API path and organization are retrieved from Intersight once
+    with one filtered, paged query that selects only the compared attributes,
+    then indexed by name, so that pre-existing objects can be compared with
+    the provided configuration before any changes are made.
+    """
+    def __init__(self,
+                 api_client,
+                 page_size=1000
+                 ):
+        self.api_client = api_client
+        self.page_size = page_size
+        self.object_indexes = {}
+        self.object_index_attributes = {}
+        self.object_index_locks = {}
+        self.lock = threading.Lock()
+
+    def __repr__(self):
+        return (
+            f"{self.__class__.__name__}"
+            f"({self.api_client}, "
+            f"{self.page_size})"
+            )
+
+    def __str__(self):
+        return (f"{self.__class__.__name__} class object with "
+                f"{len(self.object_indexes)} indexed object type(s)")
+
+    def _get_object_index(self,
+                          intersight_api_path,
+                          organization_moid,
+                          select_attributes=None
+                          ):
+        """This function returns the index of the Intersight objects under an
+        Intersight API path and organization. The Intersight objects are
+        retrieved from Intersight on first use with one filtered query, and
+        retrieved again only if attributes that were not previously selected
+        are needed.
+
+        Args:
+            intersight_api_path (str):
+                The Intersight API path of the Intersight objects.
+            organization_moid (str):
+                The MOID of the Intersight organization of the Intersight
+                objects. If None, the Intersight objects are not filtered by
+                organization.
+            select_attributes (list):
+                Optional; A list of the attributes to be retrieved for each
+                Intersight object. The "Name", "Moid" and "ModTime" attributes
+                are always retrieved. The default value is None, which
+                retrieves all attributes.
+
+        Returns:
+            A dictionary with the names of the Intersight objects as keys and
+            the Intersight objects as values. If the Intersight objects could
+            not be retrieved, None is returned.
+        """
+        base_intersight_api_path = intersight_api_path.split("?", 1)[0].strip("/")
+        object_index_key = (base_intersight_api_path, organization_moid)
+        if select_attributes is None:
+            required_attributes = None
+        else:
+            required_attributes = {"Name", "Moid", "ModTime", *select_attributes}
+        with self.lock:
+            object_index_lock = self.object_index_locks.setdefault(object_index_key, threading.Lock())
+        with object_index_lock:
+            if object_index_key in self.object_indexes:
+                indexed_attributes = self.object_index_attributes[object_index_key]
+                if indexed_attributes is None or (required_attributes is not None and required_attributes <= indexed_attributes):
+                    return self.object_indexes[object_index_key]
+                # Retrieve the Intersight objects again with the previously selected attributes and the newly needed attributes
+                if required_attributes is not None:
+                    required_attributes |= indexed_attributes
+            filter_attributes = {"Organization": {"Moid": organization_moid}} if organization_moid else None
+            query_intersight_api_path = intersight_api_query_builder(base_intersight_api_path,
+                                                                     filter_attributes=filter_attributes,
+                                                                     select_attributes=sorted(required_attributes) if required_attributes else None
+                                                                     )
+            query_separator = "&" if "?" in query_intersight_api_path else "?"
+            object_index = {}
+            try:
+                skip_count = 0
+                while True:
+                    self.api_client.call_api(resource_path=f"/{query_intersight_api_path}{query_separator}$top={self.page_size}&$skip={skip_count}",
+                                             method="GET",
+                                             auth_settings=['cookieAuth', 'http_signature', 'oAuth2', 'oAuth2']
+                                             )
+                    retrieved_intersight_objects = json.loads(self.api_client.last_response.data).get("Results") or []
+                    for intersight_object in retrieved_intersight_objects:
+                        if intersight_object.get("Name"):
+                            object_index.setdefault(intersight_object["Name"], intersight_object)
+                    if len(retrieved_intersight_objects) < self.page_size:
+                        break
+                    skip_count += self.page_size
+            except Exception:
+                # Retrieve the Intersight objects again on the next use, as the error may be transient
+                print("The pre-existing objects under the Intersight API "
+                      f"resource path '{base_intersight_api_path}' could not "
+                      "be retrieved for comparison.")
+                return None
+            self.object_indexes[object_index_key] = object_index
+            self.object_index_attributes[object_index_key] = required_attributes
+            return object_index
+
+    def get(self,
+            intersight_api_path,
+            organization_moid,
+            object_name,
+            select_attributes=None
+            ):
+        """This function retrieves the live state of an Intersight object.
+
+        Args:
+            intersight_api_path (str):
+                The Intersight API path of the Intersight object.
+            organization_moid (str):
+                The MOID of the Intersight organization of the Intersight
+                object. If None, the Intersight object is not filtered by
+                organization.
+            object_name (str):
+                The name of the Intersight object.
+            select_attributes (list):
+                Optional; A list of the attributes of the Intersight object
+                to be compared. The default value is None, which retrieves all
+                attributes.
+
+        Returns:
+            A dictionary of the Intersight object. If the Intersight object
+            does not exist or the Intersight objects could not be retrieved,
+            None is returned.
+        """
+        object_index = self._get_object_index(intersight_api_path,
+                                              organization_moid,
+                                              select_attributes
+                                              )
+        if object_index is None:
+            return None
+        return object_index.get(object_name)
+
+    def set(self,
+            intersight_api_path,
+            organization_moid,
+            object_name,
+            intersight_object
+            ):
+        """This function stores the live state of an Intersight object after
+        it has been updated.
+
+        Args:
+            intersight_api_path (str):
+                The Intersight API path of the Intersight object.
+            organization_moid (str):
+                The MOID of the Intersight organization of the Intersight
+                object.
+            object_name (str):
+                The name of the Intersight object.
+            intersight_object (dict):
+                The Intersight object.
+        """
+        base_intersight_api_path = intersight_api_path.split("?", 1)[0].strip("/")
+        with self.lock:
+            object_index = self.object_indexes.get((base_intersight_api_path, organization_moid))
+            if object_index is not None:
+                object_index[object_name] = intersight_object
+
+
+# Establish function to retrieve the object state cache of an Intersight API client
+intersight_object_state_cache_creation_lock = threading.Lock()
+
+
+def get_intersight_object_state_cache(api_client):
+    """This is a function to retrieve the object state cache for an
+    Intersight API client. The object state cache is created and attached to
+    the API client on first use, so that it is shared by every function and
+    class using the client.
+
+    Args:
+        api_client ("ApiClient"):
+            An ApiClient class instance which handles Intersight client-server
+            communication through the use of API keys.
+
+    Returns:
+        An IntersightObjectStateCache class instance.
+    """
+    with intersight_object_state_cache_creation_lock:
+        intersight_object_state_cache = getattr(api_client, "intersight_object_state_cache", None)
+        if intersight_object_state_cache is None:
+            intersight_object_state_cache = IntersightObjectStateCache(api_client)
+            api_client.intersight_object_state_cache = intersight_object_state_cache
+    return intersight_object_state_cache
+
+
+# Establish function to compare a provided attribute value with the live state of an Intersight object
+def intersight_attribute_matcher(provided_attribute_value,
+                                 existing_attribute_value
+                                 ):
+    """This is a function to determine whether a provided attribute value
+    already matches the attribute value of a pre-existing Intersight object.
+    Dictionaries are matched on the provided keys only, since Intersight
+    returns additional read-only attributes such as "ClassId" and "link" on
+    each object reference.
+
+    Args:
+        provided_attribute_value (any):
+            The provided attribute value.
+        existing_attribute_value (any):
+            The attribute value of the pre-existing Intersight object.
+
+    Returns:
+        A boolean indicating whether the provided attribute value matches.
+    """
+    if isinstance(provided_attribute_value, dict):
+        if not isinstance(existing_attribute_value, dict):
+            return False
+        return all(
+            intersight_attribute_matcher(provided_sub_value, existing_attribute_value.get(provided_sub_key))
+            for provided_sub_key, provided_sub_value in provided_attribute_value.items()
+            )
+    if isinstance(provided_attribute_value, list):
+        if not isinstance(existing_attribute_value, list) or len(provided_attribute_value) != len(existing_attribute_value):
+            return False
+        return all(
+            intersight_attribute_matcher(provided_item, existing_item)
+            for provided_item, existing_item in zip(provided_attribute_value, existing_attribute_value)
+            )
+    return provided_attribute_value == existing_attribute_value
+
+
+# Establish function to update a pre-existing Intersight object with only the changed attributes
+def intersight_object_updater(api_client,
+                              intersight_api_path,
+                              intersight_api_body,
+                              object_type="object",
+                              update_api_body_maker=None,
+                              existing_object_attributes=None
+                              ):
+    """This is a function to update a pre-existing Intersight object. The
+    provided Intersight API body is compared with the live state of the
+    Intersight object and a PATCH is performed with only the changed
+    attributes. No changes are made if the Intersight object already matches.
+
+    Args:
+        api_client ("ApiClient"):
+            An ApiClient class instance which handles Intersight client-server
+            communication through the use of API keys.
+        intersight_api_path (str):
+            The Intersight API path of the Intersight object.
+        intersight_api_body (dict):
+            The Intersight API body of the Intersight object.
+        object_type (str):
+            Optional; The type of Intersight object. The default value is
+            "object".
+        update_api_body_maker (function):
+            Optional; A function that receives the pre-existing Intersight
+            object and returns the Intersight API body to be compared, or
+            None if the pre-existing Intersight object must be updated
+            through a POST instead. The default value is None, which compares
+            the provided Intersight API body.
+        existing_object_attributes (list):
+            Optional; A list of additional attributes of the pre-existing
+            Intersight object that are needed by the update_api_body_maker
+            function. Only the attributes of the provided Intersight API body
+            and these attributes are retrieved. The default value is None.
+
+    If a state file is attached to the API client, Intersight objects with an
+    unchanged Intersight API body and modification time since the last run
+    are skipped without comparison.
+
+    Returns:
+        A string with a statement indicating whether the update was
+        successful or failed, using the same statements as the POST method.
+        If the Intersight object already matches and no update was made,
+        "The object is unchanged." is returned. If the Intersight object does
+        not already exist or must be updated through a POST, None is
+        returned. None is also returned if the Intersight API body has no
+        name or organization.
+    """
+    existing_intersight_object_name = intersight_api_body.get("Name")
+    organization_moid = (intersight_api_body.get("Organization") or {}).get("Moid")
+    if not existing_intersight_object_name or not organization_moid:
+        return None
+    intersight_object_state_cache = get_intersight_object_state_cache(api_client)
+    existing_intersight_object = intersight_object_state_cache.get(intersight_api_path,
+                                                                   organization_moid,
+                                                                   existing_intersight_object_name,
+                                                                   select_attributes=[*intersight_api_body, *(existing_object_attributes or [])]
+                                                                   )
+    if existing_intersight_object is None:
+        return None
+    intersight_object_state_file = getattr(api_client, "intersight_object_state_file", None)
+    if intersight_object_state_file and intersight_object_state_file.is_unchanged(intersight_api_path,
+                                                                                  organization_moid,
+                                                                                  existing_intersight_object_name,
+                                                                                  intersight_api_body,
+                                                                                  existing_intersight_object
+                                                                                  ):
+        print(f"The {object_type} named {existing_intersight_object_name} is "
+              "unchanged since the last run. No update is needed.")
+        return "The object is unchanged."
+    if update_api_body_maker:
+        update_api_body = update_api_body_maker(existing_intersight_object)
+        if update_api_body is None:
+            return None
+    else:
+        update_api_body = intersight_api_body
+    # Determine the attributes that differ from the pre-existing object
+    changed_attributes = {
+        attribute_name: attribute_value
+        for attribute_name, attribute_value in update_api_body.items()
+        if not intersight_attribute_matcher(attribute_value, existing_intersight_object.get(attribute_name))
+        }
+    print(f"The targeted {object_type} already exists.")
+    if not changed_attributes:
+        print(f"The pre-existing {existing_intersight_object_name} already "
+              "matches the provided configuration. No update is needed.")
+        if intersight_object_state_file:
+            intersight_object_state_file.set(intersight_api_path,
+                                             organization_moid,
+                                             existing_intersight_object_name,
+                                             intersight_api_body,
+                                             existing_intersight_object
+                                             )
+        return "The object is unchanged."
+    print("An attempt will be made to update the changed attributes of the "
+          f"pre-existing {existing_intersight_object_name}: "
+          f"{', '.join(changed_attributes)}...")
+    full_intersight_api_path_with_moid = f"/{intersight_api_path.split('?', 1)[0].strip('/')}/{existing_intersight_object['Moid']}"
+    try:
+        api_client.call_api(resource_path=full_intersight_api_path_with_moid,
+                            method="PATCH",
+                            body=changed_attributes,
+                            auth_settings=['cookieAuth', 'http_signature', 'oAuth2', 'oAuth2']
+                            )
+        # Use the modification time returned by Intersight for the updated object
+        updated_intersight_object = {**existing_intersight_object, **changed_attributes, "ModTime": None}
+        try:
+            updated_intersight_object["ModTime"] = json.loads(api_client.last_response.data).get("ModTime")
+        except Exception:
+            pass
+        intersight_object_state_cache.set(intersight_api_path,
+                                          organization_moid,
+                                          existing_intersight_object_name,
+                                          updated_intersight_object
+                                          )
+        if intersight_object_state_file:
+            intersight_object_state_file.set(intersight_api_path,
+                                             organization_moid,
+                                             existing_intersight_object_name,
+                                             intersight_api_body,
+                                             updated_intersight_object
+                                             )
+        print(f"The update of the {object_type} has completed.")
+        print(f"The pre-existing {existing_intersight_object_name} has been "
+              "updated.")
+        return "The POST method was successful."
+    except Exception:
+        print("\nA configuration error has occurred!\n")
+        print(f"Unable to update the {object_type} under the Intersight API "
+              f"resource path '{full_intersight_api_path_with_moid}'.\n")
+        print(f"The pre-existing {existing_intersight_object_name} could not "
+              "be updated.")
+        print("Exception Message: ")
+        traceback.print_exc()
+        return "The POST method failed."
 
 
 # Establish function to test for the availability of the Intersight API and Intersight account
@@ -223,6 +1148,8 @@ def test_intersight_api_service(intersight_api_key_id,
             sys.exit(0)
         else:
             intersight_account_name = iam_account["Results"][0]["Name"]
+            # Store the Intersight account context for reuse by later lookups
+            get_intersight_account_context(api_client).set_account(iam_account["Results"][0])
             print("The Intersight API and Account Availability Test has "
                   "passed.\n")
             print(f"The Intersight account named '{intersight_account_name}' "
@@ -239,6 +1166,260 @@ def test_intersight_api_service(intersight_api_key_id,
         sys.exit(0)
 
 
+# Establish function to add server-side query options to an Intersight API path
+def intersight_api_query_builder(intersight_api_path,
+                                 filter_attributes=None,
+                                 select_attributes=None
+                                 ):
+    """This is a function to add the $filter and $select query options to an
+    Intersight API path, so that matching of Intersight objects and trimming
+    of returned attributes is performed by Intersight rather than locally.
+    Any query options already present on the Intersight API path are kept and
+    an existing $filter is combined with the new filter expressions.
+
+    Args:
+        intersight_api_path (str):
+            The Intersight API path of the Intersight objects. The path can
+            include existing query options, for example
+            "compute/Blades?$top=1000".
+        filter_attributes (dict):
+            Optional; A dictionary containing the attribute keys and values
+            that the Intersight objects must match. String, number and boolean
+            values are matched with the "eq" operator. Dictionary values
+            containing a "Moid" key, such as object references, are matched on
+            the referenced MOID. Values of any other type are skipped and must
+            be matched locally. The default value is None.
+        select_attributes (list):
+            Optional; A list containing the attribute keys to be returned for
+            each Intersight object. The default value is None, which returns
+            all attributes.
+
+    Returns:
+        A string of the Intersight API path with the query options applied.
+    """
+    def filter_value_formatter(attribute_value):
+        """This is a function to format an attribute value for use in an
+        Intersight API $filter expression.
+
+        Args:
+            attribute_value (str, int, float, bool):
+                The attribute value to be formatted.
+
+        Returns:
+            A string of the formatted attribute value.
+        """
+        if isinstance(attribute_value, bool):
+            return str(attribute_value).lower()
+        if isinstance(attribute_value, (int, float)):
+            return str(attribute_value)
+        escaped_attribute_value = attribute_value.replace("'", "''")
+        return f"'{escaped_attribute_value}'"
+
+    # Separate the base Intersight API path from any existing query options
+    if "?" in intersight_api_path:
+        base_intersight_api_path, existing_query = intersight_api_path.split("?", 1)
+        query_options = existing_query.split("&")
+    else:
+        base_intersight_api_path = intersight_api_path
+        query_options = []
+    # Create the list of filter expressions
+    filter_expressions = []
+    if filter_attributes:
+        for attribute_name, attribute_value in filter_attributes.items():
+            if isinstance(attribute_value, (str, int, float, bool)):
+                filter_expressions.append(f"{attribute_name} eq {filter_value_formatter(attribute_value)}")
+            elif isinstance(attribute_value, dict) and attribute_value.get("Moid"):
+                filter_expressions.append(f"{attribute_name}.Moid eq {filter_value_formatter(attribute_value['Moid'])}")
+    # Combine the filter expressions with any existing $filter query option
+    if filter_expressions:
+        for query_option in query_options:
+            if query_option.startswith("$filter="):
+                query_options.remove(query_option)
+                existing_filter_expression = urllib.parse.unquote(query_option[len("$filter="):])
+                filter_expressions.insert(0, f"({existing_filter_expression})")
+                break
+        combined_filter_expression = " and ".join(filter_expressions)
+        query_options.append(f"$filter={urllib.parse.quote(combined_filter_expression, safe='')}")
+    # Replace any existing $select query option
+    if select_attributes:
+        query_options = [query_option for query_option in query_options if not query_option.startswith("$select=")]
+        unique_select_attributes = list(dict.fromkeys(select_attributes))
+        query_options.append(f"$select={','.join(unique_select_attributes)}")
+    if query_options:
+        return f"{base_intersight_api_path}?{'&'.join(query_options)}"
+    return base_intersight_api_path
+
+
+# Establish class to cache the MOIDs of Intersight API objects retrieved by name
+class IntersightMoidCache:
+    """This class is used to cache the MOIDs of Intersight objects that have
+    been retrieved by name for a specific Intersight API client.
+    """
+    def __init__(self,
+                 time_to_live=900
+                 ):
+        self.time_to_live = time_to_live
+        self.cached_moids = {}
+        self.lock = threading.Lock()
+
+    def __repr__(self):
+        return (
+            f"{self.__class__.__name__}"
+            f"({self.time_to_live})"
+            )
+
+    def __str__(self):
+        return (f"{self.__class__.__name__} class object with "
+                f"{len(self.cached_moids)} cached MOIDs")
+
+    @staticmethod
+    def _cache_key(intersight_api_path,
+                   organization,
+                   object_name
+                   ):
+        """This function creates the cache key for an Intersight object. Any
+        query parameters are removed from the Intersight API path, so that
+        lookups of the same object under varying queries share one entry.
+
+        Args:
+            intersight_api_path (str):
+                The Intersight API path of the Intersight object.
+            organization (str):
+                The Intersight organization of the Intersight object.
+            object_name (str):
+                The name of the Intersight object.
+
+        Returns:
+            A tuple containing the cache key for the Intersight object.
+        """
+        base_intersight_api_path = intersight_api_path.split("?", 1)[0].strip("/")
+        return (base_intersight_api_path, organization, object_name)
+
+    def get(self,
+            intersight_api_path,
+            organization,
+            object_name
+            ):
+        """This function retrieves a cached MOID for an Intersight object.
+
+        Args:
+            intersight_api_path (str):
+                The Intersight API path of the Intersight object.
+            organization (str):
+                The Intersight organization of the Intersight object.
+            object_name (str):
+                The name of the Intersight object.
+
+        Returns:
+            A string of the cached MOID for the provided Intersight object. If
+            the MOID has not been cached or has expired, None will be returned.
+        """
+        cache_key = self._cache_key(intersight_api_path,
+                                    organization,
+                                    object_name
+                                    )
+        with self.lock:
+            cached_entry = self.cached_moids.get(cache_key)
+            if cached_entry is None:
+                return None
+            cached_moid, expiration_time = cached_entry
+            if time.monotonic() >= expiration_time:
+                self.cached_moids.pop(cache_key, None)
+                return None
+            return cached_moid
+
+    def set(self,
+            intersight_api_path,
+            organization,
+            object_name,
+            object_moid
+            ):
+        """This function caches the MOID for an Intersight object.
+
+        Args:
+            intersight_api_path (str):
+                The Intersight API path of the Intersight object.
+            organization (str):
+                The Intersight organization of the Intersight object.
+            object_name (str):
+                The name of the Intersight object.
+            object_moid (str):
+                The MOID of the Intersight object.
+        """
+        cache_key = self._cache_key(intersight_api_path,
+                                    organization,
+                                    object_name
+                                    )
+        with self.lock:
+            self.cached_moids[cache_key] = (object_moid,
+                                            time.monotonic() + self.time_to_live
+                                            )
+
+    def invalidate(self,
+                   intersight_api_path,
+                   organization=None,
+                   object_name=None
+                   ):
+        """This function removes cached MOIDs for Intersight objects under an
+        Intersight API path. This should be performed whenever an Intersight
+        object under the path is created, updated or deleted.
+
+        Args:
+            intersight_api_path (str):
+                The Intersight API path of the Intersight objects.
+            organization (str):
+                Optional; The Intersight organization of the Intersight
+                objects. The default value is None, which matches every
+                organization.
+            object_name (str):
+                Optional; The name of the Intersight object. The default value
+                is None, which matches every object name.
+        """
+        base_intersight_api_path = self._cache_key(intersight_api_path,
+                                                   organization,
+                                                   object_name
+                                                   )[0]
+        with self.lock:
+            for cache_key in list(self.cached_moids):
+                if (
+                    cache_key[0] == base_intersight_api_path and
+                    organization in (None, cache_key[1]) and
+                    object_name in (None, cache_key[2])
+                    ):
+                    self.cached_moids.pop(cache_key)
+
+    def clear(self):
+        """This function removes all cached MOIDs.
+        """
+        with self.lock:
+            self.cached_moids.clear()
+
+
+# Establish function to retrieve the MOID cache of an Intersight API client
+intersight_moid_cache_creation_lock = threading.Lock()
+
+
+def get_intersight_moid_cache(api_client):
+    """This is a function to retrieve the MOID cache for an Intersight API
+    client. The MOID cache is created and attached to the API client on first
+    use, so that it is shared by every function and class using the client.
+
+    Args:
+        api_client ("ApiClient"):
+            An ApiClient class instance which handles Intersight client-server
+            communication through the use of API keys.
+
+    Returns:
+        An IntersightMoidCache class instance.
+    """
+    with intersight_moid_cache_creation_lock:
+        intersight_moid_cache = getattr(api_client, "intersight_moid_cache", None)
+        if intersight_moid_cache is None:
+            intersight_moid_cache = IntersightMoidCache()
+            api_client.intersight_moid_cache = intersight_moid_cache
+    return intersight_moid_cache
+
+
 # Establish function to retrieve the MOID of a specific Intersight API object by name
 def intersight_object_moid_retriever(intersight_api_key_id,
                                      intersight_api_key,
@@ -295,32 +1476,21 @@ def intersight_object_moid_retriever(intersight_api_key_id,
                                     )
     else:
         api_client = preconfigured_api_client
-    try:
-        # Retrieve the Intersight Account name
-        api_client.call_api(resource_path="/iam/Accounts",
-                            method="GET",
-                            auth_settings=['cookieAuth', 'http_signature', 'oAuth2', 'oAuth2']
-                            )
-        response = api_client.last_response.data
-        iam_account = json.loads(response)
-        if api_client.last_response.status != 200:
-            print("The provided Intersight account information could not be "
-                  "accessed.")
-            print("Exiting due to the Intersight account being unavailable.\n")
-            print("Please verify that the correct API Key ID and API Key have "
-                  "been entered, then re-attempt execution.\n")
-            sys.exit(0)
-        else:
-            intersight_account_name = iam_account["Results"][0]["Name"]
-    except Exception:
-        print("\nA configuration error has occurred!\n")
-        print("Unable to access the Intersight API.")
-        print("Exiting due to the Intersight API being unavailable.\n")
-        print("Please verify that the correct API Key ID and API Key have "
-              "been entered, then re-attempt execution.\n")
-        sys.exit(0)
+    # Check the MOID cache of the API client for the provided object
+    intersight_moid_cache = get_intersight_moid_cache(api_client)
+    cached_intersight_object_moid = intersight_moid_cache.get(intersight_api_path,
+                                                              organization,
+                                                              object_name
+                                                              )
+    if cached_intersight_object_moid:
+        return cached_intersight_object_moid
+    # Retrieve the Intersight account context of the API client
+    intersight_account_context = get_intersight_account_context(api_client)
     # Retrieving the provided object from Intersight...
-    full_intersight_api_path = f"/{intersight_api_path}"
+    filtered_intersight_api_path = intersight_api_query_builder(intersight_api_path,
+                                                                filter_attributes={"Name": object_name}
+                                                                )
+    full_intersight_api_path = f"/{filtered_intersight_api_path}"
     try:
         api_client.call_api(resource_path=full_intersight_api_path,
                             method="GET",
@@ -342,31 +1512,44 @@ def intersight_object_moid_retriever(intersight_api_key_id,
         sys.exit(0)
 
     if intersight_objects.get("Results"):
+        # Resolve the MOID of the provided organization once, on first use
+        provided_organization_moid = None
         for intersight_object in intersight_objects.get("Results"):
             if intersight_object.get("Organization"):
-                provided_organization_moid = intersight_object_moid_retriever(intersight_api_key_id=None,
-                                                                              intersight_api_key=None,
-                                                                              object_name=organization,
-                                                                              intersight_api_path="organization/Organizations?$top=1000",
-                                                                              object_type="Organization",
-                                                                              preconfigured_api_client=api_client
-                                                                              )
+                if provided_organization_moid is None:
+                    provided_organization_moid = intersight_object_moid_retriever(intersight_api_key_id=None,
+                                                                                  intersight_api_key=None,
+                                                                                  object_name=organization,
+                                                                                  intersight_api_path="organization/Organizations?$top=1000",
+                                                                                  object_type="Organization",
+                                                                                  preconfigured_api_client=api_client
+                                                                                  )
                 if intersight_object.get("Organization", {}).get("Moid") == provided_organization_moid:
                     if intersight_object.get("Name") == object_name:
                         intersight_object_moid = intersight_object.get("Moid")
                         # The provided object and MOID has been identified and retrieved.
+                        intersight_moid_cache.set(intersight_api_path,
+                                                  organization,
+                                                  object_name,
+                                                  intersight_object_moid
+                                                  )
                         return intersight_object_moid
             else:
                 if intersight_object.get("Name") == object_name:
                     intersight_object_moid = intersight_object.get("Moid")
                     # The provided object and MOID has been identified and retrieved.
+                    intersight_moid_cache.set(intersight_api_path,
+                                              organization,
+                                              object_name,
+                                              intersight_object_moid
+                                              )
                     return intersight_object_moid
         else:
             print("\nA configuration error has occurred!\n")
             print(f"The provided {object_type} named '{object_name}' was not "
                   "found.")
             print("Please check the Intersight Account named "
-                  f"{intersight_account_name}.")
+                  f"{intersight_account_context.get_account_name()}.")
             print("Verify through the API or GUI that the needed "
                   f"{object_type} is present.")
             print(f"If the needed {object_type} is missing, please create it.")
@@ -377,9 +1560,9 @@ def intersight_object_moid_retriever(intersight_api_key_id,
         print(f"The provided {object_type} named '{object_name}' was not "
               "found.")
         print(f"No requested {object_type} instance is currently available in "
-              f"the Intersight account named {intersight_account_name}.")
+              f"the Intersight account named {intersight_account_context.get_account_name()}.")
         print("Please check the Intersight Account named "
-              f"{intersight_account_name}.")
+              f"{intersight_account_context.get_account_name()}.")
         print(f"Verify through the API or GUI that the needed {object_type} "
               "is present.")
         print(f"If the needed {object_type} is missing, please create it.")
@@ -387,16 +1570,166 @@ def intersight_object_moid_retriever(intersight_api_key_id,
         sys.exit(0)
 
 
+# Establish function to retrieve all instances of a particular Intersight API object type one page at a time
+def get_intersight_object_pages(intersight_api_key_id,
+                                intersight_api_key,
+                                intersight_api_path,
+                                object_type="object",
+                                intersight_base_url="https://www.intersight.com/api/v1",
+                                preconfigured_api_client=None,
+                                filter_attributes=None,
+                                select_attributes=None,
+                                page_size=1000,
+                                count_preflight=False
+                                ):
+    """This is a generator function to perform paginated HTTP GETs on all
+    objects under an available Intersight API type. The objects are retrieved
+    using the $top and $skip query options and provided one page at a time,
+    so that large object types can be processed without holding every
+    object in memory.
+
+    Args:
+        intersight_api_key_id (str):
+            The ID of the Intersight API key.
+        intersight_api_key (str):
+            The system file path of the Intersight API key.
+        intersight_api_path (str):
+            The path to the targeted Intersight API object type. For example,
+            to specify the Intersight API type for adapter configuration
+            policies, enter "adapter/ConfigPolicies". Any $top or $skip query
+            options on the path are replaced by the pagination settings.
+        object_type (str):
+            Optional; The type of Intersight object. The default value is
+            "object".
+        intersight_base_url (str):
+            Optional; The base URL for Intersight API paths. The default value
+            is "https://www.intersight.com/api/v1". This value typically only
+            needs to be changed if using the Intersight Virtual Appliance.
+        preconfigured_api_client ("ApiClient"):
+            Optional; An ApiClient class instance which handles
+            Intersight client-server communication through the use of API keys.
+            The default value is None. If a preconfigured_api_client argument
+            is provided, empty strings ("") or None can be provided for the
+            intersight_api_key_id, intersight_api_key, and intersight_base_url
+            arguments.
+        filter_attributes (dict):
+            Optional; A dictionary containing the attribute keys and values
+            that the returned objects must match. The default value is None.
+        select_attributes (list):
+            Optional; A list containing the attribute keys to be returned for
+            each object. The default value is None.
+        page_size (int):
+            Optional; The number of objects to be retrieved per page. The
+            maximum accepted by Intersight is 1000. The default value is 1000.
+        count_preflight (bool):
+            Optional; The option to retrieve the total number of matching
+            objects with the $count query option before the pages are
+            retrieved, so that the exact number of pages is requested. The
+            default value is False.
+
+    Yields:
+        A list containing the objects of the specified API type for each
+        retrieved page.
+
+    Raises:
+        Exception:
+            An exception occurred due to an issue accessing the Intersight API
+            path. The status code or error message will be specified.
+    """
+    def paginated_api_path_maker(additional_query_options):
+        """This is a function to add query options to the filtered Intersight
+        API path, after removing any existing pagination query options.
+
+        Args:
+            additional_query_options (list):
+                A list of the query options to be added.
+
+        Returns:
+            A string of the Intersight API path with the query options added.
+        """
+        if "?" in filtered_intersight_api_path:
+            base_intersight_api_path, existing_query = filtered_intersight_api_path.split("?", 1)
+            query_options = [query_option for query_option in existing_query.split("&")
+                             if not query_option.startswith(("$top=", "$skip=", "$count="))]
+        else:
+            base_intersight_api_path = filtered_intersight_api_path
+            query_options = []
+        query_options.extend(additional_query_options)
+        return f"/{base_intersight_api_path}?{'&'.join(query_options)}"
+
+    def intersight_api_get(full_intersight_api_path):
+        """This is a function to perform an HTTP GET on an Intersight API path.
+
+        Args:
+            full_intersight_api_path (str):
+                The full Intersight API path to be retrieved.
+
+        Returns:
+            A dictionary containing the retrieved Intersight API response.
+        """
+        try:
+            api_client.call_api(resource_path=full_intersight_api_path,
+                                method="GET",
+                                auth_settings=['cookieAuth', 'http_signature', 'oAuth2', 'oAuth2']
+                                )
+            response = api_client.last_response.data
+            # The Intersight API resource path has been accessed successfully.
+            return json.loads(response)
+        except Exception:
+            print("\nA configuration error has occurred!\n")
+            print(f"There was an issue retrieving the requested {object_type} "
+                  "instances from Intersight.")
+            print("Unable to access the provided Intersight API resource path "
+                  f"'{intersight_api_path}'.")
+            print("Please review and resolve any error messages, then re-attempt "
+                  "execution.\n")
+            print("Exception Message: ")
+            traceback.print_exc()
+            sys.exit(0)
+
+    # Define Intersight SDK ApiClient variable
+    if preconfigured_api_client is None:
+        api_client = get_api_client(api_key_id=intersight_api_key_id,
+                                    api_secret_file=intersight_api_key,
+                                    endpoint=intersight_base_url
+                                    )
+    else:
+        api_client = preconfigured_api_client
+    filtered_intersight_api_path = intersight_api_query_builder(intersight_api_path,
+                                                                filter_attributes=filter_attributes,
+                                                                select_attributes=select_attributes
+                                                                )
+    # Retrieve the total number of matching objects, if requested
+    total_object_count = None
+    if count_preflight:
+        intersight_object_count = intersight_api_get(paginated_api_path_maker(["$count=true"]))
+        total_object_count = intersight_object_count.get("Count", 0)
+    # Retrieve the matching objects one page at a time
+    skip_count = 0
+    while total_object_count is None or skip_count < total_object_count:
+        intersight_objects_page = intersight_api_get(paginated_api_path_maker([f"$top={page_size}", f"$skip={skip_count}"]))
+        intersight_objects_page_results = intersight_objects_page.get("Results") or []
+        if intersight_objects_page_results:
+            yield intersight_objects_page_results
+        if len(intersight_objects_page_results) < page_size:
+            break
+        skip_count += page_size
+
+
 # Establish function to retrieve all instances of a particular Intersight API object type
 def get_intersight_objects(intersight_api_key_id,
                            intersight_api_key,
                            intersight_api_path,
                            object_type="object",
                            intersight_base_url="https://www.intersight.com/api/v1",
-                           preconfigured_api_client=None
+                           preconfigured_api_client=None,
+                           filter_attributes=None,
+                           select_attributes=None
                            ):
     """This is a function to perform an HTTP GET on all objects under an
-    available Intersight API type.
+    available Intersight API type. Every page of objects is retrieved, so the
+    results are not limited by the page size of a single request. To process
+    large object types one page at a time, use get_intersight_object_pages.
 
     Args:
         intersight_api_key_id (str):
@@ -423,6 +1756,15 @@ def get_intersight_objects(intersight_api_key_id,
             is provided, empty strings ("") or None can be provided for the
             intersight_api_key_id, intersight_api_key, and intersight_base_url
             arguments.
+        filter_attributes (dict):
+            Optional; A dictionary containing the attribute keys and values
+            that the returned objects must match. The matching is performed
+            by Intersight through the $filter query option. The default value
+            is None.
+        select_attributes (list):
+            Optional; A list containing the attribute keys to be returned for
+            each object through the $select query option. The default value is
+            None, which returns all attributes.
 
     Returns:
         A dictionary containing all objects of the specified API type. If the
@@ -433,36 +1775,23 @@ def get_intersight_objects(intersight_api_key_id,
             An exception occurred due to an issue accessing the Intersight API
             path. The status code or error message will be specified.
     """
-    # Define Intersight SDK ApiClient variable
-    if preconfigured_api_client is None:
-        api_client = get_api_client(api_key_id=intersight_api_key_id,
-                                    api_secret_file=intersight_api_key,
-                                    endpoint=intersight_base_url
-                                    )
-    else:
-        api_client = preconfigured_api_client
-    # Retrieving the provided object from Intersight...
-    full_intersight_api_path = f"/{intersight_api_path}"
-    try:
-        api_client.call_api(resource_path=full_intersight_api_path,
-                            method="GET",
-                            auth_settings=['cookieAuth', 'http_signature', 'oAuth2', 'oAuth2']
-                            )
-        response = api_client.last_response.data
-        intersight_objects = json.loads(response)
-        # The Intersight API resource path has been accessed successfully.
-        return intersight_objects
-    except Exception:
-        print("\nA configuration error has occurred!\n")
-        print(f"There was an issue retrieving the requested {object_type} "
-              "instances from Intersight.")
-        print("Unable to access the provided Intersight API resource path "
-              f"'{intersight_api_path}'.")
-        print("Please review and resolve any error messages, then re-attempt "
-              "execution.\n")
-        print("Exception Message: ")
-        traceback.print_exc()
-        sys.exit(0)
+    # Retrieve every page of matching objects from Intersight
+    intersight_objects_results = []
+    for intersight_objects_page_results in get_intersight_object_pages(intersight_api_key_id,
+                                                                       intersight_api_key,
+                                                                       intersight_api_path,
+                                                                       object_type=object_type,
+                                                                       intersight_base_url=intersight_base_url,
+                                                                       preconfigured_api_client=preconfigured_api_client,
+                                                                       filter_attributes=filter_attributes,
+                                                                       select_attributes=select_attributes
+                                                                       ):
+        intersight_objects_results.extend(intersight_objects_page_results)
+    intersight_objects = {
+        "ObjectType": "mo.List",
+        "Results": intersight_objects_results
+        }
+    return intersight_objects
 
 
 # Establish function to retrieve a particular instance of a particular Intersight API object type
@@ -603,32 +1932,13 @@ def advanced_intersight_object_moid_retriever(intersight_api_key_id,
                                     )
     else:
         api_client = preconfigured_api_client
-    try:
-        # Retrieve the Intersight Account name
-        api_client.call_api(resource_path="/iam/Accounts",
-                            method="GET",
-                            auth_settings=['cookieAuth', 'http_signature', 'oAuth2', 'oAuth2']
-                            )
-        response = api_client.last_response.data
-        iam_account = json.loads(response)
-        if api_client.last_response.status != 200:
-            print("The provided Intersight account information could not be "
-                  "accessed.")
-            print("Exiting due to the Intersight account being unavailable.\n")
-            print("Please verify that the correct API Key ID and API Key have "
-                  "been entered, then re-attempt execution.\n")
-            sys.exit(0)
-        else:
-            intersight_account_name = iam_account["Results"][0]["Name"]
-    except Exception:
-        print("\nA configuration error has occurred!\n")
-        print("Unable to access the Intersight API.")
-        print("Exiting due to the Intersight API being unavailable.\n")
-        print("Please verify that the correct API Key ID and API Key have "
-              "been entered, then re-attempt execution.\n")
-        sys.exit(0)
+    # Retrieve the Intersight account context of the API client
+    intersight_account_context = get_intersight_account_context(api_client)
     # Retrieving the provided object from Intersight...
-    full_intersight_api_path = f"/{intersight_api_path}"
+    filtered_intersight_api_path = intersight_api_query_builder(intersight_api_path,
+                                                                filter_attributes=object_attributes
+                                                                )
+    full_intersight_api_path = f"/{filtered_intersight_api_path}"
     try:
         api_client.call_api(resource_path=full_intersight_api_path,
                             method="GET",
@@ -650,15 +1960,18 @@ def advanced_intersight_object_moid_retriever(intersight_api_key_id,
         sys.exit(0)
 
     if intersight_objects.get("Results"):
+        # Resolve the MOID of the provided organization once, on first use
+        provided_organization_moid = None
         for intersight_object in intersight_objects.get("Results"):
             if intersight_object.get("Organization"):
-                provided_organization_moid = intersight_object_moid_retriever(intersight_api_key_id=None,
-                                                                              intersight_api_key=None,
-                                                                              object_name=organization,
-                                                                              intersight_api_path="organization/Organizations?$top=1000",
-                                                                              object_type="Organization",
-                                                                              preconfigured_api_client=api_client
-                                                                              )
+                if provided_organization_moid is None:
+                    provided_organization_moid = intersight_object_moid_retriever(intersight_api_key_id=None,
+                                                                                  intersight_api_key=None,
+                                                                                  object_name=organization,
+                                                                                  intersight_api_path="organization/Organizations?$top=1000",
+                                                                                  object_type="Organization",
+                                                                                  preconfigured_api_client=api_client
+                                                                                  )
                 if intersight_object.get("Organization", {}).get("Moid") == provided_organization_moid:
                     for object_attribute in object_attributes:
                         try:
@@ -687,7 +2000,7 @@ def advanced_intersight_object_moid_retriever(intersight_api_key_id,
             print("\nA configuration error has occurred!\n")
             print(f"The provided {object_type} was not found.")
             print("Please check the Intersight Account named "
-                  f"{intersight_account_name}.")
+                  f"{intersight_account_context.get_account_name()}.")
             print("Verify through the API or GUI that the needed "
                   f"{object_type} is present.")
             print(f"If the needed {object_type} is missing, please create it.")
@@ -697,9 +2010,9 @@ def advanced_intersight_object_moid_retriever(intersight_api_key_id,
         print("\nA configuration error has occurred!\n")
         print(f"The provided {object_type} was not found.")
         print(f"No requested {object_type} instance is currently available in "
-              f"the Intersight account named {intersight_account_name}.")
+              f"the Intersight account named {intersight_account_context.get_account_name()}.")
         print("Please check the Intersight Account named "
-              f"{intersight_account_name}.")
+              f"{intersight_account_context.get_account_name()}.")
         print(f"Verify through the API or GUI that the needed {object_type} "
               "is present.")
         print(f"If the needed {object_type} is missing, please create it.")
@@ -973,7 +2286,8 @@ class ResourcePool:
                  rack_server_resources_list=None,
                  ucs_server_type="FI-Attached",
                  resource_type="Server",
-                 pool_type="Static"
+                 pool_type="Static",
+                 server_side_selectors=False
                  ):
         self.intersight_api_key_id = intersight_api_key_id
         self.intersight_api_key = intersight_api_key
@@ -1008,6 +2322,9 @@ class ResourcePool:
         self.ucs_server_type = ucs_server_type
         self.resource_type = resource_type
         self.pool_type = pool_type
+        self.server_side_selectors = server_side_selectors
+        self.chassis_resource_indexes = None
+        self.domain_registration_moids = None
         self.intersight_api_body = {
             "Name": self.pool_name,
             "Description": self.pool_description,
@@ -1032,7 +2349,8 @@ class ResourcePool:
             f"{self.rack_server_resources_list}, "
             f"'{self.ucs_server_type}', "
             f"'{self.resource_type}', "
-            f"'{self.pool_type}')"
+            f"'{self.pool_type}', "
+            f"{self.server_side_selectors})"
             )
 
     def __str__(self):
@@ -1052,12 +2370,25 @@ class ResourcePool:
                 The status code or error message will be specified.
         """
         full_intersight_api_path = f"/{self.intersight_api_path}"
+        # Compare the provided configuration with any pre-existing object and update only the changed attributes
+        intersight_object_update_status = intersight_object_updater(api_client=self.api_client,
+                                                                    intersight_api_path=self.intersight_api_path,
+                                                                    intersight_api_body=self.intersight_api_body,
+                                                                    object_type=self.object_type,
+                                                                    update_api_body_maker=self._resource_pool_update_api_body_maker
+                                                                    )
+        if intersight_object_update_status is not None:
+            return intersight_object_update_status
         try:
             self.api_client.call_api(resource_path=full_intersight_api_path,
                                      method="POST",
                                      body=self.intersight_api_body,
                                      auth_settings=['cookieAuth', 'http_signature', 'oAuth2', 'oAuth2']
                                      )
+            # Invalidate any cached MOID for the newly configured object
+            get_intersight_moid_cache(self.api_client).invalidate(self.intersight_api_path,
+                                                                   object_name=self.intersight_api_body.get("Name")
+                                                                   )
             print(f"The configuration of the base {self.object_type} "
                   "has completed.")
             return "The POST method was successful."
@@ -1069,18 +2400,27 @@ class ResourcePool:
                 print("An attempt will be made to update the pre-existing "
                       f"{existing_intersight_object_name}...")
                 try:
-                    existing_intersight_object_moid = intersight_object_moid_retriever(intersight_api_key_id=None,
-                                                                                       intersight_api_key=None,
-                                                                                       object_name=existing_intersight_object_name,
-                                                                                       intersight_api_path=f"{self.intersight_api_path}?$top=1000",
-                                                                                       object_type=self.object_type,
-                                                                                       preconfigured_api_client=self.api_client
-                                                                                       )
+                    # Retrieve the current membership of the existing object once
+                    existing_resource_pool = self._get_existing_resource_pool()
+                    if existing_resource_pool:
+                        existing_intersight_object_moid = existing_resource_pool.get("Moid")
+                        resource_pool_update_api_body = self._resource_pool_update_api_body_maker(
+                            existing_resource_pool
+                            )
+                    else:
+                        existing_intersight_object_moid = intersight_object_moid_retriever(intersight_api_key_id=None,
+                                                                                           intersight_api_key=None,
+                                                                                           object_name=existing_intersight_object_name,
+                                                                                           intersight_api_path=f"{self.intersight_api_path}?$top=1000",
+                                                                                           object_type=self.object_type,
+                                                                                           preconfigured_api_client=self.api_client
+                                                                                           )
+                        resource_pool_update_api_body = self.intersight_api_body
                     # Update full Intersight API path with the MOID of the existing object
                     full_intersight_api_path_with_moid = f"/{self.intersight_api_path}/{existing_intersight_object_moid}"
                     self.api_client.call_api(resource_path=full_intersight_api_path_with_moid,
                                              method="POST",
-                                             body=self.intersight_api_body,
+                                             body=resource_pool_update_api_body,
                                              auth_settings=['cookieAuth', 'http_signature', 'oAuth2', 'oAuth2']
                                              )
                     print(f"The update of the {self.object_type} has "
@@ -1115,6 +2455,101 @@ class ResourcePool:
             traceback.print_exc()
             return "The POST method failed."
 
+    def _get_existing_resource_pool(self):
+        """This function retrieves the MOID and the Selectors of the
+        pre-existing Resource Pool with the same name and organization, using
+        one filtered query.
+
+        Returns:
+            A dictionary of the pre-existing Resource Pool. If the Resource
+            Pool is not found, None is returned.
+        """
+        retrieved_resource_pools = get_intersight_objects(
+            intersight_api_key_id=None,
+            intersight_api_key=None,
+            intersight_api_path=self.intersight_api_path,
+            object_type=self.object_type,
+            preconfigured_api_client=self.api_client,
+            filter_attributes={
+                "Name": self.intersight_api_body.get("Name"),
+                "Organization": self.intersight_api_body.get("Organization")
+                },
+            select_attributes=["Moid", "Selectors"]
+            )
+        retrieved_resource_pool_results = retrieved_resource_pools.get("Results") or []
+        if retrieved_resource_pool_results:
+            return retrieved_resource_pool_results[0]
+        return None
+
+    def _get_selector_membership(self,
+                                 selectors
+                                 ):
+        """This function extracts the Server MOIDs from a list of Resource
+        Pool Selectors.
+
+        Args:
+            selectors (list):
+                A list of the Resource Pool Selectors.
+
+        Returns:
+            A tuple containing a dictionary with the Intersight API paths of
+            the Servers (e.g. "compute/Blades") as keys and sets of the Server
+            MOIDs as values, and a set of any Selectors that are not a list of
+            Server MOIDs, such as server-side Selectors.
+        """
+        selector_server_moids = {}
+        other_selectors = set()
+        for selector in selectors:
+            selector_string = selector.get("Selector", "")
+            selector_match = re.fullmatch(r"/api/v1/(compute/\w+)\?\$filter=\(Moid in \(([^)]*)\)\)", selector_string)
+            if selector_match:
+                selector_server_moids.setdefault(selector_match.group(1), set()).update(
+                    server_moid for server_moid in re.findall(r"'([^']*)'", selector_match.group(2)) if server_moid
+                    )
+            else:
+                other_selectors.add(selector_string)
+        return selector_server_moids, other_selectors
+
+    def _resource_pool_update_api_body_maker(self,
+                                             existing_resource_pool
+                                             ):
+        """This function compares the Server membership of the Resource Pool
+        with the membership of the pre-existing Resource Pool. The added and
+        removed Server MOIDs are reported and the Selectors are only included
+        in the update if the membership has changed.
+
+        Args:
+            existing_resource_pool (dict):
+                A dictionary of the pre-existing Resource Pool, including the
+                Selectors.
+
+        Returns:
+            A dictionary of the Intersight API body for the update of the
+            pre-existing Resource Pool.
+        """
+        server_object_types = {
+            "compute/Blades": "Blade Server",
+            "compute/RackUnits": "Rack Server"
+            }
+        existing_server_moids, existing_other_selectors = self._get_selector_membership(existing_resource_pool.get("Selectors") or [])
+        staged_server_moids, staged_other_selectors = self._get_selector_membership(self.intersight_api_body.get("Selectors", []))
+        resource_pool_membership_changed = existing_other_selectors != staged_other_selectors
+        for server_api_path in sorted(set(existing_server_moids) | set(staged_server_moids)):
+            added_server_moids = staged_server_moids.get(server_api_path, set()) - existing_server_moids.get(server_api_path, set())
+            removed_server_moids = existing_server_moids.get(server_api_path, set()) - staged_server_moids.get(server_api_path, set())
+            if added_server_moids or removed_server_moids:
+                resource_pool_membership_changed = True
+                print(f"{len(added_server_moids)} "
+                      f"{server_object_types.get(server_api_path, server_api_path)}(s) "
+                      f"will be added and {len(removed_server_moids)} will be "
+                      f"removed from the {self.object_type}.")
+        resource_pool_update_api_body = dict(self.intersight_api_body)
+        if not resource_pool_membership_changed:
+            print(f"The Server membership of the {self.object_type} is "
+                  "unchanged.")
+            resource_pool_update_api_body.pop("Selectors", None)
+        return resource_pool_update_api_body
+
     def _update_api_body_general_attributes(self):
         """This function updates the Intersight API body with general
         attributes for the Intersight object.
@@ -1358,6 +2793,257 @@ class ResourcePool:
                 # Update Intersight API body with the converted object variable value
                 self.intersight_api_body[object_variable["AttributeName"]] = backend_object_variable_value
 
+    def _get_chassis_resource_indexes(self):
+        """This function retrieves the Chassis and the Blade Servers under
+        Intersight Managed Mode from Intersight once and indexes them by the
+        MOID of the domain registration (RegisteredDevice), the Chassis ID and
+        the Slot ID, so that each provided Chassis or Blade Server resource is
+        resolved with lookups instead of repeated searches.
+
+        Returns:
+            A dictionary containing the retrieved "Chassis" (list) and "Blade
+            Servers" (list), along with the indexes of the Blade Server MOIDs.
+            Each index is a dictionary with the lookup keys as keys and lists
+            of Blade Server MOIDs as values.
+        """
+        if self.chassis_resource_indexes is not None:
+            return self.chassis_resource_indexes
+        retrieved_intersight_chassis = get_intersight_objects(
+            intersight_api_key_id=None,
+            intersight_api_key=None,
+            intersight_api_path="equipment/Chasses",
+            object_type="Chassis",
+            preconfigured_api_client=self.api_client,
+            select_attributes=["Moid", "ChassisId", "Serial", "ManagementMode", "RegisteredDevice", "Blades"]
+            )
+        retrieved_intersight_blade_servers = get_intersight_objects(
+            intersight_api_key_id=None,
+            intersight_api_key=None,
+            intersight_api_path="compute/Blades",
+            object_type="Blade Server",
+            preconfigured_api_client=self.api_client,
+            filter_attributes={"ManagementMode": "Intersight"},
+            select_attributes=["Moid", "Name", "Serial", "ChassisId", "SlotId", "EquipmentChassis"]
+            )
+        chassis_resource_indexes = {
+            "Chassis": retrieved_intersight_chassis.get("Results") or [],
+            "Blade Servers": retrieved_intersight_blade_servers.get("Results") or [],
+            "Chassis by Domain": {},
+            "Chassis by Domain and Chassis ID": {},
+            "Chassis by Chassis ID": {},
+            "Chassis by Serial": {},
+            "Blade Servers by Domain, Chassis ID and Slot ID": {},
+            "Blade Servers by Domain and Slot ID": {},
+            "Blade Servers by Chassis ID and Slot ID": {},
+            "Blade Servers by Slot ID": {},
+            "Blade Servers by Name": {},
+            "Blade Servers by Serial": {}
+            }
+
+        def add_to_index(index_name, index_key, blade_server_moids):
+            """This is a function to add Blade Server MOIDs to an index.
+
+            Args:
+                index_name (str):
+                    The name of the index.
+                index_key (tuple):
+                    The lookup key of the Blade Server MOIDs.
+                blade_server_moids (list):
+                    A list of the Blade Server MOIDs to be added.
+            """
+            chassis_resource_indexes[index_name].setdefault(index_key, []).extend(blade_server_moids)
+
+        # Index the Blade Servers of each Chassis
+        chassis_by_moid = {}
+        for chassis in chassis_resource_indexes["Chassis"]:
+            chassis_by_moid[chassis.get("Moid")] = chassis
+            chassis_domain_moid = (chassis.get("RegisteredDevice") or {}).get("Moid")
+            chassis_blade_server_moids = [chassis_blade_server["Moid"] for chassis_blade_server in chassis.get("Blades") or []]
+            add_to_index("Chassis by Serial", chassis.get("Serial"), chassis_blade_server_moids)
+            if chassis.get("ManagementMode") == "Intersight":
+                add_to_index("Chassis by Domain", chassis_domain_moid, chassis_blade_server_moids)
+                add_to_index("Chassis by Domain and Chassis ID", (chassis_domain_moid, chassis.get("ChassisId")), chassis_blade_server_moids)
+                add_to_index("Chassis by Chassis ID", chassis.get("ChassisId"), chassis_blade_server_moids)
+        # Index each Blade Server by the domain registration of its Chassis, Chassis ID and Slot ID
+        for blade_server in chassis_resource_indexes["Blade Servers"]:
+            blade_server_moid = [blade_server["Moid"]]
+            blade_server_chassis = chassis_by_moid.get((blade_server.get("EquipmentChassis") or {}).get("Moid"), {})
+            blade_server_domain_moid = (blade_server_chassis.get("RegisteredDevice") or {}).get("Moid")
+            blade_server_chassis_id = int(blade_server.get("ChassisId") or 0)
+            blade_server_slot_id = blade_server.get("SlotId")
+            add_to_index("Blade Servers by Name", blade_server.get("Name"), blade_server_moid)
+            add_to_index("Blade Servers by Serial", blade_server.get("Serial"), blade_server_moid)
+            add_to_index("Blade Servers by Slot ID", blade_server_slot_id, blade_server_moid)
+            add_to_index("Blade Servers by Domain and Slot ID", (blade_server_domain_moid, blade_server_slot_id), blade_server_moid)
+            if blade_server_chassis.get("ManagementMode") == "Intersight":
+                add_to_index("Blade Servers by Chassis ID and Slot ID", (blade_server_chassis_id, blade_server_slot_id), blade_server_moid)
+                add_to_index("Blade Servers by Domain, Chassis ID and Slot ID", (blade_server_domain_moid, blade_server_chassis_id, blade_server_slot_id), blade_server_moid)
+        self.chassis_resource_indexes = chassis_resource_indexes
+        return chassis_resource_indexes
+
+    def _get_domain_registration_moid(self,
+                                      domain_name
+                                      ):
+        """This function returns the MOID of the domain registration for a
+        provided Domain Name. The domain registrations are retrieved from
+        Intersight once and indexed by hostname.
+
+        Args:
+            domain_name (str):
+                The Domain Name of the Chassis.
+
+        Returns:
+            A string of the MOID of the domain registration.
+        """
+        if self.domain_registration_moids is None:
+            retrieved_intersight_domain_registrations = get_intersight_objects(
+                intersight_api_key_id=None,
+                intersight_api_key=None,
+                intersight_api_path="asset/DeviceRegistrations",
+                object_type="Domain Name",
+                preconfigured_api_client=self.api_client,
+                select_attributes=["Moid", "DeviceHostname"]
+                )
+            self.domain_registration_moids = {}
+            for domain_registration in retrieved_intersight_domain_registrations.get("Results") or []:
+                self.domain_registration_moids.setdefault(tuple(domain_registration.get("DeviceHostname") or []),
+                                                          domain_registration.get("Moid")
+                                                          )
+        domain_registration_moid = self.domain_registration_moids.get((domain_name,))
+        if domain_registration_moid is None:
+            # Retrieve the domain registration by name to report a missing Domain Name
+            domain_registration_moid = advanced_intersight_object_moid_retriever(
+                intersight_api_key_id=None,
+                intersight_api_key=None,
+                object_attributes={
+                    "DeviceHostname": [domain_name]
+                    },
+                intersight_api_path="asset/DeviceRegistrations?$top=1000",
+                object_type="Domain Name",
+                organization=self.organization,
+                preconfigured_api_client=self.api_client
+                )
+            self.domain_registration_moids[(domain_name,)] = domain_registration_moid
+        return domain_registration_moid
+
+    def _update_api_body_server_side_selectors(self,
+                                               management_mode
+                                               ):
+        """This function translates the provided Chassis, Blade Server and
+        Rack Server resource criteria into server-side Selectors. Each
+        Selector is an OData $filter expression on compute/Blades or
+        compute/RackUnits that is evaluated by Intersight, so the Server
+        inventory does not need to be retrieved. Only the domain
+        registrations and any Chassis with provided serials are retrieved.
+
+        Args:
+            management_mode (str):
+                The management mode of the Rack Servers, e.g. "Intersight".
+        """
+        def odata_list(values, value_type=str):
+            """This is a function to format a list of values for an OData
+            "in" expression.
+
+            Args:
+                values (list):
+                    A list of the values to be formatted.
+                value_type (type):
+                    Optional; The type of the values. String values are quoted
+                    and integer values are not. The default value is str.
+
+            Returns:
+                A string of the formatted values, e.g. "('A','B')".
+            """
+            if value_type is int:
+                return "({})".format(",".join(str(value) for value in values))
+            return "({})".format(",".join("'{}'".format(str(value).replace("'", "''")) for value in values))
+
+        def add_selector(intersight_api_path, filter_expressions):
+            """This is a function to add a Selector to the API body.
+
+            Args:
+                intersight_api_path (str):
+                    The Intersight API path of the selected Servers.
+                filter_expressions (list):
+                    A list of the filter expressions that the selected Servers
+                    must all match.
+            """
+            self.intersight_api_body.setdefault("Selectors", []).append(
+                {"ClassId": "resource.Selector",
+                 "ObjectType": "resource.Selector",
+                 "Selector": f"/api/v1/{intersight_api_path}?$filter=" + " and ".join(
+                     f"({filter_expression})" for filter_expression in filter_expressions
+                     )
+                 }
+                )
+
+        blade_server_selector_count = 0
+        rack_server_selector_count = 0
+        # Translate the provided Chassis resources into Blade Server Selectors
+        for chassis_resources_dictionary in self.chassis_resources_list:
+            chassis_filter_expressions = ["ManagementMode eq 'Intersight'"]
+            if chassis_resources_dictionary.get("DomainName"):
+                chassis_domain_name_moid = self._get_domain_registration_moid(chassis_resources_dictionary["DomainName"])
+                chassis_filter_expressions.append(f"RegisteredDevice.Moid eq '{chassis_domain_name_moid}'")
+            if chassis_resources_dictionary.get("ChassisIds"):
+                provided_chassis_id_list = integer_number_list_maker(chassis_resources_dictionary["ChassisIds"])
+                chassis_filter_expressions.append(f"ChassisId in {odata_list(provided_chassis_id_list)}")
+            if chassis_resources_dictionary.get("SlotIds"):
+                provided_chassis_slot_ids_list = integer_number_list_maker(chassis_resources_dictionary["SlotIds"])
+                chassis_filter_expressions.append(f"SlotId in {odata_list(provided_chassis_slot_ids_list, int)}")
+            # A Domain Name provided with Chassis serials only is used for the Chassis serials
+            if chassis_resources_dictionary.get("ChassisIds") or chassis_resources_dictionary.get("SlotIds") or (
+                chassis_resources_dictionary.get("DomainName") and not chassis_resources_dictionary.get("Serials")
+                ):
+                add_selector("compute/Blades", chassis_filter_expressions)
+                blade_server_selector_count += 1
+            if chassis_resources_dictionary.get("Serials"):
+                # Retrieve the MOIDs of the Chassis with matching serials
+                provided_chassis_serials_list = string_to_list_maker(chassis_resources_dictionary["Serials"])
+                chassis_serial_filter_expression = f"Serial in {odata_list(provided_chassis_serials_list)}"
+                retrieved_intersight_chassis = get_intersight_objects(
+                    intersight_api_key_id=None,
+                    intersight_api_key=None,
+                    intersight_api_path=f"equipment/Chasses?$filter={urllib.parse.quote(chassis_serial_filter_expression, safe='')}",
+                    object_type="Chassis",
+                    preconfigured_api_client=self.api_client,
+                    select_attributes=["Moid"]
+                    )
+                retrieved_chassis_moid_list = [chassis["Moid"] for chassis in retrieved_intersight_chassis.get("Results") or []]
+                if retrieved_chassis_moid_list:
+                    add_selector("compute/Blades", [f"EquipmentChassis.Moid in {odata_list(retrieved_chassis_moid_list)}"])
+                    blade_server_selector_count += 1
+                else:
+                    print("No Chassis with the serials "
+                          f"{', '.join(provided_chassis_serials_list)} were found "
+                          "in the Intersight Account.")
+        # Translate the provided Blade Server and Rack Server resources into Selectors
+        for server_resources_list, intersight_api_path, server_management_mode in (
+            (self.blade_server_resources_list, "compute/Blades", "Intersight"),
+            (self.rack_server_resources_list, "compute/RackUnits", management_mode)
+            ):
+            for server_resources_dictionary in server_resources_list:
+                for server_attribute in ("Name", "Serial"):
+                    if server_resources_dictionary.get(f"{server_attribute}s"):
+                        provided_server_identifiers = string_to_list_maker(server_resources_dictionary[f"{server_attribute}s"])
+                        add_selector(intersight_api_path,
+                                     [f"ManagementMode eq '{server_management_mode}'",
+                                      f"{server_attribute} in {odata_list(provided_server_identifiers)}"
+                                      ])
+                        if intersight_api_path == "compute/Blades":
+                            blade_server_selector_count += 1
+                        else:
+                            rack_server_selector_count += 1
+        # Add empty Selectors for Server types without any provided resources
+        print("Based on the resource criteria provided, "
+              f"{blade_server_selector_count} Blade Server and "
+              f"{rack_server_selector_count} Rack Server Selector(s) will be "
+              "evaluated by Intersight for the Resource Pool.")
+        if not blade_server_selector_count:
+            add_selector("compute/Blades", ["Moid in ('')"])
+        if not rack_server_selector_count:
+            add_selector("compute/RackUnits", ["Moid in ('')"])
+
     def object_maker(self):
         """This function makes the targeted pool object.
         """           
@@ -1413,54 +3099,46 @@ class ResourcePool:
                   "execution.\n")
             sys.exit(0)
 
+        # Update the API body with server-side Selectors for the provided Resource Pool Resources
+        if self.server_side_selectors:
+            print("Translating the provided resources into server-side "
+                  "Selectors...")
+            self._update_api_body_server_side_selectors(
+                self.intersight_api_body["ResourcePoolParameters"]["ManagementMode"]
+                )
+            # POST the API body to Intersight
+            self._post_intersight_object()
+            return
+
         # Update the API body with the provided Resource Pool Resources
         # Setup lists for MOIDs of retrieved Blade and Rack Servers
         retrieved_blade_server_moid_list = []
         retrieved_rack_server_moid_list = []
-        
+
         # Check for provided Chassis resources
         if self.chassis_resources_list:
             print("Checking for the provided Chassis resources...")
-            retrieved_intersight_chassis = get_intersight_objects(
-                intersight_api_key_id=None,
-                intersight_api_key=None,
-                intersight_api_path="equipment/Chasses?$top=1000",
-                object_type="Chassis",
-                preconfigured_api_client=self.api_client
-                )
-            if not retrieved_intersight_chassis.get("Results"):
+            chassis_resource_indexes = self._get_chassis_resource_indexes()
+            if not chassis_resource_indexes["Chassis"]:
                 print("No Chassis were found in the Intersight Account.")
             for chassis_resources_dictionary in self.chassis_resources_list:
-                # Chassis Blade Server MOID extraction process if only the Domain Name is provided
+                # Convert provided Chassis IDs and Chassis Blade Server Slot IDs into list format
+                provided_chassis_id_list = integer_number_list_maker(chassis_resources_dictionary["ChassisIds"]) if chassis_resources_dictionary.get("ChassisIds") else []
+                provided_chassis_slot_ids_list = integer_number_list_maker(chassis_resources_dictionary["SlotIds"]) if chassis_resources_dictionary.get("SlotIds") else []
+                # Get the MOID of the provided Domain Name for the Chassis
                 if chassis_resources_dictionary.get("DomainName"):
+                    chassis_domain_name_moid = self._get_domain_registration_moid(chassis_resources_dictionary["DomainName"])
+                    # Chassis Blade Server MOID extraction process if only the Domain Name is provided
                     if not any(
                         (chassis_resources_dictionary.get("ChassisIds"),
                          chassis_resources_dictionary.get("SlotIds"),
                          chassis_resources_dictionary.get("Serials")
                          )
                         ):
-                        # Get the MOID of the provided Domain Name for the Chassis
-                        chassis_domain_name_moid = advanced_intersight_object_moid_retriever(
-                            intersight_api_key_id=None,
-                            intersight_api_key=None,
-                            object_attributes={
-                                "DeviceHostname": [chassis_resources_dictionary["DomainName"]]
-                                },
-                            intersight_api_path="asset/DeviceRegistrations?$top=1000",
-                            object_type="Domain Name",
-                            organization=self.organization,
-                            preconfigured_api_client=self.api_client
+                        # Extract MOIDs from the Blade Servers in any Chassis in the provided Domain Name
+                        retrieved_blade_server_moid_list.extend(
+                            chassis_resource_indexes["Chassis by Domain"].get(chassis_domain_name_moid, [])
                             )
-                        # Search for Chassis in the provided Domain Name under the Intersight Account
-                        for chassis in retrieved_intersight_chassis.get("Results"):
-                            if (
-                                chassis["RegisteredDevice"]["Moid"] == chassis_domain_name_moid
-                                and
-                                chassis["ManagementMode"] == "Intersight"
-                                ):
-                                # Extract MOIDs from the Blade Servers in any matched Chassis
-                                for chassis_blade_server in chassis["Blades"]:
-                                    retrieved_blade_server_moid_list.append(chassis_blade_server["Moid"])
                 # Chassis Blade Server MOID extraction process if the Domain Name and Chassis IDs are provided without any corresponding Slot IDs
                 if all(
                     (chassis_resources_dictionary.get("DomainName"),
@@ -1468,32 +3146,11 @@ class ResourcePool:
                      )
                     ):
                     if not chassis_resources_dictionary.get("SlotIds"):
-                        # Convert provided Chassis IDs into list format
-                        provided_chassis_id_list = integer_number_list_maker(chassis_resources_dictionary["ChassisIds"])
-                        # Get the MOID of the provided Domain Name for the Chassis
-                        chassis_domain_name_moid = advanced_intersight_object_moid_retriever(
-                            intersight_api_key_id=None,
-                            intersight_api_key=None,
-                            object_attributes={
-                                "DeviceHostname": [chassis_resources_dictionary["DomainName"]]
-                                },
-                            intersight_api_path="asset/DeviceRegistrations?$top=1000",
-                            object_type="Domain Name",
-                            organization=self.organization,
-                            preconfigured_api_client=self.api_client
-                            )
-                        # Search for Chassis in the provided Domain Name with matching Chassis IDs under the Intersight Account
-                        for chassis in retrieved_intersight_chassis.get("Results"):
-                            if (
-                                chassis["RegisteredDevice"]["Moid"] == chassis_domain_name_moid
-                                and
-                                chassis["ChassisId"] in provided_chassis_id_list
-                                and
-                                chassis["ManagementMode"] == "Intersight"
-                                ):
-                                # Extract MOIDs from the Blade Servers in any matched Chassis
-                                for chassis_blade_server in chassis["Blades"]:
-                                    retrieved_blade_server_moid_list.append(chassis_blade_server["Moid"])
+                        # Extract MOIDs from the Blade Servers in any Chassis in the provided Domain Name with matching Chassis IDs
+                        for provided_chassis_id in provided_chassis_id_list:
+                            retrieved_blade_server_moid_list.extend(
+                                chassis_resource_indexes["Chassis by Domain and Chassis ID"].get((chassis_domain_name_moid, provided_chassis_id), [])
+                                )
                 # Chassis Blade Server MOID extraction process if the Domain Name, Chassis IDs and Slot IDs are provided
                 if all(
                     (chassis_resources_dictionary.get("DomainName"),
@@ -1501,50 +3158,12 @@ class ResourcePool:
                      chassis_resources_dictionary.get("SlotIds")
                      )
                     ):
-                    # Convert provided Chassis IDs into list format
-                    provided_chassis_id_list = integer_number_list_maker(chassis_resources_dictionary["ChassisIds"])
-                    # Convert provided Chassis Blade Server Slot IDs into list format
-                    provided_chassis_slot_ids_list = integer_number_list_maker(chassis_resources_dictionary["SlotIds"])
-                    # Get the MOID of the provided Domain Name for the Chassis
-                    chassis_domain_name_moid = advanced_intersight_object_moid_retriever(
-                        intersight_api_key_id=None,
-                        intersight_api_key=None,
-                        object_attributes={
-                            "DeviceHostname": [chassis_resources_dictionary["DomainName"]]
-                            },
-                        intersight_api_path="asset/DeviceRegistrations?$top=1000",
-                        object_type="Domain Name",
-                        organization=self.organization,
-                        preconfigured_api_client=self.api_client
-                        )
-                    # Check for Blade Server resources located under the Intersight Account
-                    retrieved_intersight_blade_servers = get_intersight_objects(
-                        intersight_api_key_id=None,
-                        intersight_api_key=None,
-                        intersight_api_path=f"compute/Blades?$top=1000&$filter=ManagementMode%20eq%20%27Intersight%27",
-                        object_type="Blade Server",
-                        preconfigured_api_client=self.api_client
-                        )                    
-                    # Search for Chassis Blade Servers in the provided Domain Name with matching Chassis and Slot IDs under the Intersight Account
-                    for blade_server in retrieved_intersight_blade_servers.get("Results"):
-                        if (
-                            int(blade_server["ChassisId"]) in provided_chassis_id_list
-                            and
-                            blade_server["SlotId"] in provided_chassis_slot_ids_list
-                            and
-                            blade_server["ManagementMode"] == "Intersight"
-                            ):
-                            current_chassis_id = int(blade_server["ChassisId"])
-                            # Search for Chassis in the provided Domain Name with matching Chassis IDs under the Intersight Account
-                            for chassis in retrieved_intersight_chassis.get("Results"):
-                                if (
-                                    chassis["RegisteredDevice"]["Moid"] == chassis_domain_name_moid
-                                    and
-                                    chassis["ChassisId"] == current_chassis_id
-                                    and
-                                    chassis["ManagementMode"] == "Intersight"
-                                    ):
-                                    retrieved_blade_server_moid_list.append(blade_server["Moid"])
+                    # Extract MOIDs from the Chassis Blade Servers in the provided Domain Name with matching Chassis and Slot IDs
+                    for provided_chassis_id in provided_chassis_id_list:
+                        for provided_chassis_slot_id in provided_chassis_slot_ids_list:
+                            retrieved_blade_server_moid_list.extend(
+                                chassis_resource_indexes["Blade Servers by Domain, Chassis ID and Slot ID"].get((chassis_domain_name_moid, provided_chassis_id, provided_chassis_slot_id), [])
+                                )
                 # Chassis Blade Server MOID extraction process if the Chassis IDs are provided without the Domain Name or Slot IDs
                 if chassis_resources_dictionary.get("ChassisIds"):
                     if not any(
@@ -1552,18 +3171,11 @@ class ResourcePool:
                          chassis_resources_dictionary.get("SlotIds")
                          )
                         ):
-                        # Convert provided Chassis IDs into list format
-                        provided_chassis_id_list = integer_number_list_maker(chassis_resources_dictionary["ChassisIds"])
-                        # Search for Chassis with matching Chassis IDs under the Intersight Account
-                        for chassis in retrieved_intersight_chassis.get("Results"):
-                            if (
-                                chassis["ChassisId"] in provided_chassis_id_list
-                                and
-                                chassis["ManagementMode"] == "Intersight"
-                                ):
-                                # Extract MOIDs from the Blade Servers in any matched Chassis
-                                for chassis_blade_server in chassis["Blades"]:
-                                    retrieved_blade_server_moid_list.append(chassis_blade_server["Moid"])
+                        # Extract MOIDs from the Blade Servers in any Chassis with matching Chassis IDs
+                        for provided_chassis_id in provided_chassis_id_list:
+                            retrieved_blade_server_moid_list.extend(
+                                chassis_resource_indexes["Chassis by Chassis ID"].get(provided_chassis_id, [])
+                                )
                 # Chassis Blade Server MOID extraction process if the Chassis IDs and Slot IDs are provided without any corresponding Domain Name
                 if all(
                     (chassis_resources_dictionary.get("ChassisIds"),
@@ -1571,36 +3183,12 @@ class ResourcePool:
                      )
                     ):
                     if not chassis_resources_dictionary.get("DomainName"):
-                        # Convert provided Chassis IDs into list format
-                        provided_chassis_id_list = integer_number_list_maker(chassis_resources_dictionary["ChassisIds"])
-                        # Convert provided Chassis Blade Server Slot IDs into list format
-                        provided_chassis_slot_ids_list = integer_number_list_maker(chassis_resources_dictionary["SlotIds"])
-                        # Check for Blade Server resources located under the Intersight Account
-                        retrieved_intersight_blade_servers = get_intersight_objects(
-                            intersight_api_key_id=None,
-                            intersight_api_key=None,
-                            intersight_api_path=f"compute/Blades?$top=1000&$filter=ManagementMode%20eq%20%27Intersight%27",
-                            object_type="Blade Server",
-                            preconfigured_api_client=self.api_client
-                            )                        
-                        # Search for Chassis Blade Servers with matching Chassis and Slot IDs under the Intersight Account
-                        for blade_server in retrieved_intersight_blade_servers.get("Results"):
-                            if (
-                                int(blade_server["ChassisId"]) in provided_chassis_id_list
-                                and
-                                blade_server["SlotId"] in provided_chassis_slot_ids_list
-                                and
-                                blade_server["ManagementMode"] == "Intersight"
-                                ):
-                                current_chassis_id = int(blade_server["ChassisId"])
-                                # Search for Chassis with matching Chassis IDs under the Intersight Account
-                                for chassis in retrieved_intersight_chassis.get("Results"):
-                                    if (
-                                        chassis["ChassisId"] == current_chassis_id
-                                        and
-                                        chassis["ManagementMode"] == "Intersight"
-                                        ):
-                                        retrieved_blade_server_moid_list.append(blade_server["Moid"])
+                        # Extract MOIDs from the Chassis Blade Servers with matching Chassis and Slot IDs
+                        for provided_chassis_id in provided_chassis_id_list:
+                            for provided_chassis_slot_id in provided_chassis_slot_ids_list:
+                                retrieved_blade_server_moid_list.extend(
+                                    chassis_resource_indexes["Blade Servers by Chassis ID and Slot ID"].get((provided_chassis_id, provided_chassis_slot_id), [])
+                                    )
                 # Chassis Blade Server MOID extraction process if the Slot IDs are provided without the Domain Name or Chassis IDs
                 if chassis_resources_dictionary.get("SlotIds"):
                     if not any(
@@ -1608,24 +3196,11 @@ class ResourcePool:
                          chassis_resources_dictionary.get("ChassisIds")
                          )
                         ):
-                        # Convert provided Chassis Blade Server Slot IDs into list format
-                        provided_chassis_slot_ids_list = integer_number_list_maker(chassis_resources_dictionary["SlotIds"])
-                        # Check for Blade Server resources located under the Intersight Account
-                        retrieved_intersight_blade_servers = get_intersight_objects(
-                            intersight_api_key_id=None,
-                            intersight_api_key=None,
-                            intersight_api_path=f"compute/Blades?$top=1000&$filter=ManagementMode%20eq%20%27Intersight%27",
-                            object_type="Blade Server",
-                            preconfigured_api_client=self.api_client
-                            )                        
-                        # Search for Chassis Blade Servers in the provided Domain Name with matching Slot IDs under the Intersight Account
-                        for blade_server in retrieved_intersight_blade_servers.get("Results"):
-                            if (
-                                blade_server["SlotId"] in provided_chassis_slot_ids_list
-                                and
-                                blade_server["ManagementMode"] == "Intersight"
-                                ):
-                                retrieved_blade_server_moid_list.append(blade_server["Moid"])
+                        # Extract MOIDs from the Chassis Blade Servers with matching Slot IDs
+                        for provided_chassis_slot_id in provided_chassis_slot_ids_list:
+                            retrieved_blade_server_moid_list.extend(
+                                chassis_resource_indexes["Blade Servers by Slot ID"].get(provided_chassis_slot_id, [])
+                                )
                 # Chassis Blade Server MOID extraction process if the Domain Name and Slot IDs are provided without any corresponding Chassis IDs
                 if all(
                     (chassis_resources_dictionary.get("DomainName"),
@@ -1633,93 +3208,46 @@ class ResourcePool:
                      )
                     ):
                     if not chassis_resources_dictionary.get("ChassisIds"):
-                        # Convert provided Chassis Blade Server Slot IDs into list format
-                        provided_chassis_slot_ids_list = integer_number_list_maker(chassis_resources_dictionary["SlotIds"])
-                        # Get the MOID of the provided Domain Name for the Chassis
-                        chassis_domain_name_moid = advanced_intersight_object_moid_retriever(
-                            intersight_api_key_id=None,
-                            intersight_api_key=None,
-                            object_attributes={
-                                "DeviceHostname": [chassis_resources_dictionary["DomainName"]]
-                                },
-                            intersight_api_path="asset/DeviceRegistrations?$top=1000",
-                            object_type="Domain Name",
-                            organization=self.organization,
-                            preconfigured_api_client=self.api_client
-                            )                        
-                        # Check for Blade Server resources located under the Intersight Account
-                        retrieved_intersight_blade_servers = get_intersight_objects(
-                            intersight_api_key_id=None,
-                            intersight_api_key=None,
-                            intersight_api_path=f"compute/Blades?$top=1000&$filter=ManagementMode%20eq%20%27Intersight%27",
-                            object_type="Blade Server",
-                            preconfigured_api_client=self.api_client
-                            )                        
-                        # Search for Chassis Blade Servers in the provided Domain Name with matching Slot IDs under the Intersight Account
-                        for blade_server in retrieved_intersight_blade_servers.get("Results"):
-                            if (
-                                blade_server["SlotId"] in provided_chassis_slot_ids_list
-                                and
-                                blade_server["ManagementMode"] == "Intersight"
-                                ):
-                                # Get the MOID of the Chassis associated with the current Blade Server
-                                current_chassis_moid = blade_server["EquipmentChassis"]["Moid"]
-                                # Get the associated Chassis object details
-                                current_chassis_object = get_single_intersight_object(
-                                    intersight_api_key_id=None,
-                                    intersight_api_key=None,
-                                    intersight_api_path="equipment/Chasses?$top=1000",
-                                    object_moid=current_chassis_moid,
-                                    object_type="UCS Chassis",
-                                    preconfigured_api_client=self.api_client
-                                    )
-                                # Get the MOID of the Domain Name for the Chassis associated with the current Blade Server
-                                current_chassis_object_domain_name_moid = current_chassis_object["RegisteredDevice"]["Moid"]
-                                # Retrieve the current Blade Server MOID if the Chassis Domain Name matches the provided Domain Name
-                                if current_chassis_object_domain_name_moid == chassis_domain_name_moid:
-                                    retrieved_blade_server_moid_list.append(blade_server["Moid"])
+                        # Extract MOIDs from the Chassis Blade Servers in the provided Domain Name with matching Slot IDs
+                        for provided_chassis_slot_id in provided_chassis_slot_ids_list:
+                            retrieved_blade_server_moid_list.extend(
+                                chassis_resource_indexes["Blade Servers by Domain and Slot ID"].get((chassis_domain_name_moid, provided_chassis_slot_id), [])
+                                )
                 # Chassis Blade Server MOID extraction process if any Chassis serials are provided
                 if chassis_resources_dictionary.get("Serials"):
                     # Convert provided Chassis serials into list format
                     provided_chassis_serials_list = string_to_list_maker(chassis_resources_dictionary["Serials"])
-                    # Search for Chassis with matching serials under the Intersight Account
-                    for chassis in retrieved_intersight_chassis.get("Results"):
-                        if chassis["Serial"] in provided_chassis_serials_list:
-                            # Extract MOIDs from the Blade Servers in any matched Chassis
-                            for chassis_blade_server in chassis["Blades"]:
-                                retrieved_blade_server_moid_list.append(chassis_blade_server["Moid"])
+                    # Extract MOIDs from the Blade Servers in any Chassis with matching serials
+                    for provided_chassis_serial in provided_chassis_serials_list:
+                        retrieved_blade_server_moid_list.extend(
+                            chassis_resource_indexes["Chassis by Serial"].get(provided_chassis_serial, [])
+                            )
 
         # Check for provided Blade Server resources
         if self.blade_server_resources_list:
             print("Checking for the provided Blade Server resources...")
-            retrieved_intersight_blade_servers = get_intersight_objects(
-                intersight_api_key_id=None,
-                intersight_api_key=None,
-                intersight_api_path=f"compute/Blades?$top=1000&$filter=ManagementMode%20eq%20%27Intersight%27",
-                object_type="Blade Server",
-                preconfigured_api_client=self.api_client
-                )
-            if not retrieved_intersight_blade_servers.get("Results"):
+            chassis_resource_indexes = self._get_chassis_resource_indexes()
+            if not chassis_resource_indexes["Blade Servers"]:
                 print("No Blade Servers were found in the Intersight Account.")
             for blade_server_resources_dictionary in self.blade_server_resources_list:
                 # Blade Server MOID extraction process if any Blade Server names are provided
                 if blade_server_resources_dictionary.get("Names"):
                     # Convert provided Blade Server names into list format
                     provided_blade_server_names_list = string_to_list_maker(blade_server_resources_dictionary["Names"])
-                    # Search for Blade Servers with matching names under the Intersight Account
-                    for blade_server in retrieved_intersight_blade_servers.get("Results"):
-                        if blade_server["Name"] in provided_blade_server_names_list:
-                            # Extract MOIDs from the matched Blade Servers
-                            retrieved_blade_server_moid_list.append(blade_server["Moid"])
+                    # Extract MOIDs from the Blade Servers with matching names
+                    for provided_blade_server_name in provided_blade_server_names_list:
+                        retrieved_blade_server_moid_list.extend(
+                            chassis_resource_indexes["Blade Servers by Name"].get(provided_blade_server_name, [])
+                            )
                 # Blade Server MOID extraction process if any Blade Server serials are provided
                 if blade_server_resources_dictionary.get("Serials"):
                     # Convert provided Blade Server serials into list format
                     provided_blade_server_serials_list = string_to_list_maker(blade_server_resources_dictionary["Serials"])
-                    # Search for Blade Servers with matching serials under the Intersight Account
-                    for blade_server in retrieved_intersight_blade_servers.get("Results"):
-                        if blade_server["Serial"] in provided_blade_server_serials_list:
-                            # Extract MOIDs from the matched Blade Servers
-                            retrieved_blade_server_moid_list.append(blade_server["Moid"])
+                    # Extract MOIDs from the Blade Servers with matching serials
+                    for provided_blade_server_serial in provided_blade_server_serials_list:
+                        retrieved_blade_server_moid_list.extend(
+                            chassis_resource_indexes["Blade Servers by Serial"].get(provided_blade_server_serial, [])
+                            )
 
         # Setup API body with retrieved Blade Server MOIDs from any provided resources
         if retrieved_blade_server_moid_list:
@@ -1910,6 +3438,7 @@ def resource_pool_maker(
     ucs_server_type="FI-Attached",
     resource_type="Server",
     pool_type="Static",
+    server_side_selectors=False,
     pool_description="",
     pool_assignment_order="default",
     organization="default",
@@ -1996,6 +3525,13 @@ def resource_pool_maker(
             Optional; The resource management type of the pool. Static pools
             will not change unless manually updated by a user. The accepted
             values are "Static" or "Dynamic". The default value is "Static".
+        server_side_selectors (bool):
+            Optional; The option to translate the provided chassis, blade
+            server and rack server resources into server-side selectors that
+            are evaluated by Intersight, instead of retrieving the server
+            inventory and adding the MOIDs of the matching servers. This is
+            recommended for Dynamic pools, as the selectors also match servers
+            added after the pool has been created. The default value is False.
         pool_description (str):
             Optional; The description of the pool to be created. The default
             value is an empty string ("").
@@ -2064,7 +3600,8 @@ def resource_pool_maker(
             rack_server_resources_list=rack_server_resources_list,
             ucs_server_type=ucs_server_type,
             resource_type=resource_type,
-            pool_type=pool_type
+            pool_type=pool_type,
+            server_side_selectors=server_side_selectors
             ))
 
 
@@ -2076,8 +3613,15 @@ def main():
     main_intersight_api_client = get_api_client(api_key_id=key_id,
                                                 api_secret_file=key,
                                                 endpoint=intersight_base_url,
-                                                url_certificate_verification=url_certificate_verification
+                                                url_certificate_verification=url_certificate_verification,
+                                                api_request_rate_limit=intersight_api_request_rate_limit
                                                 )
+
+    # Attach the object state file to the API client, if provided
+    if intersight_object_state_file:
+        set_intersight_object_state_file(main_intersight_api_client,
+                                         intersight_object_state_file
+                                         )
     
     # Starting the Pool Maker for Cisco Intersight
     print(f"\nStarting the {maker_type} for Cisco Intersight.\n")
@@ -2101,6 +3645,7 @@ def main():
         ucs_server_type=ucs_server_type,
         resource_type=resource_type,
         pool_type=pool_type,
+        server_side_selectors=server_side_selectors,
         pool_description=resource_pool_description,
         pool_assignment_order=resource_assignment_order,
         organization=resource_pool_organization,